@@ -2,14 +2,44 @@
 The Adversarial Robustness Toolbox (ART).
 """
 import logging.config
+from typing import TYPE_CHECKING
 
-# Project Imports
-from art import attacks
-from art import defences
-from art import estimators
-from art import evaluations
-from art import metrics
-from art import preprocessing
+from art.lazy_loader import attach
+
+# Project Imports, loaded on first access
+if TYPE_CHECKING:
+    from art import attacks
+    from art import config
+    from art import data_generators
+    from art import defences
+    from art import estimators
+    from art import evaluations
+    from art import exceptions
+    from art import metrics
+    from art import optimizers
+    from art import preprocessing
+    from art import summary_writer
+    from art import utils
+    from art import visualization
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "attacks",
+        "config",
+        "data_generators",
+        "defences",
+        "estimators",
+        "evaluations",
+        "exceptions",
+        "metrics",
+        "optimizers",
+        "preprocessing",
+        "summary_writer",
+        "utils",
+        "visualization",
+    ],
+)
 
 # Semantic Version
 __version__ = "1.16.0"
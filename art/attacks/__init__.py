@@ -1,12 +1,43 @@
 """
 Module providing adversarial attacks under a common interface.
 """
-from art.attacks.attack import Attack, EvasionAttack, PoisoningAttack, PoisoningAttackBlackBox, PoisoningAttackWhiteBox
-from art.attacks.attack import PoisoningAttackGenerator, PoisoningAttackTransformer, PoisoningAttackObjectDetector
-from art.attacks.attack import ExtractionAttack, InferenceAttack, AttributeInferenceAttack
-from art.attacks.attack import ReconstructionAttack
+from typing import TYPE_CHECKING
 
-from art.attacks import evasion
-from art.attacks import extraction
-from art.attacks import inference
-from art.attacks import poisoning
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.attacks.attack import (
+        Attack,
+        EvasionAttack,
+        PoisoningAttack,
+        PoisoningAttackBlackBox,
+        PoisoningAttackWhiteBox,
+    )
+    from art.attacks.attack import PoisoningAttackGenerator, PoisoningAttackTransformer, PoisoningAttackObjectDetector
+    from art.attacks.attack import ExtractionAttack, InferenceAttack, AttributeInferenceAttack
+    from art.attacks.attack import ReconstructionAttack
+    from art.attacks import evasion
+    from art.attacks import extraction
+    from art.attacks import inference
+    from art.attacks import poisoning
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["evasion", "extraction", "inference", "poisoning"],
+    attributes={
+        "art.attacks.attack": [
+            "Attack",
+            "EvasionAttack",
+            "PoisoningAttack",
+            "PoisoningAttackBlackBox",
+            "PoisoningAttackWhiteBox",
+            "PoisoningAttackGenerator",
+            "PoisoningAttackTransformer",
+            "PoisoningAttackObjectDetector",
+            "ExtractionAttack",
+            "InferenceAttack",
+            "AttributeInferenceAttack",
+            "ReconstructionAttack",
+        ],
+    },
+)
@@ -21,8 +21,10 @@ This module implements the abstract base classes for all attacks.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import abc
+from contextlib import contextmanager
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING, cast
 
 import numpy as np
 
@@ -32,6 +34,7 @@ from art.utils import get_feature_index
 
 if TYPE_CHECKING:
     from art.utils import CLASSIFIER_TYPE, GENERATOR_TYPE
+    from art.estimators.classification.query_counting import QueryCountingClassifier
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +92,21 @@ class InputFilter(abc.ABCMeta):  # pragma: no cover
                 setattr(cls, item, new_function)
 
 
+def count_queries(generate: Callable) -> Callable:
+    """
+    Decorator for the method `generate` of black-box evasion attacks with the attribute `max_queries`, counting the
+    queries of the attack per sample with `max_queries` as budget per sample. Within `generate`, the estimator of the
+    attack is a `QueryCountingClassifier` and the attack attributes the queries to samples with `_attribute_queries`.
+    """
+
+    @functools.wraps(generate)
+    def wrapper(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
+        with self._count_queries(x.shape[0], self.max_queries):  # pylint: disable=W0212
+            return generate(self, x, y, **kwargs)
+
+    return wrapper
+
+
 class Attack(abc.ABC):
     """
     Abstract base class for all attack abstract base classes.
@@ -209,6 +227,8 @@ class EvasionAttack(Attack):
 
     def __init__(self, **kwargs) -> None:
         self._targeted = False
+        self.record_queries = False
+        self.queries_per_sample: Optional[np.ndarray] = None
         super().__init__(**kwargs)
 
     @abc.abstractmethod
@@ -235,6 +255,100 @@ class EvasionAttack(Attack):
     def targeted(self, targeted) -> None:
         self._targeted = targeted
 
+    def query_histogram(self, bins: Union[int, np.ndarray] = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the histogram of the queries per sample of the last call to `generate` of attacks counting their queries,
+        which requires a budget `max_queries` or `record_queries = True`.
+
+        :param bins: The number of bins or the bin edges, as for `np.histogram`.
+        :return: A tuple of the number of samples per bin and the bin edges.
+        """
+        if self.queries_per_sample is None:
+            raise ValueError(
+                "The queries are only counted by black-box attacks with a budget `max_queries` or `record_queries = "
+                "True` after calling `generate`."
+            )
+        return np.histogram(self.queries_per_sample, bins=bins)
+
+    @contextmanager
+    def _count_queries(
+        self, nb_samples: int, max_queries: Optional[int] = None
+    ) -> Iterator[Optional["QueryCountingClassifier"]]:
+        """
+        Count the queries to the predictions of a classifier by wrapping it in a `QueryCountingClassifier` within the
+        context if a budget is set or `record_queries` is `True`. The queries are attributed to all samples until the
+        attack calls `_attribute_queries`. The queries per sample are stored in `queries_per_sample` at the end of the
+        context.
+
+        :param nb_samples: The number of samples of the attack.
+        :param max_queries: The budget of queries per sample. Unlimited if `None`.
+        :return: The wrapper counting the queries or `None` if the queries are not counted.
+        """
+        from art.estimators.classification.classifier import ClassifierMixin
+        from art.estimators.classification.query_counting import QueryCountingClassifier
+
+        estimator = self._estimator
+        if not isinstance(estimator, ClassifierMixin) or (max_queries is None and not self.record_queries):
+            if max_queries is not None:
+                raise ValueError("The budget of queries `max_queries` requires a classifier.")
+            self.queries_per_sample = None
+            yield None
+            return
+
+        counter = QueryCountingClassifier(
+            cast("CLASSIFIER_TYPE", estimator), nb_samples=nb_samples, max_queries=max_queries
+        )
+        counter.sample_index = np.arange(nb_samples)
+        self._estimator = counter
+        try:
+            yield counter
+        finally:
+            self._estimator = estimator
+            self.queries_per_sample = counter.queries_per_sample
+
+    def _attribute_queries(self, index: Union[int, np.ndarray]) -> None:
+        """
+        Attribute the following queries to the samples `index` while counting the queries. The inputs of every query are
+        ordered as the samples with the same number of inputs per sample.
+
+        :param index: Index or indices of the samples.
+        """
+        from art.estimators.classification.query_counting import QueryCountingClassifier
+
+        if isinstance(self._estimator, QueryCountingClassifier):
+            self._estimator.sample_index = index
+
+    def _remaining_queries(self, index: Optional[Union[int, np.ndarray]] = None) -> Union[float, np.ndarray]:
+        """
+        Return the number of queries left in the budget of the samples while counting the queries.
+
+        :param index: Index or indices of the samples. The samples in `sample_index` of the counter if `None`.
+        :return: The remaining queries of the samples, `np.inf` without budget.
+        """
+        from art.estimators.classification.query_counting import QueryCountingClassifier
+
+        if isinstance(self._estimator, QueryCountingClassifier):
+            remaining = self._estimator.remaining_queries(index)
+            return remaining if np.ndim(remaining) > 0 else remaining.item()
+        if index is None or np.ndim(index) == 0:
+            return np.inf
+        return np.full(np.shape(index), np.inf)
+
+    def _queries_exhausted(self, index: Optional[Union[int, np.ndarray]] = None) -> Union[bool, np.ndarray]:
+        """
+        Check whether the budget of queries of the samples is exhausted while counting the queries.
+
+        :param index: Index or indices of the samples. The samples in `sample_index` of the counter if `None`.
+        :return: `True` for the samples without remaining queries.
+        """
+        from art.estimators.classification.query_counting import QueryCountingClassifier
+
+        if isinstance(self._estimator, QueryCountingClassifier):
+            return self._estimator.is_exhausted(index)
+        if index is None or np.ndim(index) == 0:
+            return False
+        return np.zeros(np.shape(index), dtype=bool)
+
 
 class PoisoningAttack(Attack):
     """
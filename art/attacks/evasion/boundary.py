@@ -29,7 +29,7 @@ from typing import List, Optional, Tuple, TYPE_CHECKING
 import numpy as np
 from tqdm.auto import tqdm, trange
 
-from art.attacks.attack import EvasionAttack
+from art.attacks.attack import EvasionAttack, count_queries
 from art.config import ART_NUMPY_DTYPE
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification.classifier import ClassifierMixin
@@ -59,6 +59,7 @@ class BoundaryAttack(EvasionAttack):
         "sample_size",
         "init_size",
         "batch_size",
+        "max_queries",
         "verbose",
     ]
 
@@ -77,6 +78,7 @@ class BoundaryAttack(EvasionAttack):
         sample_size: int = 20,
         init_size: int = 100,
         min_epsilon: float = 0.0,
+        max_queries: Optional[int] = None,
         verbose: bool = True,
     ) -> None:
         """
@@ -93,6 +95,9 @@ class BoundaryAttack(EvasionAttack):
         :param sample_size: Number of samples per trial.
         :param init_size: Maximum number of trials for initial generation of adversarial examples.
         :param min_epsilon: Stop attack if perturbation is smaller than `min_epsilon`.
+        :param max_queries: The budget of queries per sample. The attack of a sample stops once its budget is exhausted.
+                            The last candidates are limited to the remaining queries. Logging the success rate uses
+                            two more queries per sample. Unlimited if `None`.
         :param verbose: Show progress bars.
         """
         super().__init__(estimator=estimator)
@@ -107,11 +112,13 @@ class BoundaryAttack(EvasionAttack):
         self.init_size = init_size
         self.min_epsilon = min_epsilon
         self.batch_size = batch_size
+        self.max_queries = max_queries
         self.verbose = verbose
         self._check_params()
 
         self.curr_adv: Optional[np.ndarray] = None
 
+    @count_queries
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples and return them in an array.
@@ -160,6 +167,7 @@ class BoundaryAttack(EvasionAttack):
 
         # Generate the adversarial samples
         for ind, val in enumerate(tqdm(x_adv, desc="Boundary attack", disable=not self.verbose)):
+            self._attribute_queries(ind)
             if self.targeted:
                 x_adv[ind] = self._perturb(
                     x=val,
@@ -181,6 +189,7 @@ class BoundaryAttack(EvasionAttack):
                     clip_max=clip_max,
                 )
 
+        self._attribute_queries(np.arange(x.shape[0]))
         y = to_categorical(y, self.estimator.nb_classes)
 
         logger.info(
@@ -266,10 +275,18 @@ class BoundaryAttack(EvasionAttack):
 
         # Main loop to wander around the boundary
         for _ in trange(self.max_iter, desc="Boundary attack - iterations", disable=not self.verbose):
+            if self._queries_exhausted():
+                break
+
             # Trust region method to adjust delta
             for _ in range(self.num_trial):
+                # Limit the candidates to the remaining queries
+                nb_candidates = int(min(self.sample_size, self._remaining_queries()))
+                if nb_candidates == 0:
+                    return x_adv
+
                 potential_advs_list: List[np.ndarray] = []
-                for _ in range(self.sample_size):
+                for _ in range(nb_candidates):
                     potential_adv = x_adv + self._orthogonal_perturb(self.curr_delta, x_adv, original_sample)
                     potential_adv = np.clip(potential_adv, clip_min, clip_max)
                     potential_advs_list.append(potential_adv)
@@ -300,9 +317,13 @@ class BoundaryAttack(EvasionAttack):
 
             # Trust region method to adjust epsilon
             for _ in range(self.num_trial):
-                perturb = np.repeat(np.array([original_sample]), len(x_advs), axis=0) - x_advs
+                nb_candidates = int(min(len(x_advs), self._remaining_queries()))
+                if nb_candidates == 0:
+                    return self._best_adv(original_sample, x_advs)
+
+                perturb = np.repeat(np.array([original_sample]), nb_candidates, axis=0) - x_advs[:nb_candidates]
                 perturb *= self.curr_epsilon
-                potential_advs = x_advs + perturb
+                potential_advs = x_advs[:nb_candidates] + perturb
                 potential_advs = np.clip(potential_advs, clip_min, clip_max)
                 preds = np.argmax(
                     self.estimator.predict(potential_advs, batch_size=self.batch_size),
@@ -400,6 +421,9 @@ class BoundaryAttack(EvasionAttack):
 
             # Attack unsatisfied yet and the initial image unsatisfied
             for _ in range(self.init_size):
+                if self._queries_exhausted():
+                    break
+
                 random_img = nprd.uniform(clip_min, clip_max, size=x.shape).astype(x.dtype)
                 random_class = np.argmax(
                     self.estimator.predict(np.array([random_img]), batch_size=self.batch_size),
@@ -421,6 +445,9 @@ class BoundaryAttack(EvasionAttack):
 
             # The initial image unsatisfied
             for _ in range(self.init_size):
+                if self._queries_exhausted():
+                    break
+
                 random_img = nprd.uniform(clip_min, clip_max, size=x.shape).astype(x.dtype)
                 random_class = np.argmax(
                     self.estimator.predict(np.array([random_img]), batch_size=self.batch_size),
@@ -475,5 +502,8 @@ class BoundaryAttack(EvasionAttack):
         if not isinstance(self.min_epsilon, (float, int)) or self.min_epsilon < 0:
             raise ValueError("The minimum epsilon must be non-negative.")
 
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
+
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
@@ -135,30 +135,26 @@ class DeepFool(EvasionAttack):
             # Get predictions and gradients for batch
             f_batch = preds[batch_index_1:batch_index_2]
             fk_hat = np.argmax(f_batch, axis=1)
-            if use_grads_subset:
-                # Compute gradients only for top predicted classes
-                grd = np.array([self.estimator.class_gradient(batch, label=int(label_i)) for label_i in labels_set])
-                grd = np.squeeze(np.swapaxes(grd, 0, 2), axis=0)
-            else:
-                # Compute gradients for all classes
-                grd = self.estimator.class_gradient(batch)
-
-            # Get current predictions
+            labels_indices = sorter[np.searchsorted(labels_set, fk_hat, sorter=sorter)]
+            grd = self._class_gradients(batch, labels_set)
+
+            # Predictions and gradients are only kept and recomputed for the samples still being attacked
             active_indices = np.arange(len(batch))
             current_step = 0
             while active_indices.size > 0 and current_step < self.max_iter:
                 # Compute difference in predictions and gradients only for selected top predictions
-                labels_indices = sorter[np.searchsorted(labels_set, fk_hat, sorter=sorter)]
-                grad_diff = grd - grd[np.arange(len(grd)), labels_indices][:, None]
-                f_diff = f_batch[:, labels_set] - f_batch[np.arange(len(f_batch)), labels_indices][:, None]
+                active_range = np.arange(len(active_indices))
+                active_labels_indices = labels_indices[active_indices]
+                grad_diff = grd - grd[active_range, active_labels_indices][:, None]
+                f_diff = f_batch[:, labels_set] - f_batch[active_range, active_labels_indices][:, None]
 
                 # Choose coordinate and compute perturbation
                 norm = np.linalg.norm(grad_diff.reshape(len(grad_diff), len(labels_set), -1), axis=2) + tol
                 value = np.abs(f_diff) / norm
-                value[np.arange(len(value)), labels_indices] = np.inf
+                value[active_range, active_labels_indices] = np.inf
                 l_var = np.argmin(value, axis=1)
-                absolute1 = abs(f_diff[np.arange(len(f_diff)), l_var])
-                draddiff = grad_diff[np.arange(len(grad_diff)), l_var].reshape(len(grad_diff), -1)
+                absolute1 = abs(f_diff[active_range, l_var])
+                draddiff = grad_diff[active_range, l_var].reshape(len(grad_diff), -1)
                 pow1 = (
                     pow(
                         np.linalg.norm(draddiff, axis=1),
@@ -168,36 +164,29 @@ class DeepFool(EvasionAttack):
                 )
                 r_var = absolute1 / pow1
                 r_var = r_var.reshape((-1,) + (1,) * (len(x.shape) - 1))
-                r_var = r_var * grad_diff[np.arange(len(grad_diff)), l_var]
+                r_var = r_var * grad_diff[active_range, l_var]
 
                 # Add perturbation and clip result
                 if self.estimator.clip_values is not None:
                     batch[active_indices] = np.clip(
-                        batch[active_indices]
-                        + r_var[active_indices] * (self.estimator.clip_values[1] - self.estimator.clip_values[0]),
+                        batch[active_indices] + r_var * (self.estimator.clip_values[1] - self.estimator.clip_values[0]),
                         self.estimator.clip_values[0],
                         self.estimator.clip_values[1],
                     )
                 else:
-                    batch[active_indices] += r_var[active_indices]
-
-                # Recompute prediction for new x
-                f_batch = self.estimator.predict(batch)
-                fk_i_hat = np.argmax(f_batch, axis=1)
+                    batch[active_indices] += r_var
 
-                # Recompute gradients for new x
-                if use_grads_subset:
-                    # Compute gradients only for (originally) top predicted classes
-                    grd = np.array([self.estimator.class_gradient(batch, label=int(label_i)) for label_i in labels_set])
-                    grd = np.squeeze(np.swapaxes(grd, 0, 2), axis=0)
-                else:
-                    # Compute gradients for all classes
-                    grd = self.estimator.class_gradient(batch)
+                current_step += 1
 
-                # Stop if misclassification has been achieved
-                active_indices = np.where(fk_i_hat == fk_hat)[0]
+                # Recompute prediction for new x and stop if misclassification has been achieved
+                f_batch = self.estimator.predict(batch[active_indices])
+                still_active = np.argmax(f_batch, axis=1) == fk_hat[active_indices]
+                active_indices = active_indices[still_active]
+                f_batch = f_batch[still_active]
 
-                current_step += 1
+                # Recompute gradients for new x
+                if active_indices.size > 0 and current_step < self.max_iter:
+                    grd = self._class_gradients(batch[active_indices], labels_set)
 
             # Apply overshoot parameter
             x_adv1 = x_adv[batch_index_1:batch_index_2]
@@ -213,6 +202,22 @@ class DeepFool(EvasionAttack):
 
         return x_adv
 
+    def _class_gradients(self, x: np.ndarray, labels_set: np.ndarray) -> np.ndarray:
+        """
+        Compute the class gradients of the classes in `labels_set`.
+
+        :param x: Samples.
+        :param labels_set: Sorted array of the class labels for which to compute the gradients.
+        :return: Array of gradients of shape `(nb_samples, len(labels_set), input_shape)`.
+        """
+        if len(labels_set) == self.estimator.nb_classes:
+            # Compute gradients for all classes with a single call
+            return self.estimator.class_gradient(x)
+
+        # Compute gradients only for top predicted classes
+        grd = np.array([self.estimator.class_gradient(x, label=int(label_i)) for label_i in labels_set])
+        return np.squeeze(np.swapaxes(grd, 0, 2), axis=0)
+
     def _check_params(self) -> None:
         if not isinstance(self.max_iter, int) or self.max_iter <= 0:
             raise ValueError("The number of iterations must be a positive integer.")
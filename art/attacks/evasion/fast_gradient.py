@@ -24,7 +24,7 @@ Method attack and extends it to other norms, therefore it is called the Fast Gra
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Dict, Optional, Union, TYPE_CHECKING
 
 import numpy as np
 
@@ -65,6 +65,7 @@ class FastGradientMethod(EvasionAttack):
         "batch_size",
         "minimal",
         "summary_writer",
+        "in_place",
     ]
     _estimator_requirements = (BaseEstimator, LossGradientsMixin)
 
@@ -79,6 +80,7 @@ class FastGradientMethod(EvasionAttack):
         batch_size: int = 32,
         minimal: bool = False,
         summary_writer: Union[str, bool, SummaryWriter] = False,
+        in_place: bool = False,
     ) -> None:
         """
         Create a :class:`.FastGradientMethod` instance.
@@ -100,6 +102,9 @@ class FastGradientMethod(EvasionAttack):
                                If of type `SummaryWriter` apply provided custom summary writer.
                                Use hierarchical folder structure to compare between runs easily. e.g. pass in
                                ‘runs/exp1’, ‘runs/exp2’, etc. for each new experiment to compare across them.
+        :param in_place: Compute the gradient normalisation, the perturbation step, the clipping and the projection in
+                         reused float32 work buffers instead of allocating new arrays in every step. This reduces the
+                         peak memory and speeds up attacks on large batches. Inputs are cast to float32.
         """
         super().__init__(estimator=estimator, summary_writer=summary_writer)
         self.norm = norm
@@ -109,11 +114,13 @@ class FastGradientMethod(EvasionAttack):
         self.num_random_init = num_random_init
         self.batch_size = batch_size
         self.minimal = minimal
+        self.in_place = in_place
         self._project = True
         FastGradientMethod._check_params(self)
 
         self._batch_id = 0
         self._i_max_iter = 0
+        self._buffers: Dict[str, np.ndarray] = {}
 
     def _check_compatibility_input_and_eps(self, x: np.ndarray):
         """
@@ -154,7 +161,10 @@ class FastGradientMethod(EvasionAttack):
                     mask_batch = mask[batch_index_1:batch_index_2]
 
             # Get perturbation
-            perturbation = self._compute_perturbation(batch, batch_labels, mask_batch)
+            in_place = self.in_place and x.dtype != object
+            perturbation = self._compute_perturbation(
+                batch, batch_labels, mask_batch, out=self._get_buffer("grad", batch.shape) if in_place else None
+            )
 
             # Get current predictions
             active_indices = np.arange(len(batch))
@@ -177,7 +187,12 @@ class FastGradientMethod(EvasionAttack):
 
             while active_indices.size > 0 and partial_stop_condition:
                 # Adversarial crafting
-                current_x = self._apply_perturbation(x[batch_index_1:batch_index_2], perturbation, current_eps)
+                current_x = self._apply_perturbation(
+                    x[batch_index_1:batch_index_2],
+                    perturbation,
+                    current_eps,
+                    out=self._get_buffer("x", batch.shape) if in_place else None,
+                )
 
                 # Update
                 batch[active_indices] = current_x[active_indices]
@@ -330,6 +345,9 @@ class FastGradientMethod(EvasionAttack):
         if self.summary_writer is not None:
             self.summary_writer.reset()
 
+        # Release the work buffers
+        self._buffers = {}
+
         return adv_x_best
 
     def _check_params(self) -> None:
@@ -383,6 +401,9 @@ class FastGradientMethod(EvasionAttack):
         if not isinstance(self.minimal, bool):
             raise ValueError("The flag `minimal` has to be of type bool.")
 
+        if not isinstance(self.in_place, bool):
+            raise ValueError("The flag `in_place` has to be of type bool.")
+
     def _compute_perturbation(
         self,
         x: np.ndarray,
@@ -390,12 +411,16 @@ class FastGradientMethod(EvasionAttack):
         mask: Optional[np.ndarray],
         decay: Optional[float] = None,
         momentum: Optional[np.ndarray] = None,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         # Pick a small scalar to avoid division by 0
         tol = 10e-8
 
         # Get gradient wrt loss; invert it if attack is targeted
-        grad = self.estimator.loss_gradient(x, y) * (1 - 2 * int(self.targeted))
+        if out is None:
+            grad = self.estimator.loss_gradient(x, y) * (1 - 2 * int(self.targeted))
+        else:
+            grad = np.multiply(self.estimator.loss_gradient(x, y), 1 - 2 * int(self.targeted), out=out)
 
         # Write summary
         if self.summary_writer is not None:  # pragma: no cover
@@ -410,6 +435,9 @@ class FastGradientMethod(EvasionAttack):
                 targeted=self.targeted,
             )
 
+        if out is not None:
+            return self._normalize_in_place(grad, mask, decay, momentum)
+
         # Check for NaN before normalisation an replace with 0
         if grad.dtype != object and np.isnan(grad).any():  # pragma: no cover
             logger.warning("Elements of the loss gradient are NaN and have been replaced with 0.0.")
@@ -464,10 +492,82 @@ class FastGradientMethod(EvasionAttack):
 
         return grad
 
+    def _normalize_in_place(
+        self,
+        grad: np.ndarray,
+        mask: Optional[np.ndarray],
+        decay: Optional[float] = None,
+        momentum: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Replace NaN, apply the mask and the momentum, and normalise the gradients in place using the work buffers.
+
+        :param grad: The loss gradients in a float32 work buffer, modified in place.
+        :param mask: An array with a mask broadcastable to `grad`.
+        :param decay: Decay factor for accumulating the velocity vector when using momentum.
+        :param momentum: The velocity vector, updated in place.
+        :return: The normalised gradients, `grad`.
+        """
+        # Pick a small scalar to avoid division by 0
+        tol = 10e-8
+        flags = self._get_buffer("flags", grad.shape, dtype=bool)
+        work = self._get_buffer("work", grad.shape)
+
+        # Check for NaN before normalisation an replace with 0
+        if np.isnan(grad, out=flags).any():  # pragma: no cover
+            logger.warning("Elements of the loss gradient are NaN and have been replaced with 0.0.")
+            np.copyto(grad, 0.0, where=flags)
+
+        # Apply mask
+        if mask is not None:
+            np.copyto(grad, 0.0, where=mask == 0.0)
+
+        if np.isinf(grad, out=flags).any():  # pragma: no cover
+            logger.info("The loss gradient array contains at least one positive or negative infinity.")
+
+        def _apply_norm(norm):
+            if norm in [np.inf, "inf"]:
+                np.sign(grad, out=grad)
+            elif norm in [1, 2]:
+                axis = tuple(range(1, grad.ndim))
+                if norm == 1:
+                    grad_norm = np.sum(np.abs(grad, out=work), axis=axis, keepdims=True)
+                else:
+                    grad_norm = np.sqrt(np.sum(np.square(grad, out=work), axis=axis, keepdims=True))
+                grad_norm += tol
+                np.divide(grad, grad_norm, out=grad)
+
+        # Add momentum
+        if decay is not None and momentum is not None:
+            _apply_norm(norm=1)
+            grad += np.multiply(momentum, decay, out=work)
+            momentum += grad
+
+        _apply_norm(self.norm)
+
+        return grad
+
     def _apply_perturbation(
-        self, x: np.ndarray, perturbation: np.ndarray, eps_step: Union[int, float, np.ndarray]
+        self,
+        x: np.ndarray,
+        perturbation: np.ndarray,
+        eps_step: Union[int, float, np.ndarray],
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
 
+        if out is not None:
+            # Compute the step in a work buffer to leave `perturbation` unchanged
+            perturbation_step = np.multiply(perturbation, eps_step, out=self._get_buffer("step", perturbation.shape))
+            flags = self._get_buffer("flags", perturbation.shape, dtype=bool)
+            np.copyto(perturbation_step, 0.0, where=np.isnan(perturbation_step, out=flags))
+
+            x = np.add(x, perturbation_step, out=out)
+            if self.estimator.clip_values is not None:
+                clip_min, clip_max = self.estimator.clip_values
+                np.clip(x, clip_min, clip_max, out=x)
+
+            return x
+
         perturbation_step = eps_step * perturbation
         if perturbation_step.dtype != object:
             perturbation_step[np.isnan(perturbation_step)] = 0
@@ -503,19 +603,37 @@ class FastGradientMethod(EvasionAttack):
         batch_id_ext: Optional[int] = None,
         decay: Optional[float] = None,
         momentum: Optional[np.ndarray] = None,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
+        """
+        Compute one step of the attack with implicit batching.
+
+        :param out: Optional float32 array of the shape of `x` to write the adversarial examples into. It can be `x`
+                    itself to update the adversarial examples in place. Only used if `in_place` is True.
+        :return: An array holding the adversarial examples.
+        """
+        in_place = self.in_place and x.dtype != object
+        if in_place:
+            x_adv = np.empty(x.shape, dtype=ART_NUMPY_DTYPE) if out is None else out
+            if x_adv is not x:
+                np.copyto(x_adv, x)
+
         if random_init:
             n = x.shape[0]
             m = np.prod(x.shape[1:]).item()
             random_perturbation = random_sphere(n, m, eps, self.norm).reshape(x.shape).astype(ART_NUMPY_DTYPE)
             if mask is not None:
                 random_perturbation = random_perturbation * (mask.astype(ART_NUMPY_DTYPE))
-            x_adv = x.astype(ART_NUMPY_DTYPE) + random_perturbation
+
+            if in_place:
+                x_adv = np.add(x_adv, random_perturbation, out=x_adv)
+            else:
+                x_adv = x.astype(ART_NUMPY_DTYPE) + random_perturbation
 
             if self.estimator.clip_values is not None:
                 clip_min, clip_max = self.estimator.clip_values
-                x_adv = np.clip(x_adv, clip_min, clip_max)
-        else:
+                x_adv = np.clip(x_adv, clip_min, clip_max, out=x_adv if in_place else None)
+        elif not in_place:
             if x.dtype == object:
                 x_adv = x.copy()
             else:
@@ -540,7 +658,14 @@ class FastGradientMethod(EvasionAttack):
                     mask_batch = mask[batch_index_1:batch_index_2]
 
             # Get perturbation
-            perturbation = self._compute_perturbation(batch, batch_labels, mask_batch, decay, momentum)
+            perturbation = self._compute_perturbation(
+                batch,
+                batch_labels,
+                mask_batch,
+                decay,
+                momentum,
+                out=self._get_buffer("grad", batch.shape) if in_place else None,
+            )
 
             batch_eps: Union[int, float, np.ndarray]
             batch_eps_step: Union[int, float, np.ndarray]
@@ -560,10 +685,20 @@ class FastGradientMethod(EvasionAttack):
                 batch_eps_step = eps_step
 
             # Apply perturbation and clip
-            x_adv[batch_index_1:batch_index_2] = self._apply_perturbation(batch, perturbation, batch_eps_step)
+            if in_place:
+                self._apply_perturbation(batch, perturbation, batch_eps_step, out=batch)
+            else:
+                x_adv[batch_index_1:batch_index_2] = self._apply_perturbation(batch, perturbation, batch_eps_step)
 
             if project:
-                if x_adv.dtype == object:
+                if in_place:
+                    # Reuse the gradient buffer, which is not needed anymore, for the perturbation
+                    x_init_batch = x_init[batch_index_1:batch_index_2]
+                    perturbation = np.subtract(batch, x_init_batch, out=perturbation)
+                    projection(perturbation, batch_eps, self.norm, out=perturbation)
+                    np.add(x_init_batch, perturbation, out=batch)
+
+                elif x_adv.dtype == object:
                     for i_sample in range(batch_index_1, batch_index_2):
                         if isinstance(batch_eps, np.ndarray) and batch_eps.shape[0] == x_adv.shape[0]:
                             perturbation = projection(
@@ -583,6 +718,22 @@ class FastGradientMethod(EvasionAttack):
 
         return x_adv
 
+    def _get_buffer(self, name: str, shape: tuple, dtype: type = ART_NUMPY_DTYPE) -> np.ndarray:
+        """
+        Get a work buffer for the in-place computations, reusing the memory of previous batches and iterations. The
+        buffer of the first batch also serves smaller batches.
+
+        :param name: The name of the buffer.
+        :param shape: The shape of the buffer.
+        :param dtype: The data type of the buffer.
+        :return: An uninitialised array of the requested shape.
+        """
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or buffer.shape[1:] != shape[1:] or buffer.shape[0] < shape[0]:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer[: shape[0]]
+
     @staticmethod
     def _get_mask(x: np.ndarray, **kwargs) -> np.ndarray:
         """
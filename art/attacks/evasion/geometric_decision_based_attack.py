@@ -28,7 +28,7 @@ from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 import numpy as np
 from tqdm.auto import trange
 
-from art.attacks.attack import EvasionAttack
+from art.attacks.attack import EvasionAttack, count_queries
 from art.config import ART_NUMPY_DTYPE
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification.classifier import ClassifierMixin
@@ -56,6 +56,7 @@ class GeoDA(EvasionAttack):
         "bin_search_tol",
         "lambda_param",
         "sigma",
+        "max_queries",
         "verbose",
     ]
 
@@ -71,6 +72,7 @@ class GeoDA(EvasionAttack):
         bin_search_tol: float = 0.1,
         lambda_param: float = 0.6,
         sigma: float = 0.0002,
+        max_queries: Optional[int] = None,
         verbose: bool = True,
     ) -> None:
         """
@@ -88,6 +90,8 @@ class GeoDA(EvasionAttack):
                              `lambda_param=1` to a uniform distribution of iterations per step.
         :param sigma: Variance of the Gaussian perturbation.
         :param targeted: Should the attack target one specific class.
+        :param max_queries: The budget of queries per sample. The attack of a sample stops once its budget is exhausted,
+                            which is checked between the steps of the attack. Unlimited if `None`.
         :param verbose: Show progress bars.
         """
         super().__init__(estimator=estimator)
@@ -101,6 +105,7 @@ class GeoDA(EvasionAttack):
         self.sigma = sigma
         self._targeted = False
 
+        self.max_queries = max_queries
         self.verbose = verbose
         self._check_params()
 
@@ -159,6 +164,7 @@ class GeoDA(EvasionAttack):
 
         return dct_basis_array
 
+    @count_queries
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples.
@@ -211,6 +217,7 @@ class GeoDA(EvasionAttack):
         for i in trange(x.shape[0], desc="GeoDA - samples", disable=not self.verbose, position=0):
             x_i = x[[i]]
             y_i = y[[i]]
+            self._attribute_queries(i)
 
             # Reset number of calls
             self.nb_calls = 0
@@ -227,6 +234,10 @@ class GeoDA(EvasionAttack):
             x_adv_i = x_i
 
             for k in trange(self.iterate, desc="GeoDA - steps", disable=not self.verbose, position=1):
+                if self._queries_exhausted():
+                    x_adv_i = x_boundary
+                    break
+
                 grad_oi, _ = self._black_grad_batch(x_boundary, self.q_opt_iter[k], self.batch_size, y_i)
                 grad = grad_oi + grad
                 x_adv_i = self._go_to_boundary(x_i, y_i, grad)
@@ -447,5 +458,8 @@ class GeoDA(EvasionAttack):
         # if not isinstance(self.targeted, bool):
         #     raise ValueError("The argument `targeted` has to be of type bool.")
 
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
+
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
@@ -53,7 +53,7 @@ import random
 import numpy as np
 
 from art.config import ART_NUMPY_DTYPE
-from art.attacks.attack import EvasionAttack
+from art.attacks.attack import EvasionAttack, count_queries
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification import ClassifierMixin
 from art.utils import compute_success, to_categorical, check_and_transform_label_format
@@ -104,6 +104,7 @@ class GRAPHITEBlackbox(EvasionAttack):
         "off_y_range",
         "blur_kernels",
         "batch_size",
+        "max_queries",
     ]
     _estimator_requirements = (BaseEstimator, ClassifierMixin)
 
@@ -131,6 +132,7 @@ class GRAPHITEBlackbox(EvasionAttack):
         off_y_range: Tuple[float, float] = (-0.03125, 0.03125),
         blur_kernels: Union[Tuple[int, int], List[int]] = (0, 3),
         batch_size: int = 64,
+        max_queries: Optional[int] = None,
     ) -> None:
         """
         Create a GRAPHITEBlackbox attack instance.
@@ -157,6 +159,8 @@ class GRAPHITEBlackbox(EvasionAttack):
         :param off_y_range: The range of the y offset (percent) in the perspective transform.
         :param blur_kernels: The kernels to blur with.
         :param batch_size: The size of the batch used by the estimator during inference.
+        :param max_queries: The budget of queries per sample. The boosting of a sample stops once its budget is
+                            exhausted, which is checked between the steps of the boosting. Unlimited if `None`.
         """
         super().__init__(estimator=classifier)
         self.noise_size = noise_size
@@ -180,9 +184,11 @@ class GRAPHITEBlackbox(EvasionAttack):
         self.off_x_range = off_x_range
         self.off_y_range = off_y_range
         self.blur_kernels = blur_kernels
+        self.max_queries = max_queries
 
         self._check_params()
 
+    @count_queries
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples and return them in an array.
@@ -259,6 +265,7 @@ class GRAPHITEBlackbox(EvasionAttack):
 
         # Generate the adversarial samples
         for i in range(x_adv.shape[0]):
+            self._attribute_queries(i)
             x_adv[i] = self._perturb(
                 x=x_adv[i],
                 y=y[i],  # type: ignore
@@ -272,6 +279,7 @@ class GRAPHITEBlackbox(EvasionAttack):
             )
 
         y = to_categorical(y, self.estimator.nb_classes)  # type: ignore
+        self._attribute_queries(np.arange(x.shape[0]))
 
         # COMPUTE SUCCESS RATE
         x_copy = np.zeros((x.shape[0], self.noise_size[1], self.noise_size[0], x.shape[3]))
@@ -822,6 +830,9 @@ class GRAPHITEBlackbox(EvasionAttack):
             if (opt_count + query_count + self.num_xforms_boost * 11) > self.num_boost_queries:
                 break
 
+            if self._queries_exhausted():
+                break
+
         adv_example, _, _ = add_noise(x, mask, 1.0, best_theta)
 
         return adv_example
@@ -894,3 +905,6 @@ class GRAPHITEBlackbox(EvasionAttack):
 
         if min(self.blur_kernels) < 0:
             raise ValueError("blur kernels must be positive.")
+
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
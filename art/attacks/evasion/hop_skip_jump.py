@@ -30,7 +30,7 @@ import numpy as np
 from tqdm.auto import tqdm
 
 from art.config import ART_NUMPY_DTYPE
-from art.attacks.attack import EvasionAttack
+from art.attacks.attack import EvasionAttack, count_queries
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification import ClassifierMixin
 from art.utils import compute_success, to_categorical, check_and_transform_label_format, get_labels_np_array
@@ -58,6 +58,7 @@ class HopSkipJump(EvasionAttack):
         "init_size",
         "curr_iter",
         "batch_size",
+        "max_queries",
         "verbose",
     ]
     _estimator_requirements = (BaseEstimator, ClassifierMixin)
@@ -72,6 +73,7 @@ class HopSkipJump(EvasionAttack):
         max_eval: int = 10000,
         init_eval: int = 100,
         init_size: int = 100,
+        max_queries: Optional[int] = None,
         verbose: bool = True,
     ) -> None:
         """
@@ -85,6 +87,8 @@ class HopSkipJump(EvasionAttack):
         :param max_eval: Maximum number of evaluations for estimating gradient.
         :param init_eval: Initial number of evaluations for estimating gradient.
         :param init_size: Maximum number of trials for initial generation of adversarial examples.
+        :param max_queries: The budget of queries per sample. The attack of a sample stops once its budget is exhausted,
+                            which is checked between the steps of the attack. Unlimited if `None`.
         :param verbose: Show progress bars.
         """
         super().__init__(estimator=classifier)
@@ -96,6 +100,7 @@ class HopSkipJump(EvasionAttack):
         self.init_size = init_size
         self.curr_iter = 0
         self.batch_size = batch_size
+        self.max_queries = max_queries
         self.verbose = verbose
         self._check_params()
         self.curr_iter = 0
@@ -106,6 +111,7 @@ class HopSkipJump(EvasionAttack):
         else:
             self.theta = 0.01 / np.prod(self.estimator.input_shape)
 
+    @count_queries
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples and return them in an array.
@@ -194,6 +200,7 @@ class HopSkipJump(EvasionAttack):
         # Generate the adversarial samples
         for ind, val in enumerate(tqdm(x_adv, desc="HopSkipJump", disable=not self.verbose)):
             self.curr_iter = start
+            self._attribute_queries(ind)
 
             if self.targeted:
                 x_adv[ind] = self._perturb(
@@ -219,6 +226,7 @@ class HopSkipJump(EvasionAttack):
                     clip_max=clip_max,
                 )
 
+        self._attribute_queries(np.arange(x.shape[0]))
         y = to_categorical(y, self.estimator.nb_classes)  # type: ignore
 
         logger.info(
@@ -306,6 +314,9 @@ class HopSkipJump(EvasionAttack):
 
             # Attack unsatisfied yet and the initial image unsatisfied
             for _ in range(self.init_size):
+                if self._queries_exhausted():
+                    break
+
                 random_img = nprd.uniform(clip_min, clip_max, size=x.shape).astype(x.dtype)
 
                 if mask is not None:
@@ -341,6 +352,9 @@ class HopSkipJump(EvasionAttack):
 
             # The initial image unsatisfied
             for _ in range(self.init_size):
+                if self._queries_exhausted():
+                    break
+
                 random_img = nprd.uniform(clip_min, clip_max, size=x.shape).astype(x.dtype)
 
                 if mask is not None:
@@ -398,6 +412,9 @@ class HopSkipJump(EvasionAttack):
 
         # Main loop to wander around the boundary
         for _ in range(self.max_iter):
+            if self._queries_exhausted():
+                break
+
             # First compute delta
             delta = self._compute_delta(
                 current_sample=current_sample,
@@ -691,5 +708,8 @@ class HopSkipJump(EvasionAttack):
         if not isinstance(self.init_size, int) or self.init_size <= 0:
             raise ValueError("The number of initial trials must be a positive integer.")
 
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
+
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
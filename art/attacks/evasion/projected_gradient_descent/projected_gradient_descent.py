@@ -72,6 +72,7 @@ class ProjectedGradientDescent(EvasionAttack):
         "random_eps",
         "summary_writer",
         "verbose",
+        "in_place",
     ]
 
     _estimator_requirements = (BaseEstimator, LossGradientsMixin)
@@ -90,6 +91,7 @@ class ProjectedGradientDescent(EvasionAttack):
         random_eps: bool = False,
         summary_writer: Union[str, bool, SummaryWriter] = False,
         verbose: bool = True,
+        in_place: bool = False,
     ):
         """
         Create a :class:`.ProjectedGradientDescent` instance.
@@ -116,6 +118,8 @@ class ProjectedGradientDescent(EvasionAttack):
                                Use hierarchical folder structure to compare between runs easily. e.g. pass in
                                ‘runs/exp1’, ‘runs/exp2’, etc. for each new experiment to compare across them.
         :param verbose: Show progress bars.
+        :param in_place: Compute the iterations in reused float32 work buffers instead of allocating new arrays in
+                         every step. Only used by the NumPy implementation.
         """
         super().__init__(estimator=estimator, summary_writer=False)
 
@@ -128,6 +132,7 @@ class ProjectedGradientDescent(EvasionAttack):
         self.batch_size = batch_size
         self.random_eps = random_eps
         self.verbose = verbose
+        self.in_place = in_place
         ProjectedGradientDescent._check_params(self)
 
         self._attack: Union[
@@ -179,6 +184,7 @@ class ProjectedGradientDescent(EvasionAttack):
                 random_eps=random_eps,
                 summary_writer=summary_writer,
                 verbose=verbose,
+                in_place=in_place,
             )
 
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
@@ -194,6 +200,9 @@ class ProjectedGradientDescent(EvasionAttack):
                      Shape needs to be broadcastable to the shape of x and can also be of the same shape as `x`. Any
                      features for which the mask is zero will not be adversarially perturbed.
         :type mask: `np.ndarray`
+        :param x_adv_init: Initial array to start the iterations from instead of `x`, for example the adversarial
+                           examples of a smaller `eps`. Same shape as `x`.
+        :type x_adv_init: `np.ndarray`
         :return: An array holding the adversarial examples.
         """
         logger.info("Creating adversarial samples.")
@@ -261,3 +270,6 @@ class ProjectedGradientDescent(EvasionAttack):
 
         if not isinstance(self.verbose, bool):
             raise ValueError("The verbose has to be a Boolean.")
+
+        if not isinstance(self.in_place, bool):
+            raise ValueError("The flag `in_place` has to be of type bool.")
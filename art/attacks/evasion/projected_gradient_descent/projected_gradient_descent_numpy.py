@@ -72,6 +72,7 @@ class ProjectedGradientDescentCommon(FastGradientMethod):
         random_eps: bool = False,
         summary_writer: Union[str, bool, SummaryWriter] = False,
         verbose: bool = True,
+        in_place: bool = False,
     ) -> None:
         """
         Create a :class:`.ProjectedGradientDescentCommon` instance.
@@ -98,6 +99,8 @@ class ProjectedGradientDescentCommon(FastGradientMethod):
                                Use hierarchical folder structure to compare between runs easily. e.g. pass in
                                ‘runs/exp1’, ‘runs/exp2’, etc. for each new experiment to compare across them.
         :param verbose: Show progress bars.
+        :param in_place: Compute the iterations in reused float32 work buffers instead of allocating new arrays in
+                         every step. This reduces the peak memory and speeds up attacks on large batches.
         """
         super().__init__(
             estimator=estimator,  # type: ignore
@@ -109,6 +112,7 @@ class ProjectedGradientDescentCommon(FastGradientMethod):
             batch_size=batch_size,
             minimal=False,
             summary_writer=summary_writer,
+            in_place=in_place,
         )
         self.decay = decay
         self.max_iter = max_iter
@@ -177,6 +181,23 @@ class ProjectedGradientDescentCommon(FastGradientMethod):
 
         return targets
 
+    @staticmethod
+    def _get_x_adv_init(x: np.ndarray, **kwargs) -> Optional[np.ndarray]:
+        """
+        Get the initial adversarial examples from the kwargs.
+
+        :param x: An array with the original inputs.
+        :param x_adv_init: Initial array to start the iterations from instead of `x`. Same shape as `x`.
+        :type x_adv_init: `np.ndarray`
+        :return: The initial adversarial examples.
+        """
+        x_adv_init = kwargs.get("x_adv_init")
+
+        if x_adv_init is not None and x_adv_init.shape != x.shape:
+            raise ValueError("The initial adversarial examples `x_adv_init` must have the same shape as `x`.")
+
+        return x_adv_init
+
     def _check_params(self) -> None:  # pragma: no cover
 
         if self.norm not in [1, 2, np.inf, "inf"]:
@@ -234,6 +255,9 @@ class ProjectedGradientDescentCommon(FastGradientMethod):
         if not isinstance(self.verbose, bool):
             raise ValueError("The verbose has to be a Boolean.")
 
+        if not isinstance(self.in_place, bool):
+            raise ValueError("The flag `in_place` has to be of type bool.")
+
 
 class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
     """
@@ -258,6 +282,7 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
         random_eps: bool = False,
         summary_writer: Union[str, bool, SummaryWriter] = False,
         verbose: bool = True,
+        in_place: bool = False,
     ) -> None:
         """
         Create a :class:`.ProjectedGradientDescentNumpy` instance.
@@ -283,6 +308,8 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
                                Use hierarchical folder structure to compare between runs easily. e.g. pass in
                                ‘runs/exp1’, ‘runs/exp2’, etc. for each new experiment to compare across them.
         :param verbose: Show progress bars.
+        :param in_place: Compute the iterations in reused float32 work buffers instead of allocating new arrays in
+                         every step. This reduces the peak memory and speeds up attacks on large batches.
         """
         if summary_writer and num_random_init > 1:
             raise ValueError("TensorBoard is not yet supported for more than 1 random restart (num_random_init>1).")
@@ -300,6 +327,7 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
             random_eps=random_eps,
             summary_writer=summary_writer,
             verbose=verbose,
+            in_place=in_place,
         )
 
         self._project = True
@@ -318,9 +346,13 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
                      Shape needs to be broadcastable to the shape of x and can also be of the same shape as `x`. Any
                      features for which the mask is zero will not be adversarially perturbed.
         :type mask: `np.ndarray`
+        :param x_adv_init: Initial array to start the iterations from instead of `x`, for example the adversarial
+                           examples of a smaller `eps`. Same shape as `x`.
+        :type x_adv_init: `np.ndarray`
         :return: An array holding the adversarial examples.
         """
         mask = self._get_mask(x, **kwargs)
+        x_adv_init = self._get_x_adv_init(x, **kwargs)
 
         # Ensure eps is broadcastable
         self._check_compatibility_input_and_eps(x=x)
@@ -352,7 +384,21 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
                         if len(mask.shape) == len(x.shape):
                             mask_batch = mask[batch_index_1:batch_index_2]
 
-                    momentum = np.zeros(batch.shape)
+                    if self.in_place:
+                        # Update a float32 copy of the batch in place in all iterations
+                        x_init_batch = self._get_buffer("x_init", batch.shape)
+                        np.copyto(x_init_batch, batch)
+                        batch = self._get_buffer("x_adv", batch.shape)
+                        if x_adv_init is None:
+                            np.copyto(batch, x_init_batch)
+                        else:
+                            np.copyto(batch, x_adv_init[batch_index_1:batch_index_2])
+                        momentum: np.ndarray = np.zeros(batch.shape, dtype=ART_NUMPY_DTYPE)
+                    else:
+                        x_init_batch = batch
+                        if x_adv_init is not None:
+                            batch = x_adv_init[batch_index_1:batch_index_2]
+                        momentum = np.zeros(batch.shape)
 
                     for i_max_iter in trange(
                         self.max_iter, desc="PGD - Iterations", leave=False, disable=not self.verbose
@@ -361,7 +407,7 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
 
                         batch = self._compute(
                             batch,
-                            x[batch_index_1:batch_index_2],
+                            x_init_batch,
                             batch_labels,
                             mask_batch,
                             self.eps,
@@ -371,12 +417,13 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
                             self._batch_id,
                             decay=self.decay,
                             momentum=momentum,
+                            out=batch if self.in_place else None,
                         )
 
                     if rand_init_num == 0:
                         # initial (and possibly only) random restart: we only have this set of
                         # adversarial examples for now
-                        adv_x[batch_index_1:batch_index_2] = np.copy(batch)
+                        adv_x[batch_index_1:batch_index_2] = batch
                     else:
                         # replace adversarial examples if they are successful
                         attack_success = compute_success_array(
@@ -409,12 +456,14 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
             targets = self._set_targets(x, y, classifier_mixin=False)
 
             # Start to compute adversarial examples
-            if x.dtype == object:
-                adv_x = x.copy()
+            x_start = x if x_adv_init is None else x_adv_init
+            if x_start.dtype == object:
+                adv_x = x_start.copy()
             else:
-                adv_x = x.astype(ART_NUMPY_DTYPE)
+                adv_x = x_start.astype(ART_NUMPY_DTYPE)
 
-            momentum = np.zeros(adv_x.shape)
+            in_place = self.in_place and adv_x.dtype != object
+            momentum = np.zeros(adv_x.shape, dtype=ART_NUMPY_DTYPE if in_place else np.float64)
 
             for i_max_iter in trange(self.max_iter, desc="PGD - Iterations", disable=not self.verbose):
                 self._i_max_iter = i_max_iter
@@ -430,9 +479,13 @@ class ProjectedGradientDescentNumpy(ProjectedGradientDescentCommon):
                     self.num_random_init > 0 and i_max_iter == 0,
                     decay=self.decay,
                     momentum=momentum,
+                    out=adv_x if in_place else None,
                 )
 
         if self.summary_writer is not None:
             self.summary_writer.reset()
 
+        # Release the work buffers
+        self._buffers = {}
+
         return adv_x
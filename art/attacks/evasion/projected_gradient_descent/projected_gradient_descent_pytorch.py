@@ -138,11 +138,15 @@ class ProjectedGradientDescentPyTorch(ProjectedGradientDescentCommon):
                      Shape needs to be broadcastable to the shape of x and can also be of the same shape as `x`. Any
                      features for which the mask is zero will not be adversarially perturbed.
         :type mask: `np.ndarray`
+        :param x_adv_init: Initial array to start the iterations from instead of `x`, for example the adversarial
+                           examples of a smaller `eps`. Same shape as `x`.
+        :type x_adv_init: `np.ndarray`
         :return: An array holding the adversarial examples.
         """
         import torch
 
         mask = self._get_mask(x, **kwargs)
+        x_adv_init = self._get_x_adv_init(x, **kwargs)
 
         # Ensure eps is broadcastable
         self._check_compatibility_input_and_eps(x=x)
@@ -215,15 +219,30 @@ class ProjectedGradientDescentPyTorch(ProjectedGradientDescentCommon):
                 batch_eps = self.eps
                 batch_eps_step = self.eps_step
 
+            if x_adv_init is None:
+                batch_adv_init = None
+            else:
+                batch_adv_init = torch.from_numpy(x_adv_init[batch_index_1:batch_index_2].astype(ART_NUMPY_DTYPE))
+
             for rand_init_num in range(max(1, self.num_random_init)):
                 if rand_init_num == 0:
                     # first iteration: use the adversarial examples as they are the only ones we have now
                     adv_x[batch_index_1:batch_index_2] = self._generate_batch(
-                        x=batch, targets=batch_labels, mask=mask_batch, eps=batch_eps, eps_step=batch_eps_step
+                        x=batch,
+                        targets=batch_labels,
+                        mask=mask_batch,
+                        eps=batch_eps,
+                        eps_step=batch_eps_step,
+                        x_adv_init=batch_adv_init,
                     )
                 else:
                     adversarial_batch = self._generate_batch(
-                        x=batch, targets=batch_labels, mask=mask_batch, eps=batch_eps, eps_step=batch_eps_step
+                        x=batch,
+                        targets=batch_labels,
+                        mask=mask_batch,
+                        eps=batch_eps,
+                        eps_step=batch_eps_step,
+                        x_adv_init=batch_adv_init,
                     )
 
                     # return the successful adversarial examples
@@ -254,6 +273,7 @@ class ProjectedGradientDescentPyTorch(ProjectedGradientDescentCommon):
         mask: "torch.Tensor",
         eps: Union[int, float, np.ndarray],
         eps_step: Union[int, float, np.ndarray],
+        x_adv_init: Optional["torch.Tensor"] = None,
     ) -> np.ndarray:
         """
         Generate a batch of adversarial samples and return them in an array.
@@ -265,13 +285,14 @@ class ProjectedGradientDescentPyTorch(ProjectedGradientDescentCommon):
                      perturbed.
         :param eps: Maximum perturbation that the attacker can introduce.
         :param eps_step: Attack step size (input variation) at each iteration.
+        :param x_adv_init: Initial adversarial examples to start the iterations from instead of `x`.
         :return: Adversarial examples.
         """
         import torch
 
         inputs = x.to(self.estimator.device)
         targets = targets.to(self.estimator.device)
-        adv_x = torch.clone(inputs)
+        adv_x = torch.clone(inputs if x_adv_init is None else x_adv_init.to(self.estimator.device))
         momentum = torch.zeros(inputs.shape).to(self.estimator.device)
 
         if mask is not None:
@@ -136,11 +136,15 @@ class ProjectedGradientDescentTensorFlowV2(ProjectedGradientDescentCommon):
                      Shape needs to be broadcastable to the shape of x and can also be of the same shape as `x`. Any
                      features for which the mask is zero will not be adversarially perturbed.
         :type mask: `np.ndarray`
+        :param x_adv_init: Initial array to start the iterations from instead of `x`, for example the adversarial
+                           examples of a smaller `eps`. Same shape as `x`.
+        :type x_adv_init: `np.ndarray`
         :return: An array holding the adversarial examples.
         """
         import tensorflow as tf
 
         mask = self._get_mask(x, **kwargs)
+        x_adv_init = self._get_x_adv_init(x, **kwargs)
 
         # Ensure eps is broadcastable
         self._check_compatibility_input_and_eps(x=x)
@@ -216,15 +220,30 @@ class ProjectedGradientDescentTensorFlowV2(ProjectedGradientDescentCommon):
                 batch_eps = self.eps
                 batch_eps_step = self.eps_step
 
+            if x_adv_init is None:
+                batch_adv_init = None
+            else:
+                batch_adv_init = tf.convert_to_tensor(x_adv_init[batch_index_1:batch_index_2].astype(ART_NUMPY_DTYPE))
+
             for rand_init_num in range(max(1, self.num_random_init)):
                 if rand_init_num == 0:
                     # first iteration: use the adversarial examples as they are the only ones we have now
                     adv_x[batch_index_1:batch_index_2] = self._generate_batch(
-                        x=batch, targets=batch_labels, mask=mask_batch, eps=batch_eps, eps_step=batch_eps_step
+                        x=batch,
+                        targets=batch_labels,
+                        mask=mask_batch,
+                        eps=batch_eps,
+                        eps_step=batch_eps_step,
+                        x_adv_init=batch_adv_init,
                     )
                 else:
                     adversarial_batch = self._generate_batch(
-                        x=batch, targets=batch_labels, mask=mask_batch, eps=batch_eps, eps_step=batch_eps_step
+                        x=batch,
+                        targets=batch_labels,
+                        mask=mask_batch,
+                        eps=batch_eps,
+                        eps_step=batch_eps_step,
+                        x_adv_init=batch_adv_init,
                     )
                     attack_success = compute_success_array(
                         self.estimator,
@@ -254,6 +273,7 @@ class ProjectedGradientDescentTensorFlowV2(ProjectedGradientDescentCommon):
         mask: "tf.Tensor",
         eps: Union[int, float, np.ndarray],
         eps_step: Union[int, float, np.ndarray],
+        x_adv_init: Optional["tf.Tensor"] = None,
     ) -> "tf.Tensor":
         """
         Generate a batch of adversarial samples and return them in an array.
@@ -265,11 +285,12 @@ class ProjectedGradientDescentTensorFlowV2(ProjectedGradientDescentCommon):
                      perturbed.
         :param eps: Maximum perturbation that the attacker can introduce.
         :param eps_step: Attack step size (input variation) at each iteration.
+        :param x_adv_init: Initial adversarial examples to start the iterations from instead of `x`.
         :return: Adversarial examples.
         """
         import tensorflow as tf
 
-        adv_x = tf.identity(x)
+        adv_x = tf.identity(x) if x_adv_init is None else tf.identity(x_adv_init)
         momentum = tf.zeros(x.shape)
 
         for i_max_iter in range(self.max_iter):
@@ -294,6 +315,7 @@ class ProjectedGradientDescentTensorFlowV2(ProjectedGradientDescentCommon):
         mask: Optional["tf.Tensor"],
         decay: Optional[float] = None,
         momentum: Optional["tf.Tensor"] = None,
+        out: Optional[np.ndarray] = None,
     ) -> "tf.Tensor":
         """
         Compute perturbations.
@@ -308,6 +330,7 @@ class ProjectedGradientDescentTensorFlowV2(ProjectedGradientDescentCommon):
                      features for which the mask is zero will not be adversarially perturbed.
         :param decay: Decay factor for accumulating the velocity vector when using momentum.
         :param momentum: An array accumulating the velocity vector in the gradient direction for MIFGSM.
+        :param out: Not used, the perturbations are new tensors.
         :return: Perturbations.
         """
         import tensorflow as tf
@@ -369,7 +392,11 @@ class ProjectedGradientDescentTensorFlowV2(ProjectedGradientDescentCommon):
         return grad
 
     def _apply_perturbation(  # pylint: disable=W0221
-        self, x: "tf.Tensor", perturbation: "tf.Tensor", eps_step: Union[int, float, np.ndarray]
+        self,
+        x: "tf.Tensor",
+        perturbation: "tf.Tensor",
+        eps_step: Union[int, float, np.ndarray],
+        out: Optional[np.ndarray] = None,
     ) -> "tf.Tensor":
         """
         Apply perturbation on examples.
@@ -377,6 +404,7 @@ class ProjectedGradientDescentTensorFlowV2(ProjectedGradientDescentCommon):
         :param x: Current adversarial examples.
         :param perturbation: Current perturbations.
         :param eps_step: Attack step size (input variation) at each iteration.
+        :param out: Not used, the adversarial examples are new tensors.
         :return: Adversarial examples.
         """
         import tensorflow as tf
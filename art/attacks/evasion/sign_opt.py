@@ -52,7 +52,7 @@ import time
 import numpy as np
 from tqdm.auto import tqdm
 
-from art.attacks.attack import EvasionAttack
+from art.attacks.attack import EvasionAttack, count_queries
 from art.config import ART_NUMPY_DTYPE
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification.classifier import ClassifierMixin
@@ -82,6 +82,7 @@ class SignOPTAttack(EvasionAttack):
         "alpha",
         "beta",
         "batch_size",
+        "max_queries",
         "verbose",
     ]
 
@@ -100,6 +101,7 @@ class SignOPTAttack(EvasionAttack):
         beta: float = 0.001,
         eval_perform: bool = False,
         batch_size: int = 64,
+        max_queries: Optional[int] = None,
         verbose: bool = False,
     ) -> None:
         """
@@ -117,6 +119,10 @@ class SignOPTAttack(EvasionAttack):
         :param alpha: The step length for line search
         :param beta: The tolerance for line search
         :param batch_size: The size of the batch used by the estimator during inference.
+        :param max_queries: The budget of queries per sample. The attack of a sample stops once its budget is exhausted,
+                            which is checked before every query. Logging the success rate of an untargeted attack
+                            uses two more queries per sample and checking the result of a targeted attack one more.
+                            Unlimited if `None`.
         :param verbose: Show detailed information
         :param eval_perform: Evaluate performance with Avg. L2 and Success Rate with randomly choosing 100 samples
         """
@@ -133,6 +139,7 @@ class SignOPTAttack(EvasionAttack):
         self.beta = beta
 
         self.batch_size = batch_size
+        self.max_queries = max_queries
         self.verbose = verbose
 
         self.eval_perform = eval_perform
@@ -145,6 +152,7 @@ class SignOPTAttack(EvasionAttack):
             self.enable_clipped = False
         self._check_params()
 
+    @count_queries
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples and return them in an array.
@@ -195,6 +203,7 @@ class SignOPTAttack(EvasionAttack):
         # Generate the adversarial samples
         counter = 0  # only do the performance tests with 100 samples
         for ind, val in enumerate(tqdm(x_adv, desc="Sign_OPT attack", disable=not self.verbose)):
+            self._attribute_queries(ind)
             if self.targeted:
                 if targets[ind] == preds[ind]:
                     if self.verbose:
@@ -219,6 +228,7 @@ class SignOPTAttack(EvasionAttack):
                 self.logs[counter] = np.linalg.norm(diff)
                 counter += 1
 
+        self._attribute_queries(np.arange(x.shape[0]))
         if self.targeted is False:
             logger.info(
                 "Success rate of Sign_OPT attack: %.2f%%",
@@ -252,6 +262,8 @@ class SignOPTAttack(EvasionAttack):
         else:
             tolerate = 1e-3
         nquery = 0
+        if self._queries_exhausted():
+            return float("inf"), nquery
         if initial_lbd > current_best:
             if (self.targeted and not self._is_label(x_0 + current_best * theta, target)) or (
                 not self.targeted and self._is_label(x_0 + current_best * theta, y_0)
@@ -265,7 +277,8 @@ class SignOPTAttack(EvasionAttack):
         lbd_hi = lbd
         lbd_lo = 0.0
 
-        while (lbd_hi - lbd_lo) > tolerate:
+        # The upper bound is always adversarial and returned once the budget is exhausted
+        while (lbd_hi - lbd_lo) > tolerate and not self._queries_exhausted():
             lbd_mid = (lbd_lo + lbd_hi) / 2.0
             nquery += 1
             if not self._is_label(x_0 + lbd_mid * theta, y_0):
@@ -304,6 +317,8 @@ class SignOPTAttack(EvasionAttack):
         """
         nquery = 0
         lbd = initial_lbd
+        if self._queries_exhausted():
+            return float("inf"), nquery
         # For targeted: we want to expand(x1.01) boundary away from targeted dataset
         # For untargeted, we want to slim(x0.99) the boundary toward the original dataset
         if (self.targeted and not self._is_label(x_0 + lbd * theta, target)) or (
@@ -312,24 +327,28 @@ class SignOPTAttack(EvasionAttack):
             lbd_lo = lbd
             lbd_hi = lbd * 1.01
             nquery += 1
+            if self._queries_exhausted():
+                return float("inf"), nquery
             while (self.targeted and not self._is_label(x_0 + lbd_hi * theta, target)) or (
                 not self.targeted and self._is_label(x_0 + lbd_hi * theta, y_0)
             ):
                 lbd_hi = lbd_hi * 1.01
                 nquery += 1
-                if lbd_hi > 20:
+                if lbd_hi > 20 or self._queries_exhausted():
                     return float("inf"), nquery
         else:
             lbd_hi = lbd
             lbd_lo = lbd * 0.99
             nquery += 1
-            while (self.targeted and self._is_label(x_0 + lbd_lo * theta, target)) or (
-                not self.targeted and not self._is_label(x_0 + lbd_lo * theta, y_0)
+            while not self._queries_exhausted() and (
+                (self.targeted and self._is_label(x_0 + lbd_lo * theta, target))
+                or (not self.targeted and not self._is_label(x_0 + lbd_lo * theta, y_0))
             ):
                 lbd_lo = lbd_lo * 0.99
                 nquery += 1
 
-        while (lbd_hi - lbd_lo) > tol:
+        # The upper bound is always adversarial and returned once the budget is exhausted
+        while (lbd_hi - lbd_lo) > tol and not self._queries_exhausted():
             lbd_mid = (lbd_lo + lbd_hi) / 2.0
             nquery += 1
             if (self.targeted and self._is_label(x_0 + lbd_mid * theta, target)) or (
@@ -384,6 +403,9 @@ class SignOPTAttack(EvasionAttack):
         queries = 0
         # use orthogonal transform
         for _ in range(self.k):  # for each u
+            if self._queries_exhausted():
+                break
+
             # Algorithm 1: Sign-OPT attack
             #     A:Randomly sample u1, . . . , uQ from a Gaussian or Uniform distribution;
             u_g = np.random.randn(*theta.shape).astype(np.float32)
@@ -402,7 +424,7 @@ class SignOPTAttack(EvasionAttack):
             queries += 1
             sign_grad += u_g * sign
 
-        sign_grad /= self.k
+        sign_grad /= max(queries, 1)
 
         return sign_grad, queries
 
@@ -436,6 +458,9 @@ class SignOPTAttack(EvasionAttack):
                 print(f"this is targeted attack, org_label={y_0}, target={target}")
             sample_count = 0
             for i, x_i in enumerate(x_init):
+                if self._queries_exhausted():
+                    break
+
                 # find a training data which label is target
                 yi_pred = self._predict_label(x_i)
                 query_count += 1
@@ -454,6 +479,9 @@ class SignOPTAttack(EvasionAttack):
                     break
         else:
             for i in range(num_directions):
+                if self._queries_exhausted():
+                    break
+
                 query_count += 1
                 theta = np.random.randn(*x_0.shape).astype(np.float32)  # gaussian distortion
                 # register adv directions
@@ -501,6 +529,9 @@ class SignOPTAttack(EvasionAttack):
             min_g2 = g_g  # current g_theta
             # new_theta = np.zeros((0, 0))
             for _ in range(15):
+                if self._queries_exhausted():
+                    break
+
                 # Algorithm 1: Sign-OPT attack
                 new_theta = x_g - alpha * sign_gradient
                 new_theta /= np.linalg.norm(new_theta)
@@ -521,6 +552,9 @@ class SignOPTAttack(EvasionAttack):
 
             if min_g2 >= g_g:  # if the above code failed for the init alpha, we then try to decrease alpha
                 for _ in range(15):
+                    if self._queries_exhausted():
+                        break
+
                     alpha = alpha * 0.25
                     new_theta = x_g - alpha * sign_gradient
                     new_theta /= np.linalg.norm(new_theta)
@@ -553,6 +587,11 @@ class SignOPTAttack(EvasionAttack):
                     print(f"query_count={query_count} > query_limit={query_limit}")
                 break
 
+            if self._queries_exhausted():
+                if self.verbose:
+                    print(f"The budget of max_queries={self.max_queries} queries is exhausted")
+                break
+
             if self.verbose and (i + 1) % 10 == 0:
                 print(f"Iteration {i+1} distortion  {g_g} num_queries {query_count}")
         timeend = time.time()
@@ -620,5 +659,8 @@ class SignOPTAttack(EvasionAttack):
         if self.beta <= 0:
             raise ValueError("The value of beta must be positive.")
 
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
+
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
@@ -29,7 +29,7 @@ import numpy as np
 from scipy.fftpack import idct
 from tqdm.auto import trange
 
-from art.attacks.attack import EvasionAttack
+from art.attacks.attack import EvasionAttack, count_queries
 from art.estimators.estimator import BaseEstimator, NeuralNetworkMixin
 from art.estimators.classification.classifier import ClassifierMixin
 from art.config import ART_NUMPY_DTYPE
@@ -57,6 +57,7 @@ class SimBA(EvasionAttack):
         "stride",
         "targeted",
         "batch_size",
+        "max_queries",
         "verbose",
     ]
 
@@ -73,6 +74,7 @@ class SimBA(EvasionAttack):
         stride: int = 1,
         targeted: bool = False,
         batch_size: int = 1,
+        max_queries: Optional[int] = None,
         verbose: bool = True,
     ):
         """
@@ -86,7 +88,10 @@ class SimBA(EvasionAttack):
         :param freq_dim: dimensionality of 2D frequency space (DCT).
         :param stride: stride for block order (DCT).
         :param targeted: perform targeted attack
-        :param batch_size: Batch size (but, batch process unavailable in this implementation)
+        :param batch_size: The number of samples attacked concurrently. The candidates of all samples of a batch are
+                           evaluated with one call to the classifier per iteration.
+        :param max_queries: The budget of queries per sample. The attack of a sample stops once its budget is exhausted,
+                            which is checked between the steps of the attack. Unlimited if `None`.
         :param verbose: Show progress bars.
         """
         super().__init__(estimator=classifier)
@@ -99,9 +104,11 @@ class SimBA(EvasionAttack):
         self.stride = stride
         self._targeted = targeted
         self.batch_size = batch_size
+        self.max_queries = max_queries
         self.verbose = verbose
         self._check_params()
 
+    @count_queries
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples and return them in an array.
@@ -110,10 +117,9 @@ class SimBA(EvasionAttack):
         :param y: An array with the true or target labels.
         :return: An array holding the adversarial examples.
         """
-        x = x.astype(ART_NUMPY_DTYPE)
-        x_adv = x.copy()
+        x_adv = x.astype(ART_NUMPY_DTYPE)
 
-        y_prob_pred = self.estimator.predict(x, batch_size=self.batch_size)
+        y_prob_pred = self.estimator.predict(x_adv, batch_size=self.batch_size)
 
         if not is_probability(y_prob_pred[0]):
             raise ValueError(
@@ -145,185 +151,159 @@ class SimBA(EvasionAttack):
         else:
             y_i = np.argmax(y, axis=1)
 
-        for i_sample in trange(x.shape[0], desc="SimBA - sample", disable=not self.verbose):
+        current_labels = np.argmax(y_prob_pred, axis=1)
+        last_probs = y_prob_pred[np.arange(x.shape[0]), y_i]
+
+        clip_min = -np.inf
+        clip_max = np.inf
+        if self.estimator.clip_values is not None:
+            clip_min, clip_max = self.estimator.clip_values
+
+        nb_batches = int(np.ceil(x.shape[0] / float(self.batch_size)))
+        for batch_id in trange(nb_batches, desc="SimBA - batches", disable=not self.verbose):
+            batch_index_1, batch_index_2 = batch_id * self.batch_size, (batch_id + 1) * self.batch_size
+            x_adv[batch_index_1:batch_index_2] = self._generate_batch(
+                x_batch=x_adv[batch_index_1:batch_index_2],
+                index=np.arange(batch_index_1, min(batch_index_2, x.shape[0])),
+                desired_labels=y_i[batch_index_1:batch_index_2],
+                current_labels=current_labels[batch_index_1:batch_index_2],
+                last_probs=last_probs[batch_index_1:batch_index_2],
+                clip_min=clip_min,
+                clip_max=clip_max,
+            )
 
-            desired_label = y_i[i_sample]
+        if self.targeted:
+            nb_success = int(np.sum(y_i == current_labels))
+        else:
+            nb_success = int(np.sum(y_i != current_labels))
+        logger.info(
+            "SimBA (%s) %s attack succeeded for %d of %d samples",
+            self.attack,
+            ["non-targeted", "targeted"][int(self.targeted)],
+            nb_success,
+            x.shape[0],
+        )
 
-            current_label = np.argmax(y_prob_pred, axis=1)[i_sample]
-            last_prob = y_prob_pred[i_sample].reshape(-1)[desired_label]
+        return x_adv
 
-            if self.estimator.channels_first:
-                nb_channels = x.shape[1]
-            else:
-                nb_channels = x.shape[3]
+    def _generate_batch(
+        self,
+        x_batch: np.ndarray,
+        index: np.ndarray,
+        desired_labels: np.ndarray,
+        current_labels: np.ndarray,
+        last_probs: np.ndarray,
+        clip_min: float,
+        clip_max: float,
+    ) -> np.ndarray:
+        """
+        Run the attack on a batch of samples concurrently. The samples of the batch step through their own orders of
+        basis vectors and the `-epsilon` and `+epsilon` candidates of all active samples are evaluated with one call to
+        the classifier. `current_labels` and `last_probs` are updated in place.
+
+        :param x_batch: A batch of original inputs, modified in place.
+        :param index: The indices of the samples of the batch in the inputs of the attack.
+        :param desired_labels: The true or target labels of the batch.
+        :param current_labels: The predicted labels of the batch.
+        :param last_probs: The predicted probabilities of the desired labels of the batch.
+        :param clip_min: Minimum value of an example.
+        :param clip_max: Maximum value of an example.
+        :return: The adversarial examples of the batch.
+        """
+        if self.estimator.channels_first:
+            nb_channels = x_batch.shape[1]
+        else:
+            nb_channels = x_batch.shape[3]
 
-            n_dims = np.prod(x[[0]].shape)
+        n_dims = int(np.prod(x_batch.shape[1:]))
 
-            if self.attack == "px":
-                if self.order == "diag":
-                    indices = self.diagonal_order(x.shape[2], nb_channels)[: self.max_iter]
-                elif self.order == "random":
-                    indices = np.random.permutation(n_dims)[: self.max_iter]
-                indices_size = len(indices)
-                while indices_size < self.max_iter:
-                    if self.order == "diag":
-                        tmp_indices = self.diagonal_order(x.shape[2], nb_channels)
-                    elif self.order == "random":
-                        tmp_indices = np.random.permutation(n_dims)
-                    indices = np.hstack((indices, tmp_indices))[: self.max_iter]
-                    indices_size = len(indices)
-            elif self.attack == "dct":
-                indices = self._block_order(x.shape[2], nb_channels, initial_size=self.freq_dim, stride=self.stride)[
-                    : self.max_iter
-                ]
-                indices_size = len(indices)
-                while indices_size < self.max_iter:
-                    tmp_indices = self._block_order(
-                        x.shape[2], nb_channels, initial_size=self.freq_dim, stride=self.stride
-                    )
-                    indices = np.hstack((indices, tmp_indices))[: self.max_iter]
-                    indices_size = len(indices)
-
-                def trans(var_z):
-                    return self._block_idct(var_z, block_size=x.shape[2])
-
-            clip_min = -np.inf
-            clip_max = np.inf
-            if self.estimator.clip_values is not None:
-                clip_min, clip_max = self.estimator.clip_values
-
-            term_flag = 1
+        # Order of the basis vectors per sample
+        indices = np.stack([self._get_indices(x_batch.shape[2], nb_channels, n_dims) for _ in range(x_batch.shape[0])])
+
+        # Increase the probability of the target label or decrease the probability of the true label
+        sign = 1.0 if self.targeted else -1.0
+
+        nb_iter = 0
+        while nb_iter < self.max_iter:
             if self.targeted:
-                if desired_label != current_label:
-                    term_flag = 0
+                active = desired_labels != current_labels
             else:
-                if desired_label == current_label:
-                    term_flag = 0
-
-            nb_iter = 0
-            while term_flag == 0 and nb_iter < self.max_iter:
-                diff = np.zeros(n_dims).astype(ART_NUMPY_DTYPE)
-                diff[indices[nb_iter]] = self.epsilon
-
-                if self.attack == "dct":
-                    left_preds = self.estimator.predict(
-                        np.clip(x[[i_sample]] - trans(diff.reshape(x[[i_sample]].shape)), clip_min, clip_max),
-                        batch_size=self.batch_size,
-                    )
-                elif self.attack == "px":
-                    left_preds = self.estimator.predict(
-                        np.clip(x[[i_sample]] - diff.reshape(x[[i_sample]].shape), clip_min, clip_max),
-                        batch_size=self.batch_size,
-                    )
-                left_prob = left_preds.reshape(-1)[desired_label]
-
-                if self.attack == "dct":
-                    right_preds = self.estimator.predict(
-                        np.clip(x[[i_sample]] + trans(diff.reshape(x[[i_sample]].shape)), clip_min, clip_max),
-                        batch_size=self.batch_size,
-                    )
-                elif self.attack == "px":
-                    right_preds = self.estimator.predict(
-                        np.clip(x[[i_sample]] + diff.reshape(x[[i_sample]].shape), clip_min, clip_max),
-                        batch_size=self.batch_size,
-                    )
-                right_prob = right_preds.reshape(-1)[desired_label]
-
-                # Use (2 * int(self.targeted) - 1) to shorten code?
-                if self.targeted:
-                    if left_prob > last_prob:
-                        if left_prob > right_prob:
-                            if self.attack == "dct":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] - trans(diff.reshape(x[[i_sample]].shape)), clip_min, clip_max
-                                )
-                            elif self.attack == "px":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] - diff.reshape(x[[i_sample]].shape), clip_min, clip_max
-                                )
-                            last_prob = left_prob
-                            current_label = np.argmax(left_preds, axis=1)[0]
-                        else:
-                            if self.attack == "dct":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] + trans(diff.reshape(x[[i_sample]].shape)), clip_min, clip_max
-                                )
-                            elif self.attack == "px":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] + diff.reshape(x[[i_sample]].shape), clip_min, clip_max
-                                )
-                            last_prob = right_prob
-                            current_label = np.argmax(right_preds, axis=1)[0]
-                    else:
-                        if right_prob > last_prob:
-                            if self.attack == "dct":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] + trans(diff.reshape(x[[i_sample]].shape)), clip_min, clip_max
-                                )
-                            elif self.attack == "px":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] + diff.reshape(x[[i_sample]].shape), clip_min, clip_max
-                                )
-                            last_prob = right_prob
-                            current_label = np.argmax(right_preds, axis=1)[0]
-                else:
-                    if left_prob < last_prob:
-                        if left_prob < right_prob:
-                            if self.attack == "dct":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] - trans(diff.reshape(x[[i_sample]].shape)), clip_min, clip_max
-                                )
-                            elif self.attack == "px":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] - diff.reshape(x[[i_sample]].shape), clip_min, clip_max
-                                )
-                            last_prob = left_prob
-                            current_label = np.argmax(left_preds, axis=1)[0]
-                        else:
-                            if self.attack == "dct":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] + trans(diff.reshape(x[[i_sample]].shape)), clip_min, clip_max
-                                )
-                            elif self.attack == "px":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] + diff.reshape(x[[i_sample]].shape), clip_min, clip_max
-                                )
-                            last_prob = right_prob
-                            current_label = np.argmax(right_preds, axis=1)[0]
-                    else:
-                        if right_prob < last_prob:
-                            if self.attack == "dct":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] + trans(diff.reshape(x[[i_sample]].shape)), clip_min, clip_max
-                                )
-                            elif self.attack == "px":
-                                x[[i_sample]] = np.clip(
-                                    x[[i_sample]] + diff.reshape(x[[i_sample]].shape), clip_min, clip_max
-                                )
-                            last_prob = right_prob
-                            current_label = np.argmax(right_preds, axis=1)[0]
-
-                if self.targeted:
-                    if desired_label == current_label:
-                        term_flag = 1
-                else:
-                    if desired_label != current_label:
-                        term_flag = 1
+                active = desired_labels == current_labels
+            active &= np.logical_not(self._queries_exhausted(index))
 
-                nb_iter = nb_iter + 1
+            i_active = np.where(active)[0]
+            n_active = i_active.shape[0]
+            if n_active == 0:
+                break
 
-            if nb_iter < self.max_iter:
-                logger.info(
-                    "SimBA (%s) %s attack succeed", self.attack, ["non-targeted", "targeted"][int(self.targeted)]
-                )
-            else:
-                logger.info(
-                    "SimBA (%s) %s attack failed", self.attack, ["non-targeted", "targeted"][int(self.targeted)]
-                )
+            diff = np.zeros((n_active, n_dims)).astype(ART_NUMPY_DTYPE)
+            diff[np.arange(n_active), indices[i_active, nb_iter]] = self.epsilon
+            diff = diff.reshape((n_active,) + x_batch.shape[1:])
+            if self.attack == "dct":
+                diff = self._block_idct(diff, block_size=x_batch.shape[2])
 
-            x_adv[i_sample] = x[i_sample]
+            x_left = np.clip(x_batch[i_active] - diff, clip_min, clip_max)
+            x_right = np.clip(x_batch[i_active] + diff, clip_min, clip_max)
 
-        return x_adv
+            self._attribute_queries(np.concatenate([index[i_active], index[i_active]]))
+            preds = self.estimator.predict(np.concatenate([x_left, x_right]), batch_size=2 * self.batch_size)
+            left_preds, right_preds = preds[:n_active], preds[n_active:]
+            left_probs = left_preds[np.arange(n_active), desired_labels[i_active]]
+            right_probs = right_preds[np.arange(n_active), desired_labels[i_active]]
+
+            # Take the better candidate if it improves the probability
+            take_left = (sign * left_probs > sign * last_probs[i_active]) & (sign * left_probs > sign * right_probs)
+            take_right = np.logical_not(take_left) & (sign * right_probs > sign * last_probs[i_active])
+
+            x_batch[i_active[take_left]] = x_left[take_left]
+            last_probs[i_active[take_left]] = left_probs[take_left]
+            current_labels[i_active[take_left]] = np.argmax(left_preds[take_left], axis=1)
+
+            x_batch[i_active[take_right]] = x_right[take_right]
+            last_probs[i_active[take_right]] = right_probs[take_right]
+            current_labels[i_active[take_right]] = np.argmax(right_preds[take_right], axis=1)
+
+            nb_iter = nb_iter + 1
+
+        return x_batch
+
+    def _get_indices(self, img_size: int, nb_channels: int, n_dims: int) -> np.ndarray:
+        """
+        Draw the order of the basis vectors of the attack of one sample.
+
+        :param img_size: image size (i.e., width or height).
+        :param nb_channels: the number of channels.
+        :param n_dims: the number of features of a sample.
+        :return: An array holding the indices of the first `max_iter` basis vectors.
+        """
+        if self.attack == "px":
+            if self.order == "diag":
+                indices = self.diagonal_order(img_size, nb_channels)[: self.max_iter]
+            elif self.order == "random":
+                indices = np.random.permutation(n_dims)[: self.max_iter]
+            else:  # pragma: no cover
+                raise ValueError(f"The order {self.order} is not supported by this implementation.")
+            indices_size = len(indices)
+            while indices_size < self.max_iter:
+                if self.order == "diag":
+                    tmp_indices = self.diagonal_order(img_size, nb_channels)
+                else:
+                    tmp_indices = np.random.permutation(n_dims)
+                indices = np.hstack((indices, tmp_indices))[: self.max_iter]
+                indices_size = len(indices)
+        elif self.attack == "dct":
+            indices = self._block_order(img_size, nb_channels, initial_size=self.freq_dim, stride=self.stride)[
+                : self.max_iter
+            ]
+            indices_size = len(indices)
+            while indices_size < self.max_iter:
+                tmp_indices = self._block_order(img_size, nb_channels, initial_size=self.freq_dim, stride=self.stride)
+                indices = np.hstack((indices, tmp_indices))[: self.max_iter]
+                indices_size = len(indices)
+        else:  # pragma: no cover
+            raise ValueError(f"The attack {self.attack} is not supported by this implementation.")
+
+        return indices
 
     def _check_params(self) -> None:
 
@@ -333,8 +313,8 @@ class SimBA(EvasionAttack):
         if self.epsilon < 0:
             raise ValueError("The overshoot parameter must not be negative.")
 
-        if self.batch_size != 1:
-            raise ValueError("The batch size `batch_size` has to be 1 in this implementation.")
+        if not isinstance(self.batch_size, int) or self.batch_size <= 0:
+            raise ValueError("The batch size `batch_size` has to be a positive integer.")
 
         if not isinstance(self.stride, int) or self.stride <= 0:
             raise ValueError("The `stride` value must be a positive integer.")
@@ -351,6 +331,9 @@ class SimBA(EvasionAttack):
         if not isinstance(self.targeted, bool):
             raise ValueError("`targeted` has to be a Boolean value.")
 
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
+
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
 
@@ -23,14 +23,13 @@ This module implements the `SquareAttack` attack.
 import bisect
 import logging
 import math
-import random
-from typing import Optional, Union, Callable, TYPE_CHECKING
+from typing import Callable, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 from tqdm.auto import trange
 
 from art.config import ART_NUMPY_DTYPE
-from art.attacks.attack import EvasionAttack
+from art.attacks.attack import EvasionAttack, count_queries
 from art.estimators.estimator import BaseEstimator, NeuralNetworkMixin
 from art.estimators.classification.classifier import ClassifierMixin
 from art.utils import check_and_transform_label_format, get_labels_np_array
@@ -57,6 +56,7 @@ class SquareAttack(EvasionAttack):
         "p_init",
         "nb_restarts",
         "batch_size",
+        "max_queries",
         "verbose",
     ]
 
@@ -73,6 +73,7 @@ class SquareAttack(EvasionAttack):
         p_init: float = 0.8,
         nb_restarts: int = 1,
         batch_size: int = 128,
+        max_queries: Optional[int] = None,
         verbose: bool = True,
     ):
         """
@@ -87,6 +88,9 @@ class SquareAttack(EvasionAttack):
         :param p_init: Initial fraction of elements.
         :param nb_restarts: Number of restarts.
         :param batch_size: Batch size for estimator evaluations.
+        :param max_queries: The budget of queries per sample. The attack of a sample stops once its budget is exhausted,
+                            which is checked between the steps of the attack. Unlimited if `None`. The queries of a
+                            custom `loss` are not counted.
         :param verbose: Show progress bars.
         """
         super().__init__(estimator=estimator)
@@ -100,6 +104,8 @@ class SquareAttack(EvasionAttack):
         else:  # pragma: no cover
             raise ValueError("No acceptable adversarial criterion available.")
 
+        # The default loss is computed from the predictions, which are then reused for the adversarial criterion
+        self._use_default_loss = loss is None
         if loss is not None:
             self.loss = loss
         elif isinstance(self.estimator, ClassifierMixin):
@@ -112,12 +118,26 @@ class SquareAttack(EvasionAttack):
         self.p_init = p_init
         self.nb_restarts = nb_restarts
         self.batch_size = batch_size
+        self.max_queries = max_queries
         self.verbose = verbose
         self._check_params()
 
+    def set_params(self, **kwargs) -> None:
+        """
+        Take in a dictionary of parameters and apply attack-specific checks before saving them as attributes.
+
+        :param kwargs: A dictionary of attack-specific parameters.
+        """
+        super().set_params(**kwargs)
+        if "loss" in kwargs:
+            self._use_default_loss = False
+
     def _get_logits_diff(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
         y_pred = self.estimator.predict(x, batch_size=self.batch_size)
+        return self._get_logits_diff_from_predictions(y_pred, y)
 
+    @staticmethod
+    def _get_logits_diff_from_predictions(y_pred: np.ndarray, y: np.ndarray) -> np.ndarray:
         logit_correct = np.take_along_axis(y_pred, np.expand_dims(np.argmax(y, axis=1), axis=1), axis=1)
         logit_highest_incorrect = np.take_along_axis(
             y_pred, np.expand_dims(np.argsort(y_pred, axis=1)[:, -2], axis=1), axis=1
@@ -125,6 +145,20 @@ class SquareAttack(EvasionAttack):
 
         return (logit_correct - logit_highest_incorrect)[:, 0]
 
+    def _get_predictions_and_loss(self, x: np.ndarray, y: np.ndarray) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """
+        Compute the loss and, if the default loss is used, the predictions of the same single query.
+
+        :param x: An array with the inputs.
+        :param y: The labels of the inputs.
+        :return: A tuple of the predictions or `None` for a custom loss, and the loss.
+        """
+        if self._use_default_loss:
+            y_pred = self.estimator.predict(x, batch_size=self.batch_size)
+            return y_pred, self._get_logits_diff_from_predictions(y_pred, y)
+
+        return None, self.loss(x, y)
+
     def _get_percentage_of_elements(self, i_iter: int) -> float:
         i_p = i_iter / self.max_iter
         intervals = [0.001, 0.005, 0.02, 0.05, 0.1, 0.2, 0.4, 0.6, 0.8]
@@ -133,6 +167,114 @@ class SquareAttack(EvasionAttack):
 
         return self.p_init * p_ratio[i_ratio]
 
+    def _get_windows(self, nb_samples: int, height: int, width: int, size: int) -> Tuple[tuple, np.ndarray]:
+        """
+        Sample the position of one square window for each sample of a batch.
+
+        :param nb_samples: Number of samples.
+        :param height: Height of the images.
+        :param width: Width of the images.
+        :param size: Side length of the windows.
+        :return: A tuple of the index selecting the windows of all samples from a batch of images as array of shape
+                 `(nb_samples, size, size, channels)`, and a boolean mask of the windows of shape
+                 `(nb_samples, height, width)`.
+        """
+        rows = np.random.randint(0, height - size, size=nb_samples)[:, np.newaxis] + np.arange(size)
+        columns = np.random.randint(0, width - size, size=nb_samples)[:, np.newaxis] + np.arange(size)
+        samples = np.arange(nb_samples)[:, np.newaxis, np.newaxis]
+        rows = rows[:, :, np.newaxis]
+        columns = columns[:, np.newaxis, :]
+
+        mask = np.zeros((nb_samples, height, width), dtype=bool)
+        mask[samples, rows, columns] = True
+
+        # Channels-first images are indexed with the advanced indices before the channel slice, which moves the channel
+        # axis of the windows last as for channels-last images
+        if self.estimator.channels_first:
+            return (samples, slice(None), rows, columns), mask
+        return (samples, rows, columns, slice(None)), mask
+
+    @staticmethod
+    def _get_perturbation(height: int) -> np.ndarray:
+        """
+        Create the square perturbation of the L2 attack of unit norm.
+
+        :param height: Side length of the square.
+        :return: The perturbation of shape `(height, height)`.
+        """
+        delta = np.zeros([height, height])
+        gaussian_perturbation = np.zeros([height // 2, height])
+
+        x_c = height // 4
+        y_c = height // 2
+
+        for i_y in range(y_c):
+            gaussian_perturbation[
+                max(x_c, 0) : min(x_c + (2 * i_y + 1), height // 2),
+                max(0, y_c) : min(y_c + (2 * i_y + 1), height),
+            ] += 1.0 / ((i_y + 1) ** 2)
+            x_c -= 1
+            y_c -= 1
+
+        gaussian_perturbation /= np.sqrt(np.sum(gaussian_perturbation ** 2))
+
+        delta[: height // 2] = gaussian_perturbation
+        delta[height // 2 : height // 2 + gaussian_perturbation.shape[0]] = -gaussian_perturbation
+
+        delta /= np.sqrt(np.sum(delta ** 2))
+
+        return delta
+
+    @staticmethod
+    def _get_random_perturbations(height: int, nb_perturbations: int) -> np.ndarray:
+        """
+        Create square perturbations of the L2 attack which are randomly transposed and negated.
+
+        :param height: Side length of the squares.
+        :param nb_perturbations: Number of perturbations.
+        :return: The perturbations of shape `(nb_perturbations, height, height)`.
+        """
+        delta = SquareAttack._get_perturbation(height)
+        transposed = np.random.random(nb_perturbations) > 0.5
+        negated = np.random.random(nb_perturbations) > 0.5
+
+        deltas = np.where(transposed[:, np.newaxis, np.newaxis], delta.T, delta)
+        deltas *= np.where(negated, -1.0, 1.0)[:, np.newaxis, np.newaxis]
+
+        return deltas
+
+    def _update_predictions(
+        self,
+        y_pred_adv: np.ndarray,
+        loss_adv: np.ndarray,
+        index: np.ndarray,
+        x_new: np.ndarray,
+        y_pred_new: Optional[np.ndarray],
+        loss_new: np.ndarray,
+        accept: np.ndarray,
+    ) -> None:
+        """
+        Update the cached predictions and losses of the adversarial examples with the accepted new samples.
+
+        :param y_pred_adv: Predictions of the adversarial examples, updated in place.
+        :param loss_adv: Losses of the adversarial examples, updated in place.
+        :param index: Indices of the new samples in the adversarial examples.
+        :param x_new: The new samples.
+        :param y_pred_new: Predictions of the new samples, or `None` if they have not been computed.
+        :param loss_new: Losses of the new samples.
+        :param accept: Boolean array of the accepted new samples.
+        """
+        if not np.any(accept):
+            return
+
+        loss_adv[index[accept]] = loss_new[accept]
+        if y_pred_new is None:
+            self._attribute_queries(index[accept])
+            y_pred_adv[index[accept]] = self.estimator.predict(x_new[accept], batch_size=self.batch_size)
+        else:
+            y_pred_adv[index[accept]] = y_pred_new[accept]
+
+    @count_queries
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples and return them in an array.
@@ -175,19 +317,31 @@ class SquareAttack(EvasionAttack):
             width = x.shape[2]
             channels = x.shape[3]
 
+        # Predictions and losses of the original inputs. The predictions and losses of the adversarial examples are
+        # updated with the values computed for the accepted samples instead of querying the estimator again.
+        y_pred_init, loss_init = self._get_predictions_and_loss(x_adv, y)
+        if y_pred_init is None:
+            y_pred_init = self.estimator.predict(x_adv, batch_size=self.batch_size)
+        y_pred_adv = y_pred_init.copy()
+        loss_adv = loss_init.copy()
+
         for _ in trange(self.nb_restarts, desc="SquareAttack - restarts", disable=not self.verbose):
 
-            # Determine correctly predicted samples
-            y_pred = self.estimator.predict(x_adv, batch_size=self.batch_size)
-            sample_is_robust = np.logical_not(self.adv_criterion(y_pred, y))
+            # Determine correctly predicted samples with remaining queries
+            sample_is_robust = np.logical_not(self.adv_criterion(y_pred_adv, y))
+            sample_is_robust &= np.logical_not(self._queries_exhausted(np.arange(x.shape[0])))
 
             if np.sum(sample_is_robust) == 0:  # pragma: no cover
                 break
 
-            # x_robust = x_adv[sample_is_robust]
-            x_robust = x[sample_is_robust]
+            # Restart the robust samples from the original inputs
+            index_robust = np.where(sample_is_robust)[0]
+            x_robust = x_adv[sample_is_robust]
+            x_robust[...] = x[sample_is_robust]
             y_robust = y[sample_is_robust]
-            sample_loss_init = self.loss(x_robust, y_robust)
+            y_pred_adv[sample_is_robust] = y_pred_init[sample_is_robust]
+            loss_adv[sample_is_robust] = loss_init[sample_is_robust]
+            sample_loss_init = loss_adv[sample_is_robust]
 
             if self.norm in [np.inf, "inf"]:
 
@@ -203,126 +357,25 @@ class SquareAttack(EvasionAttack):
                     a_max=self.estimator.clip_values[1],
                 ).astype(ART_NUMPY_DTYPE)
 
-                sample_loss_new = self.loss(x_robust_new, y_robust)
-                loss_improved = (sample_loss_new - sample_loss_init) < 0.0
-
-                x_robust[loss_improved] = x_robust_new[loss_improved]
-
-                x_adv[sample_is_robust] = x_robust
-
-                for i_iter in trange(
-                    self.max_iter, desc="SquareAttack - iterations", leave=False, disable=not self.verbose
-                ):
-
-                    percentage_of_elements = self._get_percentage_of_elements(i_iter)
-
-                    # Determine correctly predicted samples
-                    y_pred = self.estimator.predict(x_adv, batch_size=self.batch_size)
-                    sample_is_robust = np.logical_not(self.adv_criterion(y_pred, y))
-
-                    if np.sum(sample_is_robust) == 0:  # pragma: no cover
-                        break
-
-                    x_robust = x_adv[sample_is_robust]
-                    x_init = x[sample_is_robust]
-                    y_robust = y[sample_is_robust]
-
-                    sample_loss_init = self.loss(x_robust, y_robust)
-
-                    height_tile = max(int(round(math.sqrt(percentage_of_elements * height * width))), 1)
-
-                    height_mid = np.random.randint(0, height - height_tile)
-                    width_start = np.random.randint(0, width - height_tile)
-
-                    delta_new = np.zeros(self.estimator.input_shape)
-
-                    if self.estimator.channels_first:
-                        delta_new[
-                            :, height_mid : height_mid + height_tile, width_start : width_start + height_tile
-                        ] = np.random.choice([-2 * self.eps, 2 * self.eps], size=[channels, 1, 1])
-                    else:
-                        delta_new[
-                            height_mid : height_mid + height_tile, width_start : width_start + height_tile, :
-                        ] = np.random.choice([-2 * self.eps, 2 * self.eps], size=[1, 1, channels])
-
-                    x_robust_new = x_robust + delta_new
-
-                    x_robust_new = np.minimum(np.maximum(x_robust_new, x_init - self.eps), x_init + self.eps)
-
-                    x_robust_new = np.clip(
-                        x_robust_new, a_min=self.estimator.clip_values[0], a_max=self.estimator.clip_values[1]
-                    ).astype(ART_NUMPY_DTYPE)
-
-                    sample_loss_new = self.loss(x_robust_new, y_robust)
-                    loss_improved = (sample_loss_new - sample_loss_init) < 0.0
-
-                    x_robust[loss_improved] = x_robust_new[loss_improved]
-
-                    x_adv[sample_is_robust] = x_robust
-
             elif self.norm == 2:
 
                 n_tiles = 5
 
                 height_tile = height // n_tiles
 
-                def _get_perturbation(height):
-                    delta = np.zeros([height, height])
-                    gaussian_perturbation = np.zeros([height // 2, height])
-
-                    x_c = height // 4
-                    y_c = height // 2
-
-                    for i_y in range(y_c):
-                        gaussian_perturbation[
-                            max(x_c, 0) : min(x_c + (2 * i_y + 1), height // 2),
-                            max(0, y_c) : min(y_c + (2 * i_y + 1), height),
-                        ] += 1.0 / ((i_y + 1) ** 2)
-                        x_c -= 1
-                        y_c -= 1
-
-                    gaussian_perturbation /= np.sqrt(np.sum(gaussian_perturbation ** 2))
-
-                    delta[: height // 2] = gaussian_perturbation
-                    delta[height // 2 : height // 2 + gaussian_perturbation.shape[0]] = -gaussian_perturbation
-
-                    delta /= np.sqrt(np.sum(delta ** 2))
-
-                    if random.random() > 0.5:
-                        delta = np.transpose(delta)
-
-                    if random.random() > 0.5:
-                        delta = -delta
-
-                    return delta
+                # Place square perturbations with random signs per sample and channel on a grid of tiles
+                perturbations = self._get_random_perturbations(height_tile, n_tiles * n_tiles).reshape(
+                    (1, n_tiles, n_tiles, height_tile, height_tile, 1)
+                )
+                signs = np.random.choice([-1, 1], size=(x_robust.shape[0], n_tiles, n_tiles, 1, 1, channels))
+                delta_tiles = (perturbations * signs).transpose((0, 1, 3, 2, 4, 5))
+                delta_tiles = delta_tiles.reshape((x_robust.shape[0], n_tiles * height_tile, n_tiles * height_tile, -1))
 
                 delta_init = np.zeros(x_robust.shape, dtype=ART_NUMPY_DTYPE)
-
-                height_start = 0
-                for _ in range(n_tiles):
-                    width_start = 0
-                    for _ in range(n_tiles):
-                        if self.estimator.channels_first:
-                            perturbation_size = (1, 1, height_tile, height_tile)
-                            random_size = (x_robust.shape[0], channels, 1, 1)
-                        else:
-                            perturbation_size = (1, height_tile, height_tile, 1)
-                            random_size = (x_robust.shape[0], 1, 1, channels)
-
-                        perturbation = _get_perturbation(height_tile).reshape(perturbation_size) * np.random.choice(
-                            [-1, 1], size=random_size
-                        )
-
-                        if self.estimator.channels_first:
-                            delta_init[
-                                :, :, height_start : height_start + height_tile, width_start : width_start + height_tile
-                            ] += perturbation
-                        else:
-                            delta_init[
-                                :, height_start : height_start + height_tile, width_start : width_start + height_tile, :
-                            ] += perturbation
-                        width_start += height_tile
-                    height_start += height_tile
+                if self.estimator.channels_first:
+                    delta_init[:, :, : n_tiles * height_tile, : n_tiles * height_tile] = np.moveaxis(delta_tiles, 3, 1)
+                else:
+                    delta_init[:, : n_tiles * height_tile, : n_tiles * height_tile, :] = delta_tiles
 
                 x_robust_new = np.clip(
                     x_robust + delta_init / np.sqrt(np.sum(delta_init ** 2, axis=(1, 2, 3), keepdims=True)) * self.eps,
@@ -330,31 +383,54 @@ class SquareAttack(EvasionAttack):
                     self.estimator.clip_values[1],
                 )
 
-                sample_loss_new = self.loss(x_robust_new, y_robust)
-                loss_improved = (sample_loss_new - sample_loss_init) < 0.0
+            else:  # pragma: no cover
+                raise ValueError(f"The norm {self.norm} is not supported by this implementation.")
 
-                x_robust[loss_improved] = x_robust_new[loss_improved]
+            self._attribute_queries(index_robust)
+            y_pred_new, sample_loss_new = self._get_predictions_and_loss(x_robust_new, y_robust)
+            loss_improved = (sample_loss_new - sample_loss_init) < 0.0
 
-                x_adv[sample_is_robust] = x_robust
+            x_robust[loss_improved] = x_robust_new[loss_improved]
+
+            x_adv[sample_is_robust] = x_robust
+            self._update_predictions(
+                y_pred_adv, loss_adv, index_robust, x_robust_new, y_pred_new, sample_loss_new, loss_improved
+            )
+
+            for i_iter in trange(
+                self.max_iter, desc="SquareAttack - iterations", leave=False, disable=not self.verbose
+            ):
 
-                for i_iter in trange(
-                    self.max_iter, desc="SquareAttack - iterations", leave=False, disable=not self.verbose
-                ):
+                percentage_of_elements = self._get_percentage_of_elements(i_iter)
 
-                    percentage_of_elements = self._get_percentage_of_elements(i_iter)
+                # Determine correctly predicted samples with remaining queries
+                sample_is_robust = np.logical_not(self.adv_criterion(y_pred_adv, y))
+                sample_is_robust &= np.logical_not(self._queries_exhausted(np.arange(x.shape[0])))
 
-                    # Determine correctly predicted samples
-                    y_pred = self.estimator.predict(x_adv, batch_size=self.batch_size)
-                    sample_is_robust = np.logical_not(self.adv_criterion(y_pred, y))
+                if np.sum(sample_is_robust) == 0:  # pragma: no cover
+                    break
 
-                    if np.sum(sample_is_robust) == 0:  # pragma: no cover
-                        break
+                index_robust = np.where(sample_is_robust)[0]
+                x_robust = x_adv[sample_is_robust]
+                x_init = x[sample_is_robust]
+                y_robust = y[sample_is_robust]
 
-                    x_robust = x_adv[sample_is_robust]
-                    x_init = x[sample_is_robust]
-                    y_robust = y[sample_is_robust]
+                sample_loss_init = loss_adv[sample_is_robust]
+
+                if self.norm in [np.inf, "inf"]:
+
+                    height_tile = max(int(round(math.sqrt(percentage_of_elements * height * width))), 1)
+
+                    # Set a square window of each sample to the boundary of the eps-ball with random signs per channel
+                    window, _ = self._get_windows(x_robust.shape[0], height, width, height_tile)
+                    signs = np.random.choice([-self.eps, self.eps], size=(x_robust.shape[0], 1, 1, channels))
+
+                    x_robust_new = x_robust.copy()
+                    x_robust_new[window] = np.clip(
+                        x_init[window] + signs, a_min=self.estimator.clip_values[0], a_max=self.estimator.clip_values[1]
+                    )
 
-                    sample_loss_init = self.loss(x_robust, y_robust)
+                elif self.norm == 2:
 
                     delta_x_robust_init = x_robust - x_init
 
@@ -362,128 +438,34 @@ class SquareAttack(EvasionAttack):
 
                     if height_tile % 2 == 0:
                         height_tile += 1
-                    height_tile_2 = height_tile
-
-                    height_start = np.random.randint(0, height - height_tile)
-                    width_start = np.random.randint(0, width - height_tile)
-
-                    new_deltas_mask = np.zeros(x_init.shape)
-                    if self.estimator.channels_first:
-                        new_deltas_mask[
-                            :, :, height_start : height_start + height_tile, width_start : width_start + height_tile
-                        ] = 1.0
-                        w_1_norm = np.sqrt(
-                            np.sum(
-                                delta_x_robust_init[
-                                    :,
-                                    :,
-                                    height_start : height_start + height_tile,
-                                    width_start : width_start + height_tile,
-                                ]
-                                ** 2,
-                                axis=(2, 3),
-                                keepdims=True,
-                            )
-                        )
-                    else:
-                        new_deltas_mask[
-                            :, height_start : height_start + height_tile, width_start : width_start + height_tile, :
-                        ] = 1.0
-                        w_1_norm = np.sqrt(
-                            np.sum(
-                                delta_x_robust_init[
-                                    :,
-                                    height_start : height_start + height_tile,
-                                    width_start : width_start + height_tile,
-                                    :,
-                                ]
-                                ** 2,
-                                axis=(1, 2),
-                                keepdims=True,
-                            )
-                        )
-
-                    height_2_start = np.random.randint(0, height - height_tile_2)
-                    width_2_start = np.random.randint(0, width - height_tile_2)
-
-                    new_deltas_mask_2 = np.zeros(x_init.shape)
-                    if self.estimator.channels_first:
-                        new_deltas_mask_2[
-                            :,
-                            :,
-                            height_2_start : height_2_start + height_tile_2,
-                            width_2_start : width_2_start + height_tile_2,
-                        ] = 1.0
-                    else:
-                        new_deltas_mask_2[
-                            :,
-                            height_2_start : height_2_start + height_tile_2,
-                            width_2_start : width_2_start + height_tile_2,
-                            :,
-                        ] = 1.0
-
-                    norms_x_robust = np.sqrt(np.sum((x_robust - x_init) ** 2, axis=(1, 2, 3), keepdims=True))
+
+                    window, window_mask = self._get_windows(x_robust.shape[0], height, width, height_tile)
+                    window_2, window_mask_2 = self._get_windows(x_robust.shape[0], height, width, height_tile)
+
+                    delta_window = delta_x_robust_init[window]
+                    w_1_norm = np.sqrt(np.sum(delta_window ** 2, axis=(1, 2), keepdims=True))
+
+                    # Squared perturbation per pixel, summed over the channels
+                    delta_squared = np.sum(delta_x_robust_init ** 2, axis=1 if self.estimator.channels_first else 3)
+                    norms_x_robust = np.sqrt(np.sum(delta_squared, axis=(1, 2))).reshape((-1, 1, 1, 1))
                     w_norm = np.sqrt(
-                        np.sum(
-                            (delta_x_robust_init * np.maximum(new_deltas_mask, new_deltas_mask_2)) ** 2,
-                            axis=(1, 2, 3),
-                            keepdims=True,
-                        )
-                    )
+                        np.sum(delta_squared * np.logical_or(window_mask, window_mask_2), axis=(1, 2))
+                    ).reshape((-1, 1, 1, 1))
 
-                    if self.estimator.channels_first:
-                        new_deltas_size = [x_init.shape[0], channels, height_tile, height_tile]
-                        random_choice_size = [x_init.shape[0], channels, 1, 1]
-                        perturbation_size = (1, 1, height_tile, height_tile)
-                    else:
-                        new_deltas_size = [x_init.shape[0], height_tile, height_tile, channels]
-                        random_choice_size = [x_init.shape[0], 1, 1, channels]
-                        perturbation_size = (1, height_tile, height_tile, 1)
-
-                    delta_new = (
-                        np.ones(new_deltas_size)
-                        * _get_perturbation(height_tile).reshape(perturbation_size)
-                        * np.random.choice([-1, 1], size=random_choice_size)
-                    )
+                    delta_new = self._get_random_perturbations(height_tile, x_robust.shape[0])[
+                        :, :, :, np.newaxis
+                    ] * np.random.choice([-1, 1], size=(x_robust.shape[0], 1, 1, channels))
 
-                    if self.estimator.channels_first:
-                        delta_new += delta_x_robust_init[
-                            :, :, height_start : height_start + height_tile, width_start : width_start + height_tile
-                        ] / (np.maximum(1e-9, w_1_norm))
-                    else:
-                        delta_new += delta_x_robust_init[
-                            :, height_start : height_start + height_tile, width_start : width_start + height_tile, :
-                        ] / (np.maximum(1e-9, w_1_norm))
+                    delta_new += delta_window / (np.maximum(1e-9, w_1_norm))
 
-                    diff_norm = (self.eps * np.ones(delta_new.shape)) ** 2 - norms_x_robust ** 2
+                    diff_norm = self.eps ** 2 - norms_x_robust ** 2
                     diff_norm[diff_norm < 0.0] = 0.0
 
-                    if self.estimator.channels_first:
-                        delta_new /= np.sqrt(np.sum(delta_new ** 2, axis=(2, 3), keepdims=True)) * np.sqrt(
-                            diff_norm / channels + w_norm ** 2
-                        )
-                        delta_x_robust_init[
-                            :,
-                            :,
-                            height_2_start : height_2_start + height_tile_2,
-                            width_2_start : width_2_start + height_tile_2,
-                        ] = 0.0
-                        delta_x_robust_init[
-                            :, :, height_start : height_start + height_tile, width_start : width_start + height_tile
-                        ] = delta_new
-                    else:
-                        delta_new /= np.sqrt(np.sum(delta_new ** 2, axis=(1, 2), keepdims=True)) * np.sqrt(
-                            diff_norm / channels + w_norm ** 2
-                        )
-                        delta_x_robust_init[
-                            :,
-                            height_2_start : height_2_start + height_tile_2,
-                            width_2_start : width_2_start + height_tile_2,
-                            :,
-                        ] = 0.0
-                        delta_x_robust_init[
-                            :, height_start : height_start + height_tile, width_start : width_start + height_tile, :
-                        ] = delta_new
+                    delta_new /= np.sqrt(np.sum(delta_new ** 2, axis=(1, 2), keepdims=True)) * np.sqrt(
+                        diff_norm / channels + w_norm ** 2
+                    )
+                    delta_x_robust_init[window_2] = 0.0
+                    delta_x_robust_init[window] = delta_new
 
                     x_robust_new = np.clip(
                         x_init
@@ -494,12 +476,19 @@ class SquareAttack(EvasionAttack):
                         self.estimator.clip_values[1],
                     )
 
-                    sample_loss_new = self.loss(x_robust_new, y_robust)
-                    loss_improved = (sample_loss_new - sample_loss_init) < 0.0
+                else:  # pragma: no cover
+                    raise ValueError(f"The norm {self.norm} is not supported by this implementation.")
 
-                    x_robust[loss_improved] = x_robust_new[loss_improved]
+                self._attribute_queries(index_robust)
+                y_pred_new, sample_loss_new = self._get_predictions_and_loss(x_robust_new, y_robust)
+                loss_improved = (sample_loss_new - sample_loss_init) < 0.0
+
+                x_robust[loss_improved] = x_robust_new[loss_improved]
 
-                    x_adv[sample_is_robust] = x_robust
+                x_adv[sample_is_robust] = x_robust
+                self._update_predictions(
+                    y_pred_adv, loss_adv, index_robust, x_robust_new, y_pred_new, sample_loss_new, loss_improved
+                )
 
         return x_adv
 
@@ -522,5 +511,8 @@ class SquareAttack(EvasionAttack):
         if not isinstance(self.batch_size, int) or self.batch_size <= 0:
             raise ValueError("The argument batch_size has to be of type int and larger than zero.")
 
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
+
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
@@ -32,7 +32,7 @@ from scipy.ndimage import zoom
 from tqdm.auto import trange
 
 from art.config import ART_NUMPY_DTYPE
-from art.attacks.attack import EvasionAttack
+from art.attacks.attack import EvasionAttack, count_queries
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification.classifier import ClassifierMixin
 from art.utils import (
@@ -68,6 +68,7 @@ class ZooAttack(EvasionAttack):
         "nb_parallel",
         "batch_size",
         "variable_h",
+        "max_queries",
         "verbose",
     ]
     _estimator_requirements = (BaseEstimator, ClassifierMixin)
@@ -87,6 +88,7 @@ class ZooAttack(EvasionAttack):
         nb_parallel: int = 128,
         batch_size: int = 1,
         variable_h: float = 1e-4,
+        max_queries: Optional[int] = None,
         verbose: bool = True,
     ):
         """
@@ -113,6 +115,8 @@ class ZooAttack(EvasionAttack):
                encouraged for ZOO, as the algorithm already runs `nb_parallel` coordinate updates in parallel for each
                sample. The batch size is a multiplier of `nb_parallel` in terms of memory consumption.
         :param variable_h: Step size for numerical estimation of derivatives.
+        :param max_queries: The budget of queries per sample. The attack of a sample stops once its budget is exhausted,
+                            which is checked between the steps of the attack. Unlimited if `None`.
         :param verbose: Show progress bars.
         """
         super().__init__(estimator=classifier)
@@ -139,6 +143,7 @@ class ZooAttack(EvasionAttack):
         self.nb_parallel = nb_parallel
         self.batch_size = batch_size
         self.variable_h = variable_h
+        self.max_queries = max_queries
         self.verbose = verbose
         self._check_params()
 
@@ -201,6 +206,7 @@ class ZooAttack(EvasionAttack):
 
         return preds, l2dist, c_weight * loss + l2dist
 
+    @count_queries
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples and return them in an array.
@@ -233,9 +239,11 @@ class ZooAttack(EvasionAttack):
             batch_index_1, batch_index_2 = batch_id * self.batch_size, (batch_id + 1) * self.batch_size
             x_batch = x[batch_index_1:batch_index_2]
             y_batch = y[batch_index_1:batch_index_2]
+            self._attribute_queries(np.arange(batch_index_1, batch_index_1 + x_batch.shape[0]))
             res = self._generate_batch(x_batch, y_batch)
             x_adv_list.append(res)
         x_adv = np.vstack(x_adv_list)
+        self._attribute_queries(np.arange(x.shape[0]))
 
         # Apply clip
         if self.estimator.clip_values is not None:
@@ -269,6 +277,10 @@ class ZooAttack(EvasionAttack):
 
         # Start with a binary search
         for bss in range(self.binary_search_steps):
+            # All samples of a batch use the same number of queries
+            if np.all(self._queries_exhausted()):
+                break
+
             logger.debug(
                 "Binary search step %i out of %i (c_mean==%f)",
                 bss,
@@ -376,6 +388,9 @@ class ZooAttack(EvasionAttack):
         best_attack = np.array([x_adv[i] for i in range(x_adv.shape[0])])
 
         for iter_ in range(self.max_iter):
+            if np.all(self._queries_exhausted()):
+                break
+
             logger.debug("Iteration step %i out of %i", iter_, self.max_iter)
 
             # Upscaling for very large number of iterations
@@ -677,5 +692,8 @@ class ZooAttack(EvasionAttack):
         if not isinstance(self.batch_size, int) or self.batch_size < 1:
             raise ValueError("The batch size must be an integer greater than zero.")
 
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
+
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
@@ -1,6 +1,20 @@
 """
 Module providing extraction attacks under a common interface.
 """
-from art.attacks.extraction.functionally_equivalent_extraction import FunctionallyEquivalentExtraction
-from art.attacks.extraction.copycat_cnn import CopycatCNN
-from art.attacks.extraction.knockoff_nets import KnockoffNets
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.attacks.extraction.functionally_equivalent_extraction import FunctionallyEquivalentExtraction
+    from art.attacks.extraction.copycat_cnn import CopycatCNN
+    from art.attacks.extraction.knockoff_nets import KnockoffNets
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.attacks.extraction.functionally_equivalent_extraction": ["FunctionallyEquivalentExtraction"],
+        "art.attacks.extraction.copycat_cnn": ["CopycatCNN"],
+        "art.attacks.extraction.knockoff_nets": ["KnockoffNets"],
+    },
+)
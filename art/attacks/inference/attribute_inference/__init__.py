@@ -1,11 +1,30 @@
 """
 Module providing attribute inference attacks.
 """
-from art.attacks.inference.attribute_inference.black_box import AttributeInferenceBlackBox
-from art.attacks.inference.attribute_inference.baseline import AttributeInferenceBaseline
-from art.attacks.inference.attribute_inference.true_label_baseline import AttributeInferenceBaselineTrueLabel
-from art.attacks.inference.attribute_inference.white_box_decision_tree import AttributeInferenceWhiteBoxDecisionTree
-from art.attacks.inference.attribute_inference.white_box_lifestyle_decision_tree import (
-    AttributeInferenceWhiteBoxLifestyleDecisionTree,
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.attacks.inference.attribute_inference.black_box import AttributeInferenceBlackBox
+    from art.attacks.inference.attribute_inference.baseline import AttributeInferenceBaseline
+    from art.attacks.inference.attribute_inference.true_label_baseline import AttributeInferenceBaselineTrueLabel
+    from art.attacks.inference.attribute_inference.white_box_decision_tree import AttributeInferenceWhiteBoxDecisionTree
+    from art.attacks.inference.attribute_inference.white_box_lifestyle_decision_tree import (
+        AttributeInferenceWhiteBoxLifestyleDecisionTree,
+    )
+    from art.attacks.inference.attribute_inference.meminf_based import AttributeInferenceMembership
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.attacks.inference.attribute_inference.black_box": ["AttributeInferenceBlackBox"],
+        "art.attacks.inference.attribute_inference.baseline": ["AttributeInferenceBaseline"],
+        "art.attacks.inference.attribute_inference.true_label_baseline": ["AttributeInferenceBaselineTrueLabel"],
+        "art.attacks.inference.attribute_inference.white_box_decision_tree": ["AttributeInferenceWhiteBoxDecisionTree"],
+        "art.attacks.inference.attribute_inference.white_box_lifestyle_decision_tree": [
+            "AttributeInferenceWhiteBoxLifestyleDecisionTree"
+        ],
+        "art.attacks.inference.attribute_inference.meminf_based": ["AttributeInferenceMembership"],
+    },
 )
-from art.attacks.inference.attribute_inference.meminf_based import AttributeInferenceMembership
@@ -22,15 +22,22 @@ This module implements membership inference attacks.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import hashlib
+import logging
 import math
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
-from typing import Callable, Tuple, TYPE_CHECKING, List, Optional, Sequence
+from typing import Any, Callable, Tuple, TYPE_CHECKING, List, Optional, Sequence
 
 import numpy as np
 
 if TYPE_CHECKING:
     from art.utils import CLASSIFIER_TYPE, CLONABLE
 
+logger = logging.getLogger(__name__)
+
 
 class ShadowModels:
     """
@@ -44,6 +51,9 @@ class ShadowModels:
         num_shadow_models: int = 3,
         disjoint_datasets=False,
         random_state=None,
+        parallel: Optional[str] = None,
+        nb_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initializes shadow models using the provided template.
@@ -55,7 +65,30 @@ class ShadowModels:
         :param disjoint_datasets: A boolean indicating whether the datasets used to train each shadow model should be
                                   disjoint. Default is False.
         :param random_state: Seed for the numpy default random number generator.
+        :param parallel: How to train the shadow models in parallel. Possible values: `None` to train them one after
+                         another, `"process"` to use a pool of processes, which is recommended for scikit-learn and
+                         gradient-boosting models, and `"thread"` to use a pool of threads, which is recommended for
+                         estimators releasing the GIL during training (e.g. PyTorch and TensorFlow). With processes, the
+                         dataset is shared with the workers through shared memory.
+        :param nb_workers: Number of parallel workers. If None, the number of CPUs is used.
+        :param cache_dir: If provided, trained shadow models are stored in this directory, keyed by the template and the
+                          training split of each shadow model, and loaded instead of being retrained when available.
+                          The parameters of the template must be plain values, arrays, preprocessing operations or
+                          scikit-learn models, which excludes for example PyTorch and TensorFlow models.
         """
+        if parallel not in [None, "process", "thread"]:
+            raise ValueError('The argument `parallel` has to be either None, "process" or "thread".')
+        if nb_workers is not None and (not isinstance(nb_workers, int) or nb_workers < 1):
+            raise ValueError("The number of workers must be an integer greater than zero.")
+        self.parallel = parallel
+        self.nb_workers = nb_workers
+        self.cache_dir = cache_dir
+
+        if cache_dir is not None:
+            try:
+                _get_cache_key(shadow_model_template.get_params())
+            except TypeError as error:
+                raise ValueError(f"The shadow models cannot be cached: {error}") from error
 
         self._shadow_models = [shadow_model_template.clone_for_refitting() for _ in range(num_shadow_models)]
         self._shadow_models_train_sets: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [None] * num_shadow_models
@@ -93,6 +126,53 @@ class ShadowModels:
         else:
             shadow_dataset_size = len(x)
 
+        # Split the dataset for every model
+        splits = []
+        for i in range(len(self._shadow_models)):
+            if self._disjoint_datasets:
+                member_indexes = np.arange(
+                    shadow_dataset_size * i, shadow_dataset_size * i + int(member_ratio * shadow_dataset_size)
+                )
+                non_member_indexes = np.arange(
+                    shadow_dataset_size * i + int(member_ratio * shadow_dataset_size), shadow_dataset_size * (i + 1)
+                )
+            else:
+                member_indexes = self._rng.choice(len(x) - 1, int(len(x) * member_ratio), replace=False)
+                non_member_indexes = np.setdiff1d(range(len(x) - 1), member_indexes, assume_unique=True)
+            splits.append((member_indexes, non_member_indexes))
+
+        # Train and create predictions for every model, reusing cached models where available
+        results: List[Any] = [None] * len(self._shadow_models)
+        cache_paths: List[Optional[str]] = [None] * len(self._shadow_models)
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for i, (member_indexes, non_member_indexes) in enumerate(splits):
+                cache_paths[i] = self._get_cache_path(self._shadow_models[i], x[member_indexes], y[member_indexes])
+                if os.path.isfile(cache_paths[i]):  # type: ignore
+                    with open(cache_paths[i], "rb") as cache_file:  # type: ignore
+                        shadow_model = pickle.load(cache_file)
+                    results[i] = (
+                        shadow_model,
+                        shadow_model.predict(x[member_indexes]),
+                        shadow_model.predict(x[non_member_indexes]),
+                    )
+
+        to_train = [i for i, result in enumerate(results) if result is None]
+        if self.parallel == "process" and len(to_train) > 1:
+            for i, result in zip(to_train, self._fit_shadow_models_processes(x, y, splits, to_train)):
+                results[i] = result
+        elif self.parallel == "thread" and len(to_train) > 1:
+            with ThreadPoolExecutor(max_workers=self.nb_workers) as executor:
+                futures = [
+                    executor.submit(_fit_shadow_model, self._shadow_models[i], x, y, splits[i][0], splits[i][1])
+                    for i in to_train
+                ]
+                for i, future in zip(to_train, futures):
+                    results[i] = future.result()
+        else:
+            for i in to_train:
+                results[i] = _fit_shadow_model(self._shadow_models[i], x, y, splits[i][0], splits[i][1])
+
         member_samples = []
         member_true_label = []
         member_prediction = []
@@ -100,35 +180,25 @@ class ShadowModels:
         nonmember_true_label = []
         nonmember_prediction = []
 
-        # Train and create predictions for every model
-        for i, shadow_model in enumerate(self._shadow_models):
-            if self._disjoint_datasets:
-                shadow_x = x[shadow_dataset_size * i : shadow_dataset_size * (i + 1)]
-                shadow_y = y[shadow_dataset_size * i : shadow_dataset_size * (i + 1)]
-
-                shadow_x_train = shadow_x[: int(member_ratio * shadow_dataset_size)]
-                shadow_y_train = shadow_y[: int(member_ratio * shadow_dataset_size)]
-                shadow_x_test = shadow_x[int(member_ratio * shadow_dataset_size) :]
-                shadow_y_test = shadow_y[int(member_ratio * shadow_dataset_size) :]
-            else:
-                member_indexes = self._rng.choice(len(x) - 1, int(len(x) * member_ratio), replace=False)
-                non_member_indexes = np.setdiff1d(range(len(x) - 1), member_indexes, assume_unique=True)
-                shadow_x_train = x[member_indexes]
-                shadow_y_train = y[member_indexes]
-                shadow_x_test = x[non_member_indexes]
-                shadow_y_test = y[non_member_indexes]
-
-            self._shadow_models_train_sets[i] = (shadow_x_train, shadow_y_train)
+        for i, ((member_indexes, non_member_indexes), result) in enumerate(zip(splits, results)):
+            shadow_model, shadow_member_prediction, shadow_nonmember_prediction = result
+            self._shadow_models[i] = shadow_model
+            self._shadow_models_train_sets[i] = (x[member_indexes], y[member_indexes])
 
-            shadow_model.fit(shadow_x_train, shadow_y_train)
+            if cache_paths[i] is not None and i in to_train:
+                try:
+                    with open(cache_paths[i], "wb") as cache_file:  # type: ignore
+                        pickle.dump(shadow_model, cache_file)
+                except (pickle.PicklingError, TypeError, AttributeError) as error:
+                    logger.warning("Shadow model %i could not be cached: %s", i, str(error))
 
-            member_samples.append(shadow_x_train)
-            member_true_label.append(shadow_y_train)
-            member_prediction.append(shadow_model.predict(shadow_x_train))
+            member_samples.append(x[member_indexes])
+            member_true_label.append(y[member_indexes])
+            member_prediction.append(shadow_member_prediction)
 
-            nonmember_samples.append(shadow_x_test)
-            nonmember_true_label.append(shadow_y_test)
-            nonmember_prediction.append(shadow_model.predict(shadow_x_test))
+            nonmember_samples.append(x[non_member_indexes])
+            nonmember_true_label.append(y[non_member_indexes])
+            nonmember_prediction.append(shadow_nonmember_prediction)
 
         def concat(first: np.ndarray, second: np.ndarray) -> np.ndarray:
             return np.concatenate((first, second))
@@ -146,6 +216,49 @@ class ShadowModels:
             (all_nonmember_samples, all_nonmember_true_label, all_nonmember_prediction),
         )
 
+    def _fit_shadow_models_processes(
+        self, x: np.ndarray, y: np.ndarray, splits: List[Tuple[np.ndarray, np.ndarray]], to_train: List[int]
+    ) -> List[Tuple["CLONABLE", np.ndarray, np.ndarray]]:
+        """
+        Train shadow models in a pool of processes. Numeric datasets are placed in shared memory once instead of being
+        sent to every worker.
+        """
+        import multiprocess
+        from multiprocessing.shared_memory import SharedMemory
+
+        shared_memories = []
+        try:
+            data: List[Any] = []
+            for array in (x, y):
+                if array.dtype.hasobject:
+                    data.append(array)
+                else:
+                    shared_memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+                    shared_memories.append(shared_memory)
+                    np.ndarray(array.shape, dtype=array.dtype, buffer=shared_memory.buf)[...] = array
+                    data.append((shared_memory.name, array.shape, array.dtype.str))
+
+            args = [(self._shadow_models[i], data[0], data[1], splits[i][0], splits[i][1]) for i in to_train]
+            with multiprocess.get_context("spawn").Pool(self.nb_workers) as pool:
+                # Results come back in the order that they were issued
+                return pool.starmap(_fit_shadow_model_shared, args)
+        finally:
+            for shared_memory in shared_memories:
+                shared_memory.close()
+                shared_memory.unlink()
+
+    def _get_cache_path(self, shadow_model: "CLONABLE", x_train: np.ndarray, y_train: np.ndarray) -> str:
+        """
+        Get the path of the cached shadow model trained from the template of `shadow_model` on the given split.
+        """
+        key = hashlib.sha256()
+        key.update(type(shadow_model).__name__.encode())
+        key.update(_get_cache_key(shadow_model.get_params()).encode())
+        for array in (x_train, y_train):
+            key.update(str((array.shape, array.dtype.str)).encode())
+            key.update(pickle.dumps(array) if array.dtype.hasobject else np.ascontiguousarray(array).tobytes())
+        return os.path.join(self.cache_dir, f"shadow_model_{key.hexdigest()}.pkl")  # type: ignore
+
     def _default_random_record(self) -> np.ndarray:
         return self._rng.random(self._input_shape)
 
@@ -155,6 +268,16 @@ class ShadowModels:
             new_record[self._rng.integers(0, self._input_shape)] = self._rng.random()
         return new_record
 
+    def _default_randomize_features_population(self, records: np.ndarray, num_features: np.ndarray) -> np.ndarray:
+        new_records = records.reshape(len(records), -1).copy()
+        max_num_features = int(np.max(num_features))
+        feature_indices = self._rng.integers(0, new_records.shape[1], size=(len(records), max_num_features))
+        values = self._rng.random((len(records), max_num_features))
+        mask = np.arange(max_num_features)[None, :] < num_features[:, None]
+        record_indices = np.broadcast_to(np.arange(len(records))[:, None], mask.shape)
+        new_records[record_indices[mask], feature_indices[mask]] = values[mask]
+        return new_records.reshape(records.shape)
+
     def _hill_climbing_synthesis(
         self,
         target_classifier: "CLASSIFIER_TYPE",
@@ -239,6 +362,131 @@ class ShadowModels:
 
         raise RuntimeError("Failed to synthesize data record")
 
+    def _hill_climbing_synthesis_population(
+        self,
+        target_classifier: "CLASSIFIER_TYPE",
+        records_per_class: int,
+        min_confidence: float,
+        max_features_randomized: Optional[int],
+        population_size: int,
+        max_retries: int,
+        max_iterations: int = 40,
+        max_rejections: int = 3,
+        min_features_randomized: int = 1,
+        random_record_fn: Optional[Callable[[], np.ndarray]] = None,
+        randomize_features_fn: Optional[Callable[[np.ndarray, int], np.ndarray]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Population version of `_hill_climbing_synthesis`, which advances up to `population_size` independent
+        hill-climbing chains for all classes with a single call to `predict` per iteration. Chains are retired once
+        their record has been accepted or after `max_iterations` steps, and replaced by new chains for the classes
+        still missing records, with at most `max_retries` chains per requested record.
+
+        :param target_classifier: The classifier to synthesize data from.
+        :param records_per_class: The number of records to synthesize for each class.
+        :param min_confidence: The minimum confidence the classifier assigns the target class for the record to be
+                               accepted.
+        :param max_features_randomized: The initial amount of features to randomize in each climbing step.
+        :param population_size: The maximum number of chains advanced in parallel.
+        :param max_retries: The maximum number of chains started for each requested record.
+        :param max_iterations: The maximum number of hill-climbing steps of each chain.
+        :param max_rejections: The maximum amount of rejections before a chain starts fine-tuning its record.
+        :param min_features_randomized: The minimum amount of features to randomize when fine-tuning.
+        :param random_record_fn: Callback that returns a single random record, see `_hill_climbing_synthesis`.
+        :param randomize_features_fn: Callback that randomizes features of a record, see `_hill_climbing_synthesis`.
+        :return: The synthesized records and their target classes, sorted by class.
+        """
+        nb_classes = target_classifier.nb_classes
+        nb_records = np.zeros(nb_classes, dtype=int)
+        nb_chains_left = np.full(nb_classes, records_per_class * max_retries)
+        records: List[np.ndarray] = []
+        records_class: List[np.ndarray] = []
+
+        # State of the chains in the population
+        x = np.empty((0,) + tuple(self._input_shape))
+        best_x = np.empty_like(x)
+        chain_class = np.empty(0, dtype=int)
+        best_class_confidence = np.empty(0)
+        num_rejections = np.empty(0, dtype=int)
+        k_features_randomized = np.empty(0, dtype=int)
+        num_iterations = np.empty(0, dtype=int)
+
+        while np.any(nb_records < records_per_class):
+            # Start new chains for the classes which are missing records and not already covered by running chains
+            nb_missing = records_per_class - nb_records - np.bincount(chain_class, minlength=nb_classes)
+            nb_new = np.minimum(np.maximum(nb_missing, 0), nb_chains_left)
+            new_class = np.repeat(np.arange(nb_classes), nb_new)[: population_size - len(x)]
+            if len(new_class) > 0:
+                nb_chains_left -= np.bincount(new_class, minlength=nb_classes)
+                if random_record_fn is None:
+                    new_x = self._rng.random((len(new_class),) + tuple(self._input_shape))
+                else:
+                    new_x = np.array([random_record_fn() for _ in range(len(new_class))])
+                if max_features_randomized is None:
+                    new_k = new_x.reshape(len(new_x), -1).shape[1] // 2
+                else:
+                    new_k = max_features_randomized
+                x = np.concatenate((x, new_x))
+                best_x = np.concatenate((best_x, new_x))
+                chain_class = np.concatenate((chain_class, new_class))
+                best_class_confidence = np.concatenate((best_class_confidence, np.zeros(len(new_class))))
+                num_rejections = np.concatenate((num_rejections, np.zeros(len(new_class), dtype=int)))
+                k_features_randomized = np.concatenate((k_features_randomized, np.full(len(new_class), new_k)))
+                num_iterations = np.concatenate((num_iterations, np.zeros(len(new_class), dtype=int)))
+
+            if len(x) == 0:
+                raise RuntimeError("Failed to synthesize data record")
+
+            y = target_classifier.predict(x.reshape(len(x), -1))
+            class_confidence = y[np.arange(len(x)), chain_class]
+
+            # Records accepted, sample randomly
+            accepted = class_confidence >= best_class_confidence
+            finished = (
+                accepted
+                & (class_confidence > min_confidence)
+                & (np.argmax(y, axis=1) == chain_class)
+                & (self._rng.random(len(x)) < class_confidence)
+            )
+            for finished_index in np.where(finished)[0]:
+                if nb_records[chain_class[finished_index]] < records_per_class:
+                    nb_records[chain_class[finished_index]] += 1
+                    records.append(x[finished_index])
+                    records_class.append(chain_class[finished_index])
+
+            improved = accepted & ~finished
+            best_x[improved] = x[improved]
+            best_class_confidence[improved] = class_confidence[improved]
+            num_rejections[improved] = 0
+
+            # Rejected too many times, we are probably making changes which are too large
+            num_rejections[~accepted] += 1
+            too_many_rejections = ~accepted & (num_rejections > max_rejections)
+            k_features_randomized[too_many_rejections] = np.maximum(
+                min_features_randomized, np.ceil(k_features_randomized[too_many_rejections] / 2)
+            )
+            num_rejections[too_many_rejections] = 0
+
+            # Retire finished and exhausted chains, as well as chains of classes which are complete
+            num_iterations += 1
+            alive = ~finished & (num_iterations < max_iterations) & (nb_records[chain_class] < records_per_class)
+            best_x = best_x[alive]
+            chain_class = chain_class[alive]
+            best_class_confidence = best_class_confidence[alive]
+            num_rejections = num_rejections[alive]
+            k_features_randomized = k_features_randomized[alive]
+            num_iterations = num_iterations[alive]
+
+            if len(best_x) == 0:
+                x = best_x.copy()
+            elif randomize_features_fn is None:
+                x = self._default_randomize_features_population(best_x, k_features_randomized)
+            else:
+                x = np.array([randomize_features_fn(record, k) for record, k in zip(best_x, k_features_randomized)])
+
+        order = np.argsort(records_class, kind="stable")
+        return np.array(records)[order], np.array(records_class)[order]
+
     def generate_synthetic_shadow_dataset(
         self,
         target_classifier: "CLASSIFIER_TYPE",
@@ -249,6 +497,7 @@ class ShadowModels:
         max_retries: int = 6,
         random_record_fn: Callable[[], np.ndarray] = None,
         randomize_features_fn: Callable[[np.ndarray, int], np.ndarray] = None,
+        population_size: Optional[int] = None,
     ) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray, np.ndarray]]:
         """
         Generates a shadow dataset (member and nonmember samples and their corresponding model predictions) by training
@@ -280,6 +529,9 @@ class ShadowModels:
                                       uniform values [0, 1) for each randomized feature. This default behaviour is not
                                       correct for one-hot-encoded features, and a custom callback which randomizes
                                       one-hot-encoded features should be used instead.
+        :param population_size: If provided, records are synthesized by up to `population_size` hill-climbing chains
+                                in parallel, which are advanced with a single batched call to the `predict` function
+                                of the target classifier per step, instead of one record at a time.
         :return: The shadow dataset generated. The shape is `((member_samples, true_label, model_prediction),
                  (nonmember_samples, true_label, model_prediction))`.
         """
@@ -288,6 +540,22 @@ class ShadowModels:
 
         records_per_class = dataset_size // target_classifier.nb_classes
 
+        if population_size is not None:
+            if population_size < 1:
+                raise ValueError("The population size must be an integer greater than zero.")
+            records, records_class = self._hill_climbing_synthesis_population(
+                target_classifier,
+                records_per_class,
+                min_confidence,
+                max_features_randomized=max_features_randomized,
+                population_size=population_size,
+                max_retries=max_retries,
+                random_record_fn=random_record_fn,
+                randomize_features_fn=randomize_features_fn,
+            )
+            one_hot_labels = np.eye(target_classifier.nb_classes)[records_class]
+            return self.generate_shadow_dataset(records, one_hot_labels, member_ratio)
+
         # Generate samples for each classification class
         for target_class in range(target_classifier.nb_classes):
             one_hot_label = np.zeros(target_classifier.nb_classes)
@@ -330,3 +598,82 @@ class ShadowModels:
         be returned.
         """
         return self._shadow_models_train_sets
+
+
+def _get_cache_key(value: Any) -> str:  # pylint: disable=R0911
+    """
+    Get a representation of a parameter value of a shadow model, which only depends on the value and not on the identity
+    of objects as their `repr` often does.
+
+    :param value: A plain value, an array, a sequence or a dictionary of values, a preprocessing operation or a model
+                  implementing `get_params` like the models of scikit-learn.
+    :return: The representation of the value.
+    :raises `TypeError`: If the value has no stable representation.
+    """
+    from art.defences.preprocessor.preprocessor import Preprocessor
+
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        return repr(value)
+    if isinstance(value, np.ndarray):
+        data = pickle.dumps(value) if value.dtype.hasobject else np.ascontiguousarray(value).tobytes()
+        return f"array({value.shape}, {value.dtype.str}, {hashlib.sha256(data).hexdigest()})"
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}({', '.join(_get_cache_key(item) for item in value)})"
+    if isinstance(value, dict):
+        items = sorted(value.items(), key=lambda item: str(item[0]))
+        return "{" + ", ".join(f"{key!r}: {_get_cache_key(item)}" for key, item in items) + "}"
+    if isinstance(value, type) or (callable(value) and "<" not in getattr(value, "__qualname__", "<")):
+        # Classes and functions defined at module level
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, Preprocessor):
+        return f"{type(value).__name__}({_get_cache_key({name: getattr(value, name) for name in value.params})})"
+    if hasattr(value, "get_params"):
+        return f"{type(value).__name__}({_get_cache_key(value.get_params())})"
+    raise TypeError(f"The parameter value of type {type(value)} has no stable representation for the cache key.")
+
+
+def _fit_shadow_model(
+    shadow_model: "CLONABLE",
+    x: np.ndarray,
+    y: np.ndarray,
+    member_indexes: np.ndarray,
+    non_member_indexes: np.ndarray,
+) -> Tuple["CLONABLE", np.ndarray, np.ndarray]:
+    """
+    Train a shadow model on its member samples and predict its member and non-member samples.
+    """
+    shadow_model.fit(x[member_indexes], y[member_indexes])
+    return shadow_model, shadow_model.predict(x[member_indexes]), shadow_model.predict(x[non_member_indexes])
+
+
+def _fit_shadow_model_shared(
+    shadow_model: "CLONABLE",
+    x: Any,
+    y: Any,
+    member_indexes: np.ndarray,
+    non_member_indexes: np.ndarray,
+) -> Tuple["CLONABLE", np.ndarray, np.ndarray]:
+    """
+    Version of `_fit_shadow_model` for worker processes, where `x` and `y` are either arrays or tuples `(name, shape,
+    dtype)` describing arrays in shared memory.
+    """
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+
+    shared_memories = []
+    arrays: List[np.ndarray] = []
+    for array in (x, y):
+        if isinstance(array, tuple):
+            shared_memory = SharedMemory(name=array[0])
+            # The parent process owns the block, it must not be unlinked when this worker exits
+            resource_tracker.unregister(shared_memory._name, "shared_memory")  # type: ignore  # pylint: disable=W0212
+            shared_memories.append(shared_memory)
+            arrays.append(np.ndarray(array[1], dtype=np.dtype(array[2]), buffer=shared_memory.buf))
+        else:
+            arrays.append(array)
+    try:
+        return _fit_shadow_model(shadow_model, arrays[0], arrays[1], member_indexes, non_member_indexes)
+    finally:
+        del arrays
+        for shared_memory in shared_memories:
+            shared_memory.close()
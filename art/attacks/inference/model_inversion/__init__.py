@@ -1,4 +1,16 @@
 """
 Module providing model inversion attacks.
 """
-from art.attacks.inference.model_inversion.mi_face import MIFace
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.attacks.inference.model_inversion.mi_face import MIFace
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.attacks.inference.model_inversion.mi_face": ["MIFace"],
+    },
+)
@@ -18,6 +18,8 @@
 """
 Adversarial perturbations designed to work for images.
 """
+from functools import lru_cache
+import os
 from typing import Optional, Tuple
 
 import numpy as np
@@ -130,27 +132,138 @@ def insert_image(
     :param blend: The blending factor
     :return: Backdoored image.
     """
-    from PIL import Image
-
     n_dim = len(x.shape)
-    if n_dim == 4:
-        return np.array(
+    if n_dim not in (3, 4):
+        raise ValueError(f"Invalid array shape {x.shape}")
+
+    original_dtype = x.dtype
+    data = x if n_dim == 4 else x[np.newaxis]
+    if channels_first:
+        data = np.transpose(data, (0, 2, 3, 1))
+
+    nb_images, height, width, num_channels = data.shape
+
+    if (mode, num_channels) not in (("L", 1), ("RGB", 3)):
+        res = np.array(
             [
-                insert_image(single_img, backdoor_path, channels_first, random, x_shift, y_shift, size, mode, blend)
-                for single_img in x
+                _insert_image_pil(single_img, backdoor_path, random, x_shift, y_shift, size, mode, blend)
+                for single_img in data
             ]
         )
+    else:
+        trigger, trigger_alpha = _load_trigger(
+            backdoor_path, None if size is None else tuple(size), os.path.getmtime(backdoor_path)
+        )
+        backdoor_height, backdoor_width = trigger_alpha.shape[:2]
 
-    if n_dim != 3:
-        raise ValueError(f"Invalid array shape {x.shape}")
+        if backdoor_width > width or backdoor_height > height:
+            raise ValueError("Backdoor does not fit inside original image")
+
+        if random:
+            # Draw the offsets of the images in the same order as one image at a time
+            shifts = np.array(
+                [
+                    (np.random.randint(width - backdoor_width + 1), np.random.randint(height - backdoor_height + 1))
+                    for _ in range(nb_images)
+                ]
+            ).reshape((nb_images, 2))
+            x_shifts, y_shifts = shifts[:, 0], shifts[:, 1]
+        else:
+            # Crop the trigger to the part inside the images
+            x_start, x_end = max(x_shift, 0), min(x_shift + backdoor_width, width)
+            y_start, y_end = max(y_shift, 0), min(y_shift + backdoor_height, height)
+            crop = (
+                slice(y_start - y_shift, max(y_end - y_shift, y_start - y_shift)),
+                slice(x_start - x_shift, max(x_end - x_shift, x_start - x_shift)),
+            )
+            trigger, trigger_alpha = trigger[crop], trigger_alpha[crop]
+            x_shifts, y_shifts = np.full(nb_images, x_start), np.full(nb_images, y_start)
+
+        res = (data * 255).astype(np.uint8)
+
+        # Indices of the pixels covered by the trigger in every image
+        rows = y_shifts[:, np.newaxis] + np.arange(trigger_alpha.shape[0])
+        cols = x_shifts[:, np.newaxis] + np.arange(trigger_alpha.shape[1])
+        index = (np.arange(nb_images)[:, np.newaxis, np.newaxis], rows[:, :, np.newaxis], cols[:, np.newaxis, :])
+
+        region = res[index].astype(np.int32)
+        if mode == "L":
+            region = np.repeat(region, 3, axis=-1)
+
+        # Alpha compositing of the trigger over the opaque images with the integer arithmetic of PIL
+        composite = region * (255 - trigger_alpha) + trigger * trigger_alpha
+        composite = composite * 128 + 128 * 128
+        composite = (((composite >> 8) + composite) >> 8) >> 7
+        composite = np.where(trigger_alpha == 0, region, composite)
+
+        # Blending with the float arithmetic of PIL
+        blended = region.astype(np.float32) + np.float32(blend) * (
+            composite.astype(np.float32) - region.astype(np.float32)
+        )
+        blended = np.clip(blended, 0, 255).astype(np.int32)
+
+        if mode == "L":
+            blended = (blended[..., 0:1] * 19595 + blended[..., 1:2] * 38470 + blended[..., 2:3] * 7471 + 0x8000) >> 16
+
+        res[index] = blended.astype(np.uint8)
+        res = res / 255.0
 
-    original_dtype = x.dtype
-    data = np.copy(x)
     if channels_first:
-        data = np.transpose(data, (1, 2, 0))
+        res = np.transpose(res, (0, 3, 1, 2))
 
-    height, width, num_channels = data.shape
+    if n_dim == 3:
+        res = res[0]
+
+    return res.astype(original_dtype)
 
+
+@lru_cache(maxsize=16)
+def _load_trigger(
+    backdoor_path: str, size: Optional[Tuple[int, int]], mtime: float  # pylint: disable=W0613
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load the trigger image once per path, size and modification time of the file.
+
+    :param backdoor_path: The path to the image to insert as a trigger.
+    :param size: The size the trigger image should be (height, width). `None` if no resizing necessary.
+    :param mtime: The modification time of the file, only used to reload a changed file.
+    :return: A tuple of the colours of shape `(height, width, 3)`, premultiplied by the alpha channel, and the alpha
+             channel of shape `(height, width, 1)` of the trigger after pasting it with itself as mask, as in PIL.
+    """
+    from PIL import Image
+
+    trigger = Image.open(backdoor_path).convert("RGBA")
+    if size is not None:
+        trigger = trigger.resize((size[1], size[0]))  # height and width are swapped for PIL
+
+    # Pasting the trigger onto a transparent image with itself as mask multiplies all channels by its alpha channel
+    trigger_array = np.asarray(trigger).astype(np.int32)
+    trigger_array = trigger_array * trigger_array[..., 3:4] + 128
+    trigger_array = ((trigger_array >> 8) + trigger_array) >> 8
+
+    colours, alpha = trigger_array[..., :3], trigger_array[..., 3:4]
+    colours.flags.writeable = False
+    alpha.flags.writeable = False
+    return colours, alpha
+
+
+def _insert_image_pil(
+    x: np.ndarray,
+    backdoor_path: str,
+    random: bool,
+    x_shift: int,
+    y_shift: int,
+    size: Optional[Tuple[int, int]],
+    mode: str,
+    blend: float,
+) -> np.ndarray:
+    """
+    Insert the trigger into a single image of shape HWC with PIL, for the modes without NumPy implementation.
+    """
+    from PIL import Image
+
+    data = np.copy(x)
+    height, width, num_channels = data.shape
     no_color = num_channels == 1
     orig_img = Image.new("RGBA", (width, height), 0)  # height and width are swapped for PIL
     backdoored_img = Image.new("RGBA", (width, height), 0)  # height and width are swapped for PIL
@@ -185,7 +298,4 @@ def insert_image(
     if no_color:
         res = np.expand_dims(res, 2)
 
-    if channels_first:
-        res = np.transpose(res, (2, 0, 1))
-
-    return res.astype(original_dtype)
+    return res
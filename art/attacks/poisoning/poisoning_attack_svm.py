@@ -234,18 +234,14 @@ class PoisoningAttackSVM(PoisoningAttackWhiteBox):
         zeta = np.matmul(qss_inv, support_labels)
         zeta = np.matmul(support_labels.T, zeta)
         nu_k = np.matmul(qss_inv, support_labels)
-        for x_k, y_k in zip(self.x_val, self.y_val):
-            y_k = 2 * np.expand_dims(np.argmax(y_k), axis=0) - 1
-
-            q_ks = art_model.q_submatrix(np.array([x_k]), support_vectors)
-            m_k = (1.0 / zeta) * np.matmul(q_ks, zeta * qss_inv - np.matmul(nu_k, nu_k.T)) + np.matmul(y_k, nu_k.T)
-            d_q_sc = np.fromfunction(
-                lambda i: art_model._get_kernel_gradient_sv(i, attack_point),
-                (len(support_vectors),),
-                dtype=int,
-            )
-            d_q_kc = art_model._kernel_grad(x_k, attack_point)
-            grad += (np.matmul(m_k, d_q_sc) + d_q_kc) * alpha_c
+
+        # The kernel gradients of the support vectors do not depend on the validation samples
+        d_q_sc = art_model._get_kernel_gradients_sv(attack_point)
+        y_val = 2 * np.argmax(self.y_val, axis=1) - 1
+        q_vs = art_model.q_submatrix(self.x_val, support_vectors)
+        m_v = (1.0 / zeta) * np.matmul(q_vs, zeta * qss_inv - np.matmul(nu_k, nu_k.T)) + y_val[:, None] * nu_k.T
+        d_q_vc = np.sum([art_model._kernel_grad(x_k, attack_point) for x_k in self.x_val], axis=0)
+        grad += (np.matmul(np.sum(m_v, axis=0), d_q_sc) + d_q_vc) * alpha_c
 
         return grad
 
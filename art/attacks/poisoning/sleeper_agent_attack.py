@@ -391,49 +391,17 @@ class SleeperAgentAttack(GradientMatchingAttack):
         :num_poison: Number of poisoned samples to be selected out of all x_samples.
         :return indices - Indices of samples to be poisoned.
         """
-        if isinstance(self.substitute_classifier, PyTorchClassifier):
-            import torch
-
-            device = torch.device(self.device_name)
-            grad_norms = []
-            criterion = torch.nn.CrossEntropyLoss()
-            model = classifier.model
-            model.eval()
-            differentiable_params = [p for p in classifier.model.parameters() if p.requires_grad]
-            for x, y in zip(x_samples, y_samples):
-                image = torch.tensor(x, dtype=torch.float32).float().to(device)
-                label = torch.tensor(y).to(device)
-                loss_pt = criterion(model(image.unsqueeze(0)), label.unsqueeze(0))
-                gradients = list(torch.autograd.grad(loss_pt, differentiable_params, only_inputs=True))
-                grad_norm = torch.tensor(0, dtype=torch.float32).to(device)
-                for grad in gradients:
-                    grad_norm += grad.detach().pow(2).sum()
-                grad_norms.append(grad_norm.sqrt())
-        elif isinstance(self.substitute_classifier, TensorFlowV2Classifier):
-            import tensorflow as tf
-
-            model_trainable = classifier.model.trainable
-            classifier.model.trainable = False
-            grad_norms = []
-            for i in range(len(x_samples) - 1):
-                image = tf.constant(x_samples[i : i + 1])
-                label = tf.constant(y_samples[i : i + 1])
-                with tf.GradientTape() as t:  # pylint: disable=C0103
-                    t.watch(classifier.model.weights)
-                    output = classifier.model(image, training=False)
-                    loss_tf = classifier.loss_object(label, output)  # type: ignore
-                    gradients = list(t.gradient(loss_tf, classifier.model.weights))
-                    gradients = [w for w in gradients if w is not None]
-                    grad_norm = tf.constant(0, dtype=tf.float32)
-                    for grad in gradients:
-                        grad_norm += tf.reduce_sum(tf.math.square(grad))
-                    grad_norms.append(tf.math.sqrt(grad_norm))
-            classifier.model.trainable = model_trainable
+        if isinstance(self.substitute_classifier, (PyTorchClassifier, TensorFlowV2Classifier)):
+            # The samples are normalised already and the classifier applies its normalisation
+            if isinstance(classifier.preprocessing, (StandardisationMeanStdPyTorch, StandardisationMeanStdTensorFlow)):
+                x_samples = (x_samples * classifier.preprocessing.std + classifier.preprocessing.mean).astype(
+                    x_samples.dtype
+                )
+            grad_norms = classifier.per_sample_weight_gradients(x_samples, y_samples, norm=True)  # type: ignore
         else:
             raise NotImplementedError("SleeperAgentAttack is currently implemented only for PyTorch and TensorFlowV2.")
-        indices = sorted(range(len(grad_norms)), key=lambda k: grad_norms[k])
-        indices = indices[-num_poison:]
-        return np.array(indices)  # this will get only indices for target class
+        indices = np.argsort(grad_norms, kind="stable")[-num_poison:]
+        return indices  # this will get only indices for target class
 
     # This function is responsible for applying trigger patches to the images
     # fixed - where the trigger is applied at the bottom right of the image
@@ -27,7 +27,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import abc
 import inspect
 import logging
-from typing import Any, Dict, Generator, Iterator, Optional, Tuple, Union, TYPE_CHECKING
+import queue
+import threading
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 
@@ -103,12 +105,15 @@ class NumpyDataGenerator(DataGenerator):
 
     Can be useful for applying numpy data to estimators in other frameworks
         e.g., when translating the entire numpy data to GPU tensors would cause OOM
+
+    Inputs and targets can also be provided as paths to `.npy` files, which are then memory-mapped read-only so that
+    only the samples of the current minibatch are loaded from disk.
     """
 
     def __init__(
         self,
-        x: np.ndarray,
-        y: np.ndarray,
+        x: Union[np.ndarray, str],
+        y: Union[np.ndarray, str],
         batch_size: int = 1,
         drop_remainder: bool = True,
         shuffle: bool = False,
@@ -116,12 +121,16 @@ class NumpyDataGenerator(DataGenerator):
         """
         Create a numpy data generator backed by numpy arrays
 
-        :param x: Numpy array of inputs
-        :param y: Numpy array of targets
+        :param x: Numpy array of inputs or path to a `.npy` file containing them
+        :param y: Numpy array of targets or path to a `.npy` file containing them
         :param batch_size: Size of the minibatches
         :param drop_remainder: Whether to omit the last incomplete minibatch in an epoch
         :param shuffle: Whether to shuffle the dataset for each epoch
         """
+        if isinstance(x, str):
+            x = np.load(x, mmap_mode="r")
+        if isinstance(y, str):
+            y = np.load(y, mmap_mode="r")
         x = np.asanyarray(x)
         y = np.asanyarray(y)
         try:
@@ -143,19 +152,24 @@ class NumpyDataGenerator(DataGenerator):
         self._iterator = self
         self.generator: Iterator[Any] = iter([])
 
-    def __iter__(self):
+    def batch_indices(self) -> Iterator[Union[slice, np.ndarray]]:
+        """
+        Iterate over the indices of the minibatches of one epoch, shuffled if `shuffle` is True.
+
+        :return: Iterator yielding a `slice` (no shuffling) or an index array (shuffling) per minibatch.
+        """
         if self.shuffle:
-            index = np.arange(self.size)
+            index = np.arange(len(self.x))
             np.random.shuffle(index)
             for i in range(self.batches_per_epoch):
-                batch_index = index[i * self.batch_size : (i + 1) * self.batch_size]
-                yield (self.x[batch_index], self.y[batch_index])
+                yield index[i * self.batch_size : (i + 1) * self.batch_size]
         else:
             for i in range(self.batches_per_epoch):
-                yield (
-                    self.x[i * self.batch_size : (i + 1) * self.batch_size],
-                    self.y[i * self.batch_size : (i + 1) * self.batch_size],
-                )
+                yield slice(i * self.batch_size, (i + 1) * self.batch_size)
+
+    def __iter__(self):
+        for batch_index in self.batch_indices():
+            yield (self.x[batch_index], self.y[batch_index])
 
     def get_batch(self) -> tuple:
         """
@@ -172,6 +186,176 @@ class NumpyDataGenerator(DataGenerator):
             return next(self.generator)
 
 
+class PrefetchDataGenerator(DataGenerator):
+    """
+    Wrapper for any :class:`.DataGenerator` that assembles minibatches in background threads and keeps them in a
+    bounded queue, so that batch loading overlaps with the training step consuming the previous batch.
+
+    For a wrapped :class:`.NumpyDataGenerator` the workers only draw the batch indices under a lock and gather the
+    samples concurrently, which also covers reading from memory-mapped `.npy` files, as NumPy releases the GIL while
+    copying. With `reuse_buffers=True` these samples are written into a fixed set of preallocated arrays, which are
+    recycled: a returned batch is then only valid until the next call to `get_batch`. Other generators are called
+    sequentially by the workers. With more than one worker, batches can be returned in a different order than they
+    are produced by the wrapped generator.
+    """
+
+    def __init__(
+        self,
+        generator: DataGenerator,
+        queue_size: int = 2,
+        nb_workers: int = 1,
+        reuse_buffers: bool = False,
+    ) -> None:
+        """
+        Create a prefetching wrapper around a data generator and start its worker threads.
+
+        :param generator: The data generator providing the batches.
+        :param queue_size: Maximum number of batches prepared ahead of time.
+        :param nb_workers: Number of background threads assembling batches.
+        :param reuse_buffers: Whether to write batches of a :class:`.NumpyDataGenerator` into preallocated arrays
+                              instead of allocating new arrays for every batch.
+        """
+        super().__init__(size=generator.size, batch_size=generator.batch_size)
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("The queue size must be an integer greater than zero.")
+        if not isinstance(nb_workers, int) or nb_workers < 1:
+            raise ValueError("The number of workers must be an integer greater than zero.")
+
+        self.generator = generator
+        self.queue_size = queue_size
+        self.nb_workers = nb_workers
+        self.reuse_buffers = reuse_buffers
+        self._iterator = generator.iterator
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._index_iterator: Iterator[Union[slice, np.ndarray]] = iter([])
+
+        # Buffers are only handed out for batches gathered from numpy arrays. A buffer can be held by each worker,
+        # by each slot of the queue and by the consumer of the latest batch at the same time.
+        self._free_buffers: "queue.Queue" = queue.Queue()
+        self._current_buffer: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        if reuse_buffers and isinstance(generator, NumpyDataGenerator):
+            for _ in range(queue_size + nb_workers + 1):
+                self._free_buffers.put(
+                    (
+                        np.empty((generator.batch_size,) + generator.x.shape[1:], dtype=generator.x.dtype),
+                        np.empty((generator.batch_size,) + generator.y.shape[1:], dtype=generator.y.dtype),
+                    )
+                )
+
+        self._workers: List[threading.Thread] = []
+        for _ in range(nb_workers):
+            worker = threading.Thread(target=self._work, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def get_batch(self) -> tuple:
+        """
+        Provide the next prefetched batch for training in the form of a tuple `(x, y)`. The generator will loop over
+        the data indefinitely.
+
+        :return: A tuple containing a batch of data `(x, y)`.
+        :raises `ValueError`: If the generator has been closed.
+        """
+        if self._current_buffer is not None:
+            self._free_buffers.put(self._current_buffer)
+            self._current_buffer = None
+
+        while True:
+            if self._stop.is_set():
+                raise ValueError("The prefetching data generator has been closed.")
+            try:
+                item = self._queue.get(timeout=0.1)
+                break
+            except queue.Empty:
+                continue
+
+        if isinstance(item, Exception):
+            self.close()
+            raise item
+
+        batch, self._current_buffer = item
+        return batch
+
+    def close(self) -> None:
+        """
+        Stop the worker threads. Batches that have been prefetched but not consumed are discarded.
+        """
+        self._stop.set()
+        for worker in self._workers:
+            if worker is not threading.current_thread():
+                worker.join()
+
+    def __enter__(self) -> "PrefetchDataGenerator":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _work(self) -> None:
+        try:
+            while not self._stop.is_set():
+                if isinstance(self.generator, NumpyDataGenerator):
+                    item = self._gather_numpy_batch()
+                else:
+                    with self._lock:
+                        item = (self.generator.get_batch(), None)
+
+                if item is None or not self._put(item):
+                    return
+        except Exception as exception:  # pylint: disable=W0703
+            self._put(exception)
+
+    def _put(self, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _gather_numpy_batch(self) -> Optional[Tuple[tuple, Optional[Tuple[np.ndarray, np.ndarray]]]]:
+        generator: NumpyDataGenerator = self.generator  # type: ignore
+        with self._lock:
+            try:
+                index = next(self._index_iterator)
+            except StopIteration:
+                self._index_iterator = generator.batch_indices()
+                index = next(self._index_iterator)
+
+        buffer = None
+        if self.reuse_buffers:
+            while buffer is None:
+                if self._stop.is_set():
+                    return None
+                try:
+                    buffer = self._free_buffers.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+        batch = []
+        for i, array in enumerate((generator.x, generator.y)):
+            if isinstance(index, slice):
+                source = array[index]
+                if buffer is not None:
+                    out = buffer[i][: len(source)]
+                    np.copyto(out, source)
+                    batch.append(out)
+                elif isinstance(array, np.memmap):
+                    batch.append(np.array(source))
+                else:
+                    batch.append(source)
+            elif buffer is not None:
+                batch.append(np.take(array, index, axis=0, out=buffer[i][: len(index)], mode="clip"))
+            else:
+                batch.append(np.take(array, index, axis=0))
+
+        return tuple(batch), buffer
+
+
 class KerasDataGenerator(DataGenerator):
     """
     Wrapper class on top of the Keras-native data generators. These can either be generator functions,
@@ -1,8 +1,18 @@
 """
 Module implementing multiple types of defences against adversarial attacks.
 """
-from art.defences import detector
-from art.defences import postprocessor
-from art.defences import preprocessor
-from art.defences import trainer
-from art.defences import transformer
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.defences import detector
+    from art.defences import postprocessor
+    from art.defences import preprocessor
+    from art.defences import trainer
+    from art.defences import transformer
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["detector", "postprocessor", "preprocessor", "trainer", "transformer"],
+)
@@ -1,5 +1,15 @@
 """
 Module implementing detector-based defences against adversarial attacks.
 """
-from art.defences.detector import evasion
-from art.defences.detector import poison
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.defences.detector import evasion
+    from art.defences.detector import poison
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["evasion", "poison"],
+)
@@ -1,10 +1,28 @@
 """
 Module implementing detector-based defences against poisoning attacks.
 """
-from art.defences.detector.poison.poison_filtering_defence import PoisonFilteringDefence
-from art.defences.detector.poison.ground_truth_evaluator import GroundTruthEvaluator
-from art.defences.detector.poison.activation_defence import ActivationDefence
-from art.defences.detector.poison.clustering_analyzer import ClusteringAnalyzer
-from art.defences.detector.poison.provenance_defense import ProvenanceDefense
-from art.defences.detector.poison.roni import RONIDefense
-from art.defences.detector.poison.spectral_signature_defense import SpectralSignatureDefense
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.defences.detector.poison.poison_filtering_defence import PoisonFilteringDefence
+    from art.defences.detector.poison.ground_truth_evaluator import GroundTruthEvaluator
+    from art.defences.detector.poison.activation_defence import ActivationDefence
+    from art.defences.detector.poison.clustering_analyzer import ClusteringAnalyzer
+    from art.defences.detector.poison.provenance_defense import ProvenanceDefense
+    from art.defences.detector.poison.roni import RONIDefense
+    from art.defences.detector.poison.spectral_signature_defense import SpectralSignatureDefense
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.defences.detector.poison.poison_filtering_defence": ["PoisonFilteringDefence"],
+        "art.defences.detector.poison.ground_truth_evaluator": ["GroundTruthEvaluator"],
+        "art.defences.detector.poison.activation_defence": ["ActivationDefence"],
+        "art.defences.detector.poison.clustering_analyzer": ["ClusteringAnalyzer"],
+        "art.defences.detector.poison.provenance_defense": ["ProvenanceDefense"],
+        "art.defences.detector.poison.roni": ["RONIDefense"],
+        "art.defences.detector.poison.spectral_signature_defense": ["SpectralSignatureDefense"],
+    },
+)
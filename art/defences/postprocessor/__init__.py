@@ -1,9 +1,26 @@
 """
 Module implementing postprocessing defences against adversarial attacks.
 """
-from art.defences.postprocessor.class_labels import ClassLabels
-from art.defences.postprocessor.gaussian_noise import GaussianNoise
-from art.defences.postprocessor.high_confidence import HighConfidence
-from art.defences.postprocessor.postprocessor import Postprocessor
-from art.defences.postprocessor.reverse_sigmoid import ReverseSigmoid
-from art.defences.postprocessor.rounded import Rounded
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.defences.postprocessor.class_labels import ClassLabels
+    from art.defences.postprocessor.gaussian_noise import GaussianNoise
+    from art.defences.postprocessor.high_confidence import HighConfidence
+    from art.defences.postprocessor.postprocessor import Postprocessor
+    from art.defences.postprocessor.reverse_sigmoid import ReverseSigmoid
+    from art.defences.postprocessor.rounded import Rounded
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.defences.postprocessor.class_labels": ["ClassLabels"],
+        "art.defences.postprocessor.gaussian_noise": ["GaussianNoise"],
+        "art.defences.postprocessor.high_confidence": ["HighConfidence"],
+        "art.defences.postprocessor.postprocessor": ["Postprocessor"],
+        "art.defences.postprocessor.reverse_sigmoid": ["ReverseSigmoid"],
+        "art.defences.postprocessor.rounded": ["Rounded"],
+    },
+)
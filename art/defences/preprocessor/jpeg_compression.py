@@ -26,9 +26,10 @@ This module implements the JPEG compression defence `JpegCompression`.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import logging
-from typing import Optional, Tuple, TYPE_CHECKING
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 from tqdm.auto import tqdm
@@ -58,7 +59,7 @@ class JpegCompression(Preprocessor):
         https://arxiv.org/abs/1902.06705
     """
 
-    params = ["quality", "channels_first", "clip_values", "verbose"]
+    params = ["quality", "channels_first", "clip_values", "verbose", "nb_workers"]
 
     def __init__(
         self,
@@ -68,6 +69,7 @@ class JpegCompression(Preprocessor):
         apply_fit: bool = True,
         apply_predict: bool = True,
         verbose: bool = False,
+        nb_workers: int = 1,
     ):
         """
         Create an instance of JPEG compression.
@@ -79,6 +81,8 @@ class JpegCompression(Preprocessor):
         :param apply_fit: True if applied during fitting/training.
         :param apply_predict: True if applied during predicting.
         :param verbose: Show progress bars.
+        :param nb_workers: Number of threads compressing frames in parallel. PIL releases the GIL while encoding and
+                           decoding.
         """
 
         super().__init__(is_fitted=True, apply_fit=apply_fit, apply_predict=apply_predict)
@@ -86,6 +90,7 @@ class JpegCompression(Preprocessor):
         self.channels_first = channels_first
         self.clip_values = clip_values
         self.verbose = verbose
+        self.nb_workers = nb_workers
         self._check_params()
 
     def _compress(self, x: np.ndarray, mode: str) -> np.ndarray:
@@ -140,23 +145,39 @@ class JpegCompression(Preprocessor):
         # Convert into uint8
         if self.clip_values[1] == 1.0:
             x = x * 255
-        x = x.astype("uint8")
-
-        # Compress one image at a time
-        x_jpeg = x.copy()
-        for idx in tqdm(np.ndindex(x.shape[:2]), desc="JPEG compression", disable=not self.verbose):  # type: ignore
-            if x.shape[-1] == 3:
-                x_jpeg[idx] = self._compress(x[idx], mode="RGB")
-            else:
-                for i_channel in range(x.shape[-1]):
-                    x_channel = x[idx[0], idx[1], ..., i_channel]
-                    x_channel = self._compress(x_channel, mode="L")
-                    x_jpeg[idx[0], idx[1], :, :, i_channel] = x_channel
+        x = x.astype("uint8", copy=False)
+
+        # Compress one frame (or for other than 3 channels one channel of a frame) at a time into the output
+        x_jpeg = np.empty_like(x)
+        frames: List[Tuple[tuple, Union[slice, int]]]
+        if x.shape[-1] == 3:
+            frames = [(idx, slice(None)) for idx in np.ndindex(x.shape[:2])]
+        else:
+            frames = [(idx, i_channel) for idx in np.ndindex(x.shape[:2]) for i_channel in range(x.shape[-1])]
+
+        def compress_frame(frame: tuple) -> None:
+            idx, channel = frame
+            x_jpeg[idx + (Ellipsis, channel)] = self._compress(
+                x[idx + (Ellipsis, channel)], mode="RGB" if x.shape[-1] == 3 else "L"
+            )
+
+        if self.nb_workers == 1 or len(frames) == 1:
+            for frame in tqdm(frames, desc="JPEG compression", disable=not self.verbose):
+                compress_frame(frame)
+        else:
+            with ThreadPoolExecutor(max_workers=self.nb_workers) as executor:
+                for _ in tqdm(
+                    executor.map(compress_frame, frames),
+                    total=len(frames),
+                    desc="JPEG compression",
+                    disable=not self.verbose,
+                ):
+                    pass
 
         # Convert to ART dtype
-        if self.clip_values[1] == 1.0:
-            x_jpeg = x_jpeg / 255.0
         x_jpeg = x_jpeg.astype(ART_NUMPY_DTYPE)
+        if self.clip_values[1] == 1.0:
+            x_jpeg /= 255
 
         # remove temporal dimension for image data
         if x_ndim == 4:
@@ -189,3 +210,6 @@ class JpegCompression(Preprocessor):
 
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
+
+        if not isinstance(self.nb_workers, int) or self.nb_workers < 1:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
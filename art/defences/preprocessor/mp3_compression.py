@@ -25,8 +25,11 @@ This module implements the MP3 compression defence `Mp3Compression`.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from io import BytesIO
+import subprocess
+import threading
 from typing import Optional, Tuple
 
 import numpy as np
@@ -42,7 +45,11 @@ class Mp3Compression(Preprocessor):
     Implement the MP3 compression defense approach.
     """
 
-    params = ["channels_first", "sample_rate", "verbose"]
+    params = ["channels_first", "sample_rate", "verbose", "nb_workers", "in_memory"]
+
+    # Samples of LAME encoder delay (576) and MP3 decoder delay (529). Streams written to a pipe carry no LAME header
+    # that would let the decoder remove them.
+    _pipe_delay = 1105
 
     def __init__(
         self,
@@ -51,6 +58,8 @@ class Mp3Compression(Preprocessor):
         apply_fit: bool = False,
         apply_predict: bool = True,
         verbose: bool = False,
+        nb_workers: int = 1,
+        in_memory: bool = False,
     ) -> None:
         """
         Create an instance of MP3 compression.
@@ -60,11 +69,16 @@ class Mp3Compression(Preprocessor):
         :param apply_fit: True if applied during fitting/training.
         :param apply_predict: True if applied during predicting.
         :param verbose: Show progress bars.
+        :param nb_workers: Number of audio items compressed in parallel, each by its own encoder and decoder processes.
+        :param in_memory: Stream each audio item through an encoding and a decoding FFmpeg process connected by pipes
+                          instead of converting it through temporary files with `pydub`.
         """
         super().__init__(is_fitted=True, apply_fit=apply_fit, apply_predict=apply_predict)
         self.channels_first = channels_first
         self.sample_rate = sample_rate
         self.verbose = verbose
+        self.nb_workers = nb_workers
+        self.in_memory = in_memory
         self._check_params()
 
     def __call__(self, x: np.ndarray, y: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
@@ -81,9 +95,6 @@ class Mp3Compression(Preprocessor):
             """
             Apply MP3 compression to audio input of shape (samples, channel).
             """
-            from pydub import AudioSegment
-            from scipy.io.wavfile import write
-
             x_dtype = x.dtype
             normalized = bool(x.min() >= -1.0 and x.max() <= 1.0)
             if x_dtype != np.int16 and not normalized:
@@ -94,13 +105,19 @@ class Mp3Compression(Preprocessor):
                 # casting to np.int16.
                 x = (x * 2 ** 15).astype(np.int16)
 
-            tmp_wav, tmp_mp3 = BytesIO(), BytesIO()
-            write(tmp_wav, sample_rate, x)
-            AudioSegment.from_wav(tmp_wav).export(tmp_mp3)
-            audio_segment = AudioSegment.from_mp3(tmp_mp3)
-            tmp_wav.close()
-            tmp_mp3.close()
-            x_mp3 = np.array(audio_segment.get_array_of_samples()).reshape((-1, audio_segment.channels))
+            if self.in_memory:
+                x_mp3 = self._compress_audio_in_memory(x, sample_rate)
+            else:
+                from pydub import AudioSegment
+                from scipy.io.wavfile import write
+
+                tmp_wav, tmp_mp3 = BytesIO(), BytesIO()
+                write(tmp_wav, sample_rate, x)
+                AudioSegment.from_wav(tmp_wav).export(tmp_mp3)
+                audio_segment = AudioSegment.from_mp3(tmp_mp3)
+                tmp_wav.close()
+                tmp_mp3.close()
+                x_mp3 = np.array(audio_segment.get_array_of_samples()).reshape((-1, audio_segment.channels))
 
             # WARNING: Sometimes we *still* need to manually resize x_mp3 to original length.
             # This should not be the case, e.g. see https://github.com/jiaaro/pydub/issues/474
@@ -126,8 +143,10 @@ class Mp3Compression(Preprocessor):
             x = np.swapaxes(x, 1, 2)
 
         # apply mp3 compression per audio item
-        x_mp3 = x.copy()
-        for i, x_i in enumerate(tqdm(x, desc="MP3 compression", disable=not self.verbose)):
+        x_mp3 = np.empty_like(x)
+
+        def compress_item(i: int) -> None:
+            x_i = x[i]
             x_i_ndim_0 = x_i.ndim
             if x.dtype == object:
                 if x_i.ndim == 1:
@@ -147,6 +166,19 @@ class Mp3Compression(Preprocessor):
 
             x_mp3[i] = x_i
 
+        if self.nb_workers == 1 or len(x) == 1:
+            for i in tqdm(range(len(x)), desc="MP3 compression", disable=not self.verbose):
+                compress_item(i)
+        else:
+            with ThreadPoolExecutor(max_workers=self.nb_workers) as executor:
+                for _ in tqdm(
+                    executor.map(compress_item, range(len(x))),
+                    total=len(x),
+                    desc="MP3 compression",
+                    disable=not self.verbose,
+                ):
+                    pass
+
         if x.dtype != object and self.channels_first:
             x_mp3 = np.swapaxes(x_mp3, 1, 2)
 
@@ -155,9 +187,60 @@ class Mp3Compression(Preprocessor):
 
         return x_mp3, y
 
+    def _compress_audio_in_memory(self, x: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Apply MP3 compression to audio input of type `np.int16` and shape (samples, channel) by streaming it through an
+        encoding and a decoding FFmpeg process connected by a pipe.
+        """
+        import ffmpeg
+
+        nb_channels = x.shape[1]
+
+        encode_args = (
+            ffmpeg.input("pipe:", format="s16le", ar=sample_rate, ac=nb_channels)
+            .output("pipe:", format="mp3")
+            .compile()
+        )
+        decode_args = (
+            ffmpeg.input("pipe:", format="mp3")
+            .output("pipe:", format="s16le", ar=sample_rate, ac=nb_channels)
+            .compile()
+        )
+
+        with subprocess.Popen(
+            encode_args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        ) as encode, subprocess.Popen(
+            decode_args, stdin=encode.stdout, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        ) as decode:
+            # The decoder owns the read end of the pipe between both processes
+            encode.stdout.close()  # type: ignore
+
+            def write_input() -> None:
+                try:
+                    encode.stdin.write(x.astype("<i2").tobytes())  # type: ignore
+                except BrokenPipeError:  # pragma: no cover
+                    pass
+                finally:
+                    encode.stdin.close()  # type: ignore
+
+            # Write the input in a separate thread, such that both processes can stream while the output is read
+            writer = threading.Thread(target=write_input, daemon=True)
+            writer.start()
+            stdout = decode.stdout.read()  # type: ignore
+            writer.join()
+
+        x_mp3 = np.frombuffer(stdout, dtype="<i2").reshape((-1, nb_channels))
+        return x_mp3[self._pipe_delay :]
+
     def _check_params(self) -> None:
         if not (isinstance(self.sample_rate, int) and self.sample_rate > 0):
             raise ValueError("Sample rate be must a positive integer.")
 
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
+
+        if not isinstance(self.nb_workers, int) or self.nb_workers < 1:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
+
+        if not isinstance(self.in_memory, bool):
+            raise ValueError("The argument `in_memory` has to be of type bool.")
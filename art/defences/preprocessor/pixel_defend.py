@@ -73,6 +73,9 @@ class PixelDefend(Preprocessor):
                for features.
         :param eps: Defense parameter 0-255.
         :param pixel_cnn: Pre-trained PixelCNN model.
+        :param batch_size: Size of batches for the PixelCNN and of the chunks of images purified at once.
+        :param apply_fit: True if applied during fitting/training.
+        :param apply_predict: True if applied during predicting.
         :param verbose: Show progress bars.
         """
         super().__init__(is_fitted=True, apply_fit=apply_fit, apply_predict=apply_predict)
@@ -107,29 +110,19 @@ class PixelDefend(Preprocessor):
         x = x.astype("uint8")
         x = x.reshape((x.shape[0], -1))
 
-        # Start defence one image at a time
-        for i, x_i in enumerate(tqdm(x, desc="PixelDefend", disable=not self.verbose)):
-            for feat_index in range(x.shape[1]):
-                # Setup the search space
-                f_probs = probs[i, feat_index, :]
-                f_range = range(
-                    int(max(x_i[feat_index] - self.eps, 0)),
-                    int(min(x_i[feat_index] + self.eps, 255) + 1),
-                )
-
-                # Look in the search space
-                best_prob = -1
-                best_idx = -1
-                for idx in f_range:
-                    if f_probs[idx] > best_prob:
-                        best_prob = f_probs[idx]
-                        best_idx = idx
-
-                # Update result
-                x_i[feat_index] = best_idx
+        # Start defence for a batch of images at a time
+        intensities = np.arange(256)
+        for i_start in tqdm(range(0, x.shape[0], self.batch_size), desc="PixelDefend", disable=not self.verbose):
+            x_batch = x[i_start : i_start + self.batch_size].astype(int)
+
+            # Set up the search space of every pixel and look for the most probable intensity in it
+            lower = np.maximum(x_batch - self.eps, 0)[:, :, np.newaxis]
+            upper = np.minimum(x_batch + self.eps, 255)[:, :, np.newaxis]
+            search_space = (intensities >= lower) & (intensities <= upper)
+            f_probs = np.where(search_space, probs[i_start : i_start + self.batch_size], -np.inf)
 
             # Update in batch
-            x[i] = x_i
+            x[i_start : i_start + self.batch_size] = np.argmax(f_probs, axis=2)
 
         # Convert to old dtype
         x = x / 255.0
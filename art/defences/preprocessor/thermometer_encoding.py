@@ -33,7 +33,6 @@ import numpy as np
 
 from art.config import ART_NUMPY_DTYPE
 from art.defences.preprocessor.preprocessor import Preprocessor
-from art.utils import to_categorical
 
 if TYPE_CHECKING:
     from art.utils import CLIP_VALUES_TYPE
@@ -91,28 +90,33 @@ class ThermometerEncoding(Preprocessor):
         x = (x - self.clip_values[0]) / (self.clip_values[1] - self.clip_values[0])
 
         # Now apply the encoding:
-        channel_index = 1 if self.channels_first else x.ndim - 1
-        result = np.apply_along_axis(self._perchannel, channel_index, x)
-        np.clip(result, 0, 1, out=result)
-        return result.astype(ART_NUMPY_DTYPE), y
+        if self.channels_first:
+            x = np.moveaxis(x, 1, -1)
+        result = self._encode(x).reshape(x.shape[:-1] + (x.shape[-1] * self.num_space,))
+        if self.channels_first:
+            result = np.moveaxis(result, -1, 1)
+        return np.ascontiguousarray(result, dtype=ART_NUMPY_DTYPE), y
 
-    def _perchannel(self, x: np.ndarray) -> np.ndarray:
+    def _encode(self, x: np.ndarray) -> np.ndarray:
         """
-        Apply thermometer encoding to one channel.
+        Apply thermometer encoding to the normalized sample `x`.
 
-        :param x: Sample to encode with shape `(batch_size, width, height)`.
-        :return: Encoded sample with shape `(batch_size, width, height, num_space)`.
+        :param x: Sample to encode with values in [0, 1].
+        :return: Boolean encoded sample with shape `x.shape + (num_space,)`, where level `k` is set if `k = 0` or
+                 `x > k / num_space`.
         """
-        pos = np.zeros(shape=x.shape)
-        for i in range(1, self.num_space):
-            pos[x > float(i) / self.num_space] += 1
-
-        onehot_rep = to_categorical(pos.reshape(-1), self.num_space)
-
-        for i in range(self.num_space - 1):
-            onehot_rep[:, i] += np.sum(onehot_rep[:, i + 1 :], axis=1)
+        encoded = x[..., np.newaxis] > self._get_levels(x.dtype)
+        encoded[..., 0] = True
+        return encoded
 
-        return onehot_rep.flatten()
+    def _get_levels(self, dtype: np.dtype) -> np.ndarray:
+        """
+        Get the levels `k / num_space` of the encoding in the precision of the inputs.
+        """
+        levels = np.arange(self.num_space) / self.num_space
+        if np.issubdtype(dtype, np.floating):
+            levels = levels.astype(dtype)
+        return levels
 
     def estimate_gradient(self, x: np.ndarray, grad: np.ndarray) -> np.ndarray:
         """
@@ -126,22 +130,16 @@ class ThermometerEncoding(Preprocessor):
         :return: The gradient (estimate) of the defence.
         """
         if self.channels_first:
-            x = np.transpose(x, (0,) + tuple(range(2, len(x.shape))) + (1,))
-            grad = np.transpose(grad, (0,) + tuple(range(2, len(x.shape))) + (1,))
-
-        thermometer_grad = np.zeros(x.shape[:-1] + (x.shape[-1] * self.num_space,))
-        mask = np.array([x > k / self.num_space for k in range(self.num_space)])
-        mask = np.moveaxis(mask, 0, -1)
-        mask = mask.reshape(thermometer_grad.shape)
-        thermometer_grad[mask] = 1
+            x = np.moveaxis(x, 1, -1)
+            grad = np.moveaxis(grad, 1, -1)
 
-        grad = grad * thermometer_grad
+        # Sum the gradients of the levels `k` with `x > k / num_space` for every feature
         grad = np.reshape(grad, grad.shape[:-1] + (grad.shape[-1] // self.num_space, self.num_space))
-        grad = np.sum(grad, -1)
+        mask = x[..., np.newaxis] > self._get_levels(x.dtype)
+        grad = np.sum(grad * mask, axis=-1)
 
         if self.channels_first:
-            x = np.transpose(x, (0,) + (len(x.shape) - 1,) + tuple(range(1, len(x.shape) - 1)))
-            grad = np.transpose(grad, (0,) + (len(x.shape) - 1,) + tuple(range(1, len(x.shape) - 1)))
+            grad = np.moveaxis(grad, -1, 1)
 
         return grad / (self.clip_values[1] - self.clip_values[0])
 
@@ -53,7 +53,7 @@ class TotalVarMin(Preprocessor):
         see https://arxiv.org/abs/1902.06705
     """
 
-    params = ["prob", "norm", "lamb", "solver", "max_iter", "clip_values", "verbose"]
+    params = ["prob", "norm", "lamb", "solver", "max_iter", "clip_values", "verbose", "batch_size", "nb_workers"]
 
     def __init__(
         self,
@@ -66,6 +66,8 @@ class TotalVarMin(Preprocessor):
         apply_fit: bool = False,
         apply_predict: bool = True,
         verbose: bool = False,
+        batch_size: int = 1,
+        nb_workers: int = 1,
     ):
         """
         Create an instance of total variance minimization.
@@ -80,6 +82,10 @@ class TotalVarMin(Preprocessor):
         :param apply_fit: True if applied during fitting/training.
         :param apply_predict: True if applied during predicting.
         :param verbose: Show progress bars.
+        :param batch_size: Number of images of which all channels are minimized jointly with a single call to the
+               solver on a vectorized objective. With `batch_size=1` every channel of every image is minimized
+               separately.
+        :param nb_workers: Number of processes minimizing batches of images in parallel.
         """
         super().__init__(is_fitted=True, apply_fit=apply_fit, apply_predict=apply_predict)
         self.prob = prob
@@ -89,6 +95,8 @@ class TotalVarMin(Preprocessor):
         self.max_iter = max_iter
         self.clip_values = clip_values
         self.verbose = verbose
+        self.batch_size = batch_size
+        self.nb_workers = nb_workers
         self._check_params()
 
     def __call__(self, x: np.ndarray, y: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
@@ -103,18 +111,62 @@ class TotalVarMin(Preprocessor):
             raise ValueError(
                 "Feature vectors detected. Variance minimization can only be applied to data with spatial dimensions."
             )
-        x_preproc = x.copy()
-
-        # Minimize one input at a time
-        for i, x_i in enumerate(tqdm(x_preproc, desc="Variance minimization", disable=not self.verbose)):
-            mask = (np.random.rand(*x_i.shape) < self.prob).astype("int")
-            x_preproc[i] = self._minimize(x_i, mask)
+        mask = (np.random.rand(*x.shape) < self.prob).astype("int")
+
+        # Minimize one batch of inputs at a time
+        batches = [
+            (x[i : i + self.batch_size], mask[i : i + self.batch_size]) for i in range(0, x.shape[0], self.batch_size)
+        ]
+        if self.nb_workers == 1:
+            x_batches = [
+                self._minimize_batch(x_batch, mask_batch)
+                for x_batch, mask_batch in tqdm(batches, desc="Variance minimization", disable=not self.verbose)
+            ]
+        else:
+            import multiprocess
+
+            with multiprocess.get_context("spawn").Pool(self.nb_workers) as pool:
+                # Results come back in the order that they were issued
+                x_batches = list(
+                    tqdm(
+                        pool.imap(lambda batch: self._minimize_batch(*batch), batches),
+                        total=len(batches),
+                        desc="Variance minimization",
+                        disable=not self.verbose,
+                    )
+                )
+        x_preproc = np.concatenate(x_batches)
 
         if self.clip_values is not None:
             np.clip(x_preproc, self.clip_values[0], self.clip_values[1], out=x_preproc)
 
         return x_preproc.astype(ART_NUMPY_DTYPE), y
 
+    def _minimize_batch(self, x: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Minimize the total variance objective function of a batch of images.
+
+        :param x: Original images.
+        :param mask: A matrix that decides which points are kept.
+        :return: New images.
+        """
+        if self.batch_size == 1:
+            return np.stack([self._minimize(x_i, mask_i) for x_i, mask_i in zip(x, mask)])
+
+        # Stack the channels of all images and minimize the sum of their objective functions jointly
+        x_channels = np.moveaxis(x, -1, 1).reshape((-1,) + x.shape[1:3])
+        res = minimize(
+            self._loss_func,
+            x_channels.flatten(),
+            (x_channels, np.moveaxis(mask, -1, 1).reshape(x_channels.shape), self.norm, self.lamb),
+            method=self.solver,
+            jac=self._deri_loss_func,
+            options={"maxiter": self.max_iter},
+        )
+        z_min = np.reshape(res.x, (x.shape[0], x.shape[3]) + x.shape[1:3])
+
+        return np.moveaxis(z_min, 1, -1)
+
     def _minimize(self, x: np.ndarray, mask: np.ndarray) -> np.ndarray:
         """
         Minimize the total variance objective function.
@@ -141,7 +193,8 @@ class TotalVarMin(Preprocessor):
     @staticmethod
     def _loss_func(z_init: np.ndarray, x: np.ndarray, mask: np.ndarray, norm: int, lamb: float) -> float:
         """
-        Loss function to be minimized.
+        Loss function to be minimized. For a stack of images `x` of shape `(nb_images, height, width)` it is the sum of
+        the losses of the images.
 
         :param z_init: Initial guess.
         :param x: Original image.
@@ -150,17 +203,18 @@ class TotalVarMin(Preprocessor):
         :param lamb: The lambda parameter in the objective function.
         :return: Loss value.
         """
-        res = np.sqrt(np.power(z_init - x.flatten(), 2).dot(mask.flatten()))
         z_init = np.reshape(z_init, x.shape)
-        res += lamb * np.linalg.norm(z_init[1:, :] - z_init[:-1, :], norm, axis=1).sum()
-        res += lamb * np.linalg.norm(z_init[:, 1:] - z_init[:, :-1], norm, axis=0).sum()
+        res = np.sqrt(np.sum((z_init - x) ** 2 * mask, axis=(-2, -1))).sum()
+        res += lamb * np.linalg.norm(z_init[..., 1:, :] - z_init[..., :-1, :], norm, axis=-1).sum()
+        res += lamb * np.linalg.norm(z_init[..., :, 1:] - z_init[..., :, :-1], norm, axis=-2).sum()
 
         return res
 
     @staticmethod
     def _deri_loss_func(z_init: np.ndarray, x: np.ndarray, mask: np.ndarray, norm: int, lamb: float) -> float:
         """
-        Derivative of loss function to be minimized.
+        Derivative of loss function to be minimized. For a stack of images `x` of shape `(nb_images, height, width)` it
+        is the derivative of the sum of the losses of the images.
 
         :param z_init: Initial guess.
         :param x: Original image.
@@ -169,36 +223,33 @@ class TotalVarMin(Preprocessor):
         :param lamb: The lambda parameter in the objective function.
         :return: Derivative value.
         """
+        z_init = np.reshape(z_init, x.shape)
+
         # First compute the derivative of the first component of the loss function
-        nor1 = np.sqrt(np.power(z_init - x.flatten(), 2).dot(mask.flatten()))
-        nor1 = max(nor1, 1e-06)
-        der1 = ((z_init - x.flatten()) * mask.flatten()) / (nor1 * 1.0)
+        nor1 = np.sqrt(np.sum((z_init - x) ** 2 * mask, axis=(-2, -1), keepdims=True))
+        nor1 = np.maximum(nor1, 1e-06)
+        der1 = ((z_init - x) * mask) / (nor1 * 1.0)
 
         # Then compute the derivative of the second component of the loss function
-        z_init = np.reshape(z_init, x.shape)
-
         if norm == 1:
-            z_d1 = np.sign(z_init[1:, :] - z_init[:-1, :])
-            z_d2 = np.sign(z_init[:, 1:] - z_init[:, :-1])
+            z_d1 = np.sign(z_init[..., 1:, :] - z_init[..., :-1, :])
+            z_d2 = np.sign(z_init[..., :, 1:] - z_init[..., :, :-1])
         else:
-            z_d1_norm = np.power(np.linalg.norm(z_init[1:, :] - z_init[:-1, :], norm, axis=1), norm - 1)
-            z_d2_norm = np.power(np.linalg.norm(z_init[:, 1:] - z_init[:, :-1], norm, axis=0), norm - 1)
+            z_d1_norm = np.linalg.norm(z_init[..., 1:, :] - z_init[..., :-1, :], norm, axis=-1) ** (norm - 1)
+            z_d2_norm = np.linalg.norm(z_init[..., :, 1:] - z_init[..., :, :-1], norm, axis=-2) ** (norm - 1)
             z_d1_norm[z_d1_norm < 1e-6] = 1e-6
             z_d2_norm[z_d2_norm < 1e-6] = 1e-6
-            z_d1_norm = np.repeat(z_d1_norm[:, np.newaxis], z_init.shape[1], axis=1)
-            z_d2_norm = np.repeat(z_d2_norm[np.newaxis, :], z_init.shape[0], axis=0)
-            z_d1 = norm * np.power(z_init[1:, :] - z_init[:-1, :], norm - 1) / z_d1_norm
-            z_d2 = norm * np.power(z_init[:, 1:] - z_init[:, :-1], norm - 1) / z_d2_norm
+            z_d1 = norm * (z_init[..., 1:, :] - z_init[..., :-1, :]) ** (norm - 1) / z_d1_norm[..., :, np.newaxis]
+            z_d2 = norm * (z_init[..., :, 1:] - z_init[..., :, :-1]) ** (norm - 1) / z_d2_norm[..., np.newaxis, :]
 
         der2 = np.zeros(z_init.shape)
-        der2[:-1, :] -= z_d1
-        der2[1:, :] += z_d1
-        der2[:, :-1] -= z_d2
-        der2[:, 1:] += z_d2
-        der2 = lamb * der2.flatten()
+        der2[..., :-1, :] -= z_d1
+        der2[..., 1:, :] += z_d1
+        der2[..., :, :-1] -= z_d2
+        der2[..., :, 1:] += z_d2
 
         # Total derivative
-        return der1 + der2
+        return (der1 + lamb * der2).flatten()
 
     def _check_params(self) -> None:
         if not isinstance(self.prob, (float, int)) or self.prob < 0.0 or self.prob > 1.0:
@@ -227,3 +278,9 @@ class TotalVarMin(Preprocessor):
 
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
+
+        if not isinstance(self.batch_size, int) or self.batch_size <= 0:
+            raise ValueError("The batch size `batch_size` has to be a positive integer.")
+
+        if not isinstance(self.nb_workers, int) or self.nb_workers <= 0:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
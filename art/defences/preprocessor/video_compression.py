@@ -23,9 +23,12 @@ This module implements a wrapper for video compression defence with FFmpeg.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+import subprocess
 from tempfile import TemporaryDirectory
+import threading
 from typing import Optional, Tuple
 import warnings
 
@@ -46,7 +49,7 @@ class VideoCompression(Preprocessor):
     parameter. More information on the constant rate factor: https://trac.ffmpeg.org/wiki/Encode/H.264.
     """
 
-    params = ["video_format", "constant_rate_factor", "channels_first", "verbose"]
+    params = ["video_format", "constant_rate_factor", "channels_first", "verbose", "in_memory", "nb_workers"]
 
     def __init__(
         self,
@@ -57,6 +60,8 @@ class VideoCompression(Preprocessor):
         apply_fit: bool = False,
         apply_predict: bool = True,
         verbose: bool = False,
+        in_memory: bool = False,
+        nb_workers: int = 1,
     ):
         """
         Create an instance of VideoCompression.
@@ -67,12 +72,18 @@ class VideoCompression(Preprocessor):
         :param apply_fit: True if applied during fitting/training.
         :param apply_predict: True if applied during predicting.
         :param verbose: Show progress bars.
+        :param in_memory: Stream each video through an encoding and a decoding FFmpeg process connected by pipes
+                          instead of writing it to a temporary file. The H.264 stream is piped without container,
+                          therefore `video_format` is not used.
+        :param nb_workers: Number of videos compressed in parallel, each by its own FFmpeg processes.
         """
         super().__init__(is_fitted=True, apply_fit=apply_fit, apply_predict=apply_predict)
         self.video_format = video_format
         self.constant_rate_factor = constant_rate_factor
         self.channels_first = channels_first
         self.verbose = verbose
+        self.in_memory = in_memory
+        self.nb_workers = nb_workers
         self._check_params()
 
     def __call__(self, x: np.ndarray, y: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
@@ -85,37 +96,6 @@ class VideoCompression(Preprocessor):
         :return: Compressed sample.
         """
 
-        def compress_video(x: np.ndarray, video_format: str, constant_rate_factor: int, dir_: str = ""):
-            """
-            Apply video compression to video input of shape (frames, height, width, channel).
-            """
-            import ffmpeg
-
-            video_path = os.path.join(dir_, f"tmp_video.{video_format}")
-            _, height, width, _ = x.shape
-
-            if (height % 2) != 0 or (width % 2) != 0:
-                warnings.warn("Codec might require even number of pixels in height and width.")
-
-            # numpy to local video file
-            process = (
-                ffmpeg.input("pipe:", format="rawvideo", pix_fmt="rgb24", s=f"{width}x{height}")
-                .output(video_path, pix_fmt="yuv420p", vcodec="libx264", crf=constant_rate_factor)
-                .overwrite_output()
-                .run_async(pipe_stdin=True, quiet=True)
-            )
-            process.stdin.write(x.flatten().astype(np.uint8).tobytes())
-            process.stdin.close()
-            process.wait()
-
-            # local video file to numpy
-            stdout, _ = (
-                ffmpeg.input(video_path)
-                .output("pipe:", format="rawvideo", pix_fmt="rgb24")
-                .run(capture_stdout=True, quiet=True)
-            )
-            return np.frombuffer(stdout, np.uint8).reshape(x.shape)
-
         if x.ndim != 5:
             raise ValueError("Video compression can only be applied to spatio-temporal data.")
 
@@ -127,19 +107,122 @@ class VideoCompression(Preprocessor):
         if x.min() >= 0 and x.max() <= 1.0:
             scale = 255
 
-        x_compressed = x.copy()
+        _, _, height, width, _ = x.shape
+        if (height % 2) != 0 or (width % 2) != 0:
+            warnings.warn("Codec might require even number of pixels in height and width.")
+
+        x_uint8 = (x * scale).astype(np.uint8)
+        x_compressed = np.empty(x_uint8.shape, dtype=np.uint8)
+
         with TemporaryDirectory(dir=config.ART_DATA_PATH) as tmp_dir:
-            for i, x_i in enumerate(tqdm(x, desc="Video compression", disable=not self.verbose)):
-                x_i *= scale
-                x_compressed[i] = compress_video(x_i, self.video_format, self.constant_rate_factor, dir_=tmp_dir)
 
-        x_compressed = x_compressed / scale
-        x_compressed = x_compressed.astype(x.dtype)
+            def compress_video(i: int) -> None:
+                if self.in_memory:
+                    self._compress_video_in_memory(x_uint8[i], x_compressed[i])
+                else:
+                    self._compress_video_file(x_uint8[i], x_compressed[i], os.path.join(tmp_dir, f"tmp_video_{i}"))
+
+            if self.nb_workers == 1 or x.shape[0] == 1:
+                for i in tqdm(range(x.shape[0]), desc="Video compression", disable=not self.verbose):
+                    compress_video(i)
+            else:
+                with ThreadPoolExecutor(max_workers=self.nb_workers) as executor:
+                    for _ in tqdm(
+                        executor.map(compress_video, range(x.shape[0])),
+                        total=x.shape[0],
+                        desc="Video compression",
+                        disable=not self.verbose,
+                    ):
+                        pass
+
+        x_video = (x_compressed / scale).astype(x.dtype)
 
         if self.channels_first:
-            x_compressed = np.transpose(x_compressed, (0, 4, 1, 2, 3))
+            x_video = np.transpose(x_video, (0, 4, 1, 2, 3))
 
-        return x_compressed, y
+        return x_video, y
+
+    def _compress_video_file(self, x: np.ndarray, out: np.ndarray, video_path: str) -> None:
+        """
+        Apply video compression to video input of shape (frames, height, width, channel) through a temporary video file
+        and write the result into `out`.
+        """
+        import ffmpeg
+
+        video_path = f"{video_path}.{self.video_format}"
+        _, height, width, _ = x.shape
+
+        # numpy to local video file
+        process = (
+            ffmpeg.input("pipe:", format="rawvideo", pix_fmt="rgb24", s=f"{width}x{height}")
+            .output(video_path, pix_fmt="yuv420p", vcodec="libx264", crf=self.constant_rate_factor)
+            .overwrite_output()
+            .run_async(pipe_stdin=True, quiet=True)
+        )
+        process.stdin.write(x.tobytes())
+        process.stdin.close()
+        process.wait()
+
+        # local video file to numpy
+        stdout, _ = (
+            ffmpeg.input(video_path)
+            .output("pipe:", format="rawvideo", pix_fmt="rgb24")
+            .run(capture_stdout=True, quiet=True)
+        )
+        out[...] = np.frombuffer(stdout, np.uint8).reshape(x.shape)
+
+    def _compress_video_in_memory(self, x: np.ndarray, out: np.ndarray) -> None:
+        """
+        Apply video compression to video input of shape (frames, height, width, channel) by streaming it through an
+        encoding and a decoding FFmpeg process connected by a pipe and reading the result directly into `out`.
+        """
+        import ffmpeg
+
+        _, height, width, _ = x.shape
+
+        encode_args = (
+            ffmpeg.input("pipe:", format="rawvideo", pix_fmt="rgb24", s=f"{width}x{height}")
+            .output("pipe:", format="h264", pix_fmt="yuv420p", vcodec="libx264", crf=self.constant_rate_factor)
+            .compile()
+        )
+        decode_args = ffmpeg.input("pipe:", format="h264").output("pipe:", format="rawvideo", pix_fmt="rgb24").compile()
+
+        with subprocess.Popen(
+            encode_args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        ) as encode, subprocess.Popen(
+            decode_args, stdin=encode.stdout, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        ) as decode:
+            # The decoder owns the read end of the pipe between both processes
+            encode.stdout.close()  # type: ignore
+
+            def write_input() -> None:
+                try:
+                    encode.stdin.write(x.tobytes())  # type: ignore
+                except BrokenPipeError:  # pragma: no cover
+                    pass
+                finally:
+                    encode.stdin.close()  # type: ignore
+
+            # Write the input in a separate thread, such that both processes can stream while the output is read
+            writer = threading.Thread(target=write_input, daemon=True)
+            writer.start()
+
+            buffer = memoryview(out).cast("B")  # type: ignore
+            nb_bytes = 0
+            while nb_bytes < buffer.nbytes:
+                nb_bytes_read = decode.stdout.readinto(buffer[nb_bytes:])  # type: ignore
+                if not nb_bytes_read:
+                    break
+                nb_bytes += nb_bytes_read
+
+            writer.join()
+            decode.stdout.read()  # type: ignore
+
+        if encode.returncode != 0 or decode.returncode != 0:
+            raise ffmpeg.Error("ffmpeg", None, None)
+
+        if nb_bytes != buffer.nbytes:
+            raise ValueError("The decoded video does not match the shape of the input video.")
 
     def _check_params(self) -> None:
         if not (isinstance(self.constant_rate_factor, int) and 0 <= self.constant_rate_factor < 52):
@@ -147,3 +230,9 @@ class VideoCompression(Preprocessor):
 
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
+
+        if not isinstance(self.in_memory, bool):
+            raise ValueError("The argument `in_memory` has to be of type bool.")
+
+        if not isinstance(self.nb_workers, int) or self.nb_workers < 1:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
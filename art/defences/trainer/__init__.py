@@ -1,15 +1,38 @@
 """
 Module implementing train-based defences against adversarial attacks.
 """
-from art.defences.trainer.trainer import Trainer
-from art.defences.trainer.adversarial_trainer import AdversarialTrainer
-from art.defences.trainer.certified_adversarial_trainer_pytorch import AdversarialTrainerCertifiedPytorch
-from art.defences.trainer.ibp_certified_trainer_pytorch import AdversarialTrainerCertifiedIBPPyTorch
-from art.defences.trainer.adversarial_trainer_madry_pgd import AdversarialTrainerMadryPGD
-from art.defences.trainer.adversarial_trainer_fbf import AdversarialTrainerFBF
-from art.defences.trainer.adversarial_trainer_fbf_pytorch import AdversarialTrainerFBFPyTorch
-from art.defences.trainer.adversarial_trainer_trades import AdversarialTrainerTRADES
-from art.defences.trainer.adversarial_trainer_trades_pytorch import AdversarialTrainerTRADESPyTorch
-from art.defences.trainer.adversarial_trainer_awp import AdversarialTrainerAWP
-from art.defences.trainer.adversarial_trainer_awp_pytorch import AdversarialTrainerAWPPyTorch
-from art.defences.trainer.dp_instahide_trainer import DPInstaHideTrainer
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.defences.trainer.trainer import Trainer
+    from art.defences.trainer.adversarial_trainer import AdversarialTrainer
+    from art.defences.trainer.certified_adversarial_trainer_pytorch import AdversarialTrainerCertifiedPytorch
+    from art.defences.trainer.ibp_certified_trainer_pytorch import AdversarialTrainerCertifiedIBPPyTorch
+    from art.defences.trainer.adversarial_trainer_madry_pgd import AdversarialTrainerMadryPGD
+    from art.defences.trainer.adversarial_trainer_fbf import AdversarialTrainerFBF
+    from art.defences.trainer.adversarial_trainer_fbf_pytorch import AdversarialTrainerFBFPyTorch
+    from art.defences.trainer.adversarial_trainer_trades import AdversarialTrainerTRADES
+    from art.defences.trainer.adversarial_trainer_trades_pytorch import AdversarialTrainerTRADESPyTorch
+    from art.defences.trainer.adversarial_trainer_awp import AdversarialTrainerAWP
+    from art.defences.trainer.adversarial_trainer_awp_pytorch import AdversarialTrainerAWPPyTorch
+    from art.defences.trainer.dp_instahide_trainer import DPInstaHideTrainer
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.defences.trainer.trainer": ["Trainer"],
+        "art.defences.trainer.adversarial_trainer": ["AdversarialTrainer"],
+        "art.defences.trainer.certified_adversarial_trainer_pytorch": ["AdversarialTrainerCertifiedPytorch"],
+        "art.defences.trainer.ibp_certified_trainer_pytorch": ["AdversarialTrainerCertifiedIBPPyTorch"],
+        "art.defences.trainer.adversarial_trainer_madry_pgd": ["AdversarialTrainerMadryPGD"],
+        "art.defences.trainer.adversarial_trainer_fbf": ["AdversarialTrainerFBF"],
+        "art.defences.trainer.adversarial_trainer_fbf_pytorch": ["AdversarialTrainerFBFPyTorch"],
+        "art.defences.trainer.adversarial_trainer_trades": ["AdversarialTrainerTRADES"],
+        "art.defences.trainer.adversarial_trainer_trades_pytorch": ["AdversarialTrainerTRADESPyTorch"],
+        "art.defences.trainer.adversarial_trainer_awp": ["AdversarialTrainerAWP"],
+        "art.defences.trainer.adversarial_trainer_awp_pytorch": ["AdversarialTrainerAWPPyTorch"],
+        "art.defences.trainer.dp_instahide_trainer": ["DPInstaHideTrainer"],
+    },
+)
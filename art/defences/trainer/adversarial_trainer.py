@@ -33,8 +33,12 @@ with their adversarial counterpart.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+import functools
 import logging
-from typing import List, Optional, Union, TYPE_CHECKING
+import queue
+import threading
+from typing import Any, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 from tqdm.auto import trange, tqdm
@@ -58,6 +62,12 @@ class AdversarialTrainer(Trainer):
     for each batch. If the specified attacks have as target a different model, then the attack is transferred. The
     `ratio` determines how many of the clean samples in each batch are replaced with their adversarial counterpart.
 
+    If `max_staleness` is greater than zero, adversarial batches are crafted by a background thread while the
+    classifier trains on the previous batches. Attacks against the trained classifier then run on a copy of it, whose
+    weights are synchronised with the trained classifier such that an adversarial batch is crafted with weights that
+    are at most `max_staleness` training steps older than those of the classifier trained on it. Transferred attacks
+    are generated batch by batch in the background instead of being precomputed.
+
      .. warning:: Both successful and unsuccessful adversarial samples are used for training. In the case of
                   unbounded attacks (e.g., DeepFool), this can result in invalid (very noisy) samples being included.
 
@@ -73,6 +83,7 @@ class AdversarialTrainer(Trainer):
         classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE",
         attacks: Union["EvasionAttack", List["EvasionAttack"]],
         ratio: float = 0.5,
+        max_staleness: int = 0,
     ) -> None:
         """
         Create an :class:`.AdversarialTrainer` instance.
@@ -81,6 +92,10 @@ class AdversarialTrainer(Trainer):
         :param attacks: attacks to use for data augmentation in adversarial training
         :param ratio: The proportion of samples in each batch to be replaced with their adversarial counterparts.
                       Setting this value to 1 allows to train only on adversarial samples.
+        :param max_staleness: Maximal number of training steps by which the weights used to craft an adversarial batch
+                              may lag behind the classifier trained on it. If 0, adversarial samples are crafted
+                              synchronously before each training step. Values greater than 0 enable the asynchronous
+                              pipeline, which requires the classifier to be copyable with `copy.deepcopy`.
         """
         from art.attacks.attack import EvasionAttack
 
@@ -96,6 +111,10 @@ class AdversarialTrainer(Trainer):
             raise ValueError("The `ratio` of adversarial samples in each batch has to be between 0 and 1.")
         self.ratio = ratio
 
+        if not isinstance(max_staleness, int) or max_staleness < 0:
+            raise ValueError("The maximal staleness `max_staleness` has to be a non-negative integer.")
+        self.max_staleness = max_staleness
+
         self._precomputed_adv_samples: List[Optional[np.ndarray]] = []
         self.x_augmented: Optional[np.ndarray] = None
         self.y_augmented: Optional[np.ndarray] = None
@@ -118,6 +137,16 @@ class AdversarialTrainer(Trainer):
         ind = np.arange(generator.size)
         attack_id = 0
 
+        if self.max_staleness > 0:
+
+            def generator_batches() -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+                for _ in range(nb_epochs * nb_batches):
+                    x_batch, y_batch = generator.get_batch()
+                    yield x_batch.copy(), y_batch
+
+            self._fit_asynchronous(generator_batches(), nb_epochs=nb_epochs, nb_batches=nb_batches, **kwargs)
+            return
+
         # Precompute adversarial samples for transferred attacks
         logged = False
         self._precomputed_adv_samples = []
@@ -209,6 +238,18 @@ class AdversarialTrainer(Trainer):
         ind = np.arange(len(x))
         attack_id = 0
 
+        if self.max_staleness > 0:
+
+            def array_batches() -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+                for _ in range(nb_epochs):
+                    np.random.shuffle(ind)
+                    for batch_id in range(nb_batches):
+                        batch_ind = ind[batch_id * batch_size : min((batch_id + 1) * batch_size, x.shape[0])]
+                        yield x[batch_ind].copy(), y[batch_ind]
+
+            self._fit_asynchronous(array_batches(), nb_epochs=nb_epochs, nb_batches=nb_batches, **kwargs)
+            return
+
         # Precompute adversarial samples for transferred attacks
         logged = False
         self._precomputed_adv_samples = []
@@ -263,6 +304,110 @@ class AdversarialTrainer(Trainer):
                 self._classifier.fit(x_batch, y_batch, nb_epochs=1, batch_size=x_batch.shape[0], verbose=0, **kwargs)
                 attack_id = (attack_id + 1) % len(self.attacks)
 
+    def _fit_asynchronous(
+        self, batches: Iterator[Tuple[np.ndarray, np.ndarray]], nb_epochs: int, nb_batches: int, **kwargs
+    ) -> None:
+        """
+        Train the classifier on adversarial batches crafted by a background thread, which runs at most
+        `max_staleness` batches ahead of the training loop.
+
+        :param batches: Iterator over the clean batches `(x, y)` of all epochs, consumed by the background thread.
+        :param nb_epochs: Number of epochs.
+        :param nb_batches: Number of batches per epoch.
+        :param kwargs: Dictionary of framework-specific arguments passed to the `fit` function of the classifier.
+        """
+        for attack in self.attacks:
+            if "verbose" in attack.attack_params:
+                attack.set_params(verbose=False)
+            if "targeted" in attack.attack_params and attack.targeted:  # type: ignore
+                raise NotImplementedError("Adversarial training with targeted attacks is currently not implemented")
+
+        # Attacks against the trained classifier run on a copy of it, all other attacks are transferred
+        synced = [attack.estimator == self._classifier for attack in self.attacks]
+        classifier_copy = None
+        attacks = list(self.attacks)
+        if any(synced):
+            try:
+                classifier_copy = copy.deepcopy(self._classifier)
+            except Exception as exception:
+                raise ValueError(
+                    "Asynchronous adversarial training requires a classifier that can be copied with `copy.deepcopy`."
+                ) from exception
+            for i, attack in enumerate(self.attacks):
+                if synced[i]:
+                    attacks[i] = copy.deepcopy(attack, memo={id(self._classifier): classifier_copy})
+
+        adv_batches: "queue.Queue" = queue.Queue(maxsize=self.max_staleness)
+        stop = threading.Event()
+        condition = threading.Condition()
+        published: List[Any] = [0, None]  # Number of training steps of the published weights and the weights
+
+        def put(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    adv_batches.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def is_ready(min_version: int) -> bool:
+            return stop.is_set() or published[0] >= min_version
+
+        def produce() -> None:
+            version = 0
+            try:
+                for step, (x_batch, y_batch) in enumerate(batches):
+                    attack_id = step % len(attacks)
+                    if synced[attack_id] and classifier_copy is not None:
+                        with condition:
+                            condition.wait_for(functools.partial(is_ready, step - self.max_staleness))
+                            if stop.is_set():
+                                return
+                            if published[0] > version:
+                                _set_weights(classifier_copy, published[1])
+                                version = published[0]
+
+                    nb_adv = int(np.ceil(self.ratio * x_batch.shape[0]))
+                    if self.ratio < 1:
+                        adv_ids = np.random.choice(x_batch.shape[0], size=nb_adv, replace=False)
+                    else:
+                        adv_ids = np.arange(x_batch.shape[0])
+                    x_batch[adv_ids] = attacks[attack_id].generate(x_batch[adv_ids], y=y_batch[adv_ids])
+                    put((x_batch, y_batch))
+                    if stop.is_set():
+                        return
+            except Exception as exception:  # pylint: disable=W0703
+                put(exception)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            step = 0
+            for _ in trange(nb_epochs, desc="Adversarial training epochs"):
+                for _ in range(nb_batches):
+                    item = adv_batches.get()
+                    if isinstance(item, Exception):
+                        raise item
+                    x_batch, y_batch = item
+
+                    # Fit batch
+                    self._classifier.fit(
+                        x_batch, y_batch, nb_epochs=1, batch_size=x_batch.shape[0], verbose=0, **kwargs
+                    )
+                    step += 1
+
+                    # Publish the current weights often enough for the staleness bound to be satisfiable
+                    if classifier_copy is not None and step % self.max_staleness == 0:
+                        weights = _get_weights(self._classifier)
+                        with condition:
+                            published[0], published[1] = step, weights
+                            condition.notify_all()
+        finally:
+            stop.set()
+            with condition:
+                condition.notify_all()
+            producer.join()
+
     def predict(self, x: np.ndarray, **kwargs) -> np.ndarray:
         """
         Perform prediction using the adversarially trained classifier.
@@ -272,3 +417,28 @@ class AdversarialTrainer(Trainer):
         :return: Predictions for test set.
         """
         return self._classifier.predict(x, **kwargs)
+
+
+def _get_weights(classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE") -> Any:
+    """
+    Create a snapshot of the weights of the model of a classifier.
+    """
+    model = classifier.model
+    if hasattr(model, "state_dict"):  # PyTorch
+        return {name: value.detach().clone() for name, value in model.state_dict().items()}
+    if hasattr(model, "get_weights"):  # Keras and TensorFlow
+        return model.get_weights()
+    raise NotImplementedError(f"Synchronising the weights of model type {type(model)} is not supported.")
+
+
+def _set_weights(classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE", weights: Any) -> None:
+    """
+    Load a snapshot of weights created by `_get_weights` into the model of a classifier.
+    """
+    model = classifier.model
+    if hasattr(model, "load_state_dict"):  # PyTorch
+        model.load_state_dict(weights)
+    elif hasattr(model, "set_weights"):  # Keras and TensorFlow
+        model.set_weights(weights)
+    else:
+        raise NotImplementedError(f"Synchronising the weights of model type {type(model)} is not supported.")
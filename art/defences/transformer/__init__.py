@@ -1,7 +1,19 @@
 """
 Module implementing transformer-based defences against adversarial attacks.
 """
-from art.defences.transformer.transformer import Transformer
+from typing import TYPE_CHECKING
 
-from art.defences.transformer import evasion
-from art.defences.transformer import poisoning
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.defences.transformer.transformer import Transformer
+    from art.defences.transformer import evasion
+    from art.defences.transformer import poisoning
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["evasion", "poisoning"],
+    attributes={
+        "art.defences.transformer.transformer": ["Transformer"],
+    },
+)
@@ -1,5 +1,18 @@
 """
 Module implementing transformer-based defences against poisoning attacks.
 """
-from art.defences.transformer.poisoning.neural_cleanse import NeuralCleanse
-from art.defences.transformer.poisoning.strip import STRIP
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.defences.transformer.poisoning.neural_cleanse import NeuralCleanse
+    from art.defences.transformer.poisoning.strip import STRIP
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.defences.transformer.poisoning.neural_cleanse": ["NeuralCleanse"],
+        "art.defences.transformer.poisoning.strip": ["STRIP"],
+    },
+)
@@ -1,24 +1,49 @@
 """
 This module contains the Estimator API.
 """
-from art.estimators.estimator import (
-    BaseEstimator,
-    LossGradientsMixin,
-    NeuralNetworkMixin,
-    DecisionTreeMixin,
-)
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
 
-from art.estimators.keras import KerasEstimator
-from art.estimators.mxnet import MXEstimator
-from art.estimators.pytorch import PyTorchEstimator
-from art.estimators.scikitlearn import ScikitlearnEstimator
-from art.estimators.tensorflow import TensorFlowEstimator, TensorFlowV2Estimator
+if TYPE_CHECKING:
+    from art.estimators.estimator import (
+        BaseEstimator,
+        LossGradientsMixin,
+        NeuralNetworkMixin,
+        DecisionTreeMixin,
+    )
+    from art.estimators.keras import KerasEstimator
+    from art.estimators.mxnet import MXEstimator
+    from art.estimators.pytorch import PyTorchEstimator
+    from art.estimators.scikitlearn import ScikitlearnEstimator
+    from art.estimators.tensorflow import TensorFlowEstimator, TensorFlowV2Estimator
+    from art.estimators import certification
+    from art.estimators import classification
+    from art.estimators import encoding
+    from art.estimators import generation
+    from art.estimators import object_detection
+    from art.estimators import poison_mitigation
+    from art.estimators import regression
+    from art.estimators import speech_recognition
 
-from art.estimators import certification
-from art.estimators import classification
-from art.estimators import encoding
-from art.estimators import generation
-from art.estimators import object_detection
-from art.estimators import poison_mitigation
-from art.estimators import regression
-from art.estimators import speech_recognition
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "certification",
+        "classification",
+        "encoding",
+        "generation",
+        "object_detection",
+        "poison_mitigation",
+        "regression",
+        "speech_recognition",
+    ],
+    attributes={
+        "art.estimators.estimator": ["BaseEstimator", "LossGradientsMixin", "NeuralNetworkMixin", "DecisionTreeMixin"],
+        "art.estimators.keras": ["KerasEstimator"],
+        "art.estimators.mxnet": ["MXEstimator"],
+        "art.estimators.pytorch": ["PyTorchEstimator"],
+        "art.estimators.scikitlearn": ["ScikitlearnEstimator"],
+        "art.estimators.tensorflow": ["TensorFlowEstimator", "TensorFlowV2Estimator"],
+    },
+)
@@ -2,16 +2,19 @@
 This module contains certified classifiers.
 """
 import importlib
-from art.estimators.certification.randomized_smoothing.randomized_smoothing import RandomizedSmoothingMixin
-from art.estimators.certification.randomized_smoothing.numpy import NumpyRandomizedSmoothing
-from art.estimators.certification.randomized_smoothing.tensorflow import TensorFlowV2RandomizedSmoothing
-from art.estimators.certification.randomized_smoothing.pytorch import PyTorchRandomizedSmoothing
-from art.estimators.certification.derandomized_smoothing.pytorch import PyTorchDeRandomizedSmoothing
-from art.estimators.certification.derandomized_smoothing.tensorflow import TensorFlowV2DeRandomizedSmoothing
-from art.estimators.certification.object_seeker.object_seeker import ObjectSeekerMixin
-from art.estimators.certification.object_seeker.pytorch import PyTorchObjectSeeker
+from typing import TYPE_CHECKING
 
-if importlib.util.find_spec("torch") is not None:
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.randomized_smoothing.randomized_smoothing import RandomizedSmoothingMixin
+    from art.estimators.certification.randomized_smoothing.numpy import NumpyRandomizedSmoothing
+    from art.estimators.certification.randomized_smoothing.tensorflow import TensorFlowV2RandomizedSmoothing
+    from art.estimators.certification.randomized_smoothing.pytorch import PyTorchRandomizedSmoothing
+    from art.estimators.certification.derandomized_smoothing.pytorch import PyTorchDeRandomizedSmoothing
+    from art.estimators.certification.derandomized_smoothing.tensorflow import TensorFlowV2DeRandomizedSmoothing
+    from art.estimators.certification.object_seeker.object_seeker import ObjectSeekerMixin
+    from art.estimators.certification.object_seeker.pytorch import PyTorchObjectSeeker
     from art.estimators.certification.deep_z.deep_z import ZonoDenseLayer
     from art.estimators.certification.deep_z.deep_z import ZonoBounds
     from art.estimators.certification.deep_z.deep_z import ZonoConv
@@ -23,7 +26,40 @@ if importlib.util.find_spec("torch") is not None:
     from art.estimators.certification.interval.interval import PyTorchIntervalFlatten
     from art.estimators.certification.interval.interval import PyTorchIntervalBounds
     from art.estimators.certification.interval.pytorch import PyTorchIBPClassifier
+
+_ATTRIBUTES = {
+    "art.estimators.certification.randomized_smoothing.randomized_smoothing": ["RandomizedSmoothingMixin"],
+    "art.estimators.certification.randomized_smoothing.numpy": ["NumpyRandomizedSmoothing"],
+    "art.estimators.certification.randomized_smoothing.tensorflow": ["TensorFlowV2RandomizedSmoothing"],
+    "art.estimators.certification.randomized_smoothing.pytorch": ["PyTorchRandomizedSmoothing"],
+    "art.estimators.certification.derandomized_smoothing.pytorch": ["PyTorchDeRandomizedSmoothing"],
+    "art.estimators.certification.derandomized_smoothing.tensorflow": ["TensorFlowV2DeRandomizedSmoothing"],
+    "art.estimators.certification.object_seeker.object_seeker": ["ObjectSeekerMixin"],
+    "art.estimators.certification.object_seeker.pytorch": ["PyTorchObjectSeeker"],
+}
+
+if importlib.util.find_spec("torch") is not None:
+    _ATTRIBUTES.update(
+        {
+            "art.estimators.certification.deep_z.deep_z": ["ZonoDenseLayer", "ZonoBounds", "ZonoConv", "ZonoReLU"],
+            "art.estimators.certification.deep_z.pytorch": ["PytorchDeepZ"],
+            "art.estimators.certification.interval.interval": [
+                "PyTorchIntervalDense",
+                "PyTorchIntervalConv2D",
+                "PyTorchIntervalReLU",
+                "PyTorchIntervalFlatten",
+                "PyTorchIntervalBounds",
+            ],
+            "art.estimators.certification.interval.pytorch": ["PyTorchIBPClassifier"],
+        }
+    )
 else:
     import warnings
 
     warnings.warn("PyTorch not found. Not importing DeepZ or Interval Bound Propagation functionality")
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["deep_z", "derandomized_smoothing", "interval", "object_seeker", "randomized_smoothing"],
+    attributes=_ATTRIBUTES,
+)
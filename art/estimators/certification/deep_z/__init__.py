@@ -1,8 +1,21 @@
 """
 DeepZ based certification estimators.
 """
-from art.estimators.certification.deep_z.deep_z import ZonoDenseLayer
-from art.estimators.certification.deep_z.deep_z import ZonoBounds
-from art.estimators.certification.deep_z.deep_z import ZonoConv
-from art.estimators.certification.deep_z.deep_z import ZonoReLU
-from art.estimators.certification.deep_z.pytorch import PytorchDeepZ
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.deep_z.deep_z import ZonoDenseLayer
+    from art.estimators.certification.deep_z.deep_z import ZonoBounds
+    from art.estimators.certification.deep_z.deep_z import ZonoConv
+    from art.estimators.certification.deep_z.deep_z import ZonoReLU
+    from art.estimators.certification.deep_z.pytorch import PytorchDeepZ
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.certification.deep_z.deep_z": ["ZonoDenseLayer", "ZonoBounds", "ZonoConv", "ZonoReLU"],
+        "art.estimators.certification.deep_z.pytorch": ["PytorchDeepZ"],
+    },
+)
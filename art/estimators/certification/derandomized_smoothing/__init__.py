@@ -1,5 +1,18 @@
 """
 DeRandomized smoothing estimators.
 """
-from art.estimators.certification.derandomized_smoothing.pytorch import PyTorchDeRandomizedSmoothing
-from art.estimators.certification.derandomized_smoothing.tensorflow import TensorFlowV2DeRandomizedSmoothing
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.derandomized_smoothing.pytorch import PyTorchDeRandomizedSmoothing
+    from art.estimators.certification.derandomized_smoothing.tensorflow import TensorFlowV2DeRandomizedSmoothing
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.certification.derandomized_smoothing.pytorch": ["PyTorchDeRandomizedSmoothing"],
+        "art.estimators.certification.derandomized_smoothing.tensorflow": ["TensorFlowV2DeRandomizedSmoothing"],
+    },
+)
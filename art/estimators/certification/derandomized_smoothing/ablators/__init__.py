@@ -2,11 +2,25 @@
 This module contains the ablators for the certified smoothing approaches.
 """
 import importlib
+from typing import TYPE_CHECKING
 
-from art.estimators.certification.derandomized_smoothing.ablators.tensorflow import ColumnAblator, BlockAblator
+from art.lazy_loader import attach
 
-if importlib.util.find_spec("torch") is not None:
+if TYPE_CHECKING:
+    from art.estimators.certification.derandomized_smoothing.ablators.tensorflow import ColumnAblator, BlockAblator
     from art.estimators.certification.derandomized_smoothing.ablators.pytorch import (
         ColumnAblatorPyTorch,
         BlockAblatorPyTorch,
     )
+
+_ATTRIBUTES = {
+    "art.estimators.certification.derandomized_smoothing.ablators.tensorflow": ["ColumnAblator", "BlockAblator"],
+}
+
+if importlib.util.find_spec("torch") is not None:
+    _ATTRIBUTES["art.estimators.certification.derandomized_smoothing.ablators.pytorch"] = [
+        "ColumnAblatorPyTorch",
+        "BlockAblatorPyTorch",
+    ]
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes=_ATTRIBUTES)
@@ -1,9 +1,28 @@
 """
 Interval based certification estimators.
 """
-from art.estimators.certification.interval.interval import PyTorchIntervalDense
-from art.estimators.certification.interval.interval import PyTorchIntervalConv2D
-from art.estimators.certification.interval.interval import PyTorchIntervalReLU
-from art.estimators.certification.interval.interval import PyTorchIntervalFlatten
-from art.estimators.certification.interval.interval import PyTorchIntervalBounds
-from art.estimators.certification.interval.pytorch import PyTorchIBPClassifier
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.interval.interval import PyTorchIntervalDense
+    from art.estimators.certification.interval.interval import PyTorchIntervalConv2D
+    from art.estimators.certification.interval.interval import PyTorchIntervalReLU
+    from art.estimators.certification.interval.interval import PyTorchIntervalFlatten
+    from art.estimators.certification.interval.interval import PyTorchIntervalBounds
+    from art.estimators.certification.interval.pytorch import PyTorchIBPClassifier
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.certification.interval.interval": [
+            "PyTorchIntervalDense",
+            "PyTorchIntervalConv2D",
+            "PyTorchIntervalReLU",
+            "PyTorchIntervalFlatten",
+            "PyTorchIntervalBounds",
+        ],
+        "art.estimators.certification.interval.pytorch": ["PyTorchIBPClassifier"],
+    },
+)
@@ -1,5 +1,18 @@
 """
 ObjectSeeker estimators.
 """
-from art.estimators.certification.object_seeker.object_seeker import ObjectSeekerMixin
-from art.estimators.certification.object_seeker.pytorch import PyTorchObjectSeeker
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.object_seeker.object_seeker import ObjectSeekerMixin
+    from art.estimators.certification.object_seeker.pytorch import PyTorchObjectSeeker
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.certification.object_seeker.object_seeker": ["ObjectSeekerMixin"],
+        "art.estimators.certification.object_seeker.pytorch": ["PyTorchObjectSeeker"],
+    },
+)
@@ -1,13 +1,32 @@
 """
 Randomized smoothing estimators.
 """
-from art.estimators.certification.randomized_smoothing.randomized_smoothing import RandomizedSmoothingMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.certification.randomized_smoothing.numpy import NumpyRandomizedSmoothing
-from art.estimators.certification.randomized_smoothing.pytorch import PyTorchRandomizedSmoothing
-from art.estimators.certification.randomized_smoothing.tensorflow import TensorFlowV2RandomizedSmoothing
-from art.estimators.certification.randomized_smoothing.smooth_mix.pytorch import PyTorchSmoothMix
-from art.estimators.certification.randomized_smoothing.macer.pytorch import PyTorchMACER
-from art.estimators.certification.randomized_smoothing.macer.tensorflow import TensorFlowV2MACER
-from art.estimators.certification.randomized_smoothing.smooth_adv.pytorch import PyTorchSmoothAdv
-from art.estimators.certification.randomized_smoothing.smooth_adv.tensorflow import TensorFlowV2SmoothAdv
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.randomized_smoothing.randomized_smoothing import RandomizedSmoothingMixin
+    from art.estimators.certification.randomized_smoothing.numpy import NumpyRandomizedSmoothing
+    from art.estimators.certification.randomized_smoothing.pytorch import PyTorchRandomizedSmoothing
+    from art.estimators.certification.randomized_smoothing.tensorflow import TensorFlowV2RandomizedSmoothing
+    from art.estimators.certification.randomized_smoothing.smooth_mix.pytorch import PyTorchSmoothMix
+    from art.estimators.certification.randomized_smoothing.macer.pytorch import PyTorchMACER
+    from art.estimators.certification.randomized_smoothing.macer.tensorflow import TensorFlowV2MACER
+    from art.estimators.certification.randomized_smoothing.smooth_adv.pytorch import PyTorchSmoothAdv
+    from art.estimators.certification.randomized_smoothing.smooth_adv.tensorflow import TensorFlowV2SmoothAdv
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.certification.randomized_smoothing.randomized_smoothing": ["RandomizedSmoothingMixin"],
+        "art.estimators.certification.randomized_smoothing.numpy": ["NumpyRandomizedSmoothing"],
+        "art.estimators.certification.randomized_smoothing.pytorch": ["PyTorchRandomizedSmoothing"],
+        "art.estimators.certification.randomized_smoothing.tensorflow": ["TensorFlowV2RandomizedSmoothing"],
+        "art.estimators.certification.randomized_smoothing.smooth_mix.pytorch": ["PyTorchSmoothMix"],
+        "art.estimators.certification.randomized_smoothing.macer.pytorch": ["PyTorchMACER"],
+        "art.estimators.certification.randomized_smoothing.macer.tensorflow": ["TensorFlowV2MACER"],
+        "art.estimators.certification.randomized_smoothing.smooth_adv.pytorch": ["PyTorchSmoothAdv"],
+        "art.estimators.certification.randomized_smoothing.smooth_adv.tensorflow": ["TensorFlowV2SmoothAdv"],
+    },
+)
@@ -2,27 +2,55 @@
 Classifier API for applying all attacks. Use the :class:`.Classifier` wrapper to be able to apply an attack to a
 preexisting model.
 """
-from art.estimators.classification.classifier import (
-    ClassifierMixin,
-    ClassGradientsMixin,
-)
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.classification.classifier import (
+        ClassifierMixin,
+        ClassGradientsMixin,
+    )
+    from art.estimators.classification.blackbox import BlackBoxClassifier, BlackBoxClassifierNeuralNetwork
+    from art.estimators.classification.catboost import CatBoostARTClassifier
+    from art.estimators.classification.deep_partition_ensemble import DeepPartitionEnsemble
+    from art.estimators.classification.detector_classifier import DetectorClassifier
+    from art.estimators.classification.ensemble import EnsembleClassifier
+    from art.estimators.classification.GPy import GPyGaussianProcessClassifier
+    from art.estimators.classification.keras import KerasClassifier
+    from art.estimators.classification.lightgbm import LightGBMClassifier
+    from art.estimators.classification.mxnet import MXClassifier
+    from art.estimators.classification.pytorch import PyTorchClassifier
+    from art.estimators.classification.hugging_face import HuggingFaceClassifierPyTorch
+    from art.estimators.classification.query_counting import QueryCountingClassifier
+    from art.estimators.classification.query_efficient_bb import QueryEfficientGradientEstimationClassifier
+    from art.estimators.classification.scikitlearn import SklearnClassifier
+    from art.estimators.classification.tensorflow import (
+        TFClassifier,
+        TensorFlowClassifier,
+        TensorFlowV2Classifier,
+    )
+    from art.estimators.classification.xgboost import XGBoostClassifier
 
-from art.estimators.classification.blackbox import BlackBoxClassifier, BlackBoxClassifierNeuralNetwork
-from art.estimators.classification.catboost import CatBoostARTClassifier
-from art.estimators.classification.deep_partition_ensemble import DeepPartitionEnsemble
-from art.estimators.classification.detector_classifier import DetectorClassifier
-from art.estimators.classification.ensemble import EnsembleClassifier
-from art.estimators.classification.GPy import GPyGaussianProcessClassifier
-from art.estimators.classification.keras import KerasClassifier
-from art.estimators.classification.lightgbm import LightGBMClassifier
-from art.estimators.classification.mxnet import MXClassifier
-from art.estimators.classification.pytorch import PyTorchClassifier
-from art.estimators.classification.hugging_face import HuggingFaceClassifierPyTorch
-from art.estimators.classification.query_efficient_bb import QueryEfficientGradientEstimationClassifier
-from art.estimators.classification.scikitlearn import SklearnClassifier
-from art.estimators.classification.tensorflow import (
-    TFClassifier,
-    TensorFlowClassifier,
-    TensorFlowV2Classifier,
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.classification.classifier": ["ClassifierMixin", "ClassGradientsMixin"],
+        "art.estimators.classification.blackbox": ["BlackBoxClassifier", "BlackBoxClassifierNeuralNetwork"],
+        "art.estimators.classification.catboost": ["CatBoostARTClassifier"],
+        "art.estimators.classification.deep_partition_ensemble": ["DeepPartitionEnsemble"],
+        "art.estimators.classification.detector_classifier": ["DetectorClassifier"],
+        "art.estimators.classification.ensemble": ["EnsembleClassifier"],
+        "art.estimators.classification.GPy": ["GPyGaussianProcessClassifier"],
+        "art.estimators.classification.keras": ["KerasClassifier"],
+        "art.estimators.classification.lightgbm": ["LightGBMClassifier"],
+        "art.estimators.classification.mxnet": ["MXClassifier"],
+        "art.estimators.classification.pytorch": ["PyTorchClassifier"],
+        "art.estimators.classification.hugging_face": ["HuggingFaceClassifierPyTorch"],
+        "art.estimators.classification.query_counting": ["QueryCountingClassifier"],
+        "art.estimators.classification.query_efficient_bb": ["QueryEfficientGradientEstimationClassifier"],
+        "art.estimators.classification.scikitlearn": ["SklearnClassifier"],
+        "art.estimators.classification.tensorflow": ["TFClassifier", "TensorFlowClassifier", "TensorFlowV2Classifier"],
+        "art.estimators.classification.xgboost": ["XGBoostClassifier"],
+    },
 )
-from art.estimators.classification.xgboost import XGBoostClassifier
@@ -869,6 +869,78 @@ class PyTorchClassifier(ClassGradientsMixin, ClassifierMixin, PyTorchEstimator):
 
         return grads
 
+    def per_sample_weight_gradients(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        batch_size: int = 128,
+        norm: bool = False,
+        training_mode: bool = False,
+    ) -> np.ndarray:
+        """
+        Compute the gradients of the loss of every sample w.r.t. the trainable parameters of the model. The gradients of
+        a batch of samples are computed with one vectorised pass of `torch.func` if available, else one sample at a
+        time.
+
+        :param x: Sample input with shape as expected by the model.
+        :param y: Target values (class labels) one-hot-encoded of shape `(nb_samples, nb_classes)` or indices of shape
+                  `(nb_samples,)`.
+        :param batch_size: Size of the batches of samples whose gradients are computed together.
+        :param norm: Return the L2 norms of the gradients instead of the gradients.
+        :param training_mode: `True` for model set to training mode and `'False` for model set to evaluation mode.
+        :return: Array of the flattened gradients of shape `(nb_samples, nb_parameters)` or, if `norm` is `True`, of
+                 their norms of shape `(nb_samples,)`.
+        """
+        import torch
+
+        self._model.train(mode=training_mode)
+
+        y = check_and_transform_label_format(y, self.nb_classes)  # type: ignore
+
+        # Apply preprocessing
+        x_preprocessed, y_preprocessed = self._apply_preprocessing(x, y, fit=False)
+
+        # Check label shape
+        y_preprocessed = self.reduce_labels(y_preprocessed)
+
+        if hasattr(torch, "func"):
+            params = {name: param.detach() for name, param in self._model.named_parameters() if param.requires_grad}
+            buffers = {name: buffer.detach() for name, buffer in self._model.named_buffers()}
+
+            def _loss_sample(params_sample, x_sample, y_sample):
+                model_outputs = torch.func.functional_call(self._model, (params_sample, buffers), (x_sample[None],))
+                return self._loss(model_outputs[-1], y_sample[None])
+
+            grad_batch = torch.func.vmap(torch.func.grad(_loss_sample), in_dims=(None, 0, 0))
+
+            def _weight_grads(x_batch, y_batch):
+                return list(grad_batch(params, x_batch, y_batch).values())
+
+        else:  # pragma: no cover
+
+            def _weight_grads(x_batch, y_batch):
+                differentiable_params = [param for param in self._model.parameters() if param.requires_grad]
+                grads = []
+                for x_sample, y_sample in zip(x_batch, y_batch):
+                    loss = self._loss(self._model(x_sample[None])[-1], y_sample[None])
+                    grads.append(torch.autograd.grad(loss, differentiable_params))
+                return [torch.stack(grads_param) for grads_param in zip(*grads)]
+
+        results = []
+        num_batch = int(np.ceil(len(x_preprocessed) / float(batch_size)))
+        for m in range(num_batch):
+            begin, end = m * batch_size, min((m + 1) * batch_size, x_preprocessed.shape[0])
+            x_batch = torch.from_numpy(x_preprocessed[begin:end]).to(self._device)
+            y_batch = torch.from_numpy(y_preprocessed[begin:end]).to(self._device)
+
+            grads = _weight_grads(x_batch, y_batch)
+            grads_flat = torch.cat([grad.reshape(end - begin, -1) for grad in grads], dim=1)
+            if norm:
+                grads_flat = torch.linalg.norm(grads_flat, dim=1)
+            results.append(grads_flat.detach().cpu().numpy())
+
+        return np.concatenate(results)
+
     def custom_loss_gradient(  # pylint: disable=W0221
         self,
         loss_fn,
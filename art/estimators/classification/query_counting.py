@@ -0,0 +1,210 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2024
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This module implements a classifier wrapper counting the queries to the predictions of a classifier.
+"""
+import logging
+from typing import Optional, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
+
+from art.estimators.estimator import BaseEstimator
+from art.estimators.classification.classifier import ClassifierMixin
+
+if TYPE_CHECKING:
+    from art.utils import CLASSIFIER_TYPE
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCountingClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Wrapper counting the queries to the predictions of a classifier, in total and per sample of an attack. Every
+    input of `predict` and `compute_loss` counts as one query. The queries of a call are attributed to the samples in
+    `sample_index`. All other attributes, including the preprocessing and postprocessing applied by the wrapped
+    classifier, are read from the wrapped classifier.
+    """
+
+    estimator_params = ["max_queries"]
+
+    def __init__(
+        self,
+        classifier: "CLASSIFIER_TYPE",
+        nb_samples: int = 1,
+        max_queries: Optional[int] = None,
+    ) -> None:
+        """
+        Create a `QueryCountingClassifier` instance.
+
+        :param classifier: The classifier whose queries are counted.
+        :param nb_samples: The number of samples the queries are attributed to.
+        :param max_queries: The budget of queries per sample. Unlimited if `None`.
+        """
+        super().__init__(model=classifier.model, clip_values=classifier.clip_values, preprocessing=None)
+        # Read the preprocessing and postprocessing of the wrapped classifier instead, which applies them
+        for name in ["preprocessing", "preprocessing_defences", "postprocessing_defences", "preprocessing_operations"]:
+            delattr(self, name)
+        self._classifier = classifier
+        self._nb_samples = nb_samples
+        self._nb_classes = classifier.nb_classes
+        self.max_queries = max_queries
+        self.sample_index: Optional[Union[int, np.ndarray]] = None
+        self.queries_per_sample = np.zeros(nb_samples, dtype=np.int64)
+        self.nb_queries = 0
+        self.nb_calls = 0
+        self._check_params()
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not found on the wrapper itself
+        if name.startswith("__") or name == "_classifier":
+            raise AttributeError(name)
+        return getattr(self._classifier, name)
+
+    @property
+    def classifier(self) -> "CLASSIFIER_TYPE":
+        """
+        Return the wrapped classifier.
+
+        :return: The wrapped classifier.
+        """
+        return self._classifier
+
+    @property
+    def input_shape(self) -> Tuple[int, ...]:
+        """
+        Return the shape of one input sample.
+
+        :return: Shape of one input sample.
+        """
+        return self._classifier.input_shape  # type: ignore
+
+    def predict(self, x: np.ndarray, batch_size: int = 128, **kwargs) -> np.ndarray:  # pylint: disable=W0221
+        """
+        Perform prediction of the wrapped classifier and count the queries. The inputs `x` are attributed to the samples
+        in `sample_index`, in the same order and with the same number of inputs per sample.
+
+        :param x: Input samples.
+        :param batch_size: Size of batches.
+        :return: Array of predictions of shape `(nb_inputs, nb_classes)`.
+        """
+        self._count(x)
+        return self._classifier.predict(x, batch_size=batch_size, **kwargs)
+
+    def fit(self, x: np.ndarray, y: np.ndarray, **kwargs) -> None:
+        """
+        Fit the wrapped classifier using the training data `(x, y)`.
+
+        :param x: Training data.
+        :param y: Target values.
+        :param kwargs: Dictionary of framework-specific arguments.
+        """
+        self._classifier.fit(x, y, **kwargs)
+
+    def compute_loss(self, x: np.ndarray, y: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Compute the loss of the wrapped classifier and count the queries as for `predict`.
+
+        :param x: Input samples.
+        :param y: Target values.
+        :return: Loss values.
+        """
+        self._count(x)
+        return self._classifier.compute_loss(x, y, **kwargs)  # type: ignore
+
+    def compute_loss_from_predictions(self, pred: np.ndarray, y: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Compute the loss of the wrapped classifier for predictions `pred`, which does not query the classifier.
+
+        :param pred: Model predictions.
+        :param y: Target values.
+        :return: Loss values.
+        """
+        return self._classifier.compute_loss_from_predictions(pred, y, **kwargs)
+
+    def clone_for_refitting(self) -> "QueryCountingClassifier":
+        """
+        Clone the wrapped classifier for refitting and wrap the clone in a new counter with the same budget.
+
+        :return: A new `QueryCountingClassifier` without queries.
+        """
+        return QueryCountingClassifier(
+            self._classifier.clone_for_refitting(),  # type: ignore
+            nb_samples=self._nb_samples,
+            max_queries=self.max_queries,
+        )
+
+    def remaining_queries(self, index: Optional[Union[int, np.ndarray]] = None) -> np.ndarray:
+        """
+        Return the number of queries left in the budget of the samples.
+
+        :param index: Index or indices of the samples. The samples in `sample_index` if `None`, or all samples if it is
+                      also `None`.
+        :return: The remaining queries of the samples, `np.inf` without budget.
+        """
+        if index is None:
+            index = np.arange(self.queries_per_sample.shape[0]) if self.sample_index is None else self.sample_index
+        if self.max_queries is None:
+            return np.full(np.shape(index), np.inf)
+        return np.maximum(self.max_queries - self.queries_per_sample[index], 0)
+
+    def is_exhausted(self, index: Optional[Union[int, np.ndarray]] = None) -> Union[bool, np.ndarray]:
+        """
+        Check whether the budget of queries of the samples is exhausted.
+
+        :param index: Index or indices of the samples. The samples in `sample_index` if `None`, or all samples if it is
+                      also `None`.
+        :return: `True` for the samples without remaining queries.
+        """
+        remaining = self.remaining_queries(index)
+        if np.ndim(remaining) == 0:
+            return bool(remaining <= 0)
+        return remaining <= 0
+
+    def histogram(self, bins: Union[int, np.ndarray] = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the histogram of the queries per sample.
+
+        :param bins: The number of bins or the bin edges, as for `np.histogram`.
+        :return: A tuple of the number of samples per bin and the bin edges.
+        """
+        return np.histogram(self.queries_per_sample, bins=bins)
+
+    def _count(self, x: np.ndarray) -> None:
+        """
+        Count the queries of the inputs `x` and attribute them to the samples in `sample_index`.
+        """
+        if self.sample_index is not None:
+            index = np.atleast_1d(self.sample_index)
+            if x.shape[0] % index.shape[0] != 0:
+                raise ValueError(
+                    "The number of inputs has to be a multiple of the number of samples in `sample_index`."
+                )
+            np.add.at(self.queries_per_sample, np.repeat(index, x.shape[0] // index.shape[0]), 1)
+
+        self.nb_queries += x.shape[0]
+        self.nb_calls += 1
+
+    def _update_preprocessing_operations(self):
+        # The wrapped classifier updates its own preprocessing operations
+        pass
+
+    def _check_params(self) -> None:
+        super()._check_params()
+
+        if self.max_queries is not None and (not isinstance(self.max_queries, int) or self.max_queries <= 0):
+            raise ValueError("The maximum number of queries `max_queries` must be a positive integer or None.")
@@ -21,7 +21,6 @@ This module implements the classifiers for scikit-learn models.
 # pylint: disable=C0302
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from copy import deepcopy
 import importlib
 import logging
 import os
@@ -370,40 +369,46 @@ class ScikitlearnDecisionTreeClassifier(ScikitlearnClassifier):
     def _get_leaf_nodes(self, node_id, i_tree, class_label, box) -> List["LeafNode"]:
         from art.metrics.verification_decisions_trees import LeafNode, Box, Interval
 
-        leaf_nodes = []
+        leaf_nodes: List[LeafNode] = []
 
-        if self.get_left_child(node_id) != self.get_right_child(node_id):
+        # Read the tree structure once, accessing the attributes of `tree_` creates new arrays on every access
+        children_left = self.model.tree_.children_left
+        children_right = self.model.tree_.children_right
+        features = self.model.tree_.feature
+        thresholds = self.model.tree_.threshold
 
-            node_left = self.get_left_child(node_id)
-            node_right = self.get_right_child(node_id)
+        # Depth-first traversal visiting left children first. A shallow copy of the parent box is sufficient because
+        # intersecting boxes replaces intervals instead of modifying them.
+        stack = [(node_id, box)]
+        while stack:
+            node_id, box = stack.pop()
 
-            box_left = deepcopy(box)
-            box_right = deepcopy(box)
+            if children_left[node_id] != children_right[node_id]:
 
-            feature = self.get_feature_at_node(node_id)
-            box_split_left = Box(intervals={feature: Interval(-np.inf, self.get_threshold_at_node(node_id))})
-            box_split_right = Box(intervals={feature: Interval(self.get_threshold_at_node(node_id), np.inf)})
+                node_left = children_left[node_id]
+                node_right = children_right[node_id]
 
-            if box.intervals:
-                box_left.intersect_with_box(box_split_left)
-                box_right.intersect_with_box(box_split_right)
-            else:
-                box_left = box_split_left
-                box_right = box_split_right
+                box_left = Box(intervals=box.intervals.copy())
+                box_right = Box(intervals=box.intervals.copy())
 
-            leaf_nodes += self._get_leaf_nodes(node_left, i_tree, class_label, box_left)
-            leaf_nodes += self._get_leaf_nodes(node_right, i_tree, class_label, box_right)
+                feature = int(features[node_id])
+                threshold = float(thresholds[node_id])
+                box_left.intersect_with_box(Box(intervals={feature: Interval(-np.inf, threshold)}))
+                box_right.intersect_with_box(Box(intervals={feature: Interval(threshold, np.inf)}))
 
-        else:
-            leaf_nodes.append(
-                LeafNode(
-                    tree_id=i_tree,
-                    class_label=class_label,
-                    node_id=node_id,
-                    box=box,
-                    value=self.get_values_at_node(node_id)[0, class_label],
+                stack.append((node_right, box_right))
+                stack.append((node_left, box_left))
+
+            else:
+                leaf_nodes.append(
+                    LeafNode(
+                        tree_id=i_tree,
+                        class_label=class_label,
+                        node_id=node_id,
+                        box=box,
+                        value=self.get_values_at_node(node_id)[0, class_label],
+                    )
                 )
-            )
 
         return leaf_nodes
 
@@ -992,6 +997,9 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
     Class for scikit-learn C-Support Vector Classification models.
     """
 
+    # Upper bound on the number of elements of the intermediate arrays of the vectorized kernel gradients.
+    _max_chunk_elements = 2**24
+
     def __init__(
         self,
         model: Union["sklearn.svm.SVC", "sklearn.svm.LinearSVC"],
@@ -1054,174 +1062,141 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
             if self.model.fit_status_:  # pragma: no cover
                 raise AssertionError("Model has not been fitted correctly.")
 
-            support_indices = [0] + list(np.cumsum(self.model.n_support_))
-
             if self.nb_classes == 2:
                 sign_multiplier = -1
             else:
                 sign_multiplier = 1
 
+            sv_weights = self._get_support_vector_weights()
             if label is None:
-                gradients = np.zeros(
-                    (
-                        x_preprocessed.shape[0],
-                        self.nb_classes,
-                        x_preprocessed.shape[1],
-                    )
-                )
-
-                for i_label in range(self.nb_classes):  # type: ignore
-                    for i_sample in range(num_samples):
-                        for not_label in range(self.nb_classes):  # type: ignore
-                            if i_label != not_label:
-                                if not_label < i_label:
-                                    label_multiplier = -1
-                                else:
-                                    label_multiplier = 1
-
-                                for label_sv in range(
-                                    support_indices[i_label],
-                                    support_indices[i_label + 1],
-                                ):
-                                    alpha_i_k_y_i = self.model.dual_coef_[
-                                        not_label if not_label < i_label else not_label - 1,
-                                        label_sv,
-                                    ]
-                                    grad_kernel = self._get_kernel_gradient_sv(label_sv, x_preprocessed[i_sample])
-                                    gradients[i_sample, i_label] += label_multiplier * alpha_i_k_y_i * grad_kernel
-
-                                for not_label_sv in range(
-                                    support_indices[not_label],
-                                    support_indices[not_label + 1],
-                                ):
-                                    alpha_i_k_y_i = self.model.dual_coef_[
-                                        i_label if i_label < not_label else i_label - 1,
-                                        not_label_sv,
-                                    ]
-                                    grad_kernel = self._get_kernel_gradient_sv(not_label_sv, x_preprocessed[i_sample])
-                                    gradients[i_sample, i_label] += label_multiplier * alpha_i_k_y_i * grad_kernel
-
+                sv_weights = sv_weights[None, ...]
             elif isinstance(label, int):
-                gradients = np.zeros((x_preprocessed.shape[0], 1, x_preprocessed.shape[1]))
-
-                for i_sample in range(num_samples):
-                    for not_label in range(self.nb_classes):  # type: ignore
-                        if label != not_label:
-                            if not_label < label:
-                                label_multiplier = -1
-                            else:
-                                label_multiplier = 1
-
-                            for label_sv in range(support_indices[label], support_indices[label + 1]):
-                                alpha_i_k_y_i = self.model.dual_coef_[
-                                    not_label if not_label < label else not_label - 1,
-                                    label_sv,
-                                ]
-                                grad_kernel = self._get_kernel_gradient_sv(label_sv, x_preprocessed[i_sample])
-                                gradients[i_sample, 0] += label_multiplier * alpha_i_k_y_i * grad_kernel
-
-                            for not_label_sv in range(
-                                support_indices[not_label],
-                                support_indices[not_label + 1],
-                            ):
-                                alpha_i_k_y_i = self.model.dual_coef_[
-                                    label if label < not_label else label - 1,
-                                    not_label_sv,
-                                ]
-                                grad_kernel = self._get_kernel_gradient_sv(not_label_sv, x_preprocessed[i_sample])
-                                gradients[i_sample, 0] += label_multiplier * alpha_i_k_y_i * grad_kernel
-
+                sv_weights = sv_weights[None, [label]]
             elif (
                 (isinstance(label, list) and len(label) == num_samples)
                 or isinstance(label, np.ndarray)
                 and label.shape == (num_samples,)
             ):
-                gradients = np.zeros((x_preprocessed.shape[0], 1, x_preprocessed.shape[1]))
-
-                for i_sample in range(num_samples):
-                    for not_label in range(self.nb_classes):  # type: ignore
-                        if label[i_sample] != not_label:
-                            if not_label < label[i_sample]:
-                                label_multiplier = -1
-                            else:
-                                label_multiplier = 1
-
-                            for label_sv in range(
-                                support_indices[label[i_sample]],
-                                support_indices[label[i_sample] + 1],
-                            ):
-                                alpha_i_k_y_i = self.model.dual_coef_[
-                                    not_label if not_label < label[i_sample] else not_label - 1,
-                                    label_sv,
-                                ]
-                                grad_kernel = self._get_kernel_gradient_sv(label_sv, x_preprocessed[i_sample])
-                                gradients[i_sample, 0] += label_multiplier * alpha_i_k_y_i * grad_kernel
-
-                            for not_label_sv in range(
-                                support_indices[not_label],
-                                support_indices[not_label + 1],
-                            ):
-                                alpha_i_k_y_i = self.model.dual_coef_[
-                                    label[i_sample] if label[i_sample] < not_label else label[i_sample] - 1,
-                                    not_label_sv,
-                                ]
-                                grad_kernel = self._get_kernel_gradient_sv(not_label_sv, x_preprocessed[i_sample])
-                                gradients[i_sample, 0] += label_multiplier * alpha_i_k_y_i * grad_kernel
-
+                sv_weights = sv_weights[np.array(label)][:, None, :]
             else:
                 raise TypeError("Unrecognized type for argument `label` with type " + str(type(label)))
 
+            gradients = self._get_kernel_gradients(x_preprocessed, sv_weights)
             gradients = self._apply_preprocessing_gradient(x, gradients * sign_multiplier)
 
         elif isinstance(self.model, sklearn.svm.LinearSVC):
-            if label is None:
-                gradients = np.zeros(
-                    (
-                        x_preprocessed.shape[0],
-                        self.nb_classes,
-                        x_preprocessed.shape[1],
-                    )
-                )
-
-                for i in range(self.nb_classes):  # type: ignore
-                    for i_sample in range(num_samples):
-                        if self.nb_classes == 2:
-                            gradients[i_sample, i] = self.model.coef_[0] * (2 * i - 1)
-                        else:
-                            gradients[i_sample, i] = self.model.coef_[i]
+            if self.nb_classes == 2:
+                coef = np.concatenate((-self.model.coef_, self.model.coef_))
+            else:
+                coef = self.model.coef_
 
+            if label is None:
+                gradients = np.repeat(coef[None, ...], num_samples, axis=0)
             elif isinstance(label, int):
-                gradients = np.zeros((x_preprocessed.shape[0], 1, x_preprocessed.shape[1]))
-
-                for i_sample in range(num_samples):
-                    if self.nb_classes == 2:
-                        gradients[i_sample, 0] = self.model.coef_[0] * (2 * label - 1)
-                    else:
-                        gradients[i_sample, 0] = self.model.coef_[label]
-
+                gradients = np.repeat(coef[None, [label]], num_samples, axis=0)
             elif (
                 (isinstance(label, list) and len(label) == num_samples)
                 or isinstance(label, np.ndarray)
                 and label.shape == (num_samples,)
             ):
-                gradients = np.zeros((x_preprocessed.shape[0], 1, x_preprocessed.shape[1]))
-
-                for i_sample in range(num_samples):
-                    if self.nb_classes == 2:
-                        gradients[i_sample, 0] = self.model.coef_[0] * (2 * label[i_sample] - 1)
-                    else:
-                        gradients[i_sample, 0] = self.model.coef_[label[i_sample]]
-
+                gradients = coef[np.array(label)][:, None, :]
             else:
                 raise TypeError("Unrecognized type for argument `label` with type " + str(type(label)))
 
-            gradients = self._apply_preprocessing_gradient(x, gradients)
+            gradients = self._apply_preprocessing_gradient(x, gradients.astype(np.float64))
 
         else:
             raise ValueError("Type of `self.model` not supported for class-gradients.")
 
         return gradients
 
+    def _get_support_vector_weights(self, loss: bool = False) -> np.ndarray:
+        """
+        Combine the dual coefficients of the one-vs-one decision functions per class, such that the gradient of the
+        output of class `c` is the sum of the kernel gradients of all support vectors weighted by row `c`.
+
+        :param loss: If `True`, weight the support vectors of both classes of each pair by the dual coefficients
+                     indexed by the other class, as in equation (1) of the loss gradient.
+        :return: Array of weights of shape `(nb_classes, nb_support_vectors)`.
+        """
+        dual_coef = self.model.dual_coef_
+        support_indices = [0] + list(np.cumsum(self.model.n_support_))
+        sv_weights = np.zeros((self.nb_classes, dual_coef.shape[1]))
+
+        for i_label in range(self.nb_classes):  # type: ignore
+            label_sv = slice(support_indices[i_label], support_indices[i_label + 1])
+            for not_label in range(self.nb_classes):  # type: ignore
+                if i_label != not_label:
+                    label_multiplier = -1 if not_label < i_label else 1
+                    not_label_sv = slice(support_indices[not_label], support_indices[not_label + 1])
+                    sv_weights[i_label, label_sv] += (
+                        label_multiplier * dual_coef[not_label if not_label < i_label else not_label - 1, label_sv]
+                    )
+                    if loss:
+                        i_dual_coef = not_label if not_label < i_label else not_label - 1
+                    else:
+                        i_dual_coef = i_label if i_label < not_label else i_label - 1
+                    sv_weights[i_label, not_label_sv] += label_multiplier * dual_coef[i_dual_coef, not_label_sv]
+
+        return sv_weights
+
+    def _get_kernel_gradient_factors(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the scalar factors of the kernel gradients for all pairs of samples and support vectors. The gradient
+        of the kernel of support vector `sv` w.r.t. sample `x` is the factor times `sv` for the linear, polynomial and
+        sigmoid kernels, and the factor times `x - sv` for the RBF kernel.
+
+        :param x: Samples of shape `(nb_samples, nb_features)`.
+        :return: Array of factors of shape `(nb_samples, nb_support_vectors)`.
+        """
+        # pylint: disable=W0212
+        support_vectors = self.model.support_vectors_
+        if self.model.kernel == "linear":
+            return np.ones((x.shape[0], support_vectors.shape[0]))
+
+        dot_products = x @ support_vectors.T
+        if self.model.kernel == "poly":
+            return self.model.degree * (self.model._gamma * dot_products + self.model.coef0) ** (self.model.degree - 1)
+        if self.model.kernel == "rbf":
+            squared_distances = (
+                np.sum(x**2, axis=1)[:, None] + np.sum(support_vectors**2, axis=1)[None, :] - 2 * dot_products
+            )
+            return -2 * self.model._gamma * np.exp(-self.model._gamma * np.maximum(squared_distances, 0))
+        if self.model.kernel == "sigmoid":
+            return self.model._gamma * (1 - np.tanh(self.model._gamma * dot_products + self.model.coef0) ** 2)
+        raise NotImplementedError(f"Loss gradients for kernel '{self.model.kernel}' are not implemented.")
+
+    def _get_kernel_gradients(self, x: np.ndarray, sv_weights: np.ndarray) -> np.ndarray:
+        """
+        Compute weighted sums of the kernel gradients of all support vectors for a batch of samples in matrix form. The
+        samples are processed in chunks to bound the memory of the intermediate arrays.
+
+        :param x: Samples of shape `(nb_samples, nb_features)`.
+        :param sv_weights: Weights of the support vectors of shape `(nb_samples, nb_outputs, nb_support_vectors)` or
+                           `(1, nb_outputs, nb_support_vectors)` for weights shared by all samples.
+        :return: Array of gradients of shape `(nb_samples, nb_outputs, nb_features)`.
+        """
+        support_vectors = self.model.support_vectors_
+        nb_outputs = sv_weights.shape[1]
+
+        if self.model.kernel == "linear":
+            gradients = sv_weights @ support_vectors
+            return np.repeat(gradients, x.shape[0], axis=0) if sv_weights.shape[0] == 1 else gradients
+
+        gradients = np.zeros((x.shape[0], nb_outputs, x.shape[1]))
+        chunk_size = max(1, self._max_chunk_elements // (nb_outputs * support_vectors.shape[0]))
+        for i_start in range(0, x.shape[0], chunk_size):
+            chunk = slice(i_start, i_start + chunk_size)
+            weights_chunk = sv_weights if sv_weights.shape[0] == 1 else sv_weights[chunk]
+            weighted_factors = self._get_kernel_gradient_factors(x[chunk])[:, None, :] * weights_chunk
+            gradients[chunk] = -(weighted_factors @ support_vectors)
+            if self.model.kernel == "rbf":
+                gradients[chunk] += np.sum(weighted_factors, axis=2)[:, :, None] * x[chunk][:, None, :]
+            else:
+                gradients[chunk] *= -1
+
+        return gradients
+
     def _kernel_grad(self, sv: np.ndarray, x_sample: np.ndarray) -> np.ndarray:
         """
         Applies the kernel gradient to a support vector.
@@ -1248,7 +1223,11 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
                 * (x_sample - sv)
             )
         elif self.model.kernel == "sigmoid":
-            raise NotImplementedError
+            grad = (
+                self.model._gamma
+                * (1 - np.tanh(self.model._gamma * np.sum(x_sample * sv) + self.model.coef0) ** 2)
+                * sv
+            )
         else:
             raise NotImplementedError(f"Loss gradients for kernel '{self.model.kernel}' are not implemented.")
         return grad
@@ -1264,6 +1243,18 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
         x_i = self.model.support_vectors_[i_sv, :]
         return self._kernel_grad(x_i, x_sample)
 
+    def _get_kernel_gradients_sv(self, x_sample: np.ndarray) -> np.ndarray:
+        """
+        Applies the kernel gradient to all of a model's support vectors at once.
+
+        :param x_sample: A sample vector.
+        :return: Array of kernel gradients of shape `(nb_support_vectors, nb_features)`.
+        """
+        factors = self._get_kernel_gradient_factors(x_sample.reshape(1, -1))[0]
+        if self.model.kernel == "rbf":
+            return factors[:, None] * (x_sample.reshape(1, -1) - self.model.support_vectors_)
+        return factors[:, None] * self.model.support_vectors_
+
     def loss_gradient(self, x: np.ndarray, y: np.ndarray, **kwargs) -> np.ndarray:
         """
         Compute the gradient of the loss function w.r.t. `x`.
@@ -1282,8 +1273,6 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
         # Apply preprocessing
         x_preprocessed, y_preprocessed = self._apply_preprocessing(x, y, fit=False)
 
-        num_samples, _ = x_preprocessed.shape
-        gradients = np.zeros_like(x_preprocessed)
         y_index = np.argmax(y_preprocessed, axis=1)
 
         if isinstance(self.model, sklearn.svm.SVC):
@@ -1296,54 +1285,20 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
             else:
                 sign_multiplier = -1
 
-            i_not_label_i = None
-            label_multiplier = None
-            support_indices = [0] + list(np.cumsum(self.model.n_support_))
-
-            for i_sample in range(num_samples):
-                i_label = y_index[i_sample]
-
-                for i_not_label in range(self.nb_classes):  # type: ignore
-                    if i_label != i_not_label:
-                        if i_not_label < i_label:
-                            i_not_label_i = i_not_label
-                            label_multiplier = -1
-                        elif i_not_label > i_label:
-                            i_not_label_i = i_not_label - 1
-                            label_multiplier = 1
-
-                        for i_label_sv in range(support_indices[i_label], support_indices[i_label + 1]):
-                            alpha_i_k_y_i = self.model.dual_coef_[i_not_label_i, i_label_sv] * label_multiplier
-                            grad_kernel = self._get_kernel_gradient_sv(i_label_sv, x_preprocessed[i_sample])
-                            gradients[i_sample, :] += sign_multiplier * alpha_i_k_y_i * grad_kernel
-
-                        for i_not_label_sv in range(
-                            support_indices[i_not_label],
-                            support_indices[i_not_label + 1],
-                        ):
-                            alpha_i_k_y_i = self.model.dual_coef_[i_not_label_i, i_not_label_sv] * label_multiplier
-                            grad_kernel = self._get_kernel_gradient_sv(i_not_label_sv, x_preprocessed[i_sample])
-                            gradients[i_sample, :] += sign_multiplier * alpha_i_k_y_i * grad_kernel
+            sv_weights = self._get_support_vector_weights(loss=True)[y_index][:, None, :]
+            gradients = sign_multiplier * self._get_kernel_gradients(x_preprocessed, sv_weights)[:, 0, :]
 
         elif isinstance(self.model, sklearn.svm.LinearSVC):
-            for i_sample in range(num_samples):
-                i_label = y_index[i_sample]
-                if self.nb_classes == 2:
-                    i_label_i = 0
-                    if i_label == 0:
-                        label_multiplier = 1
-                    elif i_label == 1:
-                        label_multiplier = -1
-                    else:
-                        raise ValueError("Label index not recognized because it is not 0 or 1.")
-                else:
-                    i_label_i = i_label
-                    label_multiplier = -1
-
-                gradients[i_sample] = label_multiplier * self.model.coef_[i_label_i]
+            if self.nb_classes == 2:
+                if np.any(y_index > 1):
+                    raise ValueError("Label index not recognized because it is not 0 or 1.")
+                gradients = (1 - 2 * y_index)[:, None] * self.model.coef_[0]
+            else:
+                gradients = -self.model.coef_[y_index]
         else:
             raise TypeError("Model not recognized.")
 
+        gradients = gradients.astype(x_preprocessed.dtype)
         gradients = self._apply_preprocessing_gradient(x, gradients)
         return gradients
 
@@ -1359,6 +1314,7 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
             polynomial_kernel,
             linear_kernel,
             rbf_kernel,
+            sigmoid_kernel,
         )
 
         if isinstance(self.model, sklearn.svm.LinearSVC):
@@ -1374,6 +1330,8 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
             kernel_func = polynomial_kernel
         elif kernel == "rbf":
             kernel_func = rbf_kernel
+        elif kernel == "sigmoid":
+            kernel_func = sigmoid_kernel
         elif callable(kernel):
             kernel_func = kernel
         else:
@@ -1389,15 +1347,11 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
         :param cols: The column vectors.
         :return: A submatrix of Q.
         """
-        submatrix_shape = (rows.shape[0], cols.shape[0])
         y_row = self.model.predict(rows)
         y_col = self.model.predict(cols)
         y_row[y_row == 0] = -1
         y_col[y_col == 0] = -1
-        q_rc = np.zeros(submatrix_shape)
-        for row in range(q_rc.shape[0]):
-            for col in range(q_rc.shape[1]):
-                q_rc[row][col] = self._kernel([rows[row]], [cols[col]])[0][0] * y_row[row] * y_col[col]
+        q_rc = self._kernel(rows, cols) * y_row[:, None] * y_col[None, :]
 
         return q_rc
 
@@ -1295,6 +1295,70 @@ class TensorFlowV2Classifier(ClassGradientsMixin, ClassifierMixin, TensorFlowV2E
 
         return gradients
 
+    def per_sample_weight_gradients(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        batch_size: int = 128,
+        norm: bool = False,
+        training_mode: bool = False,
+    ) -> np.ndarray:
+        """
+        Compute the gradients of the loss of every sample w.r.t. the weights of the model. The gradients of a batch of
+        samples are computed with one vectorised pass of `tf.vectorized_map`.
+
+        :param x: Sample input with shape as expected by the model.
+        :param y: Target values (class labels) one-hot-encoded of shape `(nb_samples, nb_classes)` or indices of shape
+                  `(nb_samples,)`.
+        :param batch_size: Size of the batches of samples whose gradients are computed together.
+        :param norm: Return the L2 norms of the gradients instead of the gradients.
+        :param training_mode: `True` for model set to training mode and `'False` for model set to evaluation mode.
+        :return: Array of the flattened gradients of shape `(nb_samples, nb_weights)` or, if `norm` is `True`, of
+                 their norms of shape `(nb_samples,)`.
+        """
+        import tensorflow as tf
+
+        if self._loss_object is None:  # pragma: no cover
+            raise TypeError(
+                "The loss function `loss_object` is required for computing weight gradients, but it has not been "
+                "defined."
+            )
+
+        if not tf.executing_eagerly():  # pragma: no cover
+            raise NotImplementedError("Expecting eager execution.")
+
+        y = check_and_transform_label_format(y, self.nb_classes)  # type: ignore
+
+        # Apply preprocessing
+        x_preprocessed, y_preprocessed = self._apply_preprocessing(x, y, fit=False)
+        if self._reduce_labels:
+            y_preprocessed = np.argmax(y_preprocessed, axis=1)
+
+        def _weight_grad(inputs):
+            x_sample, y_sample = inputs
+            with tf.GradientTape() as tape:
+                tape.watch(self.model.weights)
+                predictions = self.model(x_sample[None], training=training_mode)
+                loss = self._loss_object(y_sample[None], predictions)
+            grads = tape.gradient(loss, self.model.weights)
+            grads_flat = tf.concat([tf.reshape(grad, [-1]) for grad in grads if grad is not None], 0)
+            if norm:
+                return tf.sqrt(tf.reduce_sum(tf.square(grads_flat)))
+            return grads_flat
+
+        # Trace the vectorised gradients once for all batches of the same size
+        weight_grad_batch = tf.function(lambda x_batch, y_batch: tf.vectorized_map(_weight_grad, (x_batch, y_batch)))
+
+        results = []
+        num_batch = int(np.ceil(len(x_preprocessed) / float(batch_size)))
+        for m in range(num_batch):
+            begin, end = m * batch_size, min((m + 1) * batch_size, x_preprocessed.shape[0])
+            x_batch = tf.convert_to_tensor(x_preprocessed[begin:end])
+            y_batch = tf.convert_to_tensor(y_preprocessed[begin:end])
+            results.append(weight_grad_batch(x_batch, y_batch).numpy())
+
+        return np.concatenate(results)
+
     def clone_for_refitting(
         self,
     ) -> "TensorFlowV2Classifier":  # pragma: no cover
@@ -1,6 +1,18 @@
 """
 Encoder API.
 """
-from art.estimators.encoding.encoder import EncoderMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.encoding.tensorflow import TensorFlowEncoder
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.encoding.encoder import EncoderMixin
+    from art.estimators.encoding.tensorflow import TensorFlowEncoder
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.encoding.encoder": ["EncoderMixin"],
+        "art.estimators.encoding.tensorflow": ["TensorFlowEncoder"],
+    },
+)
@@ -19,7 +19,9 @@
 This module implements abstract base and mixin classes for estimators in ART.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from contextlib import contextmanager
+import functools
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 from tqdm.auto import trange
@@ -33,6 +35,7 @@ if TYPE_CHECKING:
     from art.metrics.verification_decisions_trees import Tree
     from art.defences.postprocessor.postprocessor import Postprocessor
     from art.defences.preprocessor.preprocessor import Preprocessor
+    from art.estimators.profiler import EstimatorProfiler
 
 
 class BaseEstimator(ABC):
@@ -49,6 +52,19 @@ class BaseEstimator(ABC):
         "preprocessing",
     ]
 
+    # Methods of the estimator and of its preprocessing operations recorded by the profiler
+    profiled_methods = [
+        "predict",
+        "fit",
+        "loss_gradient",
+        "class_gradient",
+        "get_activations",
+        "compute_loss",
+        "_apply_preprocessing",
+        "_apply_preprocessing_gradient",
+    ]
+    profiled_preprocessing_methods = ["__call__", "forward", "estimate_forward", "estimate_gradient"]
+
     def __init__(
         self,
         model,
@@ -333,6 +349,67 @@ class BaseEstimator(ABC):
 
         return post_preds
 
+    def enable_profiling(self, profiler: Optional["EstimatorProfiler"] = None) -> "EstimatorProfiler":
+        """
+        Enable the recording of the calls to the methods in `profiled_methods` of the estimator and to the methods in
+        `profiled_preprocessing_methods` of its preprocessing operations. The preprocessing operations must not be
+        changed while profiling is enabled.
+
+        :param profiler: The profiler recording the calls. A new profiler is created if `None`.
+        :return: The profiler recording the calls.
+        """
+        from art.estimators.profiler import EstimatorProfiler
+
+        self.disable_profiling()
+        if profiler is None:
+            profiler = EstimatorProfiler()
+
+        profiled_objects: List[Tuple[Any, type]] = [
+            (self, _profile_object(self, self.profiled_methods, "", profiler.ESTIMATOR, profiler))
+        ]
+        class_names = [type(preprocess).__name__ for preprocess in self.preprocessing_operations]
+        for i, preprocess in enumerate(self.preprocessing_operations):
+            prefix = class_names[i] if class_names.count(class_names[i]) == 1 else f"{class_names[i]}_{i}"
+            original_class = _profile_object(
+                preprocess, self.profiled_preprocessing_methods, prefix + ".", profiler.PREPROCESSING, profiler
+            )
+            profiled_objects.append((preprocess, original_class))
+
+        self.__dict__["_profiling"] = (profiler, profiled_objects)
+        profiler.start()
+        return profiler
+
+    def disable_profiling(self) -> Optional["EstimatorProfiler"]:
+        """
+        Disable the recording of the calls.
+
+        :return: The profiler that recorded the calls or `None` if profiling was not enabled.
+        """
+        profiling = self.__dict__.pop("_profiling", None)
+        if profiling is None:
+            return None
+
+        profiler, profiled_objects = profiling
+        profiler.stop()
+        for obj, original_class in profiled_objects:
+            obj.__class__ = original_class
+        return profiler
+
+    @contextmanager
+    def profile(self, profiler: Optional["EstimatorProfiler"] = None) -> Iterator["EstimatorProfiler"]:
+        """
+        Context manager recording the calls to the estimator and its preprocessing operations, for example of an attack
+        with `with classifier.profile() as profiler: attack.generate(x)` followed by `profiler.report()`.
+
+        :param profiler: The profiler recording the calls. A new profiler is created if `None`.
+        :return: The profiler recording the calls.
+        """
+        profiler = self.enable_profiling(profiler)
+        try:
+            yield profiler
+        finally:
+            self.disable_profiling()
+
     def compute_loss(self, x: np.ndarray, y: Any, **kwargs) -> np.ndarray:
         """
         Compute the loss of the estimator for samples `x`.
@@ -365,6 +442,32 @@ class BaseEstimator(ABC):
         return repr_string
 
 
+def _profile_object(obj: Any, methods: List[str], prefix: str, category: str, profiler: "EstimatorProfiler") -> type:
+    """
+    Replace the class of `obj` with a subclass recording the calls to `methods` with `profiler`.
+
+    :return: The original class of `obj`.
+    """
+    original_class = type(obj)
+    overrides: Dict[str, Any] = {"__module__": original_class.__module__, "__qualname__": original_class.__qualname__}
+
+    def override(wrapped):
+        @functools.wraps(wrapped)
+        def method(_, *args, **kwargs):
+            return wrapped(*args, **kwargs)
+
+        return method
+
+    for method in methods:
+        if callable(getattr(obj, method, None)):
+            overrides[method] = override(profiler.wrap(prefix + method, category, getattr(obj, method)))
+
+    # Create the subclass with the metaclass of the original class, e.g. `ABCMeta`
+    metaclass: Any = type(original_class)
+    obj.__class__ = metaclass(original_class.__name__, (original_class,), overrides)
+    return original_class
+
+
 class LossGradientsMixin(ABC):
     """
     Mixin abstract base class defining additional functionality for estimators providing loss gradients. An estimator
@@ -1,7 +1,19 @@
 """
 Generator API.
 """
-from art.estimators.generation.generator import GeneratorMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.generation.tensorflow import TensorFlowGenerator
-from art.estimators.generation.tensorflow import TensorFlowV2Generator
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.generation.generator import GeneratorMixin
+    from art.estimators.generation.tensorflow import TensorFlowGenerator
+    from art.estimators.generation.tensorflow import TensorFlowV2Generator
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.generation.generator": ["GeneratorMixin"],
+        "art.estimators.generation.tensorflow": ["TensorFlowGenerator", "TensorFlowV2Generator"],
+    },
+)
@@ -1,11 +1,28 @@
 """
 Module containing estimators for object detection.
 """
-from art.estimators.object_detection.object_detector import ObjectDetectorMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.object_detection.pytorch_object_detector import PyTorchObjectDetector
-from art.estimators.object_detection.pytorch_faster_rcnn import PyTorchFasterRCNN
-from art.estimators.object_detection.pytorch_yolo import PyTorchYolo
-from art.estimators.object_detection.tensorflow_faster_rcnn import TensorFlowFasterRCNN
-from art.estimators.object_detection.tensorflow_v2_faster_rcnn import TensorFlowV2FasterRCNN
-from art.estimators.object_detection.pytorch_detection_transformer import PyTorchDetectionTransformer
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.object_detection.object_detector import ObjectDetectorMixin
+    from art.estimators.object_detection.pytorch_object_detector import PyTorchObjectDetector
+    from art.estimators.object_detection.pytorch_faster_rcnn import PyTorchFasterRCNN
+    from art.estimators.object_detection.pytorch_yolo import PyTorchYolo
+    from art.estimators.object_detection.tensorflow_faster_rcnn import TensorFlowFasterRCNN
+    from art.estimators.object_detection.tensorflow_v2_faster_rcnn import TensorFlowV2FasterRCNN
+    from art.estimators.object_detection.pytorch_detection_transformer import PyTorchDetectionTransformer
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.object_detection.object_detector": ["ObjectDetectorMixin"],
+        "art.estimators.object_detection.pytorch_object_detector": ["PyTorchObjectDetector"],
+        "art.estimators.object_detection.pytorch_faster_rcnn": ["PyTorchFasterRCNN"],
+        "art.estimators.object_detection.pytorch_yolo": ["PyTorchYolo"],
+        "art.estimators.object_detection.tensorflow_faster_rcnn": ["TensorFlowFasterRCNN"],
+        "art.estimators.object_detection.tensorflow_v2_faster_rcnn": ["TensorFlowV2FasterRCNN"],
+        "art.estimators.object_detection.pytorch_detection_transformer": ["PyTorchDetectionTransformer"],
+    },
+)
@@ -1,5 +1,18 @@
 """
 Neural cleanse estimators.
 """
-from art.estimators.poison_mitigation.neural_cleanse.neural_cleanse import NeuralCleanseMixin
-from art.estimators.poison_mitigation.neural_cleanse.keras import KerasNeuralCleanse
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.poison_mitigation.neural_cleanse.neural_cleanse import NeuralCleanseMixin
+    from art.estimators.poison_mitigation.neural_cleanse.keras import KerasNeuralCleanse
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.poison_mitigation.neural_cleanse.neural_cleanse": ["NeuralCleanseMixin"],
+        "art.estimators.poison_mitigation.neural_cleanse.keras": ["KerasNeuralCleanse"],
+    },
+)
@@ -1,4 +1,16 @@
 """
 STRIP estimators.
 """
-from art.estimators.poison_mitigation.strip.strip import STRIPMixin
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.poison_mitigation.strip.strip import STRIPMixin
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.poison_mitigation.strip.strip": ["STRIPMixin"],
+    },
+)
@@ -0,0 +1,227 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2024
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This module implements the profiler recording the calls to the methods of estimators and their preprocessing defences.
+"""
+import functools
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class EstimatorProfiler:
+    """
+    Record the number of calls, the number of samples, the wall time and the bytes of the inputs and outputs of every
+    profiled method. The wall time of a method includes the time of all methods called by it. The summary of the report
+    splits the total time into the time spent in the preprocessing chain, in the rest of the estimator (the model) and
+    outside of the estimator (the attack).
+    """
+
+    # Categories of the profiled methods for the summary of the report
+    ESTIMATOR = "estimator"
+    PREPROCESSING = "preprocessing"
+
+    def __init__(self) -> None:
+        """
+        Create a `EstimatorProfiler` instance.
+        """
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._summary = {self.ESTIMATOR: 0.0, self.PREPROCESSING: 0.0}
+        self._time_start: Optional[float] = None
+        self._time_total = 0.0
+
+    def start(self) -> None:
+        """
+        Start measuring the total time.
+        """
+        if self._time_start is None:
+            self._time_start = time.perf_counter()
+
+    def stop(self) -> None:
+        """
+        Stop measuring the total time.
+        """
+        if self._time_start is not None:
+            self._time_total += time.perf_counter() - self._time_start
+            self._time_start = None
+
+    def reset(self) -> None:
+        """
+        Delete all records.
+        """
+        with self._lock:
+            self._records = {}
+            self._summary = {self.ESTIMATOR: 0.0, self.PREPROCESSING: 0.0}
+            self._time_total = 0.0
+            if self._time_start is not None:
+                self._time_start = time.perf_counter()
+
+    def wrap(self, name: str, category: str, func: Callable) -> Callable:
+        """
+        Wrap the function `func` to record its calls under the name `name`.
+
+        :param name: The name of the record.
+        :param category: The category of the function, either `estimator` or `preprocessing`.
+        :param func: The function to profile. Its first argument is the batch of samples.
+        :return: The wrapped function.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Only the outermost call of a category counts towards the summary
+            categories = self._categories()
+            outermost = category not in categories
+            categories.append(category)
+
+            time_start = time.perf_counter()
+            try:
+                output = func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - time_start
+                categories.pop()
+
+            inputs = list(args) + list(kwargs.values())
+            self.record(
+                name,
+                duration,
+                nb_samples=_get_nb_samples(inputs[0]) if inputs else 0,
+                bytes_in=_get_nbytes(inputs),
+                bytes_out=_get_nbytes(output),
+                category=category if outermost else None,
+            )
+            return output
+
+        return wrapper
+
+    def record(
+        self,
+        name: str,
+        duration: float,
+        nb_samples: int = 0,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        category: Optional[str] = None,
+    ) -> None:
+        """
+        Record a call.
+
+        :param name: The name of the record.
+        :param duration: The wall time of the call in seconds.
+        :param nb_samples: The number of samples of the call.
+        :param bytes_in: The number of bytes of the inputs.
+        :param bytes_out: The number of bytes of the outputs.
+        :param category: The category of the summary to which the duration is added.
+        """
+        with self._lock:
+            if name not in self._records:
+                self._records[name] = {
+                    "calls": 0,
+                    "samples": 0,
+                    "max_batch_size": 0,
+                    "time": 0.0,
+                    "bytes_in": 0,
+                    "bytes_out": 0,
+                }
+            entry = self._records[name]
+            entry["calls"] += 1
+            entry["samples"] += nb_samples
+            entry["max_batch_size"] = max(entry["max_batch_size"], nb_samples)
+            entry["time"] += duration
+            entry["bytes_in"] += bytes_in
+            entry["bytes_out"] += bytes_out
+            if category is not None:
+                self._summary[category] += duration
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Return the report of the profiler.
+
+        :return: A dictionary with the records per method under `methods`, containing the number of calls, the
+                 number of samples, the largest batch size, the wall time in seconds and the bytes of the inputs and
+                 outputs, and with the total, attack, model and preprocessing time in seconds under `summary`.
+        """
+        with self._lock:
+            total = self._time_total
+            if self._time_start is not None:
+                total += time.perf_counter() - self._time_start
+            methods = {name: dict(entry) for name, entry in self._records.items()}
+            summary = {
+                "total_time": total,
+                "attack_time": max(total - self._summary[self.ESTIMATOR], 0.0),
+                "model_time": self._summary[self.ESTIMATOR] - self._summary[self.PREPROCESSING],
+                "preprocessing_time": self._summary[self.PREPROCESSING],
+            }
+
+        for entry in methods.values():
+            entry["mean_time"] = entry["time"] / entry["calls"]
+
+        return {"summary": summary, "methods": methods}
+
+    def to_json(self, path: Optional[str] = None, **kwargs) -> str:
+        """
+        Return the report of the profiler as JSON and optionally write it into a file.
+
+        :param path: Path of the file to write the report into.
+        :param kwargs: Keyword arguments of `json.dumps`.
+        :return: The report in JSON format.
+        """
+        report = json.dumps(self.report(), **kwargs)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(report)
+        return report
+
+    def _categories(self) -> List[str]:
+        if not hasattr(self._local, "categories"):
+            self._local.categories = []
+        return self._local.categories
+
+
+def _get_nb_samples(x: Any) -> int:
+    """
+    Return the size of the first dimension of `x` or zero if it has none.
+    """
+    shape = getattr(x, "shape", None)
+    if shape is not None and len(shape) > 0 and shape[0] is not None:
+        return int(shape[0])
+    return 0
+
+
+def _get_nbytes(obj: Any) -> int:  # pylint: disable=R0911
+    """
+    Return the number of bytes of the NumPy arrays, PyTorch tensors and TensorFlow tensors in `obj`.
+    """
+    if isinstance(obj, (list, tuple)):
+        return sum(_get_nbytes(item) for item in obj)
+    if isinstance(obj, dict):
+        return sum(_get_nbytes(item) for item in obj.values())
+    if hasattr(obj, "element_size") and hasattr(obj, "nelement"):
+        return int(obj.element_size() * obj.nelement())
+    if hasattr(obj, "nbytes") and isinstance(obj.nbytes, int):
+        return int(obj.nbytes)
+    if hasattr(obj, "shape") and hasattr(obj, "dtype") and hasattr(obj.dtype, "size"):
+        size = 1
+        for dim in obj.shape:
+            if dim is None:
+                return 0
+            size *= int(dim)
+        return int(size * obj.dtype.size)
+    return 0
@@ -1,12 +1,24 @@
 """
 This module implements all regressors in ART.
 """
-from art.estimators.regression.regressor import RegressorMixin, Regressor
+from typing import TYPE_CHECKING
 
-from art.estimators.regression.scikitlearn import ScikitlearnRegressor
+from art.lazy_loader import attach
 
-from art.estimators.regression.keras import KerasRegressor
+if TYPE_CHECKING:
+    from art.estimators.regression.regressor import RegressorMixin, Regressor
+    from art.estimators.regression.scikitlearn import ScikitlearnRegressor
+    from art.estimators.regression.keras import KerasRegressor
+    from art.estimators.regression.pytorch import PyTorchRegressor
+    from art.estimators.regression.blackbox import BlackBoxRegressor
 
-from art.estimators.regression.pytorch import PyTorchRegressor
-
-from art.estimators.regression.blackbox import BlackBoxRegressor
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.regression.regressor": ["RegressorMixin", "Regressor"],
+        "art.estimators.regression.scikitlearn": ["ScikitlearnRegressor"],
+        "art.estimators.regression.keras": ["KerasRegressor"],
+        "art.estimators.regression.pytorch": ["PyTorchRegressor"],
+        "art.estimators.regression.blackbox": ["BlackBoxRegressor"],
+    },
+)
@@ -21,7 +21,6 @@ This module implements the regressors for scikit-learn models.
 import logging
 import os
 import pickle
-from copy import deepcopy
 from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
@@ -291,37 +290,43 @@ class ScikitlearnDecisionTreeRegressor(ScikitlearnRegressor):
 
         leaf_nodes: List[LeafNode] = []
 
-        if self.get_left_child(node_id) != self.get_right_child(node_id):
+        # Read the tree structure once, accessing the attributes of `tree_` creates new arrays on every access
+        children_left = self.model.tree_.children_left
+        children_right = self.model.tree_.children_right
+        features = self.model.tree_.feature
+        thresholds = self.model.tree_.threshold
 
-            node_left = self.get_left_child(node_id)
-            node_right = self.get_right_child(node_id)
+        # Depth-first traversal visiting left children first. A shallow copy of the parent box is sufficient because
+        # intersecting boxes replaces intervals instead of modifying them.
+        stack = [(node_id, box)]
+        while stack:
+            node_id, box = stack.pop()
 
-            box_left = deepcopy(box)
-            box_right = deepcopy(box)
+            if children_left[node_id] != children_right[node_id]:
 
-            feature = self.get_feature_at_node(node_id)
-            box_split_left = Box(intervals={feature: Interval(-np.inf, self.get_threshold_at_node(node_id))})
-            box_split_right = Box(intervals={feature: Interval(self.get_threshold_at_node(node_id), np.inf)})
+                node_left = children_left[node_id]
+                node_right = children_right[node_id]
 
-            if box.intervals:
-                box_left.intersect_with_box(box_split_left)
-                box_right.intersect_with_box(box_split_right)
-            else:
-                box_left = box_split_left
-                box_right = box_split_right
+                box_left = Box(intervals=box.intervals.copy())
+                box_right = Box(intervals=box.intervals.copy())
 
-            leaf_nodes += self._get_leaf_nodes(node_left, i_tree, class_label, box_left)
-            leaf_nodes += self._get_leaf_nodes(node_right, i_tree, class_label, box_right)
+                feature = int(features[node_id])
+                threshold = float(thresholds[node_id])
+                box_left.intersect_with_box(Box(intervals={feature: Interval(-np.inf, threshold)}))
+                box_right.intersect_with_box(Box(intervals={feature: Interval(threshold, np.inf)}))
 
-        else:
-            leaf_nodes.append(
-                LeafNode(
-                    tree_id=i_tree,
-                    class_label=class_label,
-                    node_id=node_id,
-                    box=box,
-                    value=self.get_values_at_node(node_id)[0, 0],
+                stack.append((node_right, box_right))
+                stack.append((node_left, box_left))
+
+            else:
+                leaf_nodes.append(
+                    LeafNode(
+                        tree_id=i_tree,
+                        class_label=class_label,
+                        node_id=node_id,
+                        box=box,
+                        value=self.get_values_at_node(node_id)[0, 0],
+                    )
                 )
-            )
 
         return leaf_nodes
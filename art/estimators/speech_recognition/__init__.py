@@ -1,8 +1,22 @@
 """
 Module containing estimators for speech recognition.
 """
-from art.estimators.speech_recognition.speech_recognizer import SpeechRecognizerMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.speech_recognition.pytorch_deep_speech import PyTorchDeepSpeech
-from art.estimators.speech_recognition.pytorch_espresso import PyTorchEspresso
-from art.estimators.speech_recognition.tensorflow_lingvo import TensorFlowLingvoASR
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.estimators.speech_recognition.speech_recognizer import SpeechRecognizerMixin
+    from art.estimators.speech_recognition.pytorch_deep_speech import PyTorchDeepSpeech
+    from art.estimators.speech_recognition.pytorch_espresso import PyTorchEspresso
+    from art.estimators.speech_recognition.tensorflow_lingvo import TensorFlowLingvoASR
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.estimators.speech_recognition.speech_recognizer": ["SpeechRecognizerMixin"],
+        "art.estimators.speech_recognition.pytorch_deep_speech": ["PyTorchDeepSpeech"],
+        "art.estimators.speech_recognition.pytorch_espresso": ["PyTorchEspresso"],
+        "art.estimators.speech_recognition.tensorflow_lingvo": ["TensorFlowLingvoASR"],
+    },
+)
@@ -1,4 +1,16 @@
 """
 This module implements the evaluation of Security Curves.
 """
-from art.evaluations.security_curve.security_curve import SecurityCurve
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.evaluations.security_curve.security_curve import SecurityCurve
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.evaluations.security_curve.security_curve": ["SecurityCurve"],
+    },
+)
@@ -20,16 +20,22 @@ This module implements the evaluation of Security Curves.
 
 Examples of Security Curves can be found in Figure 6 of Madry et al., 2017 (https://arxiv.org/abs/1706.06083).
 """
-from typing import List, Optional, Tuple, TYPE_CHECKING, Union
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import logging
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import numpy as np
 
+from art.config import ART_NUMPY_DTYPE
 from art.evaluations.evaluation import Evaluation
 from art.attacks.evasion.projected_gradient_descent.projected_gradient_descent import ProjectedGradientDescent
 
 if TYPE_CHECKING:
     from art.utils import CLASSIFIER_LOSS_GRADIENTS_TYPE
 
+logger = logging.getLogger(__name__)
+
 
 class SecurityCurve(Evaluation):
     """
@@ -38,14 +44,28 @@ class SecurityCurve(Evaluation):
     Examples of Security Curves can be found in Figure 6 of Madry et al., 2017 (https://arxiv.org/abs/1706.06083).
     """
 
-    def __init__(self, eps: Union[int, List[float], List[int]]):
+    def __init__(self, eps: Union[int, List[float], List[int]], incremental: bool = False, nb_workers: int = 1):
         """
         Create an instance of a Security Curve evaluation.
 
         :param eps: Defines the attack budgets `eps` for Projected Gradient Descent used for evaluation.
+        :param incremental: Evaluate the attack budgets in increasing order, attacking only the samples which are still
+                            classified correctly with the previous budget, starting from their adversarial examples of
+                            the previous budget. Samples that are misclassified with a budget count as misclassified for
+                            all larger budgets.
+        :param nb_workers: Number of threads evaluating different attack budgets in parallel if `incremental` is
+                           False. Every thread attacks its own copy of the classifier, unless the
+                           classifier cannot be copied.
         """
+        if not isinstance(incremental, bool):
+            raise ValueError("The flag `incremental` has to be of type bool.")
+
+        if not isinstance(nb_workers, int) or nb_workers <= 0:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
 
         self.eps = eps
+        self.incremental = incremental
+        self.nb_workers = nb_workers
         self.eps_list: List[float] = []
         self.accuracy_adv_list: List[float] = []
         self.accuracy: Optional[float] = None
@@ -93,17 +113,50 @@ class SecurityCurve(Evaluation):
         self.accuracy = self._get_accuracy(y=y, y_pred=y_pred)
 
         # Determine adversarial accuracy for each eps
-        for eps in self.eps_list:
-            attack_pgd = ProjectedGradientDescent(estimator=classifier, eps=eps, **kwargs)  # type: ignore
+        if self.incremental:
+            x_adv = x.astype(ART_NUMPY_DTYPE)
+            robust = np.argmax(y_pred, axis=1) == np.argmax(y, axis=1)
+            accuracy_adv_dict: Dict[float, float] = {}
+
+            for eps in sorted(set(self.eps_list)):
+                self._attack_robust(classifier, x, y, x_adv, robust, eps=eps, **kwargs)
+                accuracy_adv_dict[eps] = np.mean(robust).item()
 
-            x_adv = attack_pgd.generate(x=x, y=y)
+            self.accuracy_adv_list = [accuracy_adv_dict[eps] for eps in self.eps_list]
 
-            y_pred_adv = classifier.predict(x=x_adv, y=y)
-            accuracy_adv = self._get_accuracy(y=y, y_pred=y_pred_adv)
-            self.accuracy_adv_list.append(accuracy_adv)
+        else:
+            x_adv, robust = None, None
+
+            if self.nb_workers == 1:
+                self.accuracy_adv_list = [
+                    self._get_accuracy_adv(classifier, x, y, eps=eps, **kwargs) for eps in self.eps_list
+                ]
+            else:
+                # Every worker evaluates its share of the budgets with its own copy of the classifier if possible
+                try:
+                    classifiers = [classifier] + [copy.deepcopy(classifier) for _ in range(self.nb_workers - 1)]
+                except Exception:  # pylint: disable=W0703
+                    logger.warning(
+                        "The classifier cannot be copied with `copy.deepcopy` and is shared by the workers, which "
+                        "requires that it supports concurrent calls."
+                    )
+                    classifiers = [classifier] * self.nb_workers
+
+                def evaluate_worker(i_worker: int) -> List[float]:
+                    return [
+                        self._get_accuracy_adv(classifiers[i_worker], x, y, eps=eps, **kwargs)
+                        for eps in self.eps_list[i_worker :: self.nb_workers]
+                    ]
+
+                with ThreadPoolExecutor(max_workers=self.nb_workers) as executor:
+                    accuracies_adv = list(executor.map(evaluate_worker, range(self.nb_workers)))
+
+                self.accuracy_adv_list = [
+                    accuracies_adv[i % self.nb_workers][i // self.nb_workers] for i in range(len(self.eps_list))
+                ]
 
         # Check gradients for potential obfuscation
-        self._check_gradient(classifier=classifier, x=x, y=y, **kwargs)
+        self._check_gradient(classifier=classifier, x=x, y=y, x_adv=x_adv, robust=robust, **kwargs)
 
         return self.eps_list, self.accuracy_adv_list, self.accuracy
 
@@ -119,6 +172,8 @@ class SecurityCurve(Evaluation):
         classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE",
         x: np.ndarray,
         y: np.ndarray,
+        x_adv: Optional[np.ndarray] = None,
+        robust: Optional[np.ndarray] = None,
         **kwargs: Union[str, bool, int, float],
     ) -> None:
         """
@@ -129,6 +184,9 @@ class SecurityCurve(Evaluation):
         :param classifier: A trained classifier that provides loss gradients.
         :param x: Input data to classifier for evaluation.
         :param y: True labels for input data `x`.
+        :param x_adv: Adversarial examples of the largest evaluated budget to continue from in incremental mode.
+        :param robust: Indicators of the samples still classified correctly with the largest evaluated budget in
+                       incremental mode.
         :param kwargs: Keyword arguments for the Projected Gradient Descent attack used for evaluation, except keywords
                        `classifier` and `eps`.
         """
@@ -142,13 +200,12 @@ class SecurityCurve(Evaluation):
         kwargs["eps"] = float(clip_value_max)
         kwargs["eps_step"] = float(clip_value_max / (max_iter / 2))
 
-        # Create attack
-        attack_pgd = ProjectedGradientDescent(estimator=classifier, **kwargs)  # type: ignore
-
         # Evaluate accuracy with maximal attack budget
-        x_adv = attack_pgd.generate(x=x, y=y)
-        y_pred_adv = classifier.predict(x=x_adv, y=y)
-        accuracy_adv = self._get_accuracy(y=y, y_pred=y_pred_adv)
+        if x_adv is not None and robust is not None:
+            self._attack_robust(classifier, x, y, x_adv, robust, **kwargs)
+            accuracy_adv = np.mean(robust).item()
+        else:
+            accuracy_adv = self._get_accuracy_adv(classifier, x, y, **kwargs)
 
         # Decide of obfuscated gradients likely
         if accuracy_adv > 1 / classifier.nb_classes:
@@ -156,6 +213,59 @@ class SecurityCurve(Evaluation):
         else:
             self._detected_obfuscating_gradients = False
 
+    def _get_accuracy_adv(
+        self,
+        classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE",
+        x: np.ndarray,
+        y: np.ndarray,
+        **kwargs: Union[str, bool, int, float],
+    ) -> float:
+        """
+        Attack all samples with Projected Gradient Descent and calculate the adversarial accuracy.
+
+        :param classifier: A trained classifier that provides loss gradients.
+        :param x: Input data to classifier for evaluation.
+        :param y: True labels for input data `x`.
+        :param kwargs: Keyword arguments for the Projected Gradient Descent attack, including `eps`.
+        :return: Adversarial accuracy.
+        """
+        attack_pgd = ProjectedGradientDescent(estimator=classifier, **kwargs)  # type: ignore
+
+        x_adv = attack_pgd.generate(x=x, y=y)
+
+        y_pred_adv = classifier.predict(x=x_adv, y=y)
+        return self._get_accuracy(y=y, y_pred=y_pred_adv)
+
+    @staticmethod
+    def _attack_robust(
+        classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE",
+        x: np.ndarray,
+        y: np.ndarray,
+        x_adv: np.ndarray,
+        robust: np.ndarray,
+        **kwargs: Union[str, bool, int, float],
+    ) -> None:
+        """
+        Attack the samples which are still classified correctly, starting from their current adversarial examples, and
+        update `x_adv` and `robust` in place.
+
+        :param classifier: A trained classifier that provides loss gradients.
+        :param x: Input data to classifier for evaluation.
+        :param y: True labels for input data `x`.
+        :param x_adv: Current adversarial examples.
+        :param robust: Indicators of the samples still classified correctly.
+        :param kwargs: Keyword arguments for the Projected Gradient Descent attack, including `eps`.
+        """
+        index = np.where(robust)[0]
+        if index.size == 0:
+            return
+
+        attack_pgd = ProjectedGradientDescent(estimator=classifier, **kwargs)  # type: ignore
+        x_adv[index] = attack_pgd.generate(x=x[index], y=y[index], x_adv_init=x_adv[index])
+
+        y_pred_adv = classifier.predict(x=x_adv[index], y=y[index])
+        robust[index] = np.argmax(y_pred_adv, axis=1) == np.argmax(y[index], axis=1)
+
     def plot(self) -> None:  # pragma: no cover
         """
         Plot the Security Curve of adversarial accuracy as function opf attack budget `eps` together with the accuracy
@@ -1,4 +1,16 @@
 """
 Experimental Estimator API
 """
-from art.experimental.estimators.jax import JaxEstimator
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.experimental.estimators.jax import JaxEstimator
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.experimental.estimators.jax": ["JaxEstimator"],
+    },
+)
@@ -1,4 +1,16 @@
 """
 Experimental classifiers.
 """
-from art.experimental.estimators.classification.jax import JaxClassifier
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.experimental.estimators.classification.jax import JaxClassifier
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.experimental.estimators.classification.jax": ["JaxClassifier"],
+    },
+)
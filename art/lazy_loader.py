@@ -0,0 +1,78 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2023
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This module implements the lazy loading of the subpackages and classes of ART packages (PEP 562). A package only
+imports the module defining a class when the class is accessed for the first time. This module must not import any
+other module of ART or any optional dependency.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def attach(
+    package_name: str,
+    submodules: Optional[Iterable[str]] = None,
+    attributes: Optional[Dict[str, List[str]]] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Create the module-level `__getattr__`, `__dir__` and `__all__` of a package loading its subpackages and attributes
+    on first access.
+
+    Example usage in the `__init__.py` of a package:
+
+    .. code-block:: python
+
+        __getattr__, __dir__, __all__ = attach(
+            __name__,
+            submodules=["evasion"],
+            attributes={"art.attacks.attack": ["Attack", "EvasionAttack"]},
+        )
+
+    :param package_name: The full name of the package, `__name__` in the `__init__.py` of the package.
+    :param submodules: Names of the submodules of the package relative to the package.
+    :param attributes: Dictionary mapping full module names to the names of the attributes to import from them.
+    :return: A tuple of the functions `__getattr__` and `__dir__`, and the list `__all__` for the package.
+    """
+    submodule_names = set(submodules) if submodules is not None else set()
+    attribute_modules = {
+        name: module_name for module_name, names in (attributes or {}).items() for name in names  # type: ignore
+    }
+    names_all = sorted(submodule_names | set(attribute_modules))
+
+    def __getattr__(name: str) -> Any:
+        if name in submodule_names:
+            return importlib.import_module(f"{package_name}.{name}")
+
+        if name in attribute_modules:
+            module = importlib.import_module(attribute_modules[name])
+            try:
+                value = getattr(module, name)
+            except AttributeError:
+                # Like `from module import name`, fall back to importing a submodule of that name
+                value = importlib.import_module(f"{attribute_modules[name]}.{name}")
+            # Cache the attribute in the package, such that `__getattr__` is only called on first access
+            setattr(sys.modules[package_name], name, value)
+            return value
+
+        raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(names_all))
+
+    return __getattr__, __dir__, names_all
@@ -1,13 +1,36 @@
 """
 Module providing metrics and verifications.
 """
-from art.metrics.metrics import adversarial_accuracy
-from art.metrics.metrics import empirical_robustness
-from art.metrics.metrics import loss_sensitivity
-from art.metrics.metrics import clever
-from art.metrics.metrics import clever_u
-from art.metrics.metrics import clever_t
-from art.metrics.metrics import wasserstein_distance
-from art.metrics.verification_decisions_trees import RobustnessVerificationTreeModelsCliqueMethod
-from art.metrics.gradient_check import loss_gradient_check
-from art.metrics.privacy import PDTP, SHAPr, ComparisonType
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.metrics.metrics import adversarial_accuracy
+    from art.metrics.metrics import empirical_robustness
+    from art.metrics.metrics import loss_sensitivity
+    from art.metrics.metrics import clever
+    from art.metrics.metrics import clever_u
+    from art.metrics.metrics import clever_t
+    from art.metrics.metrics import wasserstein_distance
+    from art.metrics.verification_decisions_trees import RobustnessVerificationTreeModelsCliqueMethod
+    from art.metrics.gradient_check import loss_gradient_check
+    from art.metrics.privacy import PDTP, SHAPr, ComparisonType
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.metrics.metrics": [
+            "adversarial_accuracy",
+            "empirical_robustness",
+            "loss_sensitivity",
+            "clever",
+            "clever_u",
+            "clever_t",
+            "wasserstein_distance",
+        ],
+        "art.metrics.verification_decisions_trees": ["RobustnessVerificationTreeModelsCliqueMethod"],
+        "art.metrics.gradient_check": ["loss_gradient_check"],
+        "art.metrics.privacy": ["PDTP", "SHAPr", "ComparisonType"],
+    },
+)
@@ -252,6 +252,7 @@ def clever(
     c_init: float = 1.0,
     pool_factor: int = 10,
     verbose: bool = True,
+    rng: Optional[np.random.Generator] = None,
 ) -> Optional[np.ndarray]:
     """
     Compute CLEVER score for an untargeted attack.
@@ -270,6 +271,8 @@ def clever(
     :param c_init: initialization of Weibull distribution.
     :param pool_factor: The factor to create a pool of random samples with size pool_factor x n_s.
     :param verbose: Show progress bars.
+    :param rng: A NumPy random generator to sample the pools in float32. If `None`, the global NumPy random state is
+                used.
     :return: CLEVER score.
     """
     # Find the predicted class first
@@ -291,7 +294,7 @@ def clever(
         if j == pred_class:
             score_list.append(None)
             continue
-        score = clever_t(classifier, x, j, nb_batches, batch_size, radius, norm, c_init, pool_factor)
+        score = clever_t(classifier, x, j, nb_batches, batch_size, radius, norm, c_init, pool_factor, rng=rng)
         score_list.append(score)
     return np.array(score_list)
 
@@ -306,6 +309,7 @@ def clever_u(
     c_init: float = 1.0,
     pool_factor: int = 10,
     verbose: bool = True,
+    rng: Optional[np.random.Generator] = None,
 ) -> float:
     """
     Compute CLEVER score for an untargeted attack.
@@ -321,6 +325,8 @@ def clever_u(
     :param c_init: initialization of Weibull distribution.
     :param pool_factor: The factor to create a pool of random samples with size pool_factor x n_s.
     :param verbose: Show progress bars.
+    :param rng: A NumPy random generator to sample the pools in float32. If `None`, the global NumPy random state is
+                used.
     :return: CLEVER score.
     """
     # Get a list of untargeted classes
@@ -331,7 +337,7 @@ def clever_u(
     # Compute CLEVER score for each untargeted class
     score_list = []
     for j in tqdm(untarget_classes, desc="CLEVER untargeted", disable=not verbose):
-        score = clever_t(classifier, x, j, nb_batches, batch_size, radius, norm, c_init, pool_factor)
+        score = clever_t(classifier, x, j, nb_batches, batch_size, radius, norm, c_init, pool_factor, rng=rng)
         score_list.append(score)
 
     return np.min(score_list)
@@ -347,6 +353,7 @@ def clever_t(
     norm: float,
     c_init: float = 1.0,
     pool_factor: int = 10,
+    rng: Optional[np.random.Generator] = None,
 ) -> float:
     """
     Compute CLEVER score for a targeted attack.
@@ -362,6 +369,8 @@ def clever_t(
     :param norm: Current support: 1, 2, np.inf.
     :param c_init: Initialization of Weibull distribution.
     :param pool_factor: The factor to create a pool of random samples with size pool_factor x n_s.
+    :param rng: A NumPy random generator to sample the pool in float32. If `None`, the global NumPy random state is
+                used.
     :return: CLEVER score.
     """
     # Check if the targeted class is different from the predicted class
@@ -382,12 +391,16 @@ def clever_t(
     shape.extend(x.shape)
 
     # Generate a pool of samples
-    rand_pool = np.reshape(
-        random_sphere(nb_points=pool_factor * batch_size, nb_dims=dim, radius=radius, norm=norm),
-        shape,
+    rand_pool = np.empty(shape, dtype=ART_NUMPY_DTYPE)
+    random_sphere(
+        nb_points=pool_factor * batch_size,
+        nb_dims=dim,
+        radius=radius,
+        norm=norm,
+        rng=rng,
+        out=rand_pool.reshape((pool_factor * batch_size, dim)),
     )
-    rand_pool += np.repeat(np.array([x]), pool_factor * batch_size, 0)
-    rand_pool = rand_pool.astype(ART_NUMPY_DTYPE)
+    rand_pool += x
     if hasattr(classifier, "clip_values") and classifier.clip_values is not None:
         np.clip(rand_pool, classifier.clip_values[0], classifier.clip_values[1], out=rand_pool)
 
@@ -420,7 +433,10 @@ def clever_t(
     # Loop over the batches
     for _ in range(nb_batches):
         # Random selection of gradients
-        grad_norm = rand_pool_grads[np.random.choice(pool_factor * batch_size, batch_size)]
+        if rng is None:
+            grad_norm = rand_pool_grads[np.random.choice(pool_factor * batch_size, batch_size)]
+        else:
+            grad_norm = rand_pool_grads[rng.choice(pool_factor * batch_size, batch_size)]
         grad_norm = np.max(grad_norm)
         grad_norm_set.append(grad_norm)
 
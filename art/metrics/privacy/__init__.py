@@ -1,5 +1,18 @@
 """
 Module providing metrics and verifications.
 """
-from art.metrics.privacy.membership_leakage import PDTP, SHAPr, ComparisonType
-from art.metrics.privacy.worst_case_mia_score import get_roc_for_fpr, get_roc_for_multi_fprs
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.metrics.privacy.membership_leakage import PDTP, SHAPr, ComparisonType
+    from art.metrics.privacy.worst_case_mia_score import get_roc_for_fpr, get_roc_for_multi_fprs
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.metrics.privacy.membership_leakage": ["PDTP", "SHAPr", "ComparisonType"],
+        "art.metrics.privacy.worst_case_mia_score": ["get_roc_for_fpr", "get_roc_for_multi_fprs"],
+    },
+)
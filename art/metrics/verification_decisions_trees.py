@@ -20,11 +20,12 @@ This module implements robustness verifications for decision-tree-based models.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
 import logging
 from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
-from tqdm.auto import trange
+from tqdm.auto import tqdm
 
 from art.utils import check_and_transform_label_format
 
@@ -145,6 +146,138 @@ class LeafNode:
         )
 
 
+class LeafBounds:
+    """
+    Compact representation of a set of leaf nodes as arrays of interval bounds. Only the features constrained by at
+    least one of the leaf nodes are stored, all other features are unbounded.
+    """
+
+    def __init__(
+        self,
+        features: np.ndarray,
+        lower_bounds: np.ndarray,
+        upper_bounds: np.ndarray,
+        values: np.ndarray,
+        class_label: Optional[int] = None,
+    ) -> None:
+        """
+        Create a compact representation of leaf nodes.
+
+        :param features: Indices of the constrained features of shape `(nb_constrained_features,)`.
+        :param lower_bounds: Lower bounds of the constrained features of shape `(nb_leaves, nb_constrained_features)`.
+        :param upper_bounds: Upper bounds of the constrained features of shape `(nb_leaves, nb_constrained_features)`.
+        :param values: Prediction values at the leaf nodes of shape `(nb_leaves,)`.
+        :param class_label: ID of class to which the leaf nodes are contributing.
+        """
+        self.features = features
+        self.lower_bounds = lower_bounds
+        self.upper_bounds = upper_bounds
+        self.values = values
+        self.class_label = class_label
+
+    @classmethod
+    def from_leaf_nodes(cls, leaf_nodes: List[LeafNode], class_label: Optional[int] = None) -> "LeafBounds":
+        """
+        Create the compact representation of a list of leaf nodes.
+
+        :param leaf_nodes: A list of leaf nodes.
+        :param class_label: ID of class to which the leaf nodes are contributing.
+        :return: The leaf bounds.
+        """
+        features = np.array(sorted({feature for leaf in leaf_nodes for feature in leaf.box.intervals}), dtype=int)
+        feature_index = {feature: i for i, feature in enumerate(features)}
+        lower_bounds = np.full((len(leaf_nodes), len(features)), -np.inf)
+        upper_bounds = np.full((len(leaf_nodes), len(features)), np.inf)
+
+        for i_leaf, leaf in enumerate(leaf_nodes):
+            for feature, interval in leaf.box.intervals.items():
+                lower_bounds[i_leaf, feature_index[feature]] = interval.lower_bound
+                upper_bounds[i_leaf, feature_index[feature]] = interval.upper_bound
+
+        values = np.array([leaf.value for leaf in leaf_nodes], dtype=float)
+
+        return cls(features, lower_bounds, upper_bounds, values, class_label=class_label)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: Union[np.ndarray, slice]) -> "LeafBounds":
+        return LeafBounds(
+            self.features,
+            self.lower_bounds[index],
+            self.upper_bounds[index],
+            self.values[index],
+            class_label=self.class_label,
+        )
+
+    def get_distances(self, x: np.ndarray, norm: float, batch_size: int = 2**22) -> np.ndarray:
+        """
+        Determine the distances between samples and all interval boxes of the leaf nodes.
+
+        :param x: Feature data of shape `(nb_samples, nb_features)`.
+        :param norm: The norm to apply epsilon.
+        :param batch_size: Maximum number of elements of the intermediate arrays.
+        :return: Array of distances of shape `(nb_samples, nb_leaves)`.
+        """
+        distances = np.zeros((x.shape[0], len(self)))
+        if self.features.size == 0:
+            return distances
+
+        x_features = x[:, self.features]
+        chunk_size = max(1, batch_size // self.lower_bounds.size)
+
+        for i_start in range(0, x.shape[0], chunk_size):
+            x_chunk = x_features[i_start : i_start + chunk_size, None, :]
+            if norm == 0:
+                outside = (x_chunk <= self.lower_bounds) | (x_chunk >= self.upper_bounds)
+                distances[i_start : i_start + chunk_size] = np.sum(outside, axis=2)
+                continue
+
+            differences = np.maximum(np.maximum(x_chunk - self.upper_bounds, self.lower_bounds - x_chunk), 0.0)
+            if norm == np.inf:
+                distances[i_start : i_start + chunk_size] = np.max(differences, axis=2)
+            else:
+                distances[i_start : i_start + chunk_size] = np.sum(differences**norm, axis=2) ** (1.0 / norm)
+
+        return distances
+
+    def get_intersections(self, other: "LeafBounds", other_values: np.ndarray) -> "LeafBounds":
+        """
+        Get the non-empty pairwise intersections of the interval boxes of these leaf nodes with those of another set
+        of leaf nodes. The value of an intersection is the sum of the values of both leaf nodes.
+
+        :param other: The other set of leaf nodes.
+        :param other_values: Values to use for the other set of leaf nodes of shape `(nb_other_leaves,)`.
+        :return: The leaf bounds of the intersections, ordered by the leaf nodes of this set first.
+        """
+        features = np.union1d(self.features, other.features)
+        lower_self, upper_self = self._expand_bounds(features)
+        lower_other, upper_other = other._expand_bounds(features)  # pylint: disable=W0212
+
+        lower_bounds = np.maximum(lower_self[:, None, :], lower_other[None, :, :]).reshape(-1, len(features))
+        upper_bounds = np.minimum(upper_self[:, None, :], upper_other[None, :, :]).reshape(-1, len(features))
+        values = (self.values[:, None] + other_values[None, :]).reshape(-1)
+        non_empty = np.all(lower_bounds < upper_bounds, axis=1)
+
+        return LeafBounds(
+            features, lower_bounds[non_empty], upper_bounds[non_empty], values[non_empty], class_label=self.class_label
+        )
+
+    def _expand_bounds(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Expand the bounds to a sorted superset of the constrained features.
+        """
+        lower_bounds = np.full((len(self), len(features)), -np.inf)
+        upper_bounds = np.full((len(self), len(features)), np.inf)
+        columns = np.searchsorted(features, self.features)
+        lower_bounds[:, columns] = self.lower_bounds
+        upper_bounds[:, columns] = self.upper_bounds
+        return lower_bounds, upper_bounds
+
+    def __repr__(self):
+        return self.__class__.__name__ + f"({self.class_label}, {len(self)} leaves, features={self.features})"
+
+
 class Tree:
     """
     Representation of a decision tree.
@@ -159,6 +292,18 @@ class Tree:
         """
         self.class_id = class_id
         self.leaf_nodes = leaf_nodes
+        self._leaf_bounds: Optional[LeafBounds] = None
+
+    def get_leaf_bounds(self) -> LeafBounds:
+        """
+        Get the compact array representation of the leaf nodes of this decision tree.
+
+        :return: The leaf bounds.
+        """
+        if self._leaf_bounds is None:
+            class_label = self.leaf_nodes[0].class_label if self.leaf_nodes else self.class_id
+            self._leaf_bounds = LeafBounds.from_leaf_nodes(self.leaf_nodes, class_label=class_label)
+        return self._leaf_bounds
 
 
 class RobustnessVerificationTreeModelsCliqueMethod:
@@ -179,6 +324,24 @@ class RobustnessVerificationTreeModelsCliqueMethod:
         self._classifier = classifier
         self.verbose = verbose
         self._trees = self._classifier.get_trees()
+        self._leaf_bounds = [tree.get_leaf_bounds() for tree in self._trees]
+        self._distances: List[np.ndarray] = []
+        self._distances_key: Optional[Tuple[int, float]] = None
+        self.sample_results: Dict[int, Tuple[float, bool]] = {}
+
+    def drop_leaf_nodes(self) -> None:
+        """
+        Replace the trees by trees without leaf nodes to reduce the memory and serialisation costs. The verification
+        only requires the leaf bounds, which are kept.
+        """
+        self._trees = [Tree(class_id=tree.class_id, leaf_nodes=[]) for tree in self._trees]
+
+    def clear_distances(self) -> None:
+        """
+        Clear the distances between the current sample and the leaf nodes, which are reused across search steps.
+        """
+        self._distances = []
+        self._distances_key = None
 
     def verify(
         self,
@@ -189,6 +352,8 @@ class RobustnessVerificationTreeModelsCliqueMethod:
         nb_search_steps: int = 10,
         max_clique: int = 2,
         max_level: int = 2,
+        nb_workers: int = 1,
+        partial_results: Optional[Dict[int, Tuple[float, bool]]] = None,
     ) -> Tuple[float, float]:
         """
         Verify the robustness of the classifier on the dataset `(x, y)`.
@@ -201,6 +366,11 @@ class RobustnessVerificationTreeModelsCliqueMethod:
         :param nb_search_steps: The number of search steps.
         :param max_clique: The maximum number of nodes in a clique.
         :param max_level: The maximum number of clique search levels.
+        :param nb_workers: Number of worker processes verifying samples in parallel. The tree model is sent once to
+                           each worker. The default of 1 verifies all samples in the current process.
+        :param partial_results: Per-sample results of an interrupted verification of the same dataset, as found in
+                                `sample_results`, mapping sample indices to tuples of the robustness bound and
+                                whether the sample is robust at `eps_init`. These samples are not verified again.
         :return: A tuple of the average robustness bound and the verification error at `eps`.
         """
         if np.min(x) < 0 or np.max(x) > 1:
@@ -209,98 +379,146 @@ class RobustnessVerificationTreeModelsCliqueMethod:
                 "values in range [0 1]."
             )
 
+        if nb_workers < 1:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
+
         self.x: np.ndarray = x
         self.y: np.ndarray = check_and_transform_label_format(
             y, nb_classes=self._classifier.nb_classes, return_one_hot=False
         )
         self.max_clique: int = max_clique
         self.max_level: int = max_level
+        self.clear_distances()
 
-        average_bound: float = 0.0
-        num_initial_successes: int = 0
         num_samples: int = x.shape[0]
 
-        # pylint: disable=R1702
-        pbar = trange(num_samples, desc="Decision tree verification", disable=not self.verbose)
-        for i_sample in pbar:
-
-            eps: float = eps_init
-            robust_log: List[bool] = []
-            i_robust = None
-            i_not_robust = None
-            eps_robust: float = 0.0
-            eps_not_robust: float = 0.0
-            best_score: Optional[float]
+        # Results are collected as they arrive, such that an interrupted verification can be resumed from them
+        self.sample_results = {}
+        if partial_results is not None:
+            if any(i_sample < 0 or i_sample >= num_samples for i_sample in partial_results):
+                raise ValueError("The partial results contain sample indices outside of the dataset `x`.")
+            self.sample_results.update(partial_results)
+
+        samples_todo = [i_sample for i_sample in range(num_samples) if i_sample not in self.sample_results]
+
+        with tqdm(
+            total=num_samples,
+            initial=num_samples - len(samples_todo),
+            desc="Decision tree verification",
+            disable=not self.verbose,
+        ) as pbar:
+            if nb_workers == 1 or len(samples_todo) <= 1:
+                for i_sample in samples_todo:
+                    self.sample_results[i_sample] = self._verify_sample(i_sample, eps_init, norm, nb_search_steps)
+                    pbar.update(1)
+            else:
+                import multiprocess
+
+                args = [(i_sample, eps_init, norm, nb_search_steps) for i_sample in samples_todo]
+                with multiprocess.get_context("spawn").Pool(
+                    min(nb_workers, len(samples_todo)),
+                    initializer=_init_verification_worker,
+                    initargs=(self._get_worker_copy(),),
+                ) as pool:
+                    for i_sample, sample_result in pool.imap_unordered(_verify_sample_worker, args):
+                        self.sample_results[i_sample] = sample_result
+                        pbar.update(1)
+
+        # Sum in the order of the samples to obtain the same result independent of the order of completion
+        average_bound = sum(self.sample_results[i_sample][0] for i_sample in range(num_samples)) / num_samples
+        num_initial_successes = sum(self.sample_results[i_sample][1] for i_sample in range(num_samples))
+        verified_error = 1.0 - num_initial_successes / num_samples
 
-            for i_step in range(nb_search_steps):
-                logger.info("Search step %d: eps = %.4g", i_step, eps)
+        logger.info("The average interval bound is: %.4g", average_bound)
+        logger.info("The verified error at eps = %.4g is: %.4g", eps_init, verified_error)
 
-                is_robust = True
+        return average_bound, verified_error
 
-                if self._classifier.nb_classes <= 2:
-                    best_score = self._get_best_score(i_sample, eps, norm, target_label=None)
-                    is_robust = (self.y[i_sample] < 0.5 and best_score < 0) or (
-                        self.y[i_sample] > 0.5 and best_score > 0.0
-                    )
-                else:
-                    for i_class in range(self._classifier.nb_classes):
-                        if i_class != self.y[i_sample]:
-                            best_score = self._get_best_score(i_sample, eps, norm, target_label=i_class)
-                            is_robust = is_robust and (best_score > 0.0)
-                            if not is_robust:
-                                break
-
-                robust_log.append(is_robust)
-
-                if is_robust:
-                    if i_step == 0:
-                        num_initial_successes += 1
-                    logger.info("Model is robust at eps = %.4g", eps)
-                    i_robust = i_step
-                    eps_robust = eps
-                else:
-                    logger.info("Model is not robust at eps = %.4g", eps)
-                    i_not_robust = i_step
-                    eps_not_robust = eps
+    def _verify_sample(self, i_sample: int, eps_init: float, norm: float, nb_search_steps: int) -> Tuple[float, bool]:
+        """
+        Search the robustness bound of a single sample.
 
-                if i_robust is None:
-                    eps /= 2.0
-                else:
-                    if i_not_robust is None:
-                        if eps >= 1.0:  # pragma: no cover
-                            logger.info("Abort binary search because eps increased above 1.0")
+        :param i_sample: Index of training sample in `x`.
+        :param eps_init: Attack budget for the first search step.
+        :param norm: The norm to apply epsilon.
+        :param nb_search_steps: The number of search steps.
+        :return: A tuple of the robustness bound and whether the sample is robust at `eps_init`.
+        """
+        eps: float = eps_init
+        i_robust = None
+        i_not_robust = None
+        eps_robust: float = 0.0
+        eps_not_robust: float = 0.0
+        initial_success = False
+        best_score: Optional[float]
+
+        for i_step in range(nb_search_steps):
+            logger.info("Search step %d: eps = %.4g", i_step, eps)
+
+            is_robust = True
+
+            if self._classifier.nb_classes <= 2:
+                best_score = self._get_best_score(i_sample, eps, norm, target_label=None)
+                is_robust = (self.y[i_sample] < 0.5 and best_score < 0) or (self.y[i_sample] > 0.5 and best_score > 0.0)
+            else:
+                for i_class in range(self._classifier.nb_classes):
+                    if i_class != self.y[i_sample]:
+                        best_score = self._get_best_score(i_sample, eps, norm, target_label=i_class)
+                        is_robust = is_robust and (best_score > 0.0)
+                        if not is_robust:
                             break
-                        eps = min(eps * 2.0, 1.0)
-                    else:
-                        eps = (eps_robust + eps_not_robust) / 2.0
 
-            if i_robust is not None:
-                clique_bound = eps_robust
-                average_bound += clique_bound
+            if is_robust:
+                if i_step == 0:
+                    initial_success = True
+                logger.info("Model is robust at eps = %.4g", eps)
+                i_robust = i_step
+                eps_robust = eps
             else:
-                logger.info(
-                    "point %s: WARNING! no robust eps found, verification bound is set as 0 !",
-                    i_sample,
-                )
+                logger.info("Model is not robust at eps = %.4g", eps)
+                i_not_robust = i_step
+                eps_not_robust = eps
 
-        verified_error = 1.0 - num_initial_successes / num_samples
-        average_bound = average_bound / num_samples
+            if i_robust is None:
+                eps /= 2.0
+            else:
+                if i_not_robust is None:
+                    if eps >= 1.0:  # pragma: no cover
+                        logger.info("Abort binary search because eps increased above 1.0")
+                        break
+                    eps = min(eps * 2.0, 1.0)
+                else:
+                    eps = (eps_robust + eps_not_robust) / 2.0
 
-        logger.info("The average interval bound is: %.4g", average_bound)
-        logger.info("The verified error at eps = %.4g is: %.4g", eps_init, verified_error)
+        if i_robust is None:
+            logger.info(
+                "point %s: WARNING! no robust eps found, verification bound is set as 0 !",
+                i_sample,
+            )
 
-        return average_bound, verified_error
+        return eps_robust, initial_success
+
+    def _get_worker_copy(self) -> "RobustnessVerificationTreeModelsCliqueMethod":
+        """
+        Get a copy of this verification to send to worker processes, without the leaf nodes of the trees, which are
+        replaced by their leaf bounds.
+        """
+        worker_copy = copy.copy(self)
+        worker_copy.verbose = False
+        worker_copy.drop_leaf_nodes()
+        worker_copy.clear_distances()
+        return worker_copy
 
     def _get_k_partite_clique(
         self,
-        accessible_leaves: List[List[LeafNode]],
+        accessible_leaves: List[LeafBounds],
         label: int,
         target_label: Optional[int],
-    ) -> Tuple[float, List]:
+    ) -> Tuple[float, List[LeafBounds]]:
         """
         Find the K partite cliques among the accessible leaf nodes.
 
-        :param accessible_leaves: List of lists of accessible leaf nodes.
+        :param accessible_leaves: List of accessible leaf nodes of each tree or clique.
         :param label: The try label of the current sample.
         :param target_label: The target label.
         :return: The best score and a list of new cliques.
@@ -308,79 +526,49 @@ class RobustnessVerificationTreeModelsCliqueMethod:
         new_nodes_list = []
         best_scores_sum = 0.0
 
-        # pylint: disable=R1702
         for start_tree in range(0, len(accessible_leaves), self.max_clique):
-            cliques_old: List[Dict[str, Union[Box, float]]] = []
-            cliques_new: List[Dict[str, Union[Box, float]]] = []
-
             # Start searching for cliques
-            for accessible_leaf in accessible_leaves[start_tree]:
-                if (
-                    self._classifier.nb_classes > 2
-                    and target_label is not None
-                    and target_label == accessible_leaf.class_label
-                ):
-                    new_leaf_value = -accessible_leaf.value
-                else:
-                    new_leaf_value = accessible_leaf.value
-                cliques_old.append({"box": accessible_leaf.box, "value": new_leaf_value})
+            cliques = accessible_leaves[start_tree]
+            cliques = LeafBounds(
+                cliques.features,
+                cliques.lower_bounds,
+                cliques.upper_bounds,
+                self._get_leaf_values(cliques, target_label),
+                class_label=label,
+            )
 
-            # Loop over all all trees
+            # Loop over all trees
             for i_tree in range(
                 start_tree + 1,
                 min(len(accessible_leaves), start_tree + self.max_clique),
             ):
-                cliques_new.clear()
-                # Loop over all existing cliques
-                for clique in cliques_old:
-                    # Loop over leaf nodes in tree
-                    for accessible_leaf in accessible_leaves[i_tree]:
-                        leaf_box = accessible_leaf.box.get_intersection(clique["box"])  # type: ignore
-                        if leaf_box.intervals:
-                            if (
-                                self._classifier.nb_classes > 2
-                                and target_label is not None
-                                and target_label == accessible_leaf.class_label
-                            ):
-                                new_leaf_value = -accessible_leaf.value
-                            else:
-                                new_leaf_value = accessible_leaf.value
-                            cliques_new.append(
-                                {
-                                    "box": leaf_box,
-                                    "value": new_leaf_value + clique["value"],  # type: ignore
-                                }
-                            )
-
-                cliques_old = cliques_new.copy()
-
-            new_nodes = []
+                leaves = accessible_leaves[i_tree]
+                cliques = cliques.get_intersections(leaves, self._get_leaf_values(leaves, target_label))
+
             best_score = 0.0
-            for i, clique in enumerate(cliques_old):
-                # Create a new node without tree_id and node_id to represent clique
-                new_nodes.append(
-                    LeafNode(
-                        tree_id=None,
-                        class_label=label,
-                        node_id=None,
-                        box=clique["box"],  # type: ignore
-                        value=clique["value"],  # type: ignore
-                    )
-                )
-
-                if i == 0:
-                    best_score = clique["value"]  # type: ignore
+            if len(cliques) > 0:
+                if label < 0.5 and self._classifier.nb_classes <= 2:
+                    best_score = np.max(cliques.values)
                 else:
-                    if label < 0.5 and self._classifier.nb_classes <= 2:
-                        best_score = max(best_score, clique["value"])  # type: ignore
-                    else:
-                        best_score = min(best_score, clique["value"])  # type: ignore
+                    best_score = np.min(cliques.values)
 
-            new_nodes_list.append(new_nodes)
+            new_nodes_list.append(cliques)
             best_scores_sum += best_score
 
         return best_scores_sum, new_nodes_list
 
+    def _get_leaf_values(self, leaves: LeafBounds, target_label: Optional[int]) -> np.ndarray:
+        """
+        Get the values of the leaf nodes, negated if the leaf nodes contribute to the target label.
+
+        :param leaves: The leaf nodes.
+        :param target_label: The target label.
+        :return: The values of the leaf nodes.
+        """
+        if self._classifier.nb_classes > 2 and target_label is not None and target_label == leaves.class_label:
+            return -leaves.values
+        return leaves.values
+
     def _get_best_score(self, i_sample: int, eps: float, norm: float, target_label: Optional[int]) -> float:
         """
         Get the list of best scores.
@@ -405,47 +593,20 @@ class RobustnessVerificationTreeModelsCliqueMethod:
 
         return best_score
 
-    def _get_distance(self, box: Box, i_sample: int, norm: float) -> float:
+    def _get_distances(self, i_sample: int, norm: float) -> List[np.ndarray]:
         """
-        Determine the distance between sample and interval box.
+        Determine the distances between sample and the interval boxes of the leaf nodes of all trees.
 
-        :param box: Interval box.
         :param i_sample: Index of training sample in `x`.
         :param norm: The norm to apply epsilon.
-        :return: The distance.
+        :return: A list of arrays of distances of shape `(nb_leaves,)` for each tree.
         """
-        resulting_distance = 0.0
-
-        for feature, interval in box.intervals.items():
-            feature_value = self.x[i_sample, feature]
-
-            if interval.lower_bound < feature_value < interval.upper_bound:
-                distance = 0.0
-            else:
-                difference = max(
-                    feature_value - interval.upper_bound,
-                    interval.lower_bound - feature_value,
-                )
-                if norm == 0:
-                    distance = 1.0
-                elif norm == np.inf:
-                    distance = difference
-                else:
-                    distance = pow(difference, norm)
-
-            if norm == np.inf:
-                resulting_distance = max(resulting_distance, distance)
-            else:
-                resulting_distance += distance
-
-        if norm not in [0, np.inf]:
-            resulting_distance = pow(resulting_distance, 1.0 / norm)
-
-        return resulting_distance
+        x_sample = self.x[i_sample : i_sample + 1]
+        return [leaf_bounds.get_distances(x_sample, norm)[0] for leaf_bounds in self._leaf_bounds]
 
     def _get_accessible_leaves(
         self, i_sample: int, eps: float, norm: float, target_label: Optional[int]
-    ) -> List[List[LeafNode]]:
+    ) -> List[LeafBounds]:
         """
         Determine the leaf nodes accessible within the attack budget.
 
@@ -453,27 +614,45 @@ class RobustnessVerificationTreeModelsCliqueMethod:
         :param eps: Attack budget epsilon.
         :param norm: The norm to apply epsilon.
         :param target_label: The target label.
-        :return: A list of lists of leaf nodes.
+        :return: A list of accessible leaf nodes for each tree.
         """
         accessible_leaves = []
 
-        for tree in self._trees:
+        # The distances to the leaf nodes do not depend on eps and are shared by all search steps and target labels
+        if self._distances_key != (i_sample, norm):
+            self._distances = self._get_distances(i_sample, norm)
+            self._distances_key = (i_sample, norm)
+
+        for tree, leaf_bounds, distances in zip(self._trees, self._leaf_bounds, self._distances):
             if (
                 self._classifier.nb_classes <= 2
                 or target_label is None
                 or tree.class_id in [self.y[i_sample], target_label]
             ):
+                accessible = distances <= eps
 
-                leaves = []
-
-                for leaf_node in tree.leaf_nodes:
-                    distance = self._get_distance(leaf_node.box, i_sample, norm)
-                    if leaf_node.box and distance <= eps:
-                        leaves.append(leaf_node)
-
-                if not leaves:  # pragma: no cover
+                if not np.any(accessible):  # pragma: no cover
                     raise ValueError("No accessible leaves found.")
 
-                accessible_leaves.append(leaves)
+                accessible_leaves.append(leaf_bounds[accessible])
 
         return accessible_leaves
+
+
+# The verification of the current worker process
+_worker_state: Dict[str, RobustnessVerificationTreeModelsCliqueMethod] = {}
+
+
+def _init_verification_worker(verification: RobustnessVerificationTreeModelsCliqueMethod) -> None:
+    """
+    Store the verification, including the tree model and the dataset, once per worker process.
+    """
+    _worker_state["verification"] = verification
+
+
+def _verify_sample_worker(args: Tuple[int, float, float, int]) -> Tuple[int, Tuple[float, bool]]:
+    """
+    Verify a single sample with the verification of this worker process.
+    """
+    i_sample = args[0]
+    return i_sample, _worker_state["verification"]._verify_sample(*args)  # pylint: disable=W0212
@@ -1,6 +1,18 @@
 """
 Module for preprocessing operations.
 """
-from art.preprocessing.preprocessing import Preprocessor
-from art.preprocessing.preprocessing import PreprocessorPyTorch
-from art.preprocessing.preprocessing import PreprocessorTensorFlowV2
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.preprocessing.preprocessing import Preprocessor
+    from art.preprocessing.preprocessing import PreprocessorPyTorch
+    from art.preprocessing.preprocessing import PreprocessorTensorFlowV2
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.preprocessing.preprocessing": ["Preprocessor", "PreprocessorPyTorch", "PreprocessorTensorFlowV2"],
+    },
+)
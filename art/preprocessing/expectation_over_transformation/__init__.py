@@ -1,30 +1,80 @@
 """
 Module providing expectation over transformations.
 """
-from art.preprocessing.expectation_over_transformation.image_center_crop.pytorch import EoTImageCenterCropPyTorch
-from art.preprocessing.expectation_over_transformation.image_rotation.tensorflow import EoTImageRotationTensorFlow
-from art.preprocessing.expectation_over_transformation.image_rotation.pytorch import EoTImageRotationPyTorch
-from art.preprocessing.expectation_over_transformation.natural_corruptions.brightness.pytorch import (
-    EoTBrightnessPyTorch,
-)
-from art.preprocessing.expectation_over_transformation.natural_corruptions.brightness.tensorflow import (
-    EoTBrightnessTensorFlow,
-)
-from art.preprocessing.expectation_over_transformation.natural_corruptions.contrast.pytorch import EoTContrastPyTorch
-from art.preprocessing.expectation_over_transformation.natural_corruptions.contrast.tensorflow import (
-    EoTContrastTensorFlow,
-)
-from art.preprocessing.expectation_over_transformation.natural_corruptions.gaussian_noise.pytorch import (
-    EoTGaussianNoisePyTorch,
-)
-from art.preprocessing.expectation_over_transformation.natural_corruptions.gaussian_noise.tensorflow import (
-    EoTGaussianNoiseTensorFlow,
-)
-from art.preprocessing.expectation_over_transformation.natural_corruptions.shot_noise.pytorch import EoTShotNoisePyTorch
-from art.preprocessing.expectation_over_transformation.natural_corruptions.shot_noise.tensorflow import (
-    EoTShotNoiseTensorFlow,
-)
-from art.preprocessing.expectation_over_transformation.natural_corruptions.zoom_blur.pytorch import EoTZoomBlurPyTorch
-from art.preprocessing.expectation_over_transformation.natural_corruptions.zoom_blur.tensorflow import (
-    EoTZoomBlurTensorFlow,
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.preprocessing.expectation_over_transformation.image_center_crop.pytorch import EoTImageCenterCropPyTorch
+    from art.preprocessing.expectation_over_transformation.image_rotation.tensorflow import EoTImageRotationTensorFlow
+    from art.preprocessing.expectation_over_transformation.image_rotation.pytorch import EoTImageRotationPyTorch
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.brightness.pytorch import (
+        EoTBrightnessPyTorch,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.brightness.tensorflow import (
+        EoTBrightnessTensorFlow,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.contrast.pytorch import (
+        EoTContrastPyTorch,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.contrast.tensorflow import (
+        EoTContrastTensorFlow,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.gaussian_noise.pytorch import (
+        EoTGaussianNoisePyTorch,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.gaussian_noise.tensorflow import (
+        EoTGaussianNoiseTensorFlow,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.shot_noise.pytorch import (
+        EoTShotNoisePyTorch,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.shot_noise.tensorflow import (
+        EoTShotNoiseTensorFlow,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.zoom_blur.pytorch import (
+        EoTZoomBlurPyTorch,
+    )
+    from art.preprocessing.expectation_over_transformation.natural_corruptions.zoom_blur.tensorflow import (
+        EoTZoomBlurTensorFlow,
+    )
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.preprocessing.expectation_over_transformation.image_center_crop.pytorch": ["EoTImageCenterCropPyTorch"],
+        "art.preprocessing.expectation_over_transformation.image_rotation.tensorflow": ["EoTImageRotationTensorFlow"],
+        "art.preprocessing.expectation_over_transformation.image_rotation.pytorch": ["EoTImageRotationPyTorch"],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.brightness.pytorch": [
+            "EoTBrightnessPyTorch"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.brightness.tensorflow": [
+            "EoTBrightnessTensorFlow"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.contrast.pytorch": [
+            "EoTContrastPyTorch"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.contrast.tensorflow": [
+            "EoTContrastTensorFlow"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.gaussian_noise.pytorch": [
+            "EoTGaussianNoisePyTorch"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.gaussian_noise.tensorflow": [
+            "EoTGaussianNoiseTensorFlow"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.shot_noise.pytorch": [
+            "EoTShotNoisePyTorch"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.shot_noise.tensorflow": [
+            "EoTShotNoiseTensorFlow"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.zoom_blur.pytorch": [
+            "EoTZoomBlurPyTorch"
+        ],
+        "art.preprocessing.expectation_over_transformation.natural_corruptions.zoom_blur.tensorflow": [
+            "EoTZoomBlurTensorFlow"
+        ],
+    },
 )
@@ -1,6 +1,20 @@
 """
 This module contains tool for input standardisation with mean and standard deviation.
 """
-from art.preprocessing.standardisation_mean_std.numpy import StandardisationMeanStd
-from art.preprocessing.standardisation_mean_std.pytorch import StandardisationMeanStdPyTorch
-from art.preprocessing.standardisation_mean_std.tensorflow import StandardisationMeanStdTensorFlow
+from typing import TYPE_CHECKING
+
+from art.lazy_loader import attach
+
+if TYPE_CHECKING:
+    from art.preprocessing.standardisation_mean_std.numpy import StandardisationMeanStd
+    from art.preprocessing.standardisation_mean_std.pytorch import StandardisationMeanStdPyTorch
+    from art.preprocessing.standardisation_mean_std.tensorflow import StandardisationMeanStdTensorFlow
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "art.preprocessing.standardisation_mean_std.numpy": ["StandardisationMeanStd"],
+        "art.preprocessing.standardisation_mean_std.pytorch": ["StandardisationMeanStdPyTorch"],
+        "art.preprocessing.standardisation_mean_std.tensorflow": ["StandardisationMeanStdTensorFlow"],
+    },
+)
@@ -21,7 +21,9 @@ This module defines and implements the summary writers for TensorBoard output.
 
 from abc import ABC, abstractmethod
 from math import sqrt
-from typing import Dict, List, Optional, Union
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 
@@ -93,11 +95,17 @@ class SummaryWriter(ABC):
             comment = f"-generate-{init_counter}"
             self._summary_writer = SummaryWriterTbx(comment=comment)
 
+    def flush(self):
+        """
+        Flush the summary writer.
+        """
+        self.summary_writer.flush()
+
     def reset(self):
         """
         Flush and reset the summary writer.
         """
-        self.summary_writer.flush()
+        self.flush()
         self._init_counter += 1
         self._init_summary_writer(self._summary_writer_arg, init_counter=self._init_counter)
 
@@ -105,6 +113,10 @@ class SummaryWriter(ABC):
 class SummaryWriterDefault(SummaryWriter):
     """
     Implementation of the default ART Summary Writer.
+
+    By default, the values of every sample are written as separate scalars at every step. For a low-overhead
+    telemetry, `aggregate=True` writes summary statistics and a histogram of the values of every mini-batch instead and
+    `asynchronous=True` moves the writing to a background thread, which receives the values through a bounded queue.
     """
 
     def __init__(
@@ -114,13 +126,38 @@ class SummaryWriterDefault(SummaryWriter):
         ind_2: bool = False,
         ind_3: bool = False,
         ind_4: bool = False,
+        aggregate: bool = False,
+        asynchronous: bool = False,
+        queue_size: int = 100,
     ):
+        """
+        Create summary writer.
+
+        :param summary_writer: Activate summary writer for TensorBoard.
+                       If `True` save runs/CURRENT_DATETIME_HOSTNAME in current directory.
+                       If of type `str` save in path.
+        :param ind_1: Write the Attack Failure Indicator 1 - Silent Success.
+        :param ind_2: Write the Attack Failure Indicator 2 - Break-point Angle.
+        :param ind_3: Write the Attack Failure Indicator 3 - Diverging Loss.
+        :param ind_4: Write the Attack Failure Indicator 4 - Zero Gradients.
+        :param aggregate: Write the mean, the quantiles and a histogram of the finite values of the samples of a
+                          mini-batch instead of one scalar per sample.
+        :param asynchronous: Write the summaries from a background thread.
+        :param queue_size: Maximum number of summaries waiting to be written by the background thread. Updates block
+                           while the queue is full.
+        """
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("The queue size must be an integer greater than zero.")
+
         super().__init__(summary_writer=summary_writer)
 
         self.ind_1 = ind_1
         self.ind_2 = ind_2
         self.ind_3 = ind_3
         self.ind_4 = ind_4
+        self.aggregate = aggregate
+        self.asynchronous = asynchronous
+        self.queue_size = queue_size
 
         self.loss = None
         self.loss_prev: Dict[str, np.ndarray] = {}
@@ -129,6 +166,10 @@ class SummaryWriterDefault(SummaryWriter):
         self.i_3: Dict[str, np.ndarray] = {}
         self.i_4: Dict[str, np.ndarray] = {}
 
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._exception: Optional[Exception] = None
+
     def update(
         self,
         batch_id: int,
@@ -139,6 +180,8 @@ class SummaryWriterDefault(SummaryWriter):
         x: Optional[np.ndarray] = None,
         y: Optional[np.ndarray] = None,
         targeted: bool = False,
+        loss: Optional[np.ndarray] = None,
+        y_pred: Optional[np.ndarray] = None,
         **kwargs,
     ):
         """
@@ -152,41 +195,29 @@ class SummaryWriterDefault(SummaryWriter):
         :param x: Input data.
         :param y: True or target labels.
         :param targeted: Indicates whether the attack is targeted (True) or untargeted (False).
+        :param loss: Loss of `estimator` for `x` and `y` if already computed by the attack.
+        :param y_pred: Predictions of `estimator` for `x` if already computed by the attack.
         """
+        self._raise_exception()
 
         # Gradients
         if grad is not None:
-
-            l_1 = np.linalg.norm(grad.reshape(grad.shape[0], -1), axis=1, ord=1)
-            self.summary_writer.add_scalars(
-                f"gradients/norm-L1/batch-{batch_id}",
-                {str(i): v for i, v in enumerate(l_1)},
-                global_step=global_step,
+            grad_flat = grad.reshape(grad.shape[0], -1)
+            self._add_values(
+                f"gradients/norm-L1/batch-{batch_id}", np.linalg.norm(grad_flat, axis=1, ord=1), global_step
             )
-
-            l_2 = np.linalg.norm(grad.reshape(grad.shape[0], -1), axis=1, ord=2)
-            self.summary_writer.add_scalars(
-                f"gradients/norm-L2/batch-{batch_id}",
-                {str(i): v for i, v in enumerate(l_2)},
-                global_step=global_step,
+            self._add_values(
+                f"gradients/norm-L2/batch-{batch_id}", np.linalg.norm(grad_flat, axis=1, ord=2), global_step
             )
-
-            l_inf = np.linalg.norm(grad.reshape(grad.shape[0], -1), axis=1, ord=np.inf)
-            self.summary_writer.add_scalars(
-                f"gradients/norm-Linf/batch-{batch_id}",
-                {str(i): v for i, v in enumerate(l_inf)},
-                global_step=global_step,
+            self._add_values(
+                f"gradients/norm-Linf/batch-{batch_id}", np.linalg.norm(grad_flat, axis=1, ord=np.inf), global_step
             )
 
         # Patch
         if patch is not None:
             if patch.shape[2] in [1, 3, 4]:
                 patch = np.transpose(patch, (2, 0, 1))
-            self.summary_writer.add_image(
-                "patch",
-                patch,
-                global_step=global_step,
-            )
+            self._write(self.summary_writer.add_image, "patch", np.array(patch), global_step)
 
         # Losses
         if estimator is not None and x is not None and y is not None:
@@ -194,34 +225,13 @@ class SummaryWriterDefault(SummaryWriter):
                 losses = estimator.compute_losses(x=x, y=y)
 
                 for key, value in losses.items():
-                    if np.ndim(value) == 0:
-                        self.summary_writer.add_scalar(
-                            f"loss/{key}/batch-{batch_id}",
-                            value,
-                            global_step=global_step,
-                        )
-                    else:
-                        self.summary_writer.add_scalars(
-                            f"loss/{key}/batch-{batch_id}",
-                            {str(i): v for i, v in enumerate(value)},
-                            global_step=global_step,
-                        )
+                    self._add_values(f"loss/{key}/batch-{batch_id}", value, global_step)
 
             elif hasattr(estimator, "compute_loss"):
-                loss = estimator.compute_loss(x=x, y=y)
+                if loss is None:
+                    loss = estimator.compute_loss(x=x, y=y)
 
-                if np.ndim(loss) == 0:
-                    self.summary_writer.add_scalar(
-                        f"loss/batch-{batch_id}",
-                        loss,
-                        global_step=global_step,
-                    )
-                else:
-                    self.summary_writer.add_scalars(
-                        f"loss/batch-{batch_id}",
-                        {str(i): v for i, v in enumerate(loss)},
-                        global_step=global_step,
-                    )
+                self._add_values(f"loss/batch-{batch_id}", loss, global_step)
 
         # Indicators of Attack Failure by Pintor et al. (2021)
         # Paper link: https://arxiv.org/abs/2106.09947
@@ -230,12 +240,11 @@ class SummaryWriterDefault(SummaryWriter):
 
             if isinstance(estimator, ClassifierMixin):
                 if y is not None:
-                    y_pred = estimator.predict(x)  # type: ignore
+                    if y_pred is None:
+                        y_pred = estimator.predict(x)  # type: ignore
                     self.i_1 = np.argmax(y_pred, axis=1) == np.argmax(y, axis=1)
-                    self.summary_writer.add_scalars(
-                        f"Attack Failure Indicator 1 - Silent Success/batch-{batch_id}",
-                        {str(i): v for i, v in enumerate(self.i_1)},
-                        global_step=global_step,
+                    self._add_values(
+                        f"Attack Failure Indicator 1 - Silent Success/batch-{batch_id}", self.i_1, global_step
                     )
                 else:
                     raise ValueError("Attack Failure Indicator 1 requires `y`.")
@@ -246,14 +255,15 @@ class SummaryWriterDefault(SummaryWriter):
                 )
 
         if self.ind_2:  # Break-point Angle
-            losses = estimator.compute_loss(x=x, y=y)
+            if loss is None:
+                loss = estimator.compute_loss(x=x, y=y)
 
             if str(batch_id) not in self.losses:
                 self.losses[str(batch_id)] = []
 
-            self.losses[str(batch_id)].append(losses)
+            self.losses[str(batch_id)].append(np.array(loss))
 
-            self.i_2 = np.ones_like(losses)
+            self.i_2 = np.ones_like(loss)
 
             if len(self.losses[str(batch_id)]) >= 3:
 
@@ -277,23 +287,16 @@ class SummaryWriterDefault(SummaryWriter):
                     i_2_step = 1 - np.abs(cos_beta)
                     self.i_2 = np.minimum(self.i_2, i_2_step)
 
-                if np.ndim(self.i_2) == 0:
-                    self.summary_writer.add_scalar(
-                        f"Attack Failure Indicator 2 - Break-point Angle/batch-{batch_id}",
-                        self.i_2,
-                        global_step=global_step,
-                    )
-                else:
-                    self.summary_writer.add_scalars(
-                        f"Attack Failure Indicator 2 - Break-point Angle/batch-{batch_id}",
-                        {str(i): v for i, v in enumerate(self.i_2)},
-                        global_step=global_step,
-                    )
+                self._add_values(
+                    f"Attack Failure Indicator 2 - Break-point Angle/batch-{batch_id}", self.i_2, global_step
+                )
 
         if self.ind_3:  # Diverging (Increasing) Loss
-            loss = estimator.compute_loss(x=x, y=y)
+            if loss is None:
+                loss = estimator.compute_loss(x=x, y=y)
 
             if str(batch_id) in self.i_3:
+                loss_add: Union[float, np.ndarray]
                 if targeted:
                     if isinstance(loss, float):
                         loss_add = loss
@@ -309,20 +312,11 @@ class SummaryWriterDefault(SummaryWriter):
             else:
                 self.i_3[str(batch_id)] = np.zeros_like(loss)
 
-            if np.ndim(self.i_3[str(batch_id)]) == 0:
-                self.summary_writer.add_scalar(
-                    f"Attack Failure Indicator 3 - Diverging Loss/batch-{batch_id}",
-                    self.i_3[str(batch_id)],
-                    global_step=global_step,
-                )
-            else:
-                self.summary_writer.add_scalars(
-                    f"Attack Failure Indicator 3 - Diverging Loss/batch-{batch_id}",
-                    {str(i): v for i, v in enumerate(self.i_3[str(batch_id)])},
-                    global_step=global_step,
-                )
+            self._add_values(
+                f"Attack Failure Indicator 3 - Diverging Loss/batch-{batch_id}", self.i_3[str(batch_id)], global_step
+            )
 
-            self.loss_prev[str(batch_id)] = loss
+            self.loss_prev[str(batch_id)] = np.array(loss)
 
         if self.ind_4:  # Zero Gradients
 
@@ -337,10 +331,98 @@ class SummaryWriterDefault(SummaryWriter):
                     np.linalg.norm(grad.reshape(grad.shape[0], -1), axis=1, ord=2) <= threshold
                 ] += 1
 
-                self.summary_writer.add_scalars(
+                self._add_values(
                     f"Attack Failure Indicator 4 - Zero Gradients/batch-{batch_id}",
-                    {str(i): v for i, v in enumerate(self.i_4[str(batch_id)] / global_step)},
-                    global_step=global_step,
+                    self.i_4[str(batch_id)] / global_step,
+                    global_step,
                 )
             else:
                 raise ValueError("Attack Failure Indicator 4 requires `grad`.")
+
+    def flush(self):
+        """
+        Wait until all queued summaries have been written and flush the summary writer.
+        """
+        self._queue.join()
+        self._raise_exception()
+        super().flush()
+
+    def reset(self):
+        """
+        Flush and reset the summary writer and stop the background thread until the next update.
+        """
+        self.close()
+        super().reset()
+
+    def close(self):
+        """
+        Write the queued summaries and stop the background thread of the asynchronous mode. The next update starts a new
+        background thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._raise_exception()
+
+    def _add_values(self, tag: str, values: Union[float, np.ndarray], global_step: int):
+        """
+        Write a scalar or the values of the samples of a mini-batch. The values are copied because the attacks can
+        modify them in place before they have been written.
+        """
+        self._write(self._write_values, tag, np.array(values), global_step)
+
+    def _write(self, function: Callable, *args: Any):
+        """
+        Call the writing function `function` directly or queue it for the background thread.
+        """
+        if self.asynchronous:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._work, daemon=True)
+                self._thread.start()
+            self._queue.put((function, args))
+        else:
+            function(*args)
+
+    def _write_values(self, tag: str, values: np.ndarray, global_step: int):
+        if np.ndim(values) == 0:
+            self.summary_writer.add_scalar(tag, values, global_step=global_step)
+        elif self.aggregate:
+            values = values.astype(np.float64).flatten()
+            values = values[np.isfinite(values)]
+            if values.size == 0:
+                return
+            quantiles = np.quantile(values, [0.0, 0.25, 0.5, 0.75, 1.0])
+            self.summary_writer.add_scalars(
+                tag,
+                dict(zip(["mean", "min", "q25", "median", "q75", "max"], [np.mean(values)] + list(quantiles))),
+                global_step=global_step,
+            )
+            self.summary_writer.add_histogram(tag, values, global_step=global_step)
+        else:
+            self.summary_writer.add_scalars(
+                tag,
+                {str(i): v for i, v in enumerate(values)},
+                global_step=global_step,
+            )
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            try:
+                # Stop at the sentinel of `close`
+                if item is None:
+                    return
+                # Skip the remaining summaries after a failure, which is raised by the next update or flush
+                if self._exception is None:
+                    function, args = item
+                    function(*args)
+            except Exception as exception:  # pylint: disable=W0703
+                self._exception = exception
+            finally:
+                self._queue.task_done()
+
+    def _raise_exception(self):
+        if self._exception is not None:
+            exception, self._exception = self._exception, None
+            raise exception
@@ -81,6 +81,7 @@ if TYPE_CHECKING:
     from art.estimators.classification.lightgbm import LightGBMClassifier
     from art.estimators.classification.mxnet import MXClassifier
     from art.estimators.classification.pytorch import PyTorchClassifier
+    from art.estimators.classification.query_counting import QueryCountingClassifier
     from art.estimators.classification.query_efficient_bb import QueryEfficientGradientEstimationClassifier
     from art.estimators.classification.scikitlearn import (
         ScikitlearnAdaBoostClassifier,
@@ -179,6 +180,7 @@ if TYPE_CHECKING:
         LightGBMClassifier,
         MXClassifier,
         PyTorchClassifier,
+        QueryCountingClassifier,
         ScikitlearnClassifier,
         ScikitlearnDecisionTreeClassifier,
         ScikitlearnExtraTreeClassifier,
@@ -519,7 +521,12 @@ def projection_l1_2(values: np.ndarray, eps: Union[int, float, np.ndarray]) -> n
     return proj
 
 
-def projection(values: np.ndarray, eps: Union[int, float, np.ndarray], norm_p: Union[int, float, str]) -> np.ndarray:
+def projection(
+    values: np.ndarray,
+    eps: Union[int, float, np.ndarray],
+    norm_p: Union[int, float, str],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """
     Project `values` on the L_p norm ball of size `eps`.
 
@@ -528,10 +535,34 @@ def projection(values: np.ndarray, eps: Union[int, float, np.ndarray], norm_p: U
     :param norm_p: L_p norm to use for clipping.
             Only 1, 2 , `np.Inf` 1.1 and 1.2 supported for now.
             1.1 and 1.2 compute orthogonal projections on l1-ball, using two different algorithms
+    :param out: Optional contiguous array of the shape of `values` to write the projection into without allocating
+                arrays of that shape. It can be `values` itself to project in place. Only supported for the norms 1, 2
+                and `np.Inf`.
     :return: Values of `values` after projection.
     """
     # Pick a small scalar to avoid division by 0
     tol = 10e-8
+
+    if out is not None:
+        if norm_p in [np.inf, "inf"]:
+            # Equivalent to sign(values) * min(|values|, eps) for non-negative `eps`
+            return np.clip(values, -eps, eps, out=out)
+
+        if norm_p not in [1, 2]:
+            raise NotImplementedError(
+                'Values of `norm_p` different from 1, 2, `np.inf` and "inf" are currently not ' "supported with `out`."
+            )
+
+        if isinstance(eps, np.ndarray):
+            raise NotImplementedError(
+                f"The parameter `eps` of type `np.ndarray` is not supported to use with norm {norm_p}."
+            )
+
+        values_norm = np.linalg.norm(values.reshape((values.shape[0], -1)), axis=1, ord=norm_p)
+        values_norm += tol
+        factor = np.minimum(1.0, eps / values_norm).astype(values.dtype)
+        return np.multiply(values, factor.reshape((-1,) + (1,) * (values.ndim - 1)), out=out)
+
     values_tmp = values.reshape((values.shape[0], -1))
 
     if norm_p == 2:
@@ -572,11 +603,50 @@ def projection(values: np.ndarray, eps: Union[int, float, np.ndarray], norm_p: U
     return values
 
 
+def _check_radius_per_point(radius: Union[int, float, np.ndarray], nb_points: int, norm: Union[int, float, str]):
+    """
+    Check that an array radius defines one radius per point, i.e. that it is of shape `(nb_points, 1)`, or a single
+    radius.
+    """
+    if not isinstance(radius, np.ndarray) or radius.size == 1:
+        return radius
+
+    if radius.ndim != 2 or radius.shape[1] != 1 or radius.shape[0] not in [1, nb_points]:
+        raise NotImplementedError(
+            f"The parameter `radius` of type `np.ndarray` is only supported with norm {norm} for one radius per point "
+            "of shape `(nb_points, 1)`."
+        )
+
+    return radius
+
+
+def _get_sample_buffer(nb_points: int, nb_dims: int, out: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Check the output buffer of the random sampling or allocate a float32 buffer.
+    """
+    if out is None:
+        return np.empty((nb_points, nb_dims), dtype=config.ART_NUMPY_DTYPE)
+
+    if out.shape != (nb_points, nb_dims) or not np.issubdtype(out.dtype, np.floating):
+        raise ValueError(f"The buffer `out` must be a floating point array of shape {(nb_points, nb_dims)}.")
+
+    return out
+
+
+def _random_signs(rng: np.random.Generator, out: np.ndarray) -> None:
+    """
+    Flip the signs of the elements of `out` in place with probability 1/2.
+    """
+    np.negative(out, out=out, where=rng.integers(0, 2, size=out.shape, dtype=bool))
+
+
 def random_sphere(
     nb_points: int,
     nb_dims: int,
     radius: Union[int, float, np.ndarray],
     norm: Union[int, float, str],
+    rng: Optional[np.random.Generator] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generate uniformly at random `m x n`-dimension points in the `norm`-norm ball with radius `radius` and centered
@@ -584,41 +654,71 @@ def random_sphere(
 
     :param nb_points: Number of random data points.
     :param nb_dims: Dimensionality of the sphere.
-    :param radius: Radius of the sphere.
+    :param radius: Radius of the sphere. An array of shape `(nb_points, 1)` defines one radius per point. For the norm
+                   `np.inf` any array broadcastable to `(nb_points, nb_dims)` is supported.
     :param norm: Current support: 1, 2, np.inf, "inf".
+    :param rng: A NumPy random generator. If provided, the points are sampled directly in the data type of `out`, or in
+                float32 if `out` is None. Otherwise, the points are sampled in float64 with the global NumPy random
+                state.
+    :param out: Optional floating point array of shape `(nb_points, nb_dims)` in which the points are written.
     :return: The generated random sphere.
     """
-    if norm == 1:
-        if isinstance(radius, np.ndarray):
-            raise NotImplementedError(
-                "The parameter `radius` of type `np.ndarray` is not supported to use with norm 1."
-            )
+    if norm not in [1, 2, np.inf, "inf"]:
+        raise NotImplementedError(f"Norm {norm} not supported")
 
-        var_u = np.random.uniform(size=(nb_points, nb_dims))
-        var_v = np.sort(var_u)
-        v_pre = np.concatenate((np.zeros((nb_points, 1)), var_v[:, : nb_dims - 1]), axis=-1)
-        x = var_v - v_pre
-        res = radius * x * np.random.choice([-1, 1], (nb_points, nb_dims))
+    if norm in [1, 2]:
+        radius = _check_radius_per_point(radius, nb_points, norm)
 
-    elif norm == 2:
-        if isinstance(radius, np.ndarray):
-            raise NotImplementedError(
-                "The parameter `radius` of type `np.ndarray` is not supported to use with norm 2."
-            )
+    if rng is None:
+        if norm == 1:
+            var_u = np.random.uniform(size=(nb_points, nb_dims))
+            var_v = np.sort(var_u)
+            v_pre = np.concatenate((np.zeros((nb_points, 1)), var_v[:, : nb_dims - 1]), axis=-1)
+            x = var_v - v_pre
+            res = radius * x * np.random.choice([-1, 1], (nb_points, nb_dims))
+
+        elif norm == 2:
+            a_tmp = np.random.randn(nb_points, nb_dims)
+            s_2 = np.sum(a_tmp ** 2, axis=1)
+            radii = radius.reshape(-1) if isinstance(radius, np.ndarray) else radius
+            base = gammainc(nb_dims / 2.0, s_2 / 2.0) ** (1 / nb_dims) * radii / np.sqrt(s_2)
+            res = a_tmp * base[:, np.newaxis]
+
+        else:
+            if isinstance(radius, np.ndarray):
+                radius = np.broadcast_to(radius, (nb_points, nb_dims))
 
-        a_tmp = np.random.randn(nb_points, nb_dims)
-        s_2 = np.sum(a_tmp ** 2, axis=1)
-        base = gammainc(nb_dims / 2.0, s_2 / 2.0) ** (1 / nb_dims) * radius / np.sqrt(s_2)
-        res = a_tmp * (np.tile(base, (nb_dims, 1))).T
+            res = np.random.uniform(-radius, radius, (nb_points, nb_dims))
 
-    elif norm in [np.inf, "inf"]:
-        if isinstance(radius, np.ndarray):
-            radius = radius * np.ones(shape=(nb_points, nb_dims))
+        if out is None:
+            return res
 
-        res = np.random.uniform(-radius, radius, (nb_points, nb_dims))
+        out = _get_sample_buffer(nb_points, nb_dims, out)
+        out[...] = res
+        return out
+
+    res = _get_sample_buffer(nb_points, nb_dims, out)
+
+    if norm == 1:
+        # The first `nb_dims` of `nb_dims + 1` normalised exponential variables are uniform in the simplex
+        rng.standard_exponential(size=res.shape, dtype=res.dtype, out=res)
+        sums = np.sum(res, axis=1, keepdims=True)
+        sums += rng.standard_exponential(size=(nb_points, 1), dtype=res.dtype)
+        np.divide(res, sums, out=res)
+        _random_signs(rng, res)
+        res *= radius
+
+    elif norm == 2:
+        rng.standard_normal(size=res.shape, dtype=res.dtype, out=res)
+        s_2 = np.einsum("ij,ij->i", res, res, dtype=np.float64)
+        base = gammainc(nb_dims / 2.0, s_2 / 2.0) ** (1 / nb_dims) / np.sqrt(s_2)
+        res *= (base[:, np.newaxis] * radius).astype(res.dtype)
 
     else:
-        raise NotImplementedError(f"Norm {norm} not supported")
+        rng.random(size=res.shape, dtype=res.dtype, out=res)
+        res *= 2.0
+        res -= 1.0
+        res *= radius
 
     return res
 
@@ -629,6 +729,8 @@ def uniform_sample_from_sphere_or_ball(
     radius: Union[int, float, np.ndarray],
     sample_space: str = "ball",
     norm: Union[int, float, str] = 2,
+    rng: Optional[np.random.Generator] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generate a sample of  <nb_points>  distributed independently and uniformly on the sphere (with respect to the given
@@ -637,60 +739,88 @@ def uniform_sample_from_sphere_or_ball(
 
     :param nb_points: Number of random data points
     :param nb_dims: Dimensionality of the sphere
-    :param radius: Radius of the sphere
+    :param radius: Radius of the sphere, or array of shape `(nb_points,)` with one radius per point
     :param sample_space: One of 'b', 's', 'sphere', 'ball'
     :param norm: Current support: 1, 2, np.inf, "inf"
+    :param rng: A NumPy random generator. If provided, the points are sampled directly in the data type of `out`, or in
+                float32 if `out` is None. Otherwise, the points are sampled in float64 with the global NumPy random
+                state.
+    :param out: Optional floating point array of shape `(nb_points, nb_dims)` in which the points are written.
     :return: The sampled points from the sphere (i.e., boundary of the ball)
     """
     assert sample_space in ["b", "s", "sphere", "ball"]
 
-    if norm == 1:
-        if sample_space in ["s", "sphere"]:
-            y = np.random.exponential(1, (nb_points, nb_dims))
-            sums = np.sum(y, axis=1)
-            scal = np.outer(sums, np.ones(nb_dims))
-            y = y / scal
-        else:
-            y = np.random.exponential(1, (nb_points, nb_dims + 1))
-            sums = np.sum(y, axis=1)
-            scal = np.outer(sums, np.ones(nb_dims + 1))
-            y = y / scal
-            y = y[:, :nb_dims]
-
-        y = y * np.random.choice([-1, 1], (nb_points, nb_dims))
-        if type(radius) in [int, float]:
-            res = y * radius
+    if norm not in [1, 2, np.inf, "inf"]:
+        raise NotImplementedError(f"Norm {norm} not supported")
+
+    if isinstance(radius, np.ndarray):
+        radius = radius.reshape((-1, 1))
+
+    if rng is None:
+        if norm == 1:
+            if sample_space in ["s", "sphere"]:
+                y = np.random.exponential(1, (nb_points, nb_dims))
+                y = y / np.sum(y, axis=1, keepdims=True)
+            else:
+                y = np.random.exponential(1, (nb_points, nb_dims + 1))
+                y = y / np.sum(y, axis=1, keepdims=True)
+                y = y[:, :nb_dims]
+
+            res = y * np.random.choice([-1, 1], (nb_points, nb_dims)) * radius
+
+        elif norm == 2:
+            x = np.random.normal(0.0, 1.0, (nb_points, nb_dims))
+            res = x * (radius / np.sqrt(np.sum(x * x, axis=1, keepdims=True)))
+            if sample_space in ["b", "ball"]:
+                rnd = np.random.rand(nb_points)
+                res = res * np.float_power(rnd, 1 / nb_dims)[:, np.newaxis]
+
         else:
-            radii = np.outer(radius, np.ones(nb_dims))
-            res = y * radii
+            if sample_space in ["b", "ball"]:
+                x = np.random.uniform(-1.0, 1.0, (nb_points, nb_dims))
+            else:
+                x = np.random.uniform(0, 1.0, (nb_points, nb_dims))
+                rnd = np.random.random((nb_points, nb_dims))
+                maxes = np.max(rnd, axis=1, keepdims=True)
+                x = np.maximum((rnd >= maxes), x) * np.random.choice([-1, 1], (nb_points, nb_dims))
+            res = x * radius
+
+        if out is None:
+            return res
+
+        out = _get_sample_buffer(nb_points, nb_dims, out)
+        out[...] = res
+        return out
+
+    res = _get_sample_buffer(nb_points, nb_dims, out)
+
+    if norm == 1:
+        rng.standard_exponential(size=res.shape, dtype=res.dtype, out=res)
+        sums = np.sum(res, axis=1, keepdims=True)
+        if sample_space in ["b", "ball"]:
+            # Drop one of `nb_dims + 1` normalised exponential variables to sample from the interior of the ball
+            sums += rng.standard_exponential(size=(nb_points, 1), dtype=res.dtype)
+        np.divide(res, sums, out=res)
+        _random_signs(rng, res)
 
     elif norm == 2:
-        x = np.random.normal(0.0, 1.0, (nb_points, nb_dims))
-        scal = radius / np.sqrt(np.sum(x * x, axis=1))
-        scal = np.transpose(np.array(list(scal) * nb_dims).reshape((nb_dims, nb_points)))
-        res = x * scal
+        rng.standard_normal(size=res.shape, dtype=res.dtype, out=res)
+        scale = 1.0 / np.sqrt(np.einsum("ij,ij->i", res, res, dtype=np.float64))
         if sample_space in ["b", "ball"]:
-            rnd = np.random.rand(nb_points)
-            scal = np.float_power(rnd, 1 / nb_dims)
-            scal = np.outer(scal, np.ones(nb_dims))
-            res = res * scal
+            scale *= np.float_power(rng.random(nb_points), 1 / nb_dims)
+        res *= scale.astype(res.dtype)[:, np.newaxis]
 
-    elif norm in [np.inf, "inf"]:
+    else:
+        rng.random(size=res.shape, dtype=res.dtype, out=res)
         if sample_space in ["b", "ball"]:
-            x = np.random.uniform(-1.0, 1.0, (nb_points, nb_dims))
-        else:
-            x = np.random.uniform(0, 1.0, (nb_points, nb_dims))
-            rnd = np.random.random((nb_points, nb_dims))
-            maxes = np.max(rnd, axis=1)
-            maxes = np.outer(maxes, np.ones(nb_dims))
-            x = np.maximum((rnd >= maxes), x) * np.random.choice([-1, 1], (nb_points, nb_dims))
-        if type(radius) in [int, float]:
-            res = x * radius
+            res *= 2.0
+            res -= 1.0
         else:
-            radii = np.outer(radius, np.ones(nb_dims))
-            res = x * radii
-    else:
-        raise NotImplementedError(f"Norm {norm} not supported")
+            # The coordinate with the maximal absolute value is uniformly distributed
+            res[np.arange(nb_points), rng.integers(0, nb_dims, size=nb_points)] = 1.0
+            _random_signs(rng, res)
+
+    res *= radius
 
     return res
 
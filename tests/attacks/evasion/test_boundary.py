@@ -19,6 +19,8 @@
 import pytest
 import logging
 
+import numpy as np
+
 from art.attacks.evasion import BoundaryAttack
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification.classifier import ClassifierMixin
@@ -66,6 +68,23 @@ def test_images(art_warning, fix_get_mnist_subset, image_dl_estimator_for_attack
         art_warning(e)
 
 
+@pytest.mark.framework_agnostic
+def test_max_queries(art_warning, fix_get_mnist_subset, image_dl_estimator_for_attack):
+    try:
+        classifier = image_dl_estimator_for_attack(BoundaryAttack)
+        (_, _, x_test_mnist, _) = fix_get_mnist_subset
+        attack = BoundaryAttack(
+            classifier, targeted=False, max_iter=50, delta=0.01, epsilon=0.01, max_queries=200, verbose=False
+        )
+        _ = attack.generate(x_test_mnist[:3])
+
+        # The budget is checked before every query, logging the success rate uses two more queries per sample
+        assert np.all(attack.queries_per_sample <= 200 + 2)
+        assert np.max(attack.queries_per_sample) > 200 // 2
+    except ARTTestException as e:
+        art_warning(e)
+
+
 @pytest.mark.framework_agnostic
 def test_check_params(art_warning, image_dl_estimator_for_attack):
     try:
@@ -146,6 +146,37 @@ def test_minimal_perturbations_images(art_warning, fix_get_mnist_subset, image_d
         art_warning(e)
 
 
+@pytest.mark.parametrize("norm", [np.inf, 1, 2])
+@pytest.mark.framework_agnostic
+def test_in_place(art_warning, norm, fix_get_mnist_subset, image_dl_estimator_for_attack):
+    try:
+        classifier = image_dl_estimator_for_attack(FastGradientMethod)
+        (_, _, x_test_mnist, y_test_mnist) = fix_get_mnist_subset
+        x_test_original = x_test_mnist.copy()
+        mask = np.ones(x_test_mnist.shape[1:], dtype=bool)
+        mask[..., :5, :] = False
+
+        for params in [{"eps": 1.0}, {"eps": 1.0, "targeted": True}, {"minimal": True, "eps_step": 0.1, "eps": 1.0}]:
+            y = np.roll(y_test_mnist, 1, axis=1) if params.get("targeted") else None
+            x_test_adv = FastGradientMethod(classifier, norm=norm, batch_size=4, **params).generate(
+                x_test_mnist, y=y, mask=mask
+            )
+            attack = FastGradientMethod(classifier, norm=norm, batch_size=4, in_place=True, **params)
+            x_test_adv_in_place = attack.generate(x_test_mnist, y=y, mask=mask)
+
+            assert x_test_adv_in_place.dtype == np.float32
+            np.testing.assert_array_almost_equal(x_test_adv_in_place, x_test_adv, decimal=6)
+            assert attack._buffers == {}
+
+        np.testing.assert_array_equal(x_test_mnist, x_test_original)
+
+        with pytest.raises(ValueError):
+            _ = FastGradientMethod(classifier, in_place="true")
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
 @pytest.mark.parametrize("norm", [np.inf, 1, 2])
 @pytest.mark.skip_framework("pytorch")  # temporarily skipping for pytorch until find bug fix in bounded test
 @pytest.mark.framework_agnostic
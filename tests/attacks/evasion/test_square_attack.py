@@ -21,6 +21,7 @@ import pytest
 import numpy as np
 
 from art.attacks.evasion import SquareAttack
+from art.estimators.classification import BlackBoxClassifierNeuralNetwork
 from art.estimators.estimator import BaseEstimator, NeuralNetworkMixin
 
 from tests.attacks.utils import backend_test_classifier_type_check_fail
@@ -66,6 +67,46 @@ def test_generate(art_warning, fix_get_mnist_subset, image_dl_estimator_for_atta
         art_warning(e)
 
 
+@pytest.mark.framework_agnostic
+@pytest.mark.parametrize("norm", [2, "inf"])
+@pytest.mark.parametrize("channels_first", [True, False])
+def test_generate_channels_and_queries(art_warning, norm, channels_first):
+    try:
+        rng = np.random.RandomState(1234)
+        input_shape = (3, 8, 8) if channels_first else (8, 8, 3)
+        weights = rng.normal(size=(int(np.prod(input_shape)), 4))
+        classifier = BlackBoxClassifierNeuralNetwork(
+            lambda x: x.reshape(x.shape[0], -1) @ weights,
+            input_shape=input_shape,
+            nb_classes=4,
+            channels_first=channels_first,
+            clip_values=(0.0, 1.0),
+        )
+        x = rng.uniform(size=(10,) + input_shape).astype(np.float32)
+        y = classifier.predict(x)
+
+        eps = 0.5 if norm == 2 else 0.1
+        max_iter = 20
+        attack = SquareAttack(classifier, norm=norm, max_iter=max_iter, eps=eps, nb_restarts=1, verbose=False)
+        attack.record_queries = True
+        x_adv = attack.generate(x, y=y)
+
+        assert x_adv.shape == x.shape
+        assert np.any(x_adv != x)
+        perturbation = (x_adv - x).reshape(x.shape[0], -1)
+        if norm == 2:
+            assert np.all(np.linalg.norm(perturbation, axis=1) <= eps + 1e-5)
+        else:
+            assert np.all(np.abs(perturbation) <= eps + 1e-6)
+
+        # Two queries for the clean and the initial adversarial examples, then at most one query per iteration as the
+        # predictions and losses of the current adversarial examples are cached
+        assert np.all(attack.queries_per_sample <= max_iter + 2)
+        assert np.max(attack.queries_per_sample) > 1
+    except ARTTestException as e:
+        art_warning(e)
+
+
 @pytest.mark.framework_agnostic
 def test_check_params(art_warning, image_dl_estimator_for_attack):
     try:
@@ -306,3 +306,126 @@ def test_shadow_model_overlap(art_warning):
 
     except ARTTestException as e:
         art_warning(e)
+
+
+@pytest.mark.skip_framework("dl_frameworks")
+def test_synthetic_shadow_model_population(art_warning):
+    try:
+        (x_train, y_train), (_, _), _, _ = load_nursery(test_set=0.2)
+
+        model = RandomForestClassifier(random_state=7)
+        model.fit(x_train, y_train)
+        art_classifier = ScikitlearnRandomForestClassifier(model)
+
+        nb_queries = []
+        predict = art_classifier.predict
+
+        def predict_spy(x, **kwargs):
+            nb_queries.append(len(x))
+            return predict(x, **kwargs)
+
+        art_classifier.predict = predict_spy
+
+        shadow_models = ShadowModels(art_classifier, num_shadow_models=1, random_state=7)
+        shadow_dataset = shadow_models.generate_synthetic_shadow_dataset(
+            art_classifier,
+            dataset_size=40,
+            max_features_randomized=8,
+            min_confidence=0.2,
+            max_retries=15,
+            population_size=20,
+        )
+        (mem_x, mem_y, mem_pred), (nonmem_x, nonmem_y, nonmem_pred) = shadow_dataset
+
+        assert len(mem_x) == len(mem_y)
+        assert len(mem_y) == len(mem_pred)
+        assert len(nonmem_x) == len(nonmem_y)
+        assert len(nonmem_y) == len(nonmem_pred)
+        # The non-disjoint split of the 40 synthesized records leaves out the last one
+        assert len(mem_x) == 20
+        assert len(nonmem_x) == 19
+
+        # Chains are advanced together, each call to predict covers at most the population
+        assert max(nb_queries[:-2]) <= 20
+        assert len(nb_queries) < sum(nb_queries)
+
+        with pytest.raises(ValueError):
+            shadow_models.generate_synthetic_shadow_dataset(
+                art_classifier, dataset_size=40, max_features_randomized=8, population_size=0
+            )
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.skip_framework("dl_frameworks")
+@pytest.mark.parametrize("parallel", ["thread", "process"])
+def test_shadow_model_parallel_cache(art_warning, parallel, tmp_path):
+    try:
+        (x_target, y_target), (x_shadow, y_shadow), _, _ = load_nursery(test_set=0.5)
+        x_shadow, y_shadow = x_shadow[:1000], to_categorical(y_shadow[:1000], 4)
+
+        model = RandomForestClassifier(random_state=7)
+        model.fit(x_target, y_target)
+        art_classifier = ScikitlearnRandomForestClassifier(model)
+
+        shadow_models = ShadowModels(art_classifier, num_shadow_models=2, random_state=7)
+        (mem_x, mem_y, mem_pred), (nonmem_x, nonmem_y, nonmem_pred) = shadow_models.generate_shadow_dataset(
+            x_shadow, y_shadow
+        )
+
+        shadow_models_parallel = ShadowModels(
+            art_classifier, num_shadow_models=2, random_state=7, parallel=parallel, nb_workers=2, cache_dir=tmp_path
+        )
+        shadow_dataset = shadow_models_parallel.generate_shadow_dataset(x_shadow, y_shadow)
+        (mem_x_p, mem_y_p, mem_pred_p), (nonmem_x_p, nonmem_y_p, nonmem_pred_p) = shadow_dataset
+
+        np.testing.assert_array_equal(mem_x, mem_x_p)
+        np.testing.assert_array_equal(mem_y, mem_y_p)
+        np.testing.assert_array_equal(nonmem_x, nonmem_x_p)
+        assert mem_pred_p.shape == mem_pred.shape
+        assert nonmem_pred_p.shape == nonmem_pred.shape
+        assert len(shadow_models_parallel.get_shadow_models_train_sets()[1][0]) == len(x_shadow) // 2
+        assert len(list(tmp_path.iterdir())) == 2
+
+        # Shadow models are loaded from the cache instead of being retrained
+        shadow_models_cached = ShadowModels(art_classifier, num_shadow_models=2, random_state=7, cache_dir=tmp_path)
+        (_, _, mem_pred_c), (_, _, nonmem_pred_c) = shadow_models_cached.generate_shadow_dataset(x_shadow, y_shadow)
+        np.testing.assert_array_equal(mem_pred_p, mem_pred_c)
+        np.testing.assert_array_equal(nonmem_pred_p, nonmem_pred_c)
+
+        with pytest.raises(ValueError):
+            ShadowModels(art_classifier, parallel="gpu")
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.skip_framework("dl_frameworks")
+def test_shadow_model_cache_key(art_warning, tmp_path):
+    try:
+        (x_target, y_target), (x_shadow, y_shadow), _, _ = load_nursery(test_set=0.5)
+        x_shadow, y_shadow = x_shadow[:200], to_categorical(y_shadow[:200], 4)
+
+        # Equal templates created independently share the cached shadow models
+        for _ in range(2):
+            model = RandomForestClassifier(n_estimators=5, random_state=7).fit(x_target, y_target)
+            art_classifier = ScikitlearnRandomForestClassifier(model)
+            shadow_models = ShadowModels(art_classifier, num_shadow_models=1, random_state=7, cache_dir=tmp_path)
+            shadow_models.generate_shadow_dataset(x_shadow, y_shadow)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # A different template is cached separately
+        model = RandomForestClassifier(n_estimators=5, random_state=8).fit(x_target, y_target)
+        art_classifier = ScikitlearnRandomForestClassifier(model)
+        shadow_models = ShadowModels(art_classifier, num_shadow_models=1, random_state=7, cache_dir=tmp_path)
+        shadow_models.generate_shadow_dataset(x_shadow, y_shadow)
+        assert len(list(tmp_path.iterdir())) == 2
+
+        # Parameters without a stable representation cannot be part of the cache key
+        model = RandomForestClassifier(n_estimators=5, random_state=np.random.RandomState(7)).fit(x_target, y_target)
+        with pytest.raises(ValueError):
+            ShadowModels(ScikitlearnRandomForestClassifier(model), cache_dir=tmp_path)
+
+    except ARTTestException as e:
+        art_warning(e)
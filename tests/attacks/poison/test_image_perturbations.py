@@ -23,6 +23,7 @@ import numpy as np
 import pytest
 
 from art.attacks.poisoning.perturbations import add_single_bd, add_pattern_bd, insert_image
+from art.attacks.poisoning.perturbations.image_perturbations import _insert_image_pil
 
 from tests.utils import ARTTestException
 
@@ -115,3 +116,30 @@ def test_insert_image(art_warning):
 
     except ARTTestException as e:
         art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_insert_image_batch(art_warning):
+    file_path = os.path.join(os.getcwd(), "utils/data/backdoors/alert.png")
+    try:
+        x = np.random.rand(6, 16, 16, 3).astype(np.float32)
+
+        # The batch gives the same images as one image at a time, including the random locations
+        for mode, x_mode in [("RGB", x), ("L", x[..., 0:1])]:
+            np.random.seed(1234)
+            images = insert_image(x=x_mode, backdoor_path=file_path, size=(5, 7), mode=mode, blend=0.6)
+            np.random.seed(1234)
+            images_single = np.array(
+                [insert_image(x=x_i, backdoor_path=file_path, size=(5, 7), mode=mode, blend=0.6) for x_i in x_mode]
+            )
+            np.testing.assert_array_equal(images, images_single)
+            assert images.dtype == np.float32
+
+        # The compositing in NumPy gives the same images as the compositing in PIL
+        kwargs = {"random": False, "x_shift": 12, "y_shift": -2, "size": (8, 8), "mode": "RGB", "blend": 0.8}
+        images = insert_image(x=np.transpose(x, (0, 3, 1, 2)), backdoor_path=file_path, channels_first=True, **kwargs)
+        images_pil = np.array([_insert_image_pil(x_i, file_path, **kwargs) for x_i in x])
+        np.testing.assert_array_equal(images, np.transpose(images_pil, (0, 3, 1, 2)).astype(np.float32))
+
+    except ARTTestException as e:
+        art_warning(e)
@@ -191,6 +191,27 @@ class TestDeepFool(TestBase):
         accuracy = sum10 / self.y_test_mnist.shape[0]
         logger.info("Accuracy on adversarial test examples: %.2f%%", (accuracy * 100))
 
+    def test_10_pytorch_mnist_active_samples(self):
+        x_test = np.reshape(self.x_test_mnist, (self.x_test_mnist.shape[0], 1, 28, 28)).astype(np.float32)
+        classifier = get_image_classifier_pt(from_logits=True)
+
+        batch_sizes = []
+        class_gradient = classifier.class_gradient
+
+        def class_gradient_spy(x, label=None, **kwargs):
+            batch_sizes.append(len(x))
+            return class_gradient(x, label=label, **kwargs)
+
+        classifier.class_gradient = class_gradient_spy
+        attack = DeepFool(classifier, max_iter=5, batch_size=11, verbose=False)
+        x_test_adv = attack.generate(x_test)
+
+        # Gradients for all classes are requested with a single call per iteration and only for active samples
+        self.assertLessEqual(len(batch_sizes), attack.max_iter)
+        self.assertEqual(batch_sizes[0], x_test.shape[0])
+        self.assertTrue(all(b_1 >= b_2 for b_1, b_2 in zip(batch_sizes[:-1], batch_sizes[1:])))
+        self.assertFalse((x_test == x_test_adv).all())
+
     def test_1_classifier_type_check_fail(self):
         backend_test_classifier_type_check_fail(DeepFool, [BaseEstimator, ClassGradientsMixin])
 
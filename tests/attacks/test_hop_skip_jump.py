@@ -564,6 +564,29 @@ class TestHopSkipJump(TestBase):
 
         self.assertGreater(diff1, diff2)
 
+    def test_5_pytorch_max_queries(self):
+        x_test = np.reshape(self.x_test_mnist[0:3], (3, 1, 28, 28)).astype(np.float32)
+
+        # Build PyTorchClassifier
+        ptc = get_image_classifier_pt()
+
+        # HSJ attack without and with budget of queries
+        hsj = HopSkipJump(classifier=ptc, targeted=False, max_iter=10, max_eval=100, init_eval=10, verbose=False)
+        hsj.record_queries = True
+        _ = hsj.generate(x_test)
+        queries_unlimited = hsj.queries_per_sample
+        self.assertIs(hsj.estimator, ptc)
+
+        hsj.set_params(max_queries=60)
+        _ = hsj.generate(x_test)
+        self.assertEqual(hsj.queries_per_sample.shape, (3,))
+        self.assertTrue((hsj.queries_per_sample < queries_unlimited).all())
+        # The budget is checked between the steps of the attack, a step uses at most `max_eval` queries
+        self.assertTrue((hsj.queries_per_sample <= 60 + 100 + 20).all())
+
+        counts, _ = hsj.query_histogram(bins=5)
+        self.assertEqual(np.sum(counts), 3)
+
     # def test_7_keras_iris_clipped(self):
     #     classifier = get_tabular_classifier_kr()
     #
@@ -814,6 +837,9 @@ class TestHopSkipJump(TestBase):
         with self.assertRaises(ValueError):
             _ = HopSkipJump(ptc, init_size=-1)
 
+        with self.assertRaises(ValueError):
+            _ = HopSkipJump(ptc, max_queries=0)
+
         with self.assertRaises(ValueError):
             _ = HopSkipJump(ptc, verbose="true")
 
@@ -100,6 +100,29 @@ class TestPixelAttack(TestBase):
         classifier = get_image_classifier_pt()
         self._test_attack(classifier, x_test, self.y_test_mnist[[1]], False)
 
+    def test_9_pytorch_mnist_batch(self):
+        """
+        Test with the PyTorchClassifier attacking a batch of images concurrently. (Untargeted Attack)
+        :return:
+        """
+        x_test = np.reshape(self.x_test_mnist, (self.x_test_mnist.shape[0], 1, 28, 28)).astype(np.float32)
+        classifier = get_image_classifier_pt()
+
+        df = PixelAttack(classifier, th=10, es=1, max_iter=20, batch_size=self.n_test, verbose=False)
+        x_test_adv = df.generate(x_test, self.y_test_mnist)
+
+        self.assertEqual(x_test_adv.shape, x_test.shape)
+        y_pred = np.argmax(classifier.predict(x_test_adv), axis=1)
+        for i in range(self.n_test):
+            # Unsuccessful attacks return the original image, successful attacks change at most `th` pixels
+            if y_pred[i] == np.argmax(self.y_test_mnist[i]):
+                np.testing.assert_array_equal(x_test_adv[i], x_test[i])
+            else:
+                self.assertLessEqual(np.count_nonzero(x_test_adv[i] != x_test[i]), 10)
+
+        with self.assertRaises(ValueError):
+            _ = PixelAttack(classifier, batch_size=0)
+
     # def test_7_keras_mnist_targeted(self):
     #     """
     #     Test with the KerasClassifier. (Targeted Attack)
@@ -418,6 +418,58 @@ class TestPGD(TestBase):
             # Check that x_test has not been modified by attack and classifier
             self.assertAlmostEqual(float(np.max(np.abs(x_test_original - self.x_test_iris))), 0.0, delta=0.00001)
 
+    def test_7_scikitlearn_in_place(self):
+        from sklearn.linear_model import LogisticRegression
+
+        from art.estimators.classification.scikitlearn import SklearnClassifier
+
+        classifier = SklearnClassifier(model=LogisticRegression(solver="lbfgs", multi_class="auto"), clip_values=(0, 1))
+        classifier.fit(x=self.x_test_iris, y=self.y_test_iris)
+
+        x_test = self.x_test_iris.astype(np.float32)
+        x_test_original = x_test.copy()
+
+        for norm, eps, eps_step in [(np.inf, 0.2, 0.05), (1, 1.0, 0.2), (2, 0.5, 0.1)]:
+            for targeted in [False, True]:
+                y = random_targets(self.y_test_iris, nb_classes=3) if targeted else None
+                kwargs = dict(norm=norm, eps=eps, eps_step=eps_step, max_iter=5, targeted=targeted, verbose=False)
+
+                x_test_adv = ProjectedGradientDescentNumpy(classifier, **kwargs).generate(x_test, y=y)
+                attack = ProjectedGradientDescentNumpy(classifier, in_place=True, batch_size=64, **kwargs)
+                x_test_adv_in_place = attack.generate(x_test, y=y)
+
+                self.assertEqual(x_test_adv_in_place.dtype, np.float32)
+                np.testing.assert_array_almost_equal(x_test_adv_in_place, x_test_adv, decimal=5)
+                self.assertEqual(attack._buffers, {})
+
+        # Check that x_test has not been modified by the in-place attack
+        np.testing.assert_array_equal(x_test, x_test_original)
+
+        with self.assertRaises(ValueError):
+            _ = ProjectedGradientDescentNumpy(classifier, in_place="True")
+
+    def test_6_pytorch_mnist_x_adv_init(self):
+        x_test = np.swapaxes(self.x_test_mnist, 1, 3).astype(np.float32)
+        classifier = get_image_classifier_pt()
+
+        for attack in [
+            ProjectedGradientDescentNumpy(classifier, eps=0.1, eps_step=0.02, max_iter=5, verbose=False),
+            ProjectedGradientDescentNumpy(classifier, eps=0.1, eps_step=0.02, max_iter=5, verbose=False, in_place=True),
+            ProjectedGradientDescent(classifier, eps=0.1, eps_step=0.02, max_iter=5, verbose=False),
+        ]:
+            x_test_adv = attack.generate(x_test, self.y_test_mnist)
+
+            # Starting from the original inputs is the default
+            x_test_adv_init = attack.generate(x_test, self.y_test_mnist, x_adv_init=x_test.copy())
+            np.testing.assert_array_almost_equal(x_test_adv_init, x_test_adv, decimal=6)
+
+            # Continuing from adversarial examples stays within the budget
+            x_test_adv_init = attack.generate(x_test, self.y_test_mnist, x_adv_init=x_test_adv)
+            self.assertLessEqual(float(np.max(np.abs(x_test_adv_init - x_test))), 0.1 + 1e-6)
+
+            with self.assertRaises(ValueError):
+                _ = attack.generate(x_test, self.y_test_mnist, x_adv_init=x_test[:1])
+
     @unittest.skipIf(tf.__version__[0] != "2", "")
     def test_4_framework_tensorflow_v2_mnist(self):
         classifier, _ = get_image_classifier_tf()
@@ -101,6 +101,33 @@ class TestSimBA(TestBase):
         classifier = get_image_classifier_pt()
         self._test_attack(classifier, x_test, self.y_test_mnist, True)
 
+    def test_4_pytorch_mnist_batch(self):
+        """
+        Test with the PyTorchClassifier attacking a batch of images concurrently. (Targeted Attack)
+        :return:
+        """
+        x_test = np.reshape(self.x_test_mnist, (self.x_test_mnist.shape[0], 1, 28, 28)).astype(np.float32)
+        y_target = np.zeros((self.n_test, 10))
+        y_target[:, 8] = 1.0
+        classifier = get_image_classifier_pt()
+
+        for attack in ["dct", "px"]:
+            # The batched attack returns the same adversarial examples as the attack of one sample at a time
+            np.random.seed(1234)
+            x_test_adv = SimBA(classifier, attack=attack, max_iter=500, targeted=True, verbose=False).generate(
+                x_test, y=y_target
+            )
+            np.random.seed(1234)
+            df = SimBA(classifier, attack=attack, max_iter=500, targeted=True, batch_size=self.n_test, verbose=False)
+            x_test_adv_batch = df.generate(x_test, y=y_target)
+            np.testing.assert_array_almost_equal(x_test_adv_batch, x_test_adv, decimal=5)
+            self.assertFalse((x_test == x_test_adv_batch).all())
+
+        # Every iteration queries two candidates per sample
+        df.set_params(max_queries=21)
+        _ = df.generate(x_test, y=y_target)
+        self.assertTrue((df.queries_per_sample <= 21).all())
+
     def _test_attack(self, classifier, x_test, y_test, targeted):
         """
         Test with SimBA
@@ -214,7 +241,7 @@ class TestSimBA(TestBase):
             _ = SimBA(ptc, epsilon=-1)
 
         with self.assertRaises(ValueError):
-            _ = SimBA(ptc, batch_size=2)
+            _ = SimBA(ptc, batch_size=0)
 
         with self.assertRaises(ValueError):
             _ = SimBA(ptc, stride=1.0)
@@ -98,6 +98,18 @@ def test_jpeg_compression_video_data(art_warning, video_batch, channels_first):
         art_warning(e)
 
 
+@pytest.mark.parametrize("channels_first", [True, False])
+@pytest.mark.framework_agnostic
+def test_jpeg_compression_nb_workers(art_warning, video_batch, channels_first):
+    try:
+        test_input, test_output = video_batch
+        jpeg_compression = JpegCompression(clip_values=(0, 255), channels_first=channels_first, nb_workers=3)
+
+        assert_array_equal(jpeg_compression(test_input)[0], test_output)
+    except ARTTestException as e:
+        art_warning(e)
+
+
 @pytest.mark.parametrize("channels_first", [False])
 @pytest.mark.framework_agnostic
 def test_jpeg_compress(art_warning, image_batch, channels_first):
@@ -148,5 +160,8 @@ def test_check_params(art_warning):
         with pytest.raises(ValueError):
             _ = JpegCompression(clip_values=(0, 1), verbose="False")
 
+        with pytest.raises(ValueError):
+            _ = JpegCompression(clip_values=(0, 1), nb_workers=0)
+
     except ARTTestException as e:
         art_warning(e)
@@ -94,6 +94,50 @@ def test_mp3_compresssion(art_warning, audio_batch, channels_first):
         art_warning(e)
 
 
+@pytest.mark.parametrize("channels_first", [True, False])
+@pytest.mark.skip_framework("keras", "pytorch", "scikitlearn", "mxnet")
+def test_mp3_compresssion_nb_workers(art_warning, audio_batch, channels_first):
+    try:
+        test_input, test_output, sample_rate = audio_batch
+        mp3compression = Mp3Compression(sample_rate=sample_rate, channels_first=channels_first, nb_workers=2)
+
+        assert_array_equal(mp3compression(test_input)[0], test_output)
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.parametrize("channels_first", [True, False])
+@pytest.mark.skip_framework("keras", "pytorch", "scikitlearn", "mxnet")
+def test_mp3_compresssion_in_memory(art_warning, audio_batch, channels_first):
+    try:
+        test_input, test_output, sample_rate = audio_batch
+        mp3compression = Mp3Compression(
+            sample_rate=sample_rate, channels_first=channels_first, nb_workers=2, in_memory=True
+        )
+
+        assert_array_equal(mp3compression(test_input)[0], test_output)
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.skip_framework("keras", "pytorch", "scikitlearn", "mxnet")
+def test_mp3_compresssion_in_memory_alignment(art_warning):
+    try:
+        sample_rate = 16000
+        time = np.arange(sample_rate) / sample_rate
+        test_input = (10000 * np.sin(2 * np.pi * 440 * time)).astype(np.int16).reshape((1, -1, 1))
+        mp3compression = Mp3Compression(sample_rate=sample_rate, in_memory=True)
+
+        test_output = mp3compression(test_input)[0]
+
+        assert test_output.shape == test_input.shape
+        # The encoder and decoder delays are removed, such that the output is aligned with the input
+        error = np.abs(test_output.astype(np.float64) - test_input)
+        assert np.mean(error) < 0.1 * np.mean(np.abs(test_input))
+    except ARTTestException as e:
+        art_warning(e)
+
+
 @pytest.mark.parametrize("channels_first", [True, False])
 @pytest.mark.skip_framework("keras", "pytorch", "scikitlearn", "mxnet")
 def test_mp3_compresssion_object(art_warning, audio_batch, channels_first):
@@ -119,5 +163,11 @@ def test_check_params(art_warning):
         with pytest.raises(ValueError):
             _ = Mp3Compression(sample_rate=1000, verbose="False")
 
+        with pytest.raises(ValueError):
+            _ = Mp3Compression(sample_rate=1000, nb_workers=0)
+
+        with pytest.raises(ValueError):
+            _ = Mp3Compression(sample_rate=1000, in_memory="False")
+
     except ARTTestException as e:
         art_warning(e)
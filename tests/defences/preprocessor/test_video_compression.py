@@ -54,6 +54,20 @@ def test_video_compresssion(art_warning, video_batch, channels_first):
         art_warning(e)
 
 
+@pytest.mark.parametrize("channels_first", [True, False])
+@pytest.mark.skip_framework("keras", "pytorch", "scikitlearn", "mxnet")
+def test_video_compresssion_in_memory(art_warning, video_batch, channels_first):
+    try:
+        test_input, test_output = video_batch
+        video_compression = VideoCompression(
+            video_format="mp4", constant_rate_factor=0, channels_first=channels_first, in_memory=True, nb_workers=2
+        )
+
+        assert_array_equal(video_compression(test_input)[0], test_output)
+    except ARTTestException as e:
+        art_warning(e)
+
+
 @pytest.mark.skip_framework("keras", "pytorch", "scikitlearn", "mxnet")
 def test_compress_video_call(art_warning):
     try:
@@ -75,6 +89,17 @@ def test_constant_rate_factor_error(art_warning, constant_rate_factor):
         art_warning(e)
 
 
+def test_check_params(art_warning):
+    try:
+        with pytest.raises(ValueError):
+            VideoCompression(video_format="mp4", in_memory="True")
+
+        with pytest.raises(ValueError):
+            VideoCompression(video_format="mp4", nb_workers=0)
+    except ARTTestException as e:
+        art_warning(e)
+
+
 def test_non_spatio_temporal_data_error(art_warning, image_batch_small):
     try:
         test_input = image_batch_small
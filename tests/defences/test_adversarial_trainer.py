@@ -28,7 +28,7 @@ from art.data_generators import DataGenerator
 from art.defences.trainer.adversarial_trainer import AdversarialTrainer
 from art.utils import load_mnist
 
-from tests.utils import master_seed, get_image_classifier_tf
+from tests.utils import master_seed, get_image_classifier_pt, get_image_classifier_tf
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +75,10 @@ class TestAdversarialTrainer(unittest.TestCase):
             attack = FastGradientMethod(self.classifier)
             _ = AdversarialTrainer(self.classifier, attack, ratio=1.5)
 
+        with self.assertRaises(ValueError):
+            attack = FastGradientMethod(self.classifier)
+            _ = AdversarialTrainer(self.classifier, attack, max_staleness=-1)
+
     def test_fit_predict(self):
         (x_train, y_train), (x_test, y_test) = self.mnist
         x_test_original = x_test.copy()
@@ -195,6 +199,45 @@ class TestAdversarialTrainer(unittest.TestCase):
         self.assertAlmostEqual(float(np.max(np.abs(x_train_original - x_train))), 0.0, delta=0.00001)
         self.assertAlmostEqual(float(np.max(np.abs(x_test_original - x_test))), 0.0, delta=0.00001)
 
+    def test_fit_asynchronous(self):
+        (x_train, y_train), (x_test, y_test) = self.mnist
+        x_train = np.transpose(x_train, (0, 3, 1, 2)).astype(np.float32)
+        x_test = np.transpose(x_test, (0, 3, 1, 2)).astype(np.float32)
+        x_train_original = x_train.copy()
+
+        classifier = get_image_classifier_pt()
+        classifier_transfer = get_image_classifier_pt()
+        attack1 = FastGradientMethod(estimator=classifier, batch_size=16)
+        attack2 = FastGradientMethod(estimator=classifier_transfer, batch_size=16)
+        x_test_adv = attack1.generate(x_test)
+        weights_before = [p.detach().clone() for p in classifier.model.parameters()]
+
+        adv_trainer = AdversarialTrainer(classifier, attacks=[attack1, attack2], max_staleness=2)
+        adv_trainer.fit(x_train, y_train, nb_epochs=2, batch_size=16)
+
+        # The trained classifier has been updated, while the copy used by the attacks has not replaced it
+        self.assertTrue(adv_trainer.attacks[0].estimator is classifier)
+        weights_after = list(classifier.model.parameters())
+        self.assertTrue(any(not (w_b == w_a).all() for w_b, w_a in zip(weights_before, weights_after)))
+        predictions_new = np.argmax(adv_trainer.predict(x_test_adv), axis=1)
+        self.assertEqual(predictions_new.shape, (NB_TEST,))
+        self.assertAlmostEqual(float(np.max(np.abs(x_train_original - x_train))), 0.0, delta=0.00001)
+
+        class MyDataGenerator(DataGenerator):
+            def __init__(self, x, y, size, batch_size):
+                super().__init__(size=size, batch_size=batch_size)
+                self.x = x
+                self.y = y
+
+            def get_batch(self):
+                ids = np.random.choice(self.size, size=min(self.size, self.batch_size), replace=False)
+                return self.x[ids], self.y[ids]
+
+        generator = MyDataGenerator(x_train, y_train, size=x_train.shape[0], batch_size=16)
+        adv_trainer = AdversarialTrainer(classifier, attacks=attack1, ratio=1.0, max_staleness=1)
+        adv_trainer.fit_generator(generator, nb_epochs=2)
+        self.assertAlmostEqual(float(np.max(np.abs(x_train_original - x_train))), 0.0, delta=0.00001)
+
     def test_targeted_attack_error(self):
         """
         Test the adversarial trainer using a targeted attack, which will currently result in a NotImplementError.
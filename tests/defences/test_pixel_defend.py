@@ -104,6 +104,27 @@ class TestPixelDefend(unittest.TestCase):
         self.assertTrue((x_defended <= 1.0).all())
         self.assertTrue((x_defended >= 0.0).all())
 
+    def test_most_probable_intensity(self):
+        model = Model()
+        loss_fn = nn.CrossEntropyLoss()
+        optimizer = optim.Adam(model.parameters(), lr=0.01)
+        pixel_cnn = PyTorchClassifier(
+            model=model, loss=loss_fn, optimizer=optimizer, input_shape=(4,), nb_classes=2, clip_values=(0, 1)
+        )
+
+        x = np.random.rand(7, 4).astype(np.float32)
+        preprocess = PixelDefend(eps=5, pixel_cnn=pixel_cnn, batch_size=3)
+        x_defended, _ = preprocess(x)
+
+        # Every feature is set to the most probable intensity within `eps` of its original intensity
+        probs = pixel_cnn.get_activations(x, layer=-1).reshape((7, 4, 256))
+        x_uint8 = (x * 255).astype("uint8").astype(int)
+        for i in range(7):
+            for j in range(4):
+                lower, upper = max(x_uint8[i, j] - 5, 0), min(x_uint8[i, j] + 5, 255)
+                expected = lower + np.argmax(probs[i, j, lower : upper + 1])
+                self.assertAlmostEqual(float(x_defended[i, j]), expected / 255.0, places=6)
+
     def test_check_params(self):
         model = Model()
         loss_fn = nn.CrossEntropyLoss()
@@ -18,6 +18,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
+import time
 import unittest
 
 import numpy as np
@@ -57,6 +58,36 @@ class TestTotalVarMin(unittest.TestCase):
         # Check that x has not been modified by attack and classifier
         self.assertAlmostEqual(float(np.max(np.abs(x_original - x))), 0.0, delta=0.00001)
 
+    def test_batch_size(self):
+        x = np.random.rand(5, 16, 16, 3)
+        master_seed(seed=1234)
+        x_separate, _ = TotalVarMin(clip_values=(0, 1))(x)
+        master_seed(seed=1234)
+        x_joint, _ = TotalVarMin(clip_values=(0, 1), batch_size=2)(x)
+
+        self.assertEqual(x_joint.shape, x.shape)
+        self.assertFalse((x_joint == x).all())
+        self.assertLess(float(np.mean(np.abs(x_joint - x_separate))), 0.05)
+
+    def test_nb_workers(self):
+        x = np.random.rand(4, 16, 16, 3)
+        master_seed(seed=1234)
+        x_serial, _ = TotalVarMin(clip_values=(0, 1), batch_size=2)(x)
+        master_seed(seed=1234)
+        x_parallel, _ = TotalVarMin(clip_values=(0, 1), batch_size=2, nb_workers=2)(x)
+
+        np.testing.assert_array_equal(x_parallel, x_serial)
+
+    def test_benchmark(self):
+        x = np.random.rand(32, 32, 32, 3)
+        for batch_size in [1, 32]:
+            time_start = time.perf_counter()
+            x_preprocessed, _ = TotalVarMin(clip_values=(0, 1), batch_size=batch_size)(x)
+            logger.info(
+                "Duration of TotalVarMin with batch_size=%d: %.3f s", batch_size, time.perf_counter() - time_start
+            )
+            self.assertEqual(x_preprocessed.shape, x.shape)
+
     def test_failure_feature_vectors(self):
         x = np.random.rand(10, 3)
         preprocess = TotalVarMin()
@@ -86,6 +117,12 @@ class TestTotalVarMin(unittest.TestCase):
         with self.assertRaises(ValueError):
             _ = TotalVarMin(clip_values=(1, 0))
 
+        with self.assertRaises(ValueError):
+            _ = TotalVarMin(batch_size=0)
+
+        with self.assertRaises(ValueError):
+            _ = TotalVarMin(nb_workers=0)
+
         with self.assertRaises(ValueError):
             _ = TotalVarMin(verbose="False")
 
@@ -561,3 +561,41 @@ def test_clone_for_refitting(
 
     except ARTTestException as e:
         art_warning(e)
+
+
+@pytest.mark.skip_framework("tensorflow1", "keras", "kerastf", "mxnet", "non_dl_frameworks", "huggingface")
+def test_per_sample_weight_gradients(art_warning, get_default_mnist_subset, image_dl_estimator, framework):
+    try:
+        (_, _), (x_test_mnist, y_test_mnist) = get_default_mnist_subset
+        x_test_mnist, y_test_mnist = x_test_mnist[:10], y_test_mnist[:10]
+        classifier, _ = image_dl_estimator(from_logits=True)
+
+        grads = classifier.per_sample_weight_gradients(x_test_mnist, y_test_mnist, batch_size=4)
+        assert grads.shape[0] == x_test_mnist.shape[0]
+
+        # The vectorised gradients equal the gradients of the losses of single samples computed with autodiff
+        for i in [0, 5, 9]:
+            x_i, y_i = x_test_mnist[i : i + 1], np.argmax(y_test_mnist[i : i + 1], axis=1)
+            if framework == "pytorch":
+                import torch
+
+                params = [param for param in classifier.model.parameters() if param.requires_grad]
+                classifier.model.eval()
+                predictions = classifier.model(torch.from_numpy(x_i).to(classifier.device))
+                loss = classifier.loss(predictions, torch.from_numpy(y_i).to(classifier.device))
+                grads_i = [grad.detach().cpu().numpy() for grad in torch.autograd.grad(loss, params)]
+            else:
+                import tensorflow as tf
+
+                with tf.GradientTape() as tape:
+                    predictions = classifier.model(x_i, training=False)
+                    loss = classifier.loss_object(y_i, predictions)
+                grads_i = [grad.numpy() for grad in tape.gradient(loss, classifier.model.weights) if grad is not None]
+            grads_expected = np.concatenate([grad.reshape(-1) for grad in grads_i])
+            np.testing.assert_array_almost_equal(grads[i], grads_expected, decimal=4)
+
+        norms = classifier.per_sample_weight_gradients(x_test_mnist, y_test_mnist, norm=True)
+        np.testing.assert_array_almost_equal(norms, np.linalg.norm(grads, axis=1), decimal=4)
+
+    except ARTTestException as e:
+        art_warning(e)
@@ -0,0 +1,141 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2024
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import logging
+import unittest
+
+import numpy as np
+
+from art.attacks.evasion import SquareAttack
+from art.estimators.classification import QueryCountingClassifier
+
+from tests.utils import TestBase, get_image_classifier_pt, master_seed
+
+logger = logging.getLogger(__name__)
+
+
+class TestQueryCountingClassifier(TestBase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.n_test = 5
+        cls.x_test_mnist = cls.x_test_mnist[0 : cls.n_test]
+        cls.y_test_mnist = cls.y_test_mnist[0 : cls.n_test]
+        cls.x_test = np.transpose(cls.x_test_mnist, (0, 3, 1, 2)).astype(np.float32)
+
+    def setUp(self):
+        master_seed(seed=1234, set_torch=True)
+        super().setUp()
+
+    def test_predict(self):
+        ptc = get_image_classifier_pt()
+        classifier = QueryCountingClassifier(ptc, nb_samples=self.n_test, max_queries=4)
+
+        np.testing.assert_array_equal(classifier.predict(self.x_test), ptc.predict(self.x_test))
+        self.assertEqual(classifier.nb_queries, self.n_test)
+        self.assertEqual(classifier.nb_calls, 1)
+        np.testing.assert_array_equal(classifier.queries_per_sample, np.zeros(self.n_test))
+
+        # Queries are attributed to the samples in `sample_index` in the same order
+        classifier.sample_index = np.array([1, 3])
+        _ = classifier.predict(self.x_test[0:4])
+        np.testing.assert_array_equal(classifier.queries_per_sample, [0, 2, 0, 2, 0])
+        classifier.sample_index = 1
+        _ = classifier.predict(self.x_test[0:3])
+        np.testing.assert_array_equal(classifier.queries_per_sample, [0, 5, 0, 2, 0])
+
+        with self.assertRaises(ValueError):
+            classifier.sample_index = np.array([1, 3])
+            _ = classifier.predict(self.x_test[0:3])
+
+        np.testing.assert_array_equal(classifier.remaining_queries(), [0, 2])
+        np.testing.assert_array_equal(
+            classifier.is_exhausted(np.arange(self.n_test)), [False, True, False, False, False]
+        )
+        self.assertTrue(classifier.is_exhausted(1))
+        self.assertEqual(classifier.nb_queries, self.n_test + 7)
+
+        counts, edges = classifier.histogram(bins=[0, 1, 6])
+        np.testing.assert_array_equal(counts, [3, 2])
+        np.testing.assert_array_equal(edges, [0, 1, 6])
+
+        # Attributes are read from the wrapped classifier
+        self.assertEqual(classifier.nb_classes, ptc.nb_classes)
+        self.assertEqual(classifier.input_shape, ptc.input_shape)
+        self.assertEqual(classifier.channels_first, ptc.channels_first)
+        self.assertIs(classifier.classifier, ptc)
+
+        with self.assertRaises(ValueError):
+            _ = QueryCountingClassifier(ptc, max_queries=0)
+
+    def test_delegation(self):
+        ptc = get_image_classifier_pt()
+        classifier = QueryCountingClassifier(ptc, nb_samples=self.n_test, max_queries=4)
+
+        # The preprocessing is read from and applied by the wrapped classifier
+        self.assertIs(classifier.preprocessing, ptc.preprocessing)
+        self.assertIs(classifier.preprocessing_defences, ptc.preprocessing_defences)
+        self.assertIs(classifier.postprocessing_defences, ptc.postprocessing_defences)
+        self.assertIs(classifier.preprocessing_operations, ptc.preprocessing_operations)
+        self.assertEqual(len(classifier.preprocessing_operations), 1)
+        classifier.set_params(max_queries=5)
+        self.assertIs(classifier.preprocessing_operations, ptc.preprocessing_operations)
+        self.assertEqual(len(ptc.preprocessing_operations), 1)
+
+        # The loss queries the classifier, the loss from predictions does not
+        y = self.y_test_mnist
+        classifier.sample_index = np.arange(self.n_test)
+        np.testing.assert_array_almost_equal(classifier.compute_loss(self.x_test, y), ptc.compute_loss(self.x_test, y))
+        np.testing.assert_array_equal(classifier.queries_per_sample, np.ones(self.n_test))
+        # PyTorchClassifier does not implement the loss from predictions, which is forwarded without counting a query
+        with self.assertRaises(NotImplementedError):
+            _ = classifier.compute_loss_from_predictions(ptc.predict(self.x_test), y)
+        self.assertEqual(classifier.nb_queries, self.n_test)
+
+        clone = classifier.clone_for_refitting()
+        self.assertIsInstance(clone, QueryCountingClassifier)
+        self.assertIsNot(clone.classifier, ptc)
+        self.assertEqual(clone.max_queries, 5)
+        self.assertEqual(clone.queries_per_sample.shape, (self.n_test,))
+        self.assertEqual(clone.nb_queries, 0)
+
+    def test_attack_budget(self):
+        ptc = get_image_classifier_pt()
+        attack = SquareAttack(
+            estimator=ptc, norm=np.inf, max_iter=50, eps=0.1, p_init=0.1, nb_restarts=1, verbose=False
+        )
+
+        # The queries are only counted with a budget or if requested
+        _ = attack.generate(self.x_test, self.y_test_mnist)
+        self.assertIsNone(attack.queries_per_sample)
+
+        attack.record_queries = True
+        _ = attack.generate(self.x_test, self.y_test_mnist)
+        self.assertEqual(attack.queries_per_sample.shape, (self.n_test,))
+        attack.record_queries = False
+
+        attack.set_params(max_queries=10)
+        _ = attack.generate(self.x_test, self.y_test_mnist)
+        self.assertTrue((attack.queries_per_sample <= 10).all())
+        self.assertIs(attack.estimator, ptc)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -489,6 +489,27 @@ class TestScikitlearnSVCSVC(TestBase):
             "Unrecognized type for argument `label` with type <class 'numpy.ndarray'>", str(context.exception)
         )
 
+    def test_kernel_gradients_vectorized(self):
+        x_test = self.x_test_iris[0:5]
+        for kernel in ["linear", "poly", "rbf", "sigmoid"]:
+            classifier = ScikitlearnSVC(model=SVC(kernel=kernel, gamma="auto"))
+            classifier.fit(x=self.x_train_iris, y=self.y_train_iris)
+            classifier._max_chunk_elements = 64
+            support_vectors = classifier.model.support_vectors_
+            sv_weights = classifier._get_support_vector_weights()
+
+            for x_sample, grad_predicted in zip(x_test, classifier.class_gradient(x_test)):
+                kernel_grads = np.stack([classifier._kernel_grad(sv, x_sample) for sv in support_vectors])
+                np.testing.assert_array_almost_equal(kernel_grads, classifier._get_kernel_gradients_sv(x_sample))
+                np.testing.assert_array_almost_equal(grad_predicted, sv_weights @ kernel_grads)
+
+            y_row = classifier.model.predict(x_test)
+            y_col = classifier.model.predict(x_test[0:2])
+            y_row[y_row == 0] = -1
+            y_col[y_col == 0] = -1
+            q_expected = classifier._kernel(x_test, x_test[0:2]) * np.outer(y_row, y_col)
+            np.testing.assert_array_almost_equal(classifier.q_submatrix(x_test, x_test[0:2]), q_expected)
+
     def test_save(self):
         self.classifier.save(filename="test.file", path=None)
         self.classifier.save(filename="test.file", path="./")
@@ -0,0 +1,109 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2024
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from art.attacks.evasion import ProjectedGradientDescent
+from art.defences.preprocessor import FeatureSqueezing
+from art.estimators.profiler import EstimatorProfiler
+
+from tests.utils import TestBase, get_image_classifier_pt
+
+logger = logging.getLogger(__name__)
+
+
+class TestEstimatorProfiler(TestBase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.n_test = 10
+        cls.x_test_mnist = cls.x_test_mnist[0 : cls.n_test]
+        cls.y_test_mnist = cls.y_test_mnist[0 : cls.n_test]
+        cls.x_test = np.transpose(cls.x_test_mnist, (0, 3, 1, 2)).astype(np.float32)
+
+    def test_profile(self):
+        classifier = get_image_classifier_pt()
+        classifier.set_params(preprocessing_defences=FeatureSqueezing(clip_values=(0, 1), bit_depth=4))
+        classifier_class = type(classifier)
+        attack = ProjectedGradientDescent(classifier, eps=0.1, eps_step=0.01, max_iter=5, batch_size=4, verbose=False)
+
+        np.random.seed(1234)
+        x_adv_expected = attack.generate(self.x_test, self.y_test_mnist)
+
+        with classifier.profile() as profiler:
+            self.assertIsInstance(classifier, classifier_class)
+            np.random.seed(1234)
+            x_adv = attack.generate(self.x_test, self.y_test_mnist)
+
+        # Profiling does not change the results and is disabled after the context
+        np.testing.assert_array_equal(x_adv, x_adv_expected)
+        self.assertIs(type(classifier), classifier_class)
+        self.assertIsNone(classifier.disable_profiling())
+        classifier.predict(self.x_test)
+
+        report = profiler.report()
+        methods = report["methods"]
+        self.assertEqual(methods["loss_gradient"]["calls"], 5 * 3)
+        self.assertEqual(methods["loss_gradient"]["samples"], 5 * self.n_test)
+        self.assertEqual(methods["loss_gradient"]["max_batch_size"], 4)
+        self.assertEqual(methods["loss_gradient"]["bytes_out"], self.x_test.nbytes * 5)
+        self.assertEqual(methods["FeatureSqueezing.__call__"]["calls"], methods["_apply_preprocessing"]["calls"])
+        self.assertEqual(methods["FeatureSqueezing.estimate_gradient"]["calls"], 5 * 3)
+        self.assertNotIn("class_gradient", methods)
+
+        summary = report["summary"]
+        self.assertGreater(summary["total_time"], 0.0)
+        self.assertGreater(summary["model_time"], 0.0)
+        self.assertGreater(summary["preprocessing_time"], 0.0)
+        self.assertAlmostEqual(
+            summary["attack_time"] + summary["model_time"] + summary["preprocessing_time"], summary["total_time"]
+        )
+        logger.info("Profile of PGD: %s", json.dumps(summary))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profiler.to_json(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["methods"]["predict"]["calls"], methods["predict"]["calls"])
+
+    def test_profiler_shared(self):
+        classifier_1 = get_image_classifier_pt()
+        classifier_2 = get_image_classifier_pt()
+
+        profiler = EstimatorProfiler()
+        with classifier_1.profile(profiler), classifier_2.profile(profiler):
+            classifier_1.predict(self.x_test)
+            classifier_2.predict(self.x_test[:4])
+
+        self.assertEqual(profiler.report()["methods"]["predict"]["calls"], 2)
+        self.assertEqual(profiler.report()["methods"]["predict"]["samples"], self.n_test + 4)
+
+        profiler.reset()
+        self.assertEqual(profiler.report()["methods"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
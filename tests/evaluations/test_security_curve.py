@@ -18,6 +18,10 @@
 import logging
 import pytest
 
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+from art.estimators.classification.scikitlearn import ScikitlearnLogisticRegression
 from art.evaluations.security_curve import SecurityCurve
 
 from tests.utils import ARTTestException
@@ -73,6 +77,91 @@ def test_generate_list(art_warning, fix_get_mnist_subset, image_dl_estimator):
         art_warning(e)
 
 
+@pytest.mark.framework_agnostic
+def test_generate_incremental(art_warning, fix_get_mnist_subset, image_dl_estimator):
+    try:
+        classifier, _ = image_dl_estimator(from_logits=True)
+
+        sec = SecurityCurve(eps=[1.0, 0.3333333333333333, 0.6666666666666666], incremental=True)
+
+        (x_train_mnist, y_train_mnist, x_test_mnist, y_test_mnist) = fix_get_mnist_subset
+
+        eps_list, accuracy_adv_list, accuracy = sec.evaluate(classifier=classifier, x=x_train_mnist, y=y_train_mnist)
+
+        assert eps_list == [1.0, 0.3333333333333333, 0.6666666666666666]
+        assert accuracy_adv_list == [0.0, 0.0, 0.0]
+        assert accuracy == 0.27
+        assert sec.detected_obfuscating_gradients is False
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_generate_nb_workers(art_warning, fix_get_mnist_subset, image_dl_estimator):
+    try:
+        classifier, _ = image_dl_estimator(from_logits=True)
+
+        sec = SecurityCurve(eps=3, nb_workers=2)
+
+        (x_train_mnist, y_train_mnist, x_test_mnist, y_test_mnist) = fix_get_mnist_subset
+
+        eps_list, accuracy_adv_list, accuracy = sec.evaluate(classifier=classifier, x=x_train_mnist, y=y_train_mnist)
+
+        assert eps_list == [0.3333333333333333, 0.6666666666666666, 1.0]
+        assert accuracy_adv_list == [0.0, 0.0, 0.0]
+        assert accuracy == 0.27
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_generate_modes_robust(art_warning):
+    try:
+        rng = np.random.RandomState(0)
+        x = rng.rand(100, 4).astype(np.float32)
+        y_index = (x[:, 0] + x[:, 1] > 1.0).astype(int)
+        y = np.eye(2)[y_index]
+        classifier = ScikitlearnLogisticRegression(model=LogisticRegression().fit(x, y_index), clip_values=(0, 1))
+
+        eps = [0.05, 0.1, 0.2, 0.5]
+        kwargs = {"max_iter": 100, "eps_step": 0.01, "verbose": False}
+
+        _, accuracy_adv_list, accuracy = SecurityCurve(eps=eps).evaluate(classifier=classifier, x=x, y=y, **kwargs)
+
+        assert accuracy == 0.99
+        assert accuracy_adv_list == [0.8, 0.6, 0.33, 0.0]
+        # The adversarial accuracy does not increase with the attack budget
+        assert all(acc_1 >= acc_2 for acc_1, acc_2 in zip(accuracy_adv_list, accuracy_adv_list[1:]))
+
+        _, accuracy_adv_list_incremental, _ = SecurityCurve(eps=eps[::-1], incremental=True).evaluate(
+            classifier=classifier, x=x, y=y, **kwargs
+        )
+        assert accuracy_adv_list_incremental[::-1] == accuracy_adv_list
+
+        _, accuracy_adv_list_nb_workers, _ = SecurityCurve(eps=eps, nb_workers=3).evaluate(
+            classifier=classifier, x=x, y=y, **kwargs
+        )
+        assert accuracy_adv_list_nb_workers == accuracy_adv_list
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_check_params(art_warning):
+    try:
+        with pytest.raises(ValueError):
+            _ = SecurityCurve(eps=3, incremental="True")
+
+        with pytest.raises(ValueError):
+            _ = SecurityCurve(eps=3, nb_workers=0)
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
 @pytest.mark.framework_agnostic
 def test_repr(art_warning):
     try:
@@ -29,7 +29,13 @@ from art.estimators.classification.xgboost import XGBoostClassifier
 from art.estimators.classification.lightgbm import LightGBMClassifier
 from art.estimators.classification.scikitlearn import SklearnClassifier
 from art.utils import load_dataset
-from art.metrics.verification_decisions_trees import RobustnessVerificationTreeModelsCliqueMethod
+from art.metrics.verification_decisions_trees import (
+    Box,
+    Interval,
+    LeafBounds,
+    LeafNode,
+    RobustnessVerificationTreeModelsCliqueMethod,
+)
 
 from tests.utils import master_seed
 
@@ -146,6 +152,60 @@ class TestMetricsTrees(unittest.TestCase):
         self.assertEqual(average_bound, 0.05406445312499999)
         self.assertEqual(verified_error, 0.96)
 
+    def test_RandomForest_parallel(self):
+        model = RandomForestClassifier(n_estimators=4, max_depth=6)
+        model.fit(self.x_train, np.argmax(self.y_train, axis=1))
+
+        classifier = SklearnClassifier(model=model)
+
+        rt = RobustnessVerificationTreeModelsCliqueMethod(classifier=classifier, verbose=False)
+        expected = rt.verify(x=self.x_test[:10], y=self.y_test[:10], eps_init=0.3, nb_search_steps=5)
+        sample_results = rt.sample_results
+
+        rt = RobustnessVerificationTreeModelsCliqueMethod(classifier=classifier, verbose=False)
+        self.assertEqual(
+            rt.verify(x=self.x_test[:10], y=self.y_test[:10], eps_init=0.3, nb_search_steps=5, nb_workers=2), expected
+        )
+        self.assertEqual(rt.sample_results, sample_results)
+
+        partial_results = {i_sample: sample_results[i_sample] for i_sample in range(4)}
+        average_bound, verified_error = rt.verify(
+            x=self.x_test[:10],
+            y=self.y_test[:10],
+            eps_init=0.3,
+            nb_search_steps=5,
+            nb_workers=2,
+            partial_results=partial_results,
+        )
+        self.assertEqual((average_bound, verified_error), expected)
+
+        with self.assertRaises(ValueError):
+            rt.verify(x=self.x_test[:10], y=self.y_test[:10], eps_init=0.3, partial_results={10: (0.0, False)})
+
+    def test_leaf_bounds(self):
+        leaf_nodes = [
+            LeafNode(0, 0, 1, Box({2: Interval(-np.inf, 0.5)}), 1.0),
+            LeafNode(0, 0, 3, Box({2: Interval(0.5, np.inf), 0: Interval(-np.inf, 0.2)}), -1.0),
+            LeafNode(0, 0, 4, Box({2: Interval(0.5, np.inf), 0: Interval(0.2, np.inf)}), 2.0),
+        ]
+        leaf_bounds = LeafBounds.from_leaf_nodes(leaf_nodes, class_label=0)
+        np.testing.assert_array_equal(leaf_bounds.features, [0, 2])
+        np.testing.assert_array_equal(leaf_bounds.lower_bounds, [[-np.inf, -np.inf], [-np.inf, 0.5], [0.2, 0.5]])
+
+        x = np.array([[0.1, 0.0, 0.3], [0.5, 0.0, 0.9]])
+        np.testing.assert_array_almost_equal(leaf_bounds.get_distances(x, np.inf), [[0.0, 0.2, 0.2], [0.4, 0.3, 0.0]])
+        np.testing.assert_array_almost_equal(leaf_bounds.get_distances(x, 1), [[0.0, 0.2, 0.3], [0.4, 0.3, 0.0]])
+        np.testing.assert_array_almost_equal(leaf_bounds.get_distances(x, 0), [[0.0, 1.0, 2.0], [1.0, 1.0, 0.0]])
+
+        other = LeafBounds.from_leaf_nodes(
+            [
+                LeafNode(1, 0, 1, Box({0: Interval(-np.inf, 0.1)}), 0.5),
+                LeafNode(1, 0, 2, Box({0: Interval(0.1, np.inf)}), 0.25),
+            ]
+        )
+        intersections = leaf_bounds.get_intersections(other, other.values)
+        np.testing.assert_array_almost_equal(intersections.values, [1.5, 1.25, -0.5, -0.75, 2.25])
+
 
 if __name__ == "__main__":
     unittest.main()
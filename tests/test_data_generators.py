@@ -18,6 +18,8 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
+import os
+import tempfile
 import unittest
 
 import tensorflow as tf
@@ -25,7 +27,7 @@ import numpy as np
 from keras.preprocessing.image import ImageDataGenerator
 
 from art.data_generators import KerasDataGenerator, PyTorchDataGenerator, MXDataGenerator, TensorFlowDataGenerator
-from art.data_generators import TensorFlowV2DataGenerator, NumpyDataGenerator
+from art.data_generators import DataGenerator, TensorFlowV2DataGenerator, NumpyDataGenerator, PrefetchDataGenerator
 
 from tests.utils import master_seed
 
@@ -150,6 +152,83 @@ class TestNumpyDataGenerator(unittest.TestCase):
         self.assertTrue((y_batch == self.y[: self.batch_size]).all())
 
 
+class TestPrefetchDataGenerator(unittest.TestCase):
+    def setUp(self):
+        self.m = 100
+        self.n = (28, 28, 1)
+        self.x = np.random.random((self.m,) + self.n).astype(np.float32)
+        self.y = np.arange(self.m)
+        self.batch_size = 30
+
+    def test_single_worker_order(self):
+        data_generator = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size, drop_remainder=False)
+        with PrefetchDataGenerator(data_generator, queue_size=2, nb_workers=1) as prefetch_generator:
+            self.assertEqual(prefetch_generator.size, self.m)
+            self.assertEqual(prefetch_generator.batch_size, self.batch_size)
+            for i in range(5):
+                x_batch, y_batch = prefetch_generator.get_batch()
+                start = (i % 4) * self.batch_size
+                np.testing.assert_array_equal(y_batch, self.y[start : start + self.batch_size])
+                np.testing.assert_array_equal(x_batch, self.x[start : start + self.batch_size])
+
+    def test_reuse_buffers_shuffle(self):
+        master_seed(seed=42)
+        data_generator = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size, shuffle=True)
+        with PrefetchDataGenerator(data_generator, nb_workers=3, reuse_buffers=True) as prefetch_generator:
+            for _ in range(2 * data_generator.batches_per_epoch):
+                x_batch, y_batch = prefetch_generator.get_batch()
+                self.assertEqual(x_batch.shape, (self.batch_size,) + self.n)
+                self.assertEqual(len(np.unique(y_batch)), self.batch_size)
+                np.testing.assert_array_equal(x_batch, self.x[y_batch])
+
+    def test_memory_mapped_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            x_path = os.path.join(tmp_dir, "x.npy")
+            y_path = os.path.join(tmp_dir, "y.npy")
+            np.save(x_path, self.x)
+            np.save(y_path, self.y)
+
+            data_generator = NumpyDataGenerator(x_path, y_path, batch_size=self.batch_size)
+            self.assertTrue(isinstance(data_generator.x, np.memmap))
+            with PrefetchDataGenerator(data_generator) as prefetch_generator:
+                x_batch, y_batch = prefetch_generator.get_batch()
+                self.assertFalse(isinstance(x_batch, np.memmap))
+                np.testing.assert_array_equal(x_batch, self.x[: self.batch_size])
+                np.testing.assert_array_equal(y_batch, self.y[: self.batch_size])
+            del data_generator
+
+    def test_generic_generator(self):
+        class DummyGenerator(DataGenerator):
+            def __init__(self):
+                super().__init__(size=10, batch_size=2)
+                self.counter = 0
+
+            def get_batch(self):
+                self.counter += 1
+                if self.counter > 3:
+                    raise ValueError("Exhausted")
+                return np.full((2, 1), self.counter), np.zeros(2)
+
+        # A single worker keeps the order of the batches and of the exception of the wrapped generator
+        prefetch_generator = PrefetchDataGenerator(DummyGenerator(), nb_workers=1)
+        try:
+            x_batches = [prefetch_generator.get_batch()[0][0, 0] for _ in range(3)]
+            self.assertEqual(x_batches, [1, 2, 3])
+            with self.assertRaises(ValueError):
+                prefetch_generator.get_batch()
+            with self.assertRaises(ValueError):
+                prefetch_generator.get_batch()
+        finally:
+            prefetch_generator.close()
+
+    def test_errors(self):
+        data_generator = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size)
+        with self.assertRaises(ValueError):
+            PrefetchDataGenerator(data_generator, queue_size=0)
+        with self.assertRaises(ValueError):
+            PrefetchDataGenerator(data_generator, nb_workers=0)
+
+
 class TestKerasDataGenerator(unittest.TestCase):
     def setUp(self):
         from tensorflow import keras
@@ -0,0 +1,133 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2023
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import importlib
+import json
+import logging
+import subprocess
+import sys
+import unittest
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BENCHMARK = """
+import json
+import sys
+import time
+
+time_start = time.perf_counter()
+{statement}
+duration = time.perf_counter() - time_start
+
+print(json.dumps({{"duration": duration, "modules": sorted(sys.modules)}}))
+"""
+
+EAGER_IMPORT = "import art.attacks.evasion as evasion\n_ = [getattr(evasion, name) for name in evasion.__all__]"
+
+TOP_LEVEL_MODULES = [
+    "attacks",
+    "config",
+    "data_generators",
+    "defences",
+    "estimators",
+    "evaluations",
+    "exceptions",
+    "metrics",
+    "optimizers",
+    "preprocessing",
+    "summary_writer",
+    "utils",
+    "visualization",
+]
+
+
+def _benchmark_import(statement):
+    """
+    Import in a new interpreter and return the duration and the loaded modules.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_BENCHMARK.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestLazyLoader(unittest.TestCase):
+    def test_import_art(self):
+        result = _benchmark_import("import art")
+        logger.info("Import time of `import art`: %.3f s", result["duration"])
+
+        for module in ["art.attacks", "art.defences", "art.estimators", "art.metrics", "torch", "tensorflow"]:
+            self.assertNotIn(module, result["modules"])
+
+    def test_import_time(self):
+        lazy = _benchmark_import("import art")
+        eager = _benchmark_import(EAGER_IMPORT)
+        logger.info(
+            "Import time of `import art`: %.3f s, of all evasion attacks: %.3f s", lazy["duration"], eager["duration"]
+        )
+
+        self.assertLess(lazy["duration"], eager["duration"])
+
+    def test_import_classes(self):
+        result = _benchmark_import(
+            "from art.attacks.evasion import FastGradientMethod\n"
+            "from art.estimators.classification import SklearnClassifier"
+        )
+        logger.info("Import time of FastGradientMethod and SklearnClassifier: %.3f s", result["duration"])
+        modules = result["modules"]
+
+        self.assertIn("art.attacks.evasion.fast_gradient", modules)
+        self.assertIn("art.estimators.classification.scikitlearn", modules)
+        for module in [
+            "art.attacks.evasion.carlini",
+            "art.attacks.evasion.brendel_bethge",
+            "art.attacks.poisoning",
+            "art.defences.preprocessor",
+            "art.estimators.certification",
+            "art.estimators.classification.keras",
+            "art.metrics",
+            "numba",
+        ]:
+            self.assertNotIn(module, modules)
+
+    def test_attributes(self):
+        import art
+        from art.attacks import evasion
+        from art.attacks.evasion.fast_gradient import FastGradientMethod
+
+        self.assertIs(art.attacks.evasion, evasion)
+        self.assertIs(evasion.FastGradientMethod, FastGradientMethod)
+        self.assertIn("FastGradientMethod", evasion.__all__)
+        self.assertIn("FastGradientMethod", dir(evasion))
+        for name in TOP_LEVEL_MODULES:
+            self.assertIn(name, dir(art))
+            self.assertIs(getattr(art, name), importlib.import_module("art." + name))
+
+        with self.assertRaises(AttributeError):
+            _ = evasion.NotAnAttack
+
+        with self.assertRaises(ImportError):
+            from art.attacks.evasion import NotAnAttack  # noqa: F401  # pylint: disable=W0611,E0611
+
+
+if __name__ == "__main__":
+    unittest.main()
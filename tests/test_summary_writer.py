@@ -27,6 +27,35 @@ from tests.utils import ARTTestException
 logger = logging.getLogger(__name__)
 
 
+class RecordingWriter:
+    """
+    Record the summaries instead of writing them to TensorBoard.
+    """
+
+    def __init__(self):
+        self.scalars = {}
+        self.histograms = {}
+
+    def add_scalars(self, tag, values, global_step):
+        self.scalars[(tag, global_step)] = values
+
+    def add_histogram(self, tag, values, global_step):
+        self.histograms[(tag, global_step)] = values
+
+    def flush(self):
+        pass
+
+
+class SummaryWriterRecording(SummaryWriterDefault):
+    def _init_summary_writer(self, summary_writer, init_counter):
+        self._summary_writer = RecordingWriter()
+
+
+class LossEstimator:
+    def compute_loss(self, x, y):
+        raise NotImplementedError
+
+
 @pytest.fixture()
 def fix_get_mnist_subset(get_mnist_dataset):
     (x_train_mnist, y_train_mnist), (x_test_mnist, y_test_mnist) = get_mnist_dataset
@@ -63,6 +92,90 @@ def test_update_image_classification_sw(art_warning, fix_get_mnist_subset, image
         art_warning(e)
 
 
+@pytest.mark.skip_framework("scikitlearn", "mxnet")
+def test_update_image_classification_sw_aggregate_asynchronous(art_warning, fix_get_mnist_subset, image_dl_estimator):
+    try:
+
+        from art.attacks.evasion import ProjectedGradientDescent
+
+        classifier, _ = image_dl_estimator(from_logits=False)
+
+        swd = SummaryWriterDefault(
+            summary_writer=True,
+            ind_1=True,
+            ind_2=True,
+            ind_3=True,
+            ind_4=True,
+            aggregate=True,
+            asynchronous=True,
+            queue_size=2,
+        )
+
+        attack = ProjectedGradientDescent(
+            estimator=classifier, max_iter=10, eps=0.3, eps_step=0.03, batch_size=5, verbose=False, summary_writer=swd
+        )
+
+        (x_train_mnist, y_train_mnist, x_test_mnist, y_test_mnist) = fix_get_mnist_subset
+
+        attack.generate(x=x_train_mnist, y=y_train_mnist)
+        swd.flush()
+
+        # The attack resets the summary writer at the end of `generate`, which stops the background thread
+        assert swd._thread is None
+
+        assert all(attack.summary_writer.i_1 == [False, False, False, False, False])
+        np.testing.assert_almost_equal(attack.summary_writer.i_3["0"], np.array([0.0, 0.0, 0.0, 0.0, 0.0]))
+        np.testing.assert_almost_equal(attack.summary_writer.i_4["0"], np.array([0.0, 0.0, 0.0, 0.0, 0.0]))
+
+        with pytest.raises(ValueError):
+            _ = SummaryWriterDefault(summary_writer=True, queue_size=0)
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_aggregate_asynchronous_written_values(art_warning):
+    try:
+        swd = SummaryWriterRecording(summary_writer=True, ind_3=True, aggregate=True, asynchronous=True, queue_size=1)
+
+        grad = np.zeros((4, 2))
+        grad[:, 0] = [1.0, 2.0, 3.0, 4.0]
+        loss = np.array([4.0, 3.0, 2.0, 1.0])
+        x = np.zeros((4, 2))
+        y = np.zeros((4, 2))
+        for global_step in [1, 2]:
+            swd.update(batch_id=0, global_step=global_step, grad=grad, estimator=LossEstimator(), x=x, y=y, loss=loss)
+            # The attacks modify their arrays in place while the background thread is still writing
+            grad *= 2.0
+            loss -= 1.0
+        swd.flush()
+
+        writer = swd.summary_writer
+        l2_norms = writer.scalars[("gradients/norm-L2/batch-0", 1)]
+        assert l2_norms["mean"] == pytest.approx(2.5)
+        assert l2_norms["min"] == pytest.approx(1.0)
+        assert l2_norms["median"] == pytest.approx(2.5)
+        assert l2_norms["max"] == pytest.approx(4.0)
+        np.testing.assert_array_almost_equal(writer.histograms[("gradients/norm-L2/batch-0", 1)], [1, 2, 3, 4])
+        assert writer.scalars[("gradients/norm-L2/batch-0", 2)]["max"] == pytest.approx(8.0)
+        assert writer.scalars[("loss/batch-0", 1)]["max"] == pytest.approx(4.0)
+        assert writer.scalars[("loss/batch-0", 2)]["max"] == pytest.approx(3.0)
+        # Every loss decreased in the second step
+        np.testing.assert_array_almost_equal(
+            writer.histograms[("Attack Failure Indicator 3 - Diverging Loss/batch-0", 2)], [3, 2, 1, 0]
+        )
+
+        # The stored losses are copies, which are not changed by the attacks and are kept after a reset
+        swd.reset()
+        assert swd._thread is None
+        np.testing.assert_array_almost_equal(swd.loss_prev["0"], [3.0, 2.0, 1.0, 0.0])
+        assert swd.summary_writer is not writer
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
 @pytest.mark.skip_framework("scikitlearn", "mxnet")
 @pytest.mark.parametrize("summary_writer", [True, "./"])
 def test_update_image_classification_bool_str(art_warning, fix_get_mnist_subset, image_dl_estimator, summary_writer):
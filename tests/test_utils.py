@@ -207,6 +207,47 @@ class TestUtils(unittest.TestCase):
         x = uniform_sample_from_sphere_or_ball(nb_points=1, nb_dims=10000, radius=1, sample_space="ball", norm=np.inf)
         self.assertTrue(np.abs(np.max(np.abs(x), axis=1) - 1.0) < 1e-2)
 
+    def test_random_sphere_generator(self):
+        radius = np.linspace(0.5, 1.0, 100).reshape((100, 1))
+
+        for norm in [1, 2, np.inf]:
+            x = random_sphere(100, 10, radius, norm, rng=np.random.default_rng(1))
+            self.assertEqual(x.shape, (100, 10))
+            self.assertEqual(x.dtype, np.float32)
+            self.assertTrue(np.all(np.linalg.norm(x, ord=norm, axis=1) <= radius[:, 0] + 1e-6))
+
+            x_out = np.zeros((100, 10), dtype=np.float32)
+            x_repeated = random_sphere(100, 10, radius, norm, rng=np.random.default_rng(1), out=x_out)
+            self.assertIs(x_repeated, x_out)
+            np.testing.assert_array_equal(x_repeated, x)
+
+            x = random_sphere(1, 10000, 1, norm, rng=np.random.default_rng(1))
+            self.assertTrue(np.abs(np.linalg.norm(x, ord=norm, axis=1) - 1.0) < 1e-2)
+
+        x_out = np.zeros((10, 10), dtype=np.float32)
+        self.assertIs(random_sphere(10, 10, 1, 2, out=x_out), x_out)
+        self.assertTrue(np.all(np.linalg.norm(x_out, axis=1) < 1.0))
+
+        with self.assertRaises(NotImplementedError):
+            random_sphere(10, 10, np.ones(10), 2, rng=np.random.default_rng(1))
+
+        with self.assertRaises(ValueError):
+            random_sphere(10, 10, 1, 2, rng=np.random.default_rng(1), out=np.zeros((10, 5)))
+
+    def test_uniform_sample_from_sphere_or_ball_generator(self):
+        radius = np.linspace(0.5, 1.0, 100)
+
+        for norm in [1, 2, np.inf]:
+            x = uniform_sample_from_sphere_or_ball(100, 10, radius, "sphere", norm, rng=np.random.default_rng(1))
+            self.assertEqual(x.dtype, np.float32)
+            np.testing.assert_array_almost_equal(np.linalg.norm(x, ord=norm, axis=1), radius, decimal=5)
+
+            x = uniform_sample_from_sphere_or_ball(100, 10, radius, "ball", norm, rng=np.random.default_rng(1))
+            self.assertTrue(np.all(np.linalg.norm(x, ord=norm, axis=1) <= radius + 1e-6))
+
+            x = uniform_sample_from_sphere_or_ball(1, 10000, 1, "ball", norm, rng=np.random.default_rng(1))
+            self.assertTrue(np.abs(np.linalg.norm(x, ord=norm, axis=1) - 1.0) < 1e-2)
+
     def test_to_categorical(self):
         y = np.array([3, 1, 4, 1, 5, 9])
         y_ = to_categorical(y)